@@ -16,6 +16,7 @@ from boring.agents.orchestrator import (
     MultiAgentOrchestrator,
     ReviewerAgent,
 )
+from boring.agents.pool import AgentWorkerPool
 from boring.agents.protocol import (
     AgentResponse,
     AgentTask,
@@ -24,6 +25,7 @@ from boring.agents.protocol import (
     ToolCall,
 )
 from boring.agents.runner import AsyncAgentRunner
+from boring.agents.scheduler import DagScheduler, PlanTask, parse_plan
 
 __all__ = [
     # Protocol
@@ -34,6 +36,11 @@ __all__ = [
     "AgentTask",
     # Runner
     "AsyncAgentRunner",
+    "AgentWorkerPool",
+    # Scheduling
+    "PlanTask",
+    "DagScheduler",
+    "parse_plan",
     # Bus
     "AgentMessage",
     "SharedMemory",
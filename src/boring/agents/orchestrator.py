@@ -8,6 +8,7 @@ from rich.panel import Panel
 from boring.agents.bus import get_agent_bus
 from boring.agents.protocol import AgentResponse, AgentTask
 from boring.agents.runner import AsyncAgentRunner
+from boring.agents.scheduler import DagScheduler, PlanTask, ScheduleReport, parse_plan
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -50,6 +51,25 @@ class ArchitectAgent(BaseAgent):
         ]
         return tasks
 
+    async def plan(self, goal: str) -> list[PlanTask]:
+        """Decompose goal into a task DAG with declared file footprints."""
+        prompt = (
+            "Decompose the following coding goal into specific, actionable sub-tasks for "
+            "Coder agents that may work in parallel.\n"
+            f"Goal: {goal}\n"
+            "Respond ONLY with one line per task in this format:\n"
+            "- [T1] <task> (files: <paths or modules it will modify>) (after: <task ids it needs>)\n"
+            "Omit (after: ...) when a task has no prerequisites. Declare every file a task "
+            "touches so tasks editing the same files are not run at the same time."
+        )
+        res = await self.run(prompt)
+
+        # Safety guard: Check if messages list is not empty
+        if not res.messages or not res.messages[-1].content:
+            logger.error("Architect returned an empty response.")
+            return []
+        return parse_plan(res.messages[-1].content)
+
 
 class CoderAgent(BaseAgent):
     """Responsible for implementing specific code changes."""
@@ -75,10 +95,12 @@ class MultiAgentOrchestrator:
     Coordinates multiple specialized agents to achieve a complex goal.
     """
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, max_parallel: int = 3):
         self.root = project_root
-        self.runner = AsyncAgentRunner(project_root)
+        self.max_parallel = max_parallel
+        self.runner = AsyncAgentRunner(project_root, max_concurrency=max_parallel)
         self.bus = get_agent_bus()
+        self.last_schedule: ScheduleReport | None = None
 
         # Initialize agents
         self.architect = ArchitectAgent(self.runner)
@@ -88,33 +110,49 @@ class MultiAgentOrchestrator:
     async def execute_goal(self, goal: str):
         """
         Main orchestration loop: Architect -> (Coders) -> Reviewer.
+
+        Workers stay warm for the whole goal and are stopped when it ends.
         """
+        try:
+            return await self._execute_goal(goal)
+        finally:
+            await self.runner.close()
+
+    async def _execute_goal(self, goal: str):
         console.print(f"[bold cyan]🎯 Orchestrating Goal: {goal}[/bold cyan]")
 
         # 1. Design Phase
         console.print("[bold yellow]🏗️ Architect is designing...[/bold yellow]")
-        tasks = await self.architect.decompose_goal(goal)
+        tasks = await self.architect.plan(goal)
 
         if not tasks:
             console.print("[red]Architect failed to decompose the goal.[/red]")
             return
 
-        console.print(Panel("\n".join([f"• {t}" for t in tasks]), title="Architect's Plan"))
+        console.print(Panel(self._format_plan(tasks), title="Architect's Plan"))
 
-        # 2. Implementation Phase
-        results = []
-        for i, task_desc in enumerate(tasks):
+        # 2. Implementation Phase: non-conflicting tasks run concurrently
+        async def implement(task: PlanTask) -> AgentResponse:
             console.print(
-                f"[bold blue]👨‍💻 Coder task {i + 1}/{len(tasks)}: {task_desc}[/bold blue]"
+                f"[bold blue]👨‍💻 Coder task {task.task_id}: {task.description}[/bold blue]"
+            )
+            res = await self.coder.run(
+                f"Implement this sub-task: {task.description}", context_files=task.files
             )
-            res = await self.coder.run(f"Implement this sub-task: {task_desc}")
-            results.append(res)
 
             # Simple check
             if res.error:
-                console.print(f"[red]Coder failed on task: {res.error}[/red]")
+                console.print(f"[red]Coder failed on task {task.task_id}: {res.error}[/red]")
             else:
-                console.print("[green]✓ Task completed.[/green]")
+                console.print(f"[green]✓ Task {task.task_id} completed.[/green]")
+            return res
+
+        scheduler = DagScheduler(self.max_parallel, is_failure=self._is_failure)
+        report = await scheduler.run(tasks, implement, on_skip=self._skipped_response)
+        self.last_schedule = report
+        console.print(Panel(self._format_timing(report), title="Schedule"))
+
+        results = [self._as_response(report.results[t.task_id]) for t in tasks]
 
         # 3. Review Phase
         console.print("[bold magenta]🧐 Reviewer is checking work...[/bold magenta]")
@@ -143,6 +181,40 @@ class MultiAgentOrchestrator:
         console.print("[bold green]🏁 Multi-Agent Session Complete.[/bold green]")
         return results
 
+    @staticmethod
+    def _is_failure(result) -> bool:
+        return isinstance(result, BaseException) or bool(getattr(result, "error", None))
+
+    @staticmethod
+    def _skipped_response(task: PlanTask, reason: str) -> AgentResponse:
+        return AgentResponse(messages=[], finish_reason="error", error=reason)
+
+    @staticmethod
+    def _as_response(result) -> AgentResponse:
+        if isinstance(result, AgentResponse):
+            return result
+        return AgentResponse(messages=[], finish_reason="error", error=str(result))
+
+    @staticmethod
+    def _format_plan(tasks: list[PlanTask]) -> str:
+        lines = []
+        for t in tasks:
+            line = f"• [{t.task_id}] {t.description}"
+            if t.depends_on:
+                line += f" (after {', '.join(t.depends_on)})"
+            lines.append(line)
+        return "\n".join(lines)
+
+    @staticmethod
+    def _format_timing(report: ScheduleReport) -> str:
+        lines = [
+            f"Wall time: {report.wall_time:.1f}s | Sum of tasks: {report.busy_time:.1f}s "
+            f"| Speedup: {report.speedup:.2f}x",
+            "Critical path:",
+        ]
+        lines += [f"  {tid}: {duration:.1f}s" for tid, duration in report.breakdown()]
+        return "\n".join(lines)
+
 
 if __name__ == "__main__":
     # Test stub
@@ -0,0 +1,242 @@
+"""
+Warm pool of agent worker processes.
+
+Each worker (boring.agents.worker) imports Boring once and then serves tasks
+over a framed stdin/stdout channel, so sub-agents stop paying interpreter
+startup, CLI/i18n imports and config load per task. Idle workers are
+health-checked before reuse and recycled after max_tasks_per_worker tasks to
+bound state and memory drift.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+from boring.agents.worker import FrameError, encode_frame, read_frame_async
+from boring.intelligence.agent_scorer import AgentScorer
+
+logger = logging.getLogger(__name__)
+
+WORKER_COMMAND = [sys.executable, "-m", "boring.agents.worker"]
+
+
+class WorkerError(Exception):
+    """Raised when a worker fails to start, dies, or breaks protocol."""
+
+
+class AgentWorker:
+    """Parent-side handle for one worker process."""
+
+    def __init__(self, process: asyncio.subprocess.Process, pid: int):
+        self.process = process
+        self.pid = pid
+        self.tasks_completed = 0
+        self.last_used = time.monotonic()
+
+    @classmethod
+    async def spawn(
+        cls,
+        command: list[str],
+        cwd: Path,
+        env: dict[str, str] | None = None,
+        start_timeout: float = 60.0,
+    ) -> "AgentWorker":
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            cwd=cwd,
+            env={**os.environ, **(env or {})},
+        )
+        try:
+            ready = await asyncio.wait_for(read_frame_async(process.stdout), start_timeout)
+        except (asyncio.TimeoutError, FrameError, ValueError) as e:
+            process.kill()
+            await process.wait()
+            raise WorkerError(f"Agent worker failed to start: {e!r}") from e
+        except BaseException:
+            process.kill()
+            await process.wait()
+            raise
+        if not ready or ready.get("type") != "ready":
+            process.kill()
+            await process.wait()
+            raise WorkerError(f"Agent worker failed to start (exit code {process.returncode})")
+        return cls(process, ready.get("pid", process.pid))
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+    async def request(self, message: dict[str, Any], timeout: float | None = None) -> dict:
+        """Send one frame and wait for the reply."""
+        if not self.alive:
+            raise WorkerError(f"Agent worker {self.pid} is not running")
+        try:
+            self.process.stdin.write(encode_frame(message))
+            await self.process.stdin.drain()
+            reply = await asyncio.wait_for(read_frame_async(self.process.stdout), timeout)
+        except (ConnectionError, FrameError, ValueError) as e:
+            raise WorkerError(f"Agent worker {self.pid} protocol error: {e!r}") from e
+        if reply is None:
+            raise WorkerError(f"Agent worker {self.pid} exited unexpectedly")
+        return reply
+
+    async def ping(self, timeout: float = 5.0) -> bool:
+        try:
+            reply = await self.request({"type": "ping"}, timeout=timeout)
+        except (WorkerError, asyncio.TimeoutError):
+            return False
+        return reply.get("type") == "pong"
+
+    async def stop(self, timeout: float = 5.0):
+        """Ask the worker to exit; kill it if it does not."""
+        if self.alive:
+            try:
+                self.process.stdin.write(encode_frame({"type": "shutdown"}))
+                await self.process.stdin.drain()
+                self.process.stdin.close()
+                await asyncio.wait_for(self.process.wait(), timeout)
+            except (ConnectionError, asyncio.TimeoutError):
+                pass
+        await self.kill()
+
+    async def kill(self):
+        if self.alive:
+            self.process.kill()
+        await self.process.wait()
+
+
+class AgentWorkerPool:
+    """
+    Bounded pool of reusable agent workers.
+
+    Usage:
+        pool = AgentWorkerPool(project_root, size=3)
+        result = await pool.run({"prompt": ..., "env": {...}}, agent_id="coder")
+        await pool.close()
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        size: int = 3,
+        max_tasks_per_worker: int = 25,
+        task_timeout: float | None = None,
+        start_timeout: float = 60.0,
+        health_check_interval: float = 30.0,
+        scorer: AgentScorer | None = None,
+        command: list[str] | None = None,
+        env: dict[str, str] | None = None,
+    ):
+        self.project_root = Path(project_root)
+        self.size = size
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.task_timeout = task_timeout
+        self.start_timeout = start_timeout
+        self.health_check_interval = health_check_interval
+        self.scorer = scorer
+        self.command = command or WORKER_COMMAND
+        self.env = env or {}
+        self._slots = asyncio.Semaphore(size)
+        self._idle: list[AgentWorker] = []
+        self.stats = {"spawned": 0, "reused": 0, "recycled": 0, "unhealthy": 0, "failed": 0}
+
+    async def run(self, payload: dict[str, Any], agent_id: str = "agent") -> dict[str, Any]:
+        """
+        Run one task on a warm worker.
+
+        Returns the worker's result frame; worker crashes and timeouts are
+        reported as an unsuccessful result rather than raised.
+        """
+        async with self._slots:
+            try:
+                worker = await self._checkout(agent_id)
+            except (WorkerError, OSError) as e:
+                self.stats["failed"] += 1
+                return {"success": False, "output": "", "error": str(e)}
+
+            message = {"type": "task", "id": uuid.uuid4().hex, **payload}
+            try:
+                result = await worker.request(message, timeout=self.task_timeout)
+            except asyncio.TimeoutError:
+                await worker.kill()
+                self.stats["failed"] += 1
+                return {
+                    "success": False,
+                    "output": "",
+                    "error": f"Agent task timed out after {self.task_timeout}s",
+                }
+            except WorkerError as e:
+                await worker.kill()
+                self.stats["failed"] += 1
+                return {"success": False, "output": "", "error": str(e)}
+            except BaseException:
+                # Cancelled mid-task: its reply is still pending, so the worker can't be reused
+                await worker.kill()
+                raise
+
+            worker.tasks_completed += 1
+            await self._checkin(worker, agent_id)
+            return result
+
+    async def close(self):
+        """Stop all idle workers (busy ones are stopped by their task)."""
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(w.stop() for w in idle), return_exceptions=True)
+
+    @property
+    def idle_workers(self) -> int:
+        return len(self._idle)
+
+    async def _checkout(self, agent_id: str) -> AgentWorker:
+        while self._idle:
+            worker = self._idle.pop()  # LIFO: the most recently used worker is warmest
+            if not worker.alive:
+                continue
+            if time.monotonic() - worker.last_used > self.health_check_interval:
+                try:
+                    healthy = await worker.ping()
+                except BaseException:
+                    await worker.kill()
+                    raise
+                if not healthy:
+                    self.stats["unhealthy"] += 1
+                    await self._record(agent_id, "worker_unhealthy", 1.0, worker)
+                    await worker.kill()
+                    continue
+            self.stats["reused"] += 1
+            return worker
+
+        start = time.perf_counter()
+        worker = await AgentWorker.spawn(
+            self.command, self.project_root, env=self.env, start_timeout=self.start_timeout
+        )
+        self.stats["spawned"] += 1
+        await self._record(
+            agent_id, "worker_spawn_ms", (time.perf_counter() - start) * 1000, worker
+        )
+        return worker
+
+    async def _checkin(self, worker: AgentWorker, agent_id: str):
+        worker.last_used = time.monotonic()
+        if worker.tasks_completed >= self.max_tasks_per_worker:
+            self.stats["recycled"] += 1
+            await self._record(agent_id, "worker_recycled", 1.0, worker)
+            await worker.stop()
+        elif worker.alive:
+            self._idle.append(worker)
+
+    async def _record(self, agent_id: str, metric: str, value: float, worker: AgentWorker):
+        if self.scorer is None:
+            return
+        try:
+            await self.scorer.record_metric(agent_id, metric, value, tags={"worker": worker.pid})
+        except Exception as e:
+            logger.debug(f"Failed to record {metric}: {e}")
@@ -3,24 +3,72 @@ import logging
 import os
 import sys
 import time
+import uuid
 from pathlib import Path
 
+from boring.agents.pool import AgentWorkerPool
 from boring.agents.protocol import AgentResponse, AgentTask, ChatMessage
 from boring.intelligence.agent_scorer import AgentScorer
 
 logger = logging.getLogger(__name__)
 
+SUB_AGENT_MAX_LOOPS = 5  # Limit iterations for sub-agents
+
 
 class AsyncAgentRunner:
     """
-    Orchestrates multiple agents concurrently via asyncio subprocesses.
-    Each agent runs in its own process (using the boring CLI) to ensure isolation and GIL bypass.
+    Orchestrates multiple agents concurrently.
+
+    Tasks run on a pool of warm worker processes (see AgentWorkerPool) that
+    keep Boring loaded between tasks, preserving process isolation and GIL
+    bypass without per-task startup. With use_worker_pool=False each task runs
+    in a fresh `boring run` subprocess instead.
     """
 
-    def __init__(self, project_root: Path, max_concurrency: int = 3):
+    def __init__(
+        self,
+        project_root: Path,
+        max_concurrency: int = 3,
+        use_worker_pool: bool = True,
+        max_tasks_per_worker: int = 25,
+        task_timeout: float | None = None,
+    ):
         self.project_root = project_root
         self.semaphore = asyncio.Semaphore(max_concurrency)
         self.scorer = AgentScorer()  # Uses default DB path
+        self.pool = (
+            AgentWorkerPool(
+                project_root,
+                size=max_concurrency,
+                max_tasks_per_worker=max_tasks_per_worker,
+                task_timeout=task_timeout,
+                scorer=self.scorer,
+                env={"BORING_MULTI_AGENT": "1"},
+            )
+            if use_worker_pool
+            else None
+        )
+        self._token_tracker = None
+
+    def _build_prompt(self, task: AgentTask) -> str:
+        """Structured prompt with role context for the LLM."""
+        role_prefix = f"""# Agent Role: {task.agent_name}
+
+You are acting as the **{task.agent_name}** agent in a multi-agent system.
+Your responsibilities are defined by your role. Execute the following task:
+
+"""
+        full_prompt = role_prefix + task.instructions
+
+        if task.context_files:
+            full_prompt += "\n\n## Context Files:\n" + "\n".join(
+                f"- {f}" for f in task.context_files
+            )
+
+        if task.tools:
+            full_prompt += "\n\n## Available Tools:\n" + "\n".join(f"- {t}" for t in task.tools)
+
+        return full_prompt
 
     async def execute_task(self, task: AgentTask) -> AgentResponse:
         """
@@ -30,66 +78,36 @@ class AsyncAgentRunner:
         agent_id = task.agent_name  # Use agent name as ID for scoring
 
         async with self.semaphore:
-            # Construct structured prompt with role context
-            # Role is passed via:
-            # 1. Environment variable BORING_AGENT_ROLE for downstream components
-            # 2. Structured prompt format for the LLM
-            # 3. Optional --role flag if boring CLI supports it
-
-            role_prefix = f"""# Agent Role: {task.agent_name}
+            full_prompt = self._build_prompt(task)
 
-You are acting as the **{task.agent_name}** agent in a multi-agent system.
-Your responsibilities are defined by your role. Execute the following task:
-
-"""
-            full_prompt = role_prefix + task.instructions
-
-            if task.context_files:
-                full_prompt += "\n\n## Context Files:\n" + "\n".join(
-                    f"- {f}" for f in task.context_files
-                )
-
-            if task.tools:
-                full_prompt += "\n\n## Available Tools:\n" + "\n".join(f"- {t}" for t in task.tools)
-
-            cmd = [
-                sys.executable,
-                "-m",
-                "boring.main",
-                "run",
-                full_prompt,
-                "--backend",
-                "cli",
-                "--calls",
-                "5",  # Limit iterations for sub-agents
-            ]
-
-            # Pass model override if specified
-            if task.model_override:
-                cmd.extend(["--model", task.model_override])
-
-            # Environment includes role for downstream components
+            # Role is passed via environment variable BORING_AGENT_ROLE for
+            # downstream components and via the structured prompt for the LLM
             env = {
-                **os.environ.copy(),
                 "BORING_AGENT_ROLE": task.agent_name,
                 "BORING_MULTI_AGENT": "1",  # Signal multi-agent context
             }
 
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=env,
-            )
+            if self.pool is not None:
+                result = await self.pool.run(
+                    {
+                        "prompt": full_prompt,
+                        "model": task.model_override,
+                        "env": env,
+                        "max_loops": SUB_AGENT_MAX_LOOPS,
+                    },
+                    agent_id=agent_id,
+                )
+                success = bool(result.get("success"))
+                output_text = result.get("output") or ""
+                error_text = None if success else (result.get("error") or "")
+            else:
+                success, output_text, error_text = await self._run_subprocess(
+                    full_prompt, task, env
+                )
 
-            stdout, stderr = await process.communicate()
             end_time = time.time()
             latency_ms = (end_time - start_time) * 1000
 
-            success = process.returncode == 0
-            output_text = stdout.decode().strip()
-            error_text = stderr.decode().strip() if not success else None
-
             # Record stats
             await self.scorer.record_metric(agent_id, "latency_ms", latency_ms)
             await self.scorer.record_metric(agent_id, "success", 1.0 if success else 0.0)
@@ -97,9 +115,8 @@ Your responsibilities are defined by your role. Execute the following task:
             # Token usage estimation (lightweight heuristic)
             try:
                 from boring.core.config import settings
-                from boring.metrics.token_tracker import TokenTracker
 
-                tracker = TokenTracker(self.project_root)
+                tracker = self._get_token_tracker()
                 input_tokens = tracker.estimate_tokens(full_prompt)
                 output_tokens = tracker.estimate_tokens(output_text)
                 tracker.track_usage(settings.DEFAULT_MODEL, input_tokens, output_tokens)
@@ -118,9 +135,56 @@ Your responsibilities are defined by your role. Execute the following task:
 
             return response
 
+    async def _run_subprocess(
+        self, full_prompt: str, task: AgentTask, env: dict[str, str]
+    ) -> tuple[bool, str, str | None]:
+        """Run one task in a fresh `boring run` process."""
+        cmd = [
+            sys.executable,
+            "-m",
+            "boring.main",
+            "run",
+            full_prompt,
+            "--backend",
+            "cli",
+            # Concurrent subprocesses must not share the default prompt file
+            "--prompt-file",
+            f".boring_run_prompt.{uuid.uuid4().hex}.md",
+        ]
+
+        # Pass model override if specified
+        if task.model_override:
+            cmd.extend(["--model", task.model_override])
+
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env={**os.environ.copy(), **env},
+        )
+
+        stdout, stderr = await process.communicate()
+        success = process.returncode == 0
+        output_text = stdout.decode().strip()
+        error_text = stderr.decode().strip() if not success else None
+        return success, output_text, error_text
+
+    def _get_token_tracker(self):
+        """One TokenTracker for the runner's lifetime."""
+        if self._token_tracker is None:
+            from boring.metrics.token_tracker import TokenTracker
+
+            self._token_tracker = TokenTracker(self.project_root)
+        return self._token_tracker
+
     async def execute_parallel(self, tasks: list[AgentTask]) -> list[AgentResponse]:
         """
         Run multiple tasks in parallel.
         """
         coroutines = [self.execute_task(t) for t in tasks]
         return await asyncio.gather(*coroutines, return_exceptions=True)
+
+    async def close(self):
+        """Stop pooled workers."""
+        if self.pool is not None:
+            await self.pool.close()
@@ -0,0 +1,303 @@
+"""
+DAG scheduling for multi-agent plans.
+
+The architect's plan becomes a list of PlanTask nodes, each with a declared
+file/module footprint and optional explicit dependencies. DagScheduler runs
+every task whose predecessors are done, up to a configurable width; tasks with
+overlapping footprints are ordered by plan position so two agents never edit
+the same file at once. A task with no declared footprint may touch anything
+and is serialized against every other task.
+
+Plan line format (anything else is a plain task with an inferred footprint):
+    - [T2] Add retry to the HTTP client (files: src/http.py, tests/test_http.py) (after: T1)
+"""
+
+import asyncio
+import logging
+import re
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_SOURCE_SUFFIXES = (
+    ".py",
+    ".pyi",
+    ".js",
+    ".jsx",
+    ".ts",
+    ".tsx",
+    ".go",
+    ".rs",
+    ".java",
+    ".kt",
+    ".rb",
+    ".c",
+    ".h",
+    ".cpp",
+    ".hpp",
+    ".cs",
+    ".md",
+    ".json",
+    ".toml",
+    ".yaml",
+    ".yml",
+)
+_TASK_LINE = re.compile(r"^\s*(?:[-*•]|\d+[.)])?\s*(?:\[(?P<id>[^\]]+)\]\s*)?(?P<body>.+?)\s*$")
+_ANNOTATION = re.compile(
+    r"\((?P<key>files?|modules?|after|depends on)\s*:\s*(?P<value>[^)]*)\)", re.I
+)
+_PATH_TOKEN = re.compile(
+    r"(?<![\w/.-])((?:[\w.-]+/)*[\w.-]+(?:"
+    + "|".join(re.escape(s) for s in _SOURCE_SUFFIXES)
+    + r"))(?![\w/])"
+)
+
+
+@dataclass
+class PlanTask:
+    """One node of the plan DAG."""
+
+    task_id: str
+    description: str
+    footprint: frozenset[str] = frozenset()  # Empty: unknown, conflicts with everything
+    depends_on: list[str] = field(default_factory=list)
+    files: list[str] = field(default_factory=list)  # Paths/modules as the plan declared them
+
+
+@dataclass
+class TaskTiming:
+    task_id: str
+    start: float
+    end: float
+    status: str  # "ok", "failed", "skipped"
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+@dataclass
+class ScheduleReport:
+    """Results keyed by task id plus the timing breakdown of the run."""
+
+    results: dict[str, Any]
+    timings: dict[str, TaskTiming]
+    critical_path: list[str]
+    wall_time: float
+
+    @property
+    def busy_time(self) -> float:
+        """Sum of task durations (the wall time of a fully serial run)."""
+        return sum(t.duration for t in self.timings.values())
+
+    @property
+    def speedup(self) -> float:
+        return self.busy_time / self.wall_time if self.wall_time > 0 else 1.0
+
+    def breakdown(self) -> list[tuple[str, float]]:
+        """(task_id, duration) along the critical path."""
+        return [(tid, self.timings[tid].duration) for tid in self.critical_path]
+
+
+def footprint_key(token: str) -> str:
+    """Normalize a file path or dotted module name for overlap checks."""
+    key = token.strip().strip("`'\"").replace("\\", "/").removeprefix("./").rstrip("/")
+    for suffix in _SOURCE_SUFFIXES:
+        if key.endswith(suffix):
+            return key[: -len(suffix)]
+    if "/" not in key and "." in key:
+        key = key.replace(".", "/")  # Dotted module name
+    return key
+
+
+def footprints_overlap(a: frozenset[str], b: frozenset[str]) -> bool:
+    """True if the footprints may touch the same file (unknown overlaps everything)."""
+    if not a or not b:
+        return True
+    for x in a:
+        for y in b:
+            if x == y or x.startswith(y + "/") or y.startswith(x + "/"):
+                return True
+            if x.endswith("/" + y) or y.endswith("/" + x):
+                return True  # src/pkg/mod vs pkg/mod
+    return False
+
+
+def parse_plan(lines: list[str] | str) -> list[PlanTask]:
+    """
+    Turn plan lines into PlanTask nodes.
+
+    Footprints come from (files: ...) / (modules: ...) annotations, or else from
+    path-like tokens in the description; the annotated values are also kept
+    verbatim in PlanTask.files. Dependencies come from (after: ...)
+    and may only point at earlier tasks, which keeps the graph acyclic.
+    """
+    if isinstance(lines, str):
+        lines = lines.splitlines()
+
+    tasks: list[PlanTask] = []
+    seen: set[str] = set()
+    for line in lines:
+        match = _TASK_LINE.match(line)
+        if not match or not match.group("body").strip("-* "):
+            continue
+        body = match.group("body")
+        task_id = (match.group("id") or "").strip() or f"T{len(tasks) + 1}"
+        if task_id in seen:
+            task_id = f"{task_id}-{len(tasks) + 1}"
+
+        declared: list[str] = []
+        depends_on: list[str] = []
+        for ann in _ANNOTATION.finditer(body):
+            values = [v.strip() for v in ann.group("value").split(",") if v.strip()]
+            if ann.group("key").lower() in ("after", "depends on"):
+                for dep in values:
+                    dep = dep.strip("[]")
+                    if dep in seen:
+                        depends_on.append(dep)
+                    else:
+                        logger.warning(f"Plan task {task_id}: ignoring dependency on {dep}")
+            else:
+                declared.extend(v for v in values if v not in declared)
+        description = _ANNOTATION.sub("", body).strip()
+        if declared:
+            files = {footprint_key(v) for v in declared}
+        else:
+            files = {footprint_key(m.group(1)) for m in _PATH_TOKEN.finditer(description)}
+
+        tasks.append(PlanTask(task_id, description, frozenset(files), depends_on, declared))
+        seen.add(task_id)
+    return tasks
+
+
+def build_edges(tasks: list[PlanTask]) -> dict[str, list[str]]:
+    """
+    Predecessors of each task: explicit dependencies plus every earlier task
+    whose footprint overlaps (so conflicting edits run in plan order).
+    """
+    preds: dict[str, list[str]] = {}
+    for i, task in enumerate(tasks):
+        before = list(task.depends_on)
+        for earlier in tasks[:i]:
+            if earlier.task_id not in before and footprints_overlap(
+                earlier.footprint, task.footprint
+            ):
+                before.append(earlier.task_id)
+        preds[task.task_id] = before
+    return preds
+
+
+class DagScheduler:
+    """
+    Runs PlanTasks concurrently, respecting dependencies and footprints.
+
+    Usage:
+        scheduler = DagScheduler(max_parallel=3)
+        report = await scheduler.run(tasks, execute)  # execute(task) -> result
+    """
+
+    def __init__(
+        self,
+        max_parallel: int = 3,
+        is_failure: Callable[[Any], bool] | None = None,
+    ):
+        self.max_parallel = max(1, max_parallel)
+        self.is_failure = is_failure or (lambda result: isinstance(result, BaseException))
+
+    async def run(
+        self,
+        tasks: list[PlanTask],
+        execute: Callable[[PlanTask], Awaitable[Any]],
+        on_skip: Callable[[PlanTask, str], Any] | None = None,
+    ) -> ScheduleReport:
+        """
+        Execute tasks; a task whose explicit dependency failed is skipped
+        (on_skip(task, reason) provides its result). Exceptions raised by
+        execute are returned as results, not propagated.
+        """
+        by_id = {t.task_id: t for t in tasks}
+        preds = build_edges(tasks)
+        waiting = {tid: set(p) for tid, p in preds.items()}
+        dependents: dict[str, list[str]] = {tid: [] for tid in by_id}
+        for tid, before in preds.items():
+            for p in before:
+                dependents[p].append(tid)
+
+        results: dict[str, Any] = {}
+        timings: dict[str, TaskTiming] = {}
+        failed: set[str] = set()
+        ready = [t.task_id for t in tasks if not waiting[t.task_id]]
+        running: dict[asyncio.Task, str] = {}
+        started = time.perf_counter()
+
+        async def invoke(task: PlanTask):
+            try:
+                return await execute(task)
+            except Exception as e:
+                logger.error(f"Plan task {task.task_id} failed: {e}")
+                return e
+
+        def finish(tid: str):
+            for dep in dependents[tid]:
+                waiting[dep].discard(tid)
+                if not waiting[dep]:
+                    ready.append(dep)
+
+        while ready or running:
+            # Skips complete instantly and may unlock more work
+            while ready:
+                tid = ready.pop(0)
+                task = by_id[tid]
+                bad = [d for d in task.depends_on if d in failed]
+                if bad:
+                    reason = f"Skipped: dependency {', '.join(bad)} failed"
+                    now = time.perf_counter()
+                    results[tid] = on_skip(task, reason) if on_skip else None
+                    timings[tid] = TaskTiming(tid, now, now, "skipped")
+                    failed.add(tid)
+                    finish(tid)
+                    continue
+                if len(running) >= self.max_parallel:
+                    ready.insert(0, tid)
+                    break
+                timings[tid] = TaskTiming(tid, time.perf_counter(), 0.0, "running")
+                running[asyncio.create_task(invoke(task))] = tid
+
+            if not running:
+                continue
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for fut in done:
+                tid = running.pop(fut)
+                result = fut.result()
+                results[tid] = result
+                timing = timings[tid]
+                timing.end = time.perf_counter()
+                if self.is_failure(result):
+                    timing.status = "failed"
+                    failed.add(tid)
+                else:
+                    timing.status = "ok"
+                finish(tid)
+
+        wall_time = time.perf_counter() - started
+        return ScheduleReport(
+            results=results,
+            timings=timings,
+            critical_path=self._critical_path(preds, timings),
+            wall_time=wall_time,
+        )
+
+    @staticmethod
+    def _critical_path(preds: dict[str, list[str]], timings: dict[str, TaskTiming]) -> list[str]:
+        """Walk back from the last task to finish through the predecessor that gated it."""
+        if not timings:
+            return []
+        current = max(timings.values(), key=lambda t: t.end).task_id
+        path = [current]
+        while preds.get(current):
+            current = max(preds[current], key=lambda p: timings[p].end)
+            path.append(current)
+        return path[::-1]
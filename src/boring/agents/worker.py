@@ -0,0 +1,179 @@
+"""
+Long-lived agent worker process.
+
+Started by AgentWorkerPool as `python -m boring.agents.worker` with the
+project root as working directory. Boring (Typer CLI, rich, i18n, settings,
+agent loop) is imported once at startup; tasks then arrive as length-prefixed
+JSON frames on stdin and results go back the same way on stdout. Anything a
+task prints is captured into its result instead of corrupting the channel.
+
+Frames (4-byte big-endian length + UTF-8 JSON):
+    parent -> worker: {"type": "task", "id", "prompt", "model", "env", "max_loops"}
+                      {"type": "ping"} | {"type": "shutdown"}
+    worker -> parent: {"type": "ready", "pid"} | {"type": "pong", "tasks"}
+                      {"type": "result", "id", "success", "output", "error", "duration_ms"}
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+import os
+import re
+import struct
+import sys
+import time
+import traceback
+import uuid
+from pathlib import Path
+from typing import Any, BinaryIO
+
+_HEADER = struct.Struct(">I")
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+
+class FrameError(Exception):
+    """Raised on a malformed or oversized frame."""
+
+
+def encode_frame(message: dict[str, Any]) -> bytes:
+    payload = json.dumps(message).encode("utf-8")
+    return _HEADER.pack(len(payload)) + payload
+
+
+def _frame_length(header: bytes) -> int:
+    (length,) = _HEADER.unpack(header)
+    if length > MAX_FRAME_BYTES:
+        raise FrameError(f"Frame of {length} bytes exceeds limit")
+    return length
+
+
+def write_frame(stream: BinaryIO, message: dict[str, Any]):
+    stream.write(encode_frame(message))
+    stream.flush()
+
+
+def read_frame(stream: BinaryIO) -> dict[str, Any] | None:
+    """Blocking read of one frame; None on clean EOF."""
+    header = stream.read(_HEADER.size)
+    if not header:
+        return None
+    if len(header) < _HEADER.size:
+        raise FrameError("Truncated frame header")
+    length = _frame_length(header)
+    payload = stream.read(length)
+    if len(payload) < length:
+        raise FrameError("Truncated frame payload")
+    return json.loads(payload.decode("utf-8"))
+
+
+async def read_frame_async(reader: asyncio.StreamReader) -> dict[str, Any] | None:
+    """Read one frame from an asyncio stream; None on clean EOF."""
+    try:
+        header = await reader.readexactly(_HEADER.size)
+    except asyncio.IncompleteReadError as e:
+        if not e.partial:
+            return None
+        raise FrameError("Truncated frame header") from e
+    length = _frame_length(header)
+    try:
+        payload = await reader.readexactly(length)
+    except asyncio.IncompleteReadError as e:
+        raise FrameError("Truncated frame payload") from e
+    return json.loads(payload.decode("utf-8"))
+
+
+def run_task(frame: dict[str, Any]) -> dict[str, Any]:
+    """
+    Execute one agent task in this process (the equivalent of `boring run`).
+
+    Environment overrides, MAX_LOOPS and PROMPT_FILE apply to the task only. Each task
+    writes its prompt to its own file, since workers share the project root.
+    """
+    import click
+
+    from boring.core.config import settings
+    from boring.main import _run_one_shot
+
+    start = time.perf_counter()
+    env = frame.get("env") or {}
+    saved_env = {key: os.environ.get(key) for key in env}
+    saved_max_loops = settings.MAX_LOOPS
+    saved_prompt_file = settings.PROMPT_FILE
+    out, err = io.StringIO(), io.StringIO()
+    success = True
+    task_key = re.sub(r"[^\w.-]", "_", str(frame.get("id") or uuid.uuid4().hex))
+    prompt_file = Path(f".boring_run_prompt.{task_key}.md")
+
+    try:
+        os.environ.update(env)
+        if frame.get("max_loops"):
+            settings.MAX_LOOPS = int(frame["max_loops"])
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            _run_one_shot(
+                instruction=frame["prompt"],
+                backend="cli",
+                model=frame.get("model") or settings.DEFAULT_MODEL,
+                command_name="run",
+                prompt_file=prompt_file,
+            )
+    except click.exceptions.Exit as e:
+        success = e.exit_code == 0
+    except SystemExit as e:
+        success = e.code in (0, None)
+    except Exception:
+        success = False
+        err.write(traceback.format_exc())
+    finally:
+        settings.MAX_LOOPS = saved_max_loops
+        settings.PROMPT_FILE = saved_prompt_file
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+    return {
+        "type": "result",
+        "id": frame.get("id"),
+        "success": success,
+        "output": out.getvalue().strip(),
+        "error": None if success else err.getvalue().strip(),
+        "duration_ms": (time.perf_counter() - start) * 1000,
+    }
+
+
+def serve(stdin: BinaryIO, channel: BinaryIO, handler=run_task):
+    """Answer frames from stdin on channel until shutdown or EOF."""
+    tasks = 0
+    write_frame(channel, {"type": "ready", "pid": os.getpid()})
+    while True:
+        frame = read_frame(stdin)
+        if frame is None or frame.get("type") == "shutdown":
+            return
+        kind = frame.get("type")
+        if kind == "ping":
+            write_frame(channel, {"type": "pong", "tasks": tasks})
+        elif kind == "task":
+            result = handler(frame)
+            tasks += 1
+            write_frame(channel, result)
+        else:
+            write_frame(channel, {"type": "error", "error": f"Unknown frame type: {kind}"})
+
+
+def main():
+    # Keep the real stdout for frames; route stray fd-1 writes to stderr
+    channel = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    # Preload everything a task needs so only the first import pays for it
+    import boring.main  # noqa: F401
+    from boring.loop import AgentLoop  # noqa: F401
+    from boring.mcp import tools  # noqa: F401
+
+    serve(sys.stdin.buffer, channel)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,17 @@
-import hashlib
 import json
 import logging
-import threading
-import time
 from dataclasses import asdict
 from pathlib import Path
 
 from .config import settings
+from .fingerprint import get_fingerprint_store
 from .models import VerificationResult
 
 logger = logging.getLogger(__name__)
 
-# =============================================================================
-# Performance: In-memory cache layer with TTL
-# =============================================================================
-_memory_cache: dict[str, tuple[dict, float]] = {}  # hash -> (data, timestamp)
-_MEMORY_CACHE_TTL = 60.0  # 60 seconds
-_cache_lock = threading.RLock()
-
 
 class VerificationCache:
-    """File-hash based verification cache with in-memory layer."""
+    """File-hash based verification cache backed by the shared fingerprint service."""
 
     CACHE_FILENAME = "verification.json"
 
@@ -32,27 +23,9 @@ class VerificationCache:
         self._dirty = False  # Track if cache needs saving
 
     def _file_hash(self, path: Path) -> str:
-        """Calculate SHA256 hash of file content with memory caching."""
+        """SHA256 of file content via the shared stat-keyed fingerprint service."""
         try:
-            # Use file stat for quick change detection
-            stat = path.stat()
-            stat_key = f"{path}:{stat.st_size}:{stat.st_mtime}"
-
-            with _cache_lock:
-                if stat_key in _memory_cache:
-                    cached_hash, cache_time = _memory_cache[stat_key]
-                    if time.time() - cache_time < _MEMORY_CACHE_TTL:
-                        return cached_hash.get("hash", "")
-
-            # Calculate hash
-            file_hash = hashlib.sha256(path.read_bytes()).hexdigest()
-
-            with _cache_lock:
-                _memory_cache[stat_key] = ({"hash": file_hash}, time.time())
-
-            return file_hash
-        except FileNotFoundError:
-            return ""
+            return get_fingerprint_store(self.cache_dir).fingerprint(path) or ""
         except Exception as e:
             logger.warning(f"Failed to hash file {path}: {e}")
             return ""
@@ -110,9 +83,14 @@ class VerificationCache:
         if not updates:
             return
 
+        try:
+            digests = get_fingerprint_store(self.cache_dir).fingerprint_many(updates)
+        except Exception as e:
+            logger.warning(f"Failed to hash files: {e}")
+            digests = {}
         for file_path, result in updates.items():
             rel_path = self._get_rel_path(file_path)
-            current_hash = self._file_hash(file_path)
+            current_hash = digests.get(Path(file_path), "")
             self.cache[rel_path] = {"hash": current_hash, "result": asdict(result)}
 
         self._save()
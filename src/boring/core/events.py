@@ -76,15 +76,134 @@ class LedgerCorruptionError(Exception):
 logger = logging.getLogger(__name__)
 
 
+def _chain_checksum(
+    event_type: str, payload_json: str, session_id: str | None, seq: int, prev_hash: str | None
+) -> str:
+    content_str = f"{event_type}{payload_json}{str(session_id or '')}{seq}{prev_hash}"
+    return hashlib.sha256(content_str.encode()).hexdigest()
+
+
+class LedgerWriter:
+    """
+    Single writer connection for the events table plus the cached chain head.
+
+    The head (seq, checksum) is kept in memory so appends do not SELECT the
+    last event first. It is trusted only while PRAGMA data_version is
+    unchanged, i.e. no other connection (another EventStore, truncate,
+    migration) committed since our last write; otherwise it is reloaded
+    inside the write transaction.
+    """
+
+    def __init__(self, db_path: Path, timeout: float = 5.0):
+        self.db_path = db_path
+        self.timeout = timeout
+        self.lock = threading.RLock()
+        self.commits = 0
+        self.events_written = 0
+        self._conn: sqlite3.Connection | None = None
+        self._head: tuple[int, str | None] | None = None
+        self._data_version: int | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(
+                self.db_path, timeout=self.timeout, isolation_level=None, check_same_thread=False
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL;")
+            self._conn.execute("PRAGMA synchronous=NORMAL;")
+        return self._conn
+
+    def invalidate(self):
+        """Forget the cached head (e.g. after a truncate)."""
+        with self.lock:
+            self._head = None
+
+    def write(self, batch: list[dict[str, Any]]) -> list[tuple[int, str | None, str]]:
+        """
+        Chain and insert a batch of events in one transaction.
+
+        Each item needs id, type, payload, session_id and a float timestamp.
+        Returns (seq, prev_hash, checksum) per item.
+        """
+        with self.lock:
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                version = conn.execute("PRAGMA data_version").fetchone()[0]
+                if self._head is None or version != self._data_version:
+                    row = conn.execute(
+                        "SELECT seq, checksum FROM events ORDER BY seq DESC LIMIT 1"
+                    ).fetchone()
+                    self._head = (row[0], row[1]) if row else (-1, None)
+
+                last_seq, last_checksum = self._head
+                rows = []
+                chained = []
+                for evt_data in batch:
+                    last_seq += 1
+                    payload_json = json.dumps(
+                        evt_data["payload"], sort_keys=True, separators=(",", ":")
+                    )
+                    checksum = _chain_checksum(
+                        evt_data["type"],
+                        payload_json,
+                        evt_data.get("session_id"),
+                        last_seq,
+                        last_checksum,
+                    )
+                    rows.append(
+                        (
+                            evt_data["id"],
+                            evt_data.get("session_id"),
+                            evt_data["type"],
+                            evt_data["timestamp"],
+                            last_checksum,
+                            checksum,
+                            payload_json,
+                            last_seq,
+                        )
+                    )
+                    chained.append((last_seq, last_checksum, checksum))
+                    last_checksum = checksum
+
+                conn.executemany(
+                    """
+                    INSERT INTO events (id, session_id, type, timestamp, prev_hash, checksum, payload, seq)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                self._head = None
+                raise
+
+            self._head = (last_seq, last_checksum)
+            self._data_version = version
+            self.commits += 1
+            self.events_written += len(batch)
+            return chained
+
+    def close(self):
+        with self.lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._head = None
+
+
 class EventWriter(threading.Thread):
     """
     Background worker that drains an event queue and commits to SQLite in batches.
     """
 
-    def __init__(self, db_path: Path, event_queue: queue.Queue):
+    def __init__(self, db_path: Path, event_queue: queue.Queue, ledger: LedgerWriter | None = None):
         super().__init__(name="BoringEventWriter", daemon=True)
         self.db_path = db_path
         self.queue = event_queue
+        self.ledger = ledger or LedgerWriter(db_path, timeout=2.0)
         self.running = True
         self._batch_size = 50
         self._flush_interval = 0.1  # seconds
@@ -121,8 +240,6 @@ class EventWriter(threading.Thread):
         self._done_event.wait(timeout=2.0)
 
     def run(self):
-        import sqlite3
-
         while self.running or not self.queue.empty():
             # RISK-007: Queue Depth Monitoring
             q_depth = self.queue.qsize()
@@ -156,64 +273,17 @@ class EventWriter(threading.Thread):
                 if not batch:
                     continue
 
-                if not batch:
-                    continue
-
                 # Batch Commit with Retry
                 attempt = 0
 
                 while attempt < self.retry_policy.max_retries:
-                    conn = sqlite3.connect(self.db_path, timeout=2.0)
                     try:
-                        with conn:
-                            conn.execute("BEGIN IMMEDIATE")
-                            # 1. Get last seq once for the whole batch
-                            cursor = conn.execute(
-                                "SELECT checksum, seq FROM events ORDER BY seq DESC LIMIT 1"
-                            )
-                            row = cursor.fetchone()
-
-                            last_checksum = row[0] if row else None
-                            last_seq = row[1] if row else -1
-
-                            for evt_data in batch:
-                                last_seq += 1
-
-                                # Recalculate checksum in the writer to ensure strict sequence
-                                # Recalculate checksum in the writer to ensure strict sequence
-                                payload_json = json.dumps(
-                                    evt_data["payload"], sort_keys=True, separators=(",", ":")
-                                )
-                                sess_id = str(evt_data.get("session_id") or "")
-                                content_str = f"{evt_data['type']}{payload_json}{sess_id}{last_seq}{last_checksum}"
-                                checksum = hashlib.sha256(content_str.encode()).hexdigest()
-
-                                conn.execute(
-                                    """
-                                    INSERT INTO events (id, session_id, type, timestamp, prev_hash, checksum, payload, seq)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                                """,
-                                    (
-                                        evt_data["id"],
-                                        evt_data["session_id"],
-                                        evt_data["type"],
-                                        evt_data["timestamp"],
-                                        last_checksum,
-                                        checksum,
-                                        payload_json,
-                                        last_seq,
-                                    ),
-                                )
-                                last_checksum = checksum
-
-                                # Signal completion if it's a synchronous wait
-                                if "future" in evt_data:
-                                    evt_data["result"] = last_seq
-                                    # Defer setting future until after commit
+                        chained = self.ledger.write(batch)
 
                         # Success path: Notify all waiters
-                        for evt_data in batch:
+                        for evt_data, (seq, _, _) in zip(batch, chained, strict=True):
                             if "future" in evt_data:
+                                evt_data["result"] = seq
                                 evt_data["future"].set()
                         break
 
@@ -240,8 +310,6 @@ class EventWriter(threading.Thread):
                                     evt_data["result"] = -1
                                     evt_data["future"].set()
                             break
-                    finally:
-                        conn.close()
 
                 # Always mark task done, whether committed or DLQ'd
                 for _ in range(len(batch)):
@@ -271,9 +339,21 @@ class EventStore:
         self._queue = None
         self._writer = None
 
+        # Single writer connection + cached chain head, shared by both modes
+        self._ledger = LedgerWriter(self.db_path, timeout=2.0 if async_mode else 5.0)
+
+        # Read-only connection used just for PRAGMA data_version (see data_version)
+        self._version_conn: sqlite3.Connection | None = None
+        self._version_lock = threading.Lock()
+
+        # Group commit (sync mode): concurrent appenders share one transaction
+        self._group_cond = threading.Condition()
+        self._group_pending: list[dict[str, Any]] = []
+        self._group_leader = False
+
         if self.async_mode:
             self._queue = queue.Queue(maxsize=10000)
-            self._writer = EventWriter(self.db_path, self._queue)
+            self._writer = EventWriter(self.db_path, self._queue, self._ledger)
             self._writer.start()
             atexit.register(self.close)
 
@@ -297,7 +377,7 @@ class EventStore:
             self._queue = queue.Queue(maxsize=10000)
 
         logger.info("Spawning new EventWriter thread.")
-        self._writer = EventWriter(self.db_path, self._queue)
+        self._writer = EventWriter(self.db_path, self._queue, self._ledger)
         self._writer.start()
 
     def _check_and_migrate(self):
@@ -397,53 +477,67 @@ class EventStore:
             return None, -1
 
         # Synchronous Path (Strict Durability)
+        evt_data = {
+            "id": id,
+            "timestamp": timestamp.timestamp(),
+            "type": event_type,
+            "payload": payload,
+            "session_id": session_id,
+        }
         try:
-            # V14.9 Refactor: Use SQLiteEventStore connection pool!
-            # 1. Get State
-            last_evt = self.store.get_last_event()
-            if last_evt:
-                prev_hash = last_evt["checksum"]
-                last_seq = last_evt["seq"]
-                seq = last_seq + 1
-            else:
-                prev_hash = None
-                seq = 0
-
-            # 2. Compute Checksum
-            sess_id = str(session_id or "")
-            payload_json = json.dumps(payload, sort_keys=True, separators=(",", ":"))
-            content_str = f"{event_type}{payload_json}{sess_id}{seq}{prev_hash}"
-            checksum = hashlib.sha256(content_str.encode()).hexdigest()
-
-            # 3. Write
-            # store.append handles transaction and connection pooling
-            self.store.append(
-                id,
-                timestamp,  # Pass datetime object, store handles it
-                event_type,
-                payload,
-                session_id,
-                prev_hash,
-                checksum,
-            )
-
-            event = BoringEvent(
-                id=id,
-                timestamp=timestamp,
-                type=event_type,
-                payload=payload,
-                session_id=session_id,
-                seq=seq,
-                prev_hash=prev_hash,
-                checksum=checksum,
-            )
-            return event, seq
-
+            seq, prev_hash, checksum = self._group_commit(evt_data)
         except sqlite3.OperationalError as e:
             if "locked" in str(e):
                 logger.warning("EventStore Locked")
-                raise
-            raise e
+            raise
+
+        event = BoringEvent(
+            id=id,
+            timestamp=timestamp,
+            type=event_type,
+            payload=payload,
+            session_id=session_id,
+            seq=seq,
+            prev_hash=prev_hash,
+            checksum=checksum,
+        )
+        return event, seq
+
+    def _group_commit(self, evt_data: dict[str, Any]) -> tuple[int, str | None, str]:
+        """
+        Commit one event, sharing the transaction with concurrent appenders.
+
+        The first caller to arrive becomes the leader and writes everything
+        queued so far in a single transaction; callers that arrive meanwhile
+        wait and are committed together in the leader's next round.
+        """
+        with self._group_cond:
+            self._group_pending.append(evt_data)
+            while "result" not in evt_data and "error" not in evt_data:
+                if self._group_leader:
+                    self._group_cond.wait()
+                    continue
+
+                self._group_leader = True
+                batch, self._group_pending = self._group_pending, []
+                self._group_cond.release()
+                try:
+                    try:
+                        chained = self._ledger.write(batch)
+                        for item, result in zip(batch, chained, strict=True):
+                            item["result"] = result
+                        get_telemetry().counter("eventstore.group_commit", len(batch))
+                    except Exception as e:
+                        for item in batch:
+                            item["error"] = e
+                finally:
+                    self._group_cond.acquire()
+                    self._group_leader = False
+                    self._group_cond.notify_all()
+
+        if "error" in evt_data:
+            raise evt_data["error"]
+        return evt_data["result"]
 
     def flush(self):
         """Wait for all queued events to be committed."""
@@ -528,6 +622,11 @@ class EventStore:
             self.flush()
             self._writer.stop()
             self._writer = None
+        self._ledger.close()
+        with self._version_lock:
+            if self._version_conn is not None:
+                self._version_conn.close()
+                self._version_conn = None
 
     def stream(self, start_offset: int = 0) -> Generator[BoringEvent, None, None]:
         """Yield events. start_offset now means start_seq (Backward compat naming)."""
@@ -545,6 +644,20 @@ class EventStore:
 
             yield BoringEvent(**data)
 
+    def replay(self, start_seq: int = 0) -> Generator[tuple[int, str, datetime, dict], None, None]:
+        """
+        Yield (seq, type, timestamp, payload) for events with seq >= start_seq.
+
+        Lighter than stream(): no BoringEvent model is built per event, which
+        is what state hydration needs.
+        """
+        for seq, event_type, ts, payload in self.store.stream_rows(start_seq):
+            if isinstance(ts, (float, int)):
+                ts = datetime.fromtimestamp(ts)
+            elif isinstance(ts, str):
+                ts = datetime.fromisoformat(ts)
+            yield seq, event_type, ts, json.loads(payload) if isinstance(payload, str) else payload
+
     def _rotate_ledger_locked(self, *args):
         pass  # No-op for SQLite
 
@@ -582,7 +695,9 @@ class EventStore:
             sess_id = str(event.session_id or "")
             payload_json = json.dumps(event.payload, sort_keys=True, separators=(",", ":"))
             content_str = f"{event.type}{payload_json}{sess_id}{event.seq}{event.prev_hash}"
-            recalc = hashlib.sha256(content_str.encode()).hexdigest()
+            recalc = _chain_checksum(
+                event.type, payload_json, event.session_id, event.seq, event.prev_hash
+            )
             if recalc != event.checksum:
                 logger.error(
                     f"CORRUPTION: Checksum mismatch at event {event.id} (seq {event.seq})\n"
@@ -622,11 +737,32 @@ class EventStore:
                     )
         finally:
             conn.close()
+            self._ledger.invalidate()
 
     def getattr_ledger_file(self):
         # Backward compatibility for 'ledger_file' property access if anyone uses it?
         return self.db_path
 
+    @property
+    def data_version(self) -> int | None:
+        """
+        Token that changes whenever the ledger is committed to, by any connection
+        in any process (None if it cannot be read).
+
+        Read on a dedicated connection that never writes, so every commit counts
+        as "another connection" for PRAGMA data_version. Much cheaper than
+        latest_seq, so readers can poll it and query only when it moves.
+        """
+        with self._version_lock:
+            try:
+                if self._version_conn is None:
+                    self._version_conn = sqlite3.connect(
+                        self.db_path, isolation_level=None, check_same_thread=False
+                    )
+                return self._version_conn.execute("PRAGMA data_version").fetchone()[0]
+            except sqlite3.Error:
+                return None
+
     @property
     def latest_seq(self) -> int:
         """Get the sequence number of the last event."""
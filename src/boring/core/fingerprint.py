@@ -0,0 +1,252 @@
+"""
+Shared file fingerprint service.
+
+One SHA-256 per file version for the whole process: every subsystem that needs
+a content hash (RAG index state, verification cache, integrity monitor, backups)
+asks this service, which keeps a persistent (path, mtime_ns, size, ctime_ns,
+inode) -> digest table so unchanged files are never re-read. ctime and inode
+are part of the key because a caller can put mtime back with os.utime(); a
+same-size rewrite or a file swapped in by rename still changes them.
+
+Files modified within the last couple of seconds are hashed but not memoized,
+since a same-size rewrite inside the filesystem's mtime granularity would
+otherwise be invisible ("racily clean" entries).
+"""
+
+import hashlib
+import logging
+import mmap
+import os
+import sqlite3
+import stat
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+DB_FILENAME = "fingerprints.db"
+
+_MMAP_THRESHOLD = 256 * 1024  # Files at least this large are hashed through mmap
+_RACY_WINDOW_NS = 2_000_000_000  # Don't memoize files modified this recently
+_PARALLEL_MIN_FILES = 8  # Below this, hashing inline beats pool overhead
+
+
+def hash_file(path: Path | str) -> str:
+    """SHA-256 hex digest of a file's content (mmap for large files)."""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class FingerprintStore:
+    """
+    Persistent stat-keyed digest cache.
+
+    Usage:
+        store = get_fingerprint_store()
+        digest = store.fingerprint(path)            # None if unreadable
+        digests = store.fingerprint_many(paths)     # {path: digest}
+    """
+
+    def __init__(self, db_path: Path | None = None, max_workers: int | None = None):
+        self.db_path = Path(db_path) if db_path else settings.CACHE_DIR / DB_FILENAME
+        self.max_workers = max_workers or min(8, (os.cpu_count() or 2))
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        # key -> (stat signature, digest); mirrors rows read or written this process
+        self._memo: dict[str, tuple[tuple[int, int, int, int], str]] = {}
+        self.stats = {"hits": 0, "hashed": 0}
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def fingerprint(self, path: Path | str) -> str | None:
+        """Digest of one file, or None if it does not exist or cannot be read."""
+        return self.fingerprint_many([path]).get(Path(path))
+
+    def fingerprint_many(self, paths: Iterable[Path | str]) -> dict[Path, str]:
+        """
+        Digest many files at once.
+
+        Stats every path, answers unchanged files from the table, hashes the rest
+        in a thread pool and records them in one transaction. Missing or
+        unreadable files are left out of the result.
+        """
+        stats: dict[Path, tuple[str, tuple[int, int, int, int]]] = {}
+        for p in paths:
+            path = Path(p)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            stats[path] = (self._key(path), self._signature(st))
+        if not stats:
+            return {}
+
+        result: dict[Path, str] = {}
+        known = self._lookup([key for key, _ in stats.values()])
+        to_hash = []
+        for path, (key, signature) in stats.items():
+            entry = known.get(key)
+            if entry is not None and entry[0] == signature:
+                result[path] = entry[1]
+            else:
+                to_hash.append(path)
+        self.stats["hits"] += len(result)
+
+        if to_hash:
+            if len(to_hash) >= _PARALLEL_MIN_FILES and self.max_workers > 1:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                    digests = list(pool.map(self._safe_hash, to_hash))
+            else:
+                digests = [self._safe_hash(p) for p in to_hash]
+
+            cutoff = time.time_ns() - _RACY_WINDOW_NS
+            rows = []
+            for path, digest in zip(to_hash, digests, strict=True):
+                if digest is None:
+                    continue
+                result[path] = digest
+                key, signature = stats[path]
+                if signature[0] < cutoff:
+                    rows.append((key, signature, digest))
+            self.stats["hashed"] += len(to_hash)
+            self._store(rows)
+
+        return result
+
+    def forget(self, paths: Iterable[Path | str]):
+        """Drop entries (e.g. after deleting files)."""
+        keys = [self._key(Path(p)) for p in paths]
+        with self._lock:
+            for key in keys:
+                self._memo.pop(key, None)
+            try:
+                conn = self._connect()
+                with conn:
+                    conn.executemany(
+                        "DELETE FROM fingerprints WHERE path = ?", [(k,) for k in keys]
+                    )
+            except sqlite3.Error as e:
+                logger.debug(f"Fingerprint cache delete failed: {e}")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return os.path.abspath(path)
+
+    @staticmethod
+    def _signature(st: os.stat_result) -> tuple[int, int, int, int]:
+        return (st.st_mtime_ns, st.st_size, st.st_ctime_ns, st.st_ino)
+
+    @staticmethod
+    def _safe_hash(path: Path) -> str | None:
+        try:
+            return hash_file(path)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Failed to hash file {path}: {e}")
+            return None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(fingerprints)")}
+            if columns and "ctime_ns" not in columns:
+                # Rows from before ctime/inode were recorded; it's only a cache
+                conn.execute("DROP TABLE fingerprints")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS fingerprints (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    ctime_ns INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    digest TEXT NOT NULL
+                ) WITHOUT ROWID
+            """)
+            self._conn = conn
+        return self._conn
+
+    def _lookup(self, keys: list[str]) -> dict[str, tuple[tuple[int, int, int, int], str]]:
+        with self._lock:
+            found = {k: self._memo[k] for k in keys if k in self._memo}
+            missing = [k for k in keys if k not in found]
+            if not missing:
+                return found
+            try:
+                conn = self._connect()
+                # Stay below SQLite's bound-parameter limit
+                for start in range(0, len(missing), 500):
+                    part = missing[start : start + 500]
+                    placeholders = ",".join("?" * len(part))
+                    for key, mtime_ns, size, ctime_ns, inode, digest in conn.execute(
+                        f"SELECT path, mtime_ns, size, ctime_ns, inode, digest FROM fingerprints "
+                        f"WHERE path IN ({placeholders})",
+                        part,
+                    ):
+                        found[key] = self._memo[key] = ((mtime_ns, size, ctime_ns, inode), digest)
+            except sqlite3.Error as e:
+                logger.debug(f"Fingerprint cache read failed: {e}")
+            return found
+
+    def _store(self, rows: list[tuple[str, tuple[int, int, int, int], str]]):
+        if not rows:
+            return
+        with self._lock:
+            for key, signature, digest in rows:
+                self._memo[key] = (signature, digest)
+            try:
+                conn = self._connect()
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO fingerprints "
+                        "(path, mtime_ns, size, ctime_ns, inode, digest) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        [(key, *signature, digest) for key, signature, digest in rows],
+                    )
+            except sqlite3.Error as e:
+                logger.debug(f"Fingerprint cache write failed: {e}")
+
+
+_stores: dict[str, FingerprintStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_fingerprint_store(cache_dir: Path | None = None) -> FingerprintStore:
+    """Shared store for a cache directory (defaults to settings.CACHE_DIR)."""
+    db_path = Path(cache_dir or settings.CACHE_DIR) / DB_FILENAME
+    key = str(db_path)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = FingerprintStore(db_path)
+            _stores[key] = store
+        return store
+
+
+def fingerprint_many(paths: Iterable[Path | str], cache_dir: Path | None = None) -> dict[Path, str]:
+    """Convenience wrapper around the shared store's fingerprint_many()."""
+    return get_fingerprint_store(cache_dir).fingerprint_many(paths)
@@ -333,6 +333,11 @@ class BoringKernel:
 
         # Close StateManager/EventStore if owned
         if hasattr(self, "state_manager") and self.state_manager:
+            if hasattr(self.state_manager, "checkpoint"):
+                try:
+                    self.state_manager.checkpoint()
+                except Exception as e:
+                    logger.debug(f"Final state snapshot failed: {e}")
             if hasattr(self.state_manager, "events") and self.state_manager.events:
                 if hasattr(self.state_manager.events, "close"):
                     self.state_manager.events.close()
@@ -3,12 +3,16 @@ from __future__ import annotations
 import contextlib
 import json
 import logging
+import marshal
+import time
+import zlib
 from collections.abc import Generator
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from boring.core.config import settings
+from boring.core.telemetry import get_telemetry
 from boring.flow.states import FlowStage
 
 if TYPE_CHECKING:
@@ -78,32 +82,64 @@ logger = logging.getLogger(__name__)
 from boring.core.events import EventStore, LedgerCorruptionError
 from boring.utils.lock import RobustLock
 
+# Binary snapshot: magic + format version + flags, then a marshal'd dict of
+# JSON-compatible values (zlib-compressed when settings.COMPRESS_STATE).
+SNAPSHOT_MAGIC = b"BSNAP"
+SNAPSHOT_VERSION = 1
+_FLAG_ZLIB = 0x01
+
 
 class StateManager:
     """
     Manages ProjectState using Event Sourcing with Snapshot Optimization.
-    The State is a projection of the Event Ledger, cached in state.json.
+    The State is a projection of the Event Ledger, cached in state.snap.
+
+    Snapshots are written every `snapshot_every` applied events or
+    `snapshot_interval` seconds (not on every transaction), so hydration
+    replays at most a bounded tail of the ledger.
 
     Architecture Hardening V2: Atomic Transactions & Robust Sync
     """
 
-    def __init__(self, project_root: Path, session_id: str = None):
+    def __init__(
+        self,
+        project_root: Path,
+        session_id: str = None,
+        snapshot_every: int = 100,
+        snapshot_interval: float = 60.0,
+    ):
         self.root = project_root
         from boring.core.config import settings
 
         self.events = EventStore(project_root, async_mode=settings.ASYNC_LEDGER_WRITE)
         self.session_id = session_id
-        self.snapshot_file = self.root / ".boring" / "state.json"
+        self.snapshot_file = self.root / ".boring" / "state.snap"
+        # Pre-binary snapshots (state.json / state.json.gz) are still read once
+        self.legacy_snapshot_file = self.root / ".boring" / "state.json"
         self.lock_file = self.root / ".boring" / "state_lock"
 
         # Robust Global Lock for State Transactions
         self.state_lock = RobustLock(self.lock_file)
 
+        self.snapshot_every = snapshot_every
+        self.snapshot_interval = snapshot_interval
+        self.metrics = {
+            "hydrate_ms": 0.0,
+            "events_replayed": 0,
+            "snapshot_loaded": False,
+            "snapshots_written": 0,
+        }
+
         # Defer hydration until .current is accessed
         self._state = None
 
         # Track last sync to detect disk changes
         self._last_snapshot_mtime = 0.0
+        # Ledger offset covered by the snapshot on disk, and when it was written
+        self._snapshot_offset = -1
+        self._last_snapshot_time = time.monotonic()
+        # events.data_version when the ledger was last checked for new events
+        self._ledger_version: int | None = None
 
     @property
     def current(self) -> Any:
@@ -120,80 +156,123 @@ class StateManager:
             # We do NOT auto-sync here aggressively to avoid read-locks,
             # but we respect _last_snapshot_mtime.
             try:
-                if self.snapshot_file.exists():
-                    mtime = self.snapshot_file.stat().st_mtime
-                    if mtime > self._last_snapshot_mtime:
-                        logger.debug("State snapshot changed on disk, reloading...")
-                        self._state = self._hydrate()
+                mtime = self.snapshot_file.stat().st_mtime
+                if mtime > self._last_snapshot_mtime:
+                    logger.debug("State snapshot changed on disk, reloading...")
+                    self._state = self._hydrate()
+                    return self._state
             except OSError:
                 pass
 
+            # Snapshots are periodic, so also pick up events other processes
+            # appended since (or rebuild if the ledger was truncated under us).
+            # Only query the ledger when something has committed to it.
+            version = self.events.data_version
+            if version is None or version != self._ledger_version:
+                latest = self.events.latest_seq
+                if latest > self._state.ledger_offset:
+                    self._replay(self._state, self._state.ledger_offset + 1)
+                elif latest < self._state.ledger_offset:
+                    self._state = self._hydrate()
+                self._ledger_version = version
+
         return self._state
 
     def _hydrate(self) -> Any:
         """Replay history to build the current state (Optimized)."""
+        started = time.perf_counter()
+        self._ledger_version = self.events.data_version
+
         # 1. Try Load Snapshot
         state = self._load_snapshot()
+        loaded = state is not None
         if not state:
             state = ProjectState()
 
         # 2. Replay Delta (Events after snapshot offset)
         # ledger_offset is now Last Applied Seq.
         last_applied = getattr(state, "ledger_offset", -1)
-        start_seq = last_applied + 1
-
-        # Optimization: Only stream if we are behind
         latest = self.events.latest_seq
-        if latest >= start_seq:
-            try:
-                for event in self.events.stream(start_offset=start_seq):
-                    self._apply_event(state, event)
-                    # Update local tracker of last applied
-                    state.ledger_offset = event.seq
+        if last_applied > latest:
+            # Ledger was truncated below the snapshot (e.g. rollback elsewhere)
+            logger.warning("State snapshot is ahead of the ledger, rebuilding from ledger.")
+            state = ProjectState()
+            last_applied = -1
+            loaded = False
+        self._snapshot_offset = last_applied
 
-            except LedgerCorruptionError:
-                logger.critical("FATAL: Ledger corruption detected. System integrity compromised.")
-                raise
+        # Optimization: Only stream if we are behind
+        replayed = 0
+        if latest > last_applied:
+            replayed = self._replay(state, last_applied + 1)
 
         # In-memory session tracking
         if self.session_id:
             state.session_id = self.session_id
 
+        hydrate_ms = (time.perf_counter() - started) * 1000
+        self.metrics.update(hydrate_ms=hydrate_ms, events_replayed=replayed, snapshot_loaded=loaded)
+        telemetry = get_telemetry()
+        telemetry.gauge("state.hydrate_ms", hydrate_ms, {"snapshot": loaded})
+        telemetry.counter("state.events_replayed", replayed)
+        logger.debug(f"State hydrated in {hydrate_ms:.1f}ms ({replayed} events replayed)")
+
+        # Keep the next cold start bounded
+        if replayed >= self.snapshot_every:
+            self._save_snapshot(state)
+
         return state
 
+    def _replay(self, state: Any, start_seq: int) -> int:
+        """Apply ledger rows with seq >= start_seq straight into the reducer."""
+        count = 0
+        try:
+            for seq, event_type, timestamp, payload in self.events.replay(start_seq):
+                self._apply(state, event_type, payload, timestamp)
+                # Update local tracker of last applied
+                state.ledger_offset = seq
+                count += 1
+        except LedgerCorruptionError:
+            logger.critical("FATAL: Ledger corruption detected. System integrity compromised.")
+            raise
+        return count
+
     def _load_snapshot(self) -> Any | None:
-        """Load state from JSON snapshot. Supports Gzip (V14.1)."""
-        snapshot_gz = self.snapshot_file.with_suffix(".json.gz")
+        """Load state from the binary snapshot, falling back to legacy JSON (or Gzip)."""
+        snapshot_gz = self.legacy_snapshot_file.with_suffix(".json.gz")
 
         target_file = None
-        if snapshot_gz.exists():
-            target_file = snapshot_gz
-        elif self.snapshot_file.exists():
-            target_file = self.snapshot_file
+        for candidate in (self.snapshot_file, snapshot_gz, self.legacy_snapshot_file):
+            if candidate.exists():
+                target_file = candidate
+                break
 
         if not target_file:
             return None
 
         try:
-            if target_file.suffix == ".gz":
-                import gzip
-
-                with gzip.open(target_file, "rt", encoding="utf-8") as f:
-                    content = f.read()
+            if target_file == self.snapshot_file:
+                data = self._decode_snapshot(target_file.read_bytes())
             else:
-                content = target_file.read_text(encoding="utf-8")
+                if target_file.suffix == ".gz":
+                    import gzip
+
+                    with gzip.open(target_file, "rt", encoding="utf-8") as f:
+                        content = f.read()
+                else:
+                    content = target_file.read_text(encoding="utf-8")
 
-            if not content.strip():
-                return None
+                if not content.strip():
+                    return None
 
-            data = json.loads(content)
+                data = json.loads(content)
 
             # Update mtime tracker
             self._last_snapshot_mtime = target_file.stat().st_mtime
 
             return ProjectState(**data)
 
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, ValueError, EOFError, TypeError, zlib.error) as e:
             # CORRUPTION DETECTED
             logger.error(f"CRITICAL: State snapshot corrupted: {e}. Moving to .corrupted")
             try:
@@ -210,48 +289,90 @@ class StateManager:
             logger.critical(f"FATAL: Could not read state snapshot {target_file.name}: {e}")
             raise
 
-    def _save_snapshot(self):
-        """Persist current state to JSON atomically. Supports Gzip (V14.1)."""
+    @staticmethod
+    def _encode_snapshot(data: dict[str, Any], compress: bool) -> bytes:
+        body = marshal.dumps(data)
+        flags = 0
+        if compress:
+            body = zlib.compress(body)
+            flags |= _FLAG_ZLIB
+        return SNAPSHOT_MAGIC + bytes([SNAPSHOT_VERSION, flags]) + body
+
+    @staticmethod
+    def _decode_snapshot(blob: bytes) -> dict[str, Any]:
+        header = len(SNAPSHOT_MAGIC) + 2
+        if len(blob) < header or not blob.startswith(SNAPSHOT_MAGIC):
+            raise ValueError("not a state snapshot")
+        version, flags = blob[len(SNAPSHOT_MAGIC)], blob[len(SNAPSHOT_MAGIC) + 1]
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"unsupported snapshot version {version}")
+        body = blob[header:]
+        if flags & _FLAG_ZLIB:
+            body = zlib.decompress(body)
+        data = marshal.loads(body)
+        if not isinstance(data, dict):
+            raise ValueError("snapshot body is not a mapping")
+        return data
+
+    def _save_snapshot(self, state: Any = None):
+        """Persist state to the binary snapshot atomically."""
+        state = state if state is not None else self._state
         try:
             from boring.core.utils import TransactionalFileWriter
 
-            # model_dump_json is available on the proxied instance
-            data = self._state.model_dump_json(indent=2)
-
-            if settings.COMPRESS_STATE:
-                target = self.snapshot_file.with_suffix(".json.gz")
-                if TransactionalFileWriter.write_gzip(target, data):
-                    # Remove uncompressed if exists for consistency
-                    if self.snapshot_file.exists():
-                        with contextlib.suppress(OSError):
-                            self.snapshot_file.unlink()
-                    self._last_snapshot_mtime = target.stat().st_mtime
-            else:
-                if TransactionalFileWriter.write_text(self.snapshot_file, data):
-                    # Remove compressed if exists for consistency
-                    gz = self.snapshot_file.with_suffix(".json.gz")
-                    if gz.exists():
+            blob = self._encode_snapshot(state.model_dump(mode="json"), settings.COMPRESS_STATE)
+            if TransactionalFileWriter.write_bytes(self.snapshot_file, blob):
+                self._snapshot_offset = state.ledger_offset
+                self._last_snapshot_time = time.monotonic()
+                self._last_snapshot_mtime = self.snapshot_file.stat().st_mtime
+                self.metrics["snapshots_written"] += 1
+                # Legacy JSON snapshots are superseded
+                for legacy in (
+                    self.legacy_snapshot_file,
+                    self.legacy_snapshot_file.with_suffix(".json.gz"),
+                ):
+                    if legacy.exists():
                         with contextlib.suppress(OSError):
-                            gz.unlink()
-                    self._last_snapshot_mtime = self.snapshot_file.stat().st_mtime
+                            legacy.unlink()
 
         except Exception as e:
             logger.warning(f"Failed to save state snapshot: {e}")
             # If we fail to save snapshot, it's bad but not fatal to memory state.
             # Next hydrate will just have to replay more events.
 
+    def _maybe_snapshot(self):
+        """Snapshot if enough events or time have passed since the last one."""
+        state = self._state
+        pending = state.ledger_offset - self._snapshot_offset
+        if pending <= 0:
+            return
+        if (
+            pending >= self.snapshot_every
+            or time.monotonic() - self._last_snapshot_time >= self.snapshot_interval
+            or not self.snapshot_file.exists()
+        ):
+            self._save_snapshot()
+
+    def checkpoint(self):
+        """Write a snapshot now if any events are not yet covered by one."""
+        with self.state_lock:
+            if self._state is not None and self._state.ledger_offset > self._snapshot_offset:
+                self._save_snapshot()
+
     def _apply_event(self, state: Any, event: Any):
         """Reducer: Apply a single event to the state."""
-        payload = event.payload
+        self._apply(state, event.type, event.payload, event.timestamp)
 
-        if event.type == "UserGoalUpdated":
+    def _apply(self, state: Any, event_type: str, payload: dict, timestamp: datetime):
+        """Reducer on raw event fields (used directly by replay)."""
+        if event_type == "UserGoalUpdated":
             state.user_goal = payload.get("goal", "")
             state.has_plan = False
             state.has_tasks = False
             if state.stage in [FlowStage.BUILD, FlowStage.POLISH]:
                 state.stage = FlowStage.DESIGN
 
-        elif event.type == "StageChanged":
+        elif event_type == "StageChanged":
             new_stage = payload.get("stage")
             if isinstance(new_stage, str):
                 try:
@@ -261,7 +382,7 @@ class StateManager:
             else:
                 state.stage = new_stage
 
-        elif event.type == "StateUpdated":
+        elif event_type == "StateUpdated":
             for k, v in payload.items():
                 if k == "stage" and isinstance(v, str):
                     try:
@@ -272,7 +393,7 @@ class StateManager:
                 if hasattr(state, k):
                     setattr(state, k, v)
 
-        elif event.type == "ArtifactCreated":
+        elif event_type == "ArtifactCreated":
             artifact_type = payload.get("type")
             if artifact_type == "constitution":
                 state.has_constitution = True
@@ -281,16 +402,34 @@ class StateManager:
             elif artifact_type == "tasks":
                 state.has_tasks = True
 
-        state.last_updated = event.timestamp
+        state.last_updated = timestamp
 
     def sync(self):
         """
         Forces the state to match disk (snapshot + ledger).
         MUST be called inside a lock to ensure we don't drift immediately.
         """
-        # Always re-hydrate inside a transaction to ensure we are based on strict latest
+        # Cheap path: nobody replaced the snapshot and the ledger only grew,
+        # so replaying the new tail onto the in-memory state is enough.
+        if self._state is not None and not self._snapshot_changed():
+            latest = self.events.latest_seq
+            if latest >= self._state.ledger_offset:
+                if latest > self._state.ledger_offset:
+                    self._replay(self._state, self._state.ledger_offset + 1)
+                return
+
+        # Otherwise re-hydrate to ensure we are based on strict latest
         self._state = self._hydrate()
 
+    def _snapshot_changed(self) -> bool:
+        """True if the snapshot on disk is not the one this manager last read or wrote."""
+        try:
+            mtime = self.snapshot_file.stat().st_mtime
+        except OSError:
+            # Deleted (e.g. rollback by another process) after we had one
+            return self._last_snapshot_mtime > 0
+        return mtime != self._last_snapshot_mtime
+
     @contextlib.contextmanager
     def state_transaction(self) -> Generator[Any, None, None]:
         """
@@ -298,7 +437,7 @@ class StateManager:
         1. Acquires Global State Lock.
         2. Syncs state from disk (Catch up).
         3. Yields State for modification.
-        4. Saves Snapshot.
+        4. Saves a Snapshot if one is due.
         5. Releases Lock.
         """
         # 1. Acquire Lock
@@ -309,10 +448,9 @@ class StateManager:
             # 3. Yield for mutation
             yield self._state
 
-            # 4. Save Snapshot (Atomic Commit of the view)
+            # 4. Save Snapshot (periodically; the ledger already holds the events)
             # Note: actual Events were appended during the mutation (update/set_goal calls)
-            # We just need to save the projection.
-            self._save_snapshot()
+            self._maybe_snapshot()
 
     def update(self, **kwargs):
         """Record a generic state update event."""
@@ -358,21 +496,18 @@ class StateManager:
 
             # 2. Reset in-memory state and cache
             self._state = None
-            if self.snapshot_file.exists():
-                try:
-                    self.snapshot_file.unlink()
-                    logger.info("Rollback: Deleted state snapshot.")
-                except OSError as e:
-                    logger.error(f"Rollback: Failed to delete snapshot: {e}")
-
-            # [V14.8 Fix] Also delete compressed snapshot if exists
-            snapshot_gz = self.snapshot_file.with_suffix(".json.gz")
-            if snapshot_gz.exists():
-                try:
-                    snapshot_gz.unlink()
-                    logger.info("Rollback: Deleted compressed state snapshot.")
-                except OSError as e:
-                    logger.error(f"Rollback: Failed to delete compressed snapshot: {e}")
+            # [V14.8 Fix] Also delete legacy (compressed) snapshots if they exist
+            for snapshot in (
+                self.snapshot_file,
+                self.legacy_snapshot_file,
+                self.legacy_snapshot_file.with_suffix(".json.gz"),
+            ):
+                if snapshot.exists():
+                    try:
+                        snapshot.unlink()
+                        logger.info(f"Rollback: Deleted state snapshot {snapshot.name}.")
+                    except OSError as e:
+                        logger.error(f"Rollback: Failed to delete snapshot: {e}")
 
             # 3. Reload from fresh ledger
             self.sync()
@@ -237,6 +237,20 @@ class SQLiteEventStore:
             for row in rows:
                 yield dict(row)
 
+    def stream_rows(self, start_seq: int = 0) -> Generator[tuple, None, None]:
+        """Stream (seq, type, timestamp, payload_json) tuples where seq >= start_seq."""
+        cursor = self._get_connection().cursor()
+        cursor.row_factory = None
+        cursor.execute(
+            "SELECT seq, type, timestamp, payload FROM events WHERE seq >= ? ORDER BY seq ASC",
+            (start_seq,),
+        )
+        while True:
+            rows = cursor.fetchmany(500)
+            if not rows:
+                break
+            yield from rows
+
     def count(self) -> int:
         conn = self._get_connection()
         return conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
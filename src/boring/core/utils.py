@@ -255,6 +255,48 @@ class TransactionalFileWriter:
             logger.error(f"Atomic text write failed for {file_path}: {e}")
             return False
 
+    @staticmethod
+    def write_bytes(file_path: Path, content: bytes) -> bool:
+        """Write raw bytes to a file atomically."""
+        try:
+            TransactionalFileWriter._validate_path(file_path)
+        except ValueError as e:
+            logger.error(str(e))
+            return False
+
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_fd, temp_path = tempfile.mkstemp(
+            suffix=".tmp", prefix=".boring_", dir=file_path.parent
+        )
+        try:
+            with os.fdopen(temp_fd, "wb") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Atomic replace with retry for Windows lock contention
+            for attempt in range(5):
+                try:
+                    os.replace(temp_path, file_path)
+                    return True
+                except (OSError, PermissionError) as e:
+                    if attempt < 4 and (getattr(e, "errno", 0) == 13 or "WinError 32" in str(e)):
+                        time.sleep(0.2 * (attempt + 1))
+                        continue
+                    raise
+
+            return False
+        except Exception as e:
+            if os.path.exists(temp_path):
+                try:
+                    os.unlink(temp_path)
+                except Exception:
+                    pass
+            logger.error(f"Atomic binary write failed for {file_path}: {e}")
+            return False
+
     @staticmethod
     def write_gzip(file_path: Path, content: str) -> bool:
         """Write a string to a gzipped file atomically (V14.1)."""
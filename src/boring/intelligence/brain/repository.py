@@ -2,13 +2,15 @@
 Pattern Repository Component.
 
 Handles CRUD operations for LearnedPatterns in SQLite.
-Decoupled from Vector Store and Inverted Index logic.
+Embeddings and full-text search live in the same database (see
+SQLiteStorage.search_patterns), so there is no side index to keep in sync.
 """
 
 import json
 import logging
 import shutil
 from pathlib import Path
+from typing import Any
 
 from ...services.storage import create_storage
 from .types import LearnedPattern
@@ -63,8 +65,8 @@ class PatternRepository:
         except Exception as e:
             logger.error(f"Brain migration failed: {e}")
 
-    def save(self, pattern: LearnedPattern):
-        """Save or update a pattern."""
+    def save(self, pattern: LearnedPattern, embedding: Any = None):
+        """Save or update a pattern (with its embedding, if one was computed)."""
         data = {
             "pattern_id": pattern.pattern_id,
             "pattern_type": pattern.pattern_type,
@@ -77,9 +79,18 @@ class PatternRepository:
             "decay_score": pattern.decay_score,
             "session_boost": pattern.session_boost,
             "cluster_id": pattern.cluster_id,
+            "embedding": embedding,
         }
         self.storage.upsert_pattern(data)
 
+    def search(
+        self, query: str, embedding: Any = None, pattern_type: str | None = None, limit: int = 5
+    ) -> list[dict]:
+        """Hybrid (full-text + vector) pattern search in one storage call."""
+        return self.storage.search_patterns(
+            query, embedding=embedding, pattern_type=pattern_type, limit=limit
+        )
+
     def get(self, pattern_id: str) -> LearnedPattern | None:
         """Retrieve a pattern by ID."""
         data = self.storage.get_pattern_by_id(pattern_id)
@@ -8,12 +8,17 @@ import asyncio
 import logging
 from pathlib import Path
 
-from ..embedding_service import get_embedding_service
+from ..embedding_service import get_embedding_engine, get_embedding_service
 from .types import LearnedPattern
 
 logger = logging.getLogger(__name__)
 
 
+def _to_chroma(embedding) -> list[float]:
+    """Chroma < 0.5 only accepts plain lists; convert at the store boundary."""
+    return [float(x) for x in embedding]
+
+
 class VectorSearchEngine:
     """
     Manages vector embeddings and similarity search.
@@ -31,20 +36,9 @@ class VectorSearchEngine:
         # FAISS fallback storage
         self.faiss_patterns = []
 
-        # Legacy local model (for sync fallback)
+        # Explicit model override; by default the shared embedding engine is used
         self.embedding_model = None
 
-    def _init_local_model(self):
-        """Lazy load local embedding model for synchronous fallback."""
-        if self.embedding_model:
-            return
-        try:
-            from sentence_transformers import SentenceTransformer
-
-            self.embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
-        except ImportError:
-            self.embedding_model = None
-
     def _ensure_vector_store(self):
         """Initialize ChromaDB or FAISS."""
         if self.vector_store or self.faiss_index:
@@ -79,21 +73,24 @@ class VectorSearchEngine:
         except ImportError:
             logger.warning("FAISS not found. Semantic search capabilities disabled.")
 
-    async def compute_embedding_async(self, text: str) -> list[float] | None:
-        """Compute embedding using ProcessPool (Non-blocking)."""
+    async def compute_embedding_async(self, text: str):
+        """Compute a float32 embedding via the shared engine (Non-blocking)."""
         service = get_embedding_service()
         return await service.compute_embedding(text)
 
-    def compute_embedding_sync(self, text: str) -> list[float] | None:
-        """Legacy sync embedding (Blocking)."""
-        self._init_local_model()
-        if self.embedding_model:
-            try:
-                return self.embedding_model.encode([text])[0].tolist()
-            except Exception:
+    def compute_embedding_sync(self, text: str):
+        """Compute a float32 embedding (Blocking)."""
+        import numpy as np
+
+        try:
+            if self.embedding_model is not None:
+                return np.asarray(self.embedding_model.encode([text])[0], dtype=np.float32)
+            engine = get_embedding_engine()
+            if not engine.is_available:
                 return None
-        # Fallback: could try to run async via new loop? No, risky.
-        return None
+            return engine.embed_one(text)
+        except Exception:
+            return None
 
     async def add_pattern_async(self, pattern: LearnedPattern):
         """Add pattern asynchronously."""
@@ -103,7 +100,7 @@ class VectorSearchEngine:
 
         # 1. Compute Embedding (Non-blocking)
         embedding = await self.compute_embedding_async(content)
-        if not embedding:
+        if embedding is None:
             logger.warning(f"Could not compute embedding for pattern {pattern.pattern_id}")
             return  # Or proceed without embedding if store supports automatic (blocking)
 
@@ -126,7 +123,7 @@ class VectorSearchEngine:
                         ids=[pattern.pattern_id],
                         documents=[content],
                         metadatas=[metadata],
-                        embeddings=[embedding],
+                        embeddings=[_to_chroma(embedding)],
                     ),
                 )
             elif self.faiss_index:
@@ -144,7 +141,7 @@ class VectorSearchEngine:
 
         content = f"{pattern.description} {pattern.solution} {pattern.context}"
 
-        if not embedding:
+        if embedding is None:
             embedding = self.compute_embedding_sync(content)
 
         metadata = {
@@ -160,9 +157,9 @@ class VectorSearchEngine:
                     ids=[pattern.pattern_id],
                     documents=[content],
                     metadatas=[metadata],
-                    embeddings=[embedding] if embedding else None,
+                    embeddings=[_to_chroma(embedding)] if embedding is not None else None,
                 )
-            elif self.faiss_index and embedding:
+            elif self.faiss_index and embedding is not None:
                 import numpy as np
 
                 vec = np.array([embedding]).astype("float32")
@@ -184,11 +181,11 @@ class VectorSearchEngine:
                 loop = asyncio.get_running_loop()
 
                 # Query using embedding if available, else text
-                if embedding:
+                if embedding is not None:
                     chroma_results = await loop.run_in_executor(
                         None,
                         lambda: self.vector_store.query(
-                            query_embeddings=[embedding], n_results=limit
+                            query_embeddings=[_to_chroma(embedding)], n_results=limit
                         ),
                     )
                 else:
@@ -218,7 +215,7 @@ class VectorSearchEngine:
                             }
                         )
 
-            elif self.faiss_index and embedding:
+            elif self.faiss_index and embedding is not None:
                 import numpy as np
 
                 # FAISS search is CPU bound in C++, fast but technically blocking.
@@ -251,9 +248,9 @@ class VectorSearchEngine:
 
         try:
             if self.vector_store:
-                if embedding:
+                if embedding is not None:
                     chroma_results = self.vector_store.query(
-                        query_embeddings=[embedding], n_results=limit
+                        query_embeddings=[_to_chroma(embedding)], n_results=limit
                     )
                 else:
                     chroma_results = self.vector_store.query(query_texts=[query], n_results=limit)
@@ -280,7 +277,7 @@ class VectorSearchEngine:
                             }
                         )
 
-            elif self.faiss_index and embedding:
+            elif self.faiss_index and embedding is not None:
                 import numpy as np
 
                 # FAISS search
@@ -22,7 +22,6 @@ try:
 except ImportError:
     _clear_thread_local_connection = None
 
-from .brain.index_manager import InvertedIndexManager
 from .brain.repository import PatternRepository
 
 # Re-export types for backward compatibility
@@ -63,7 +62,6 @@ class BrainManager:
         # Initialize Components
         self.repository = PatternRepository(self.project_root, self.log_dir)
         self.vector_engine = VectorSearchEngine(self.brain_dir, self.log_dir)
-        self.index_manager = InvertedIndexManager(self.brain_dir, self.log_dir)
 
         # Legacy Compatibility / Direct Access
         self.patterns_dir = self.brain_dir / "learned_patterns"
@@ -71,7 +69,6 @@ class BrainManager:
         self.adaptations_dir = self.brain_dir / "workflow_adaptations"
 
         self.storage = self.repository.storage
-        self.index = self.index_manager.index
 
         # Locking
         from ..utils.lock import RobustLock
@@ -90,9 +87,6 @@ class BrainManager:
             self.audit = None
 
         self._ensure_structure()
-        self.index_manager.load_from_disk()
-        if not self.index_manager.index.documents:
-            self.index_manager.rebuild(self.repository)
 
         # FAISS/Vector properties delegated to vector_engine
         self.vector_engine._ensure_vector_store()
@@ -197,7 +191,7 @@ class BrainManager:
         )
 
     def get_relevant_patterns(self, query: str, limit: int = 5) -> list[dict]:
-        """Search patterns by query (vector or inverted fallback)."""
+        """Search patterns by query (SQLite FTS5 + vectors, legacy vector store fallback)."""
         if not query or not query.strip():
             patterns = self.repository.get_all(limit=limit)
             return [asdict(p) for p in patterns]
@@ -206,15 +200,15 @@ class BrainManager:
 
     def _get_relevant_patterns_unsafe(self, query: str, limit: int = 5) -> list[dict]:
         """Internal search logic."""
-        results = self.vector_engine.search(query, limit)
-        if results:
-            return results
+        # Primary: hybrid FTS5 + vector search over the pattern table itself
+        if self.storage.get_pattern_count():
+            embedding = self.vector_engine.compute_embedding_sync(query)
+            results = self.repository.search(query, embedding=embedding, limit=limit)
+            if results:
+                return results
 
-        if self.index:
-            results = self.index.search(query, limit=limit)
-            return [r.get("metadata", r) if isinstance(r, dict) else r for r in results]
-
-        return []
+        # Legacy vector stores (external Chroma/FAISS)
+        return self.vector_engine.search(query, limit)
 
     # Add missing methods for tests
     def get_relevant_patterns_embedding(self, context: str, limit: int = 5) -> list[dict]:
@@ -345,19 +339,10 @@ class BrainManager:
         pattern = self._prepare_pattern_object(
             context=context, problem=problem, solution=solution, pattern_type=pattern_type, **kwargs
         )
-        self.repository.save(pattern)
-
-        # Sync to components
-        if self.index_manager:
-            content = f"{pattern.description} {pattern.solution} {pattern.context}"
-            self.index_manager.add_pattern(pattern, content)
-
-        try:
-            from dataclasses import asdict
-
-            self._sync_patterns_to_vector([asdict(pattern)])
-        except Exception:
-            pass  # Vibe check: don't crash on vector sync in tests
+        # The embedding is stored next to the row; FTS5 triggers index the text
+        content = f"{pattern.description} {pattern.solution} {pattern.context}"
+        embedding = self.vector_engine.compute_embedding_sync(content)
+        self.repository.save(pattern, embedding=embedding)
         return pattern
 
     def _load_patterns(self) -> list[dict]:
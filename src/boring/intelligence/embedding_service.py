@@ -1,61 +1,389 @@
 """
 Embedding Service.
 
-Offloads CPU-intensive vector embedding calculations to a separate Process Pool.
-This prevents the main asyncio event loop from blocking during model inference.
-Reference: RISK-004
+One shared embedding engine per model for the whole process. Every embedding
+consumer (RAG local embeddings, Chroma embedding functions, the brain's vector
+engine) goes through it, so each model is loaded once.
+
+- Concurrent requests are coalesced by a batcher thread into micro-batches,
+  one model.encode() call per batch.
+- Vectors are returned as float32 numpy arrays.
+- Vectors are persisted in an on-disk cache keyed by (model, sha256(text)), so
+  re-embedding unchanged content costs no inference.
+- Async callers await a future resolved by the batcher thread, so the event
+  loop never blocks on model inference (RISK-004).
 """
 
 import asyncio
+import hashlib
 import logging
-from concurrent.futures import ProcessPoolExecutor
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
 from typing import Optional
 
+from ..config import settings
+
 logger = logging.getLogger(__name__)
 
-# Global variable to hold the model inside the worker process
-_WORKER_MODEL = None
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+CACHE_FILENAME = "embedding_cache.db"
+
+_MAX_BATCH_SIZE = 64  # Texts per model.encode() call
+_MAX_WAIT_SECONDS = 0.005  # How long the batcher waits for more requests
+
+
+def text_digest(text: str) -> str:
+    """Cache key for a text: sha256 of its UTF-8 bytes."""
+    return hashlib.sha256(text.encode("utf-8", errors="surrogatepass")).hexdigest()
 
 
-def _worker_encode(text: str) -> list[float]:
+class EmbeddingCache:
     """
-    Worker function executed in a separate process.
-    Manages its own SentenceTransformer instance to avoid pickling issues.
+    Persistent (model, sha256(text)) -> float32 vector store.
+
+    Vectors are stored as raw float32 BLOBs in SQLite (WAL), one row per text.
     """
-    global _WORKER_MODEL
-    try:
-        # Lazy import to keep main process startup fast
-        from sentence_transformers import SentenceTransformer
 
-        # Initialize model singleton for this worker process
-        if _WORKER_MODEL is None:
-            # Use a standard lightweight model
-            # Note: First run will download if not cached (~80MB)
-            _WORKER_MODEL = SentenceTransformer("all-MiniLM-L6-v2")
+    def __init__(self, db_path: Path | None = None):
+        self.db_path = Path(db_path) if db_path else settings.CACHE_DIR / CACHE_FILENAME
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    model TEXT NOT NULL,
+                    digest TEXT NOT NULL,
+                    dim INTEGER NOT NULL,
+                    vector BLOB NOT NULL,
+                    PRIMARY KEY (model, digest)
+                ) WITHOUT ROWID
+            """)
+            self._conn = conn
+        return self._conn
 
-        # Compute embedding
-        # encode returns numpy array, need tolist for serialization
-        return _WORKER_MODEL.encode([text])[0].tolist()
+    def get_many(self, model: str, digests: list[str]) -> dict:
+        """Return {digest: float32 vector} for the digests that are cached."""
+        import numpy as np
+
+        found = {}
+        if not digests:
+            return found
+        try:
+            with self._lock:
+                conn = self._connect()
+                # Stay below SQLite's bound-parameter limit
+                for start in range(0, len(digests), 500):
+                    part = digests[start : start + 500]
+                    placeholders = ",".join("?" * len(part))
+                    rows = conn.execute(
+                        f"SELECT digest, vector FROM embeddings "
+                        f"WHERE model = ? AND digest IN ({placeholders})",
+                        [model, *part],
+                    )
+                    for digest, blob in rows:
+                        found[digest] = np.frombuffer(blob, dtype=np.float32)
+        except sqlite3.Error as e:
+            logger.debug(f"Embedding cache read failed: {e}")
+        return found
 
-    except ImportError:
-        # Fallback if library missing
-        raise RuntimeError("sentence-transformers not installed in worker environment.")
-    except Exception as e:
-        logger.error(f"Embedding worker failed: {e}")
-        raise
+    def put_many(self, model: str, items: list[tuple[str, object]]):
+        """Store (digest, vector) pairs for a model."""
+        import numpy as np
+
+        if not items:
+            return
+        rows = []
+        for digest, vector in items:
+            vec = np.ascontiguousarray(vector, dtype=np.float32)
+            rows.append((model, digest, int(vec.shape[0]), vec.tobytes()))
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO embeddings (model, digest, dim, vector) "
+                        "VALUES (?, ?, ?, ?)",
+                        rows,
+                    )
+        except sqlite3.Error as e:
+            logger.debug(f"Embedding cache write failed: {e}")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class EmbeddingEngine:
+    """
+    Shared, batching sentence-transformers model.
+
+    Usage:
+        engine = get_embedding_engine()
+        vectors = engine.embed(["chunk 1", "chunk 2"])  # (2, dim) float32
+        vector = await engine.embed_one_async("query")
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        cache: EmbeddingCache | None = None,
+        max_batch_size: int = _MAX_BATCH_SIZE,
+        max_wait_seconds: float = _MAX_WAIT_SECONDS,
+    ):
+        self.model_name = model_name
+        self.cache = cache
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+
+        self._model = None
+        self._available: bool | None = None
+        self._load_lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        self._batcher: threading.Thread | None = None
+        self._batcher_lock = threading.Lock()
+
+        self.stats = {"requests": 0, "texts": 0, "cache_hits": 0, "encoded": 0, "batches": 0}
+
+    # -------------------------------------------------------------------------
+    # Model
+    # -------------------------------------------------------------------------
+
+    @property
+    def is_available(self) -> bool:
+        """Check if sentence-transformers is installed."""
+        if self._available is None:
+            try:
+                from sentence_transformers import SentenceTransformer  # noqa: F401
+
+                self._available = True
+            except ImportError:
+                logger.debug("sentence-transformers not installed, local embedding unavailable")
+                self._available = False
+        return self._available
+
+    def load(self):
+        """Load the model once (thread-safe). Raises if it cannot be loaded."""
+        if self._model is not None:
+            return self._model
+        with self._load_lock:
+            if self._model is None:
+                if not self.is_available:
+                    raise ImportError(
+                        "sentence-transformers not installed. "
+                        "Run `pip install boring-aicoding[vector]`"
+                    )
+                from sentence_transformers import SentenceTransformer
+
+                logger.info(f"Loading embedding model: {self.model_name}")
+                self._model = SentenceTransformer(self.model_name)
+        return self._model
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._model is not None
+
+    @property
+    def dimensions(self) -> int | None:
+        if self._model is None:
+            return None
+        try:
+            return int(self._model.get_sentence_embedding_dimension())
+        except Exception:
+            return None
+
+    def unload(self):
+        """Drop the model to free memory; it is reloaded on the next request."""
+        with self._load_lock:
+            self._model = None
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def submit(self, texts: list[str]) -> Future:
+        """
+        Queue texts for embedding; the future resolves to a (len(texts), dim)
+        float32 array. Cached texts never reach the model.
+        """
+        import numpy as np
+
+        future: Future = Future()
+        texts = list(texts)
+        self.stats["requests"] += 1
+        self.stats["texts"] += len(texts)
+        if not texts:
+            future.set_result(np.zeros((0, self.dimensions or 0), dtype=np.float32))
+            return future
+
+        digests = [text_digest(t) for t in texts]
+        cached = self.cache.get_many(self.model_name, list(set(digests))) if self.cache else {}
+        self.stats["cache_hits"] += sum(1 for d in digests if d in cached)
+        if len(cached) == len(set(digests)):
+            future.set_result(np.stack([cached[d] for d in digests]))
+            return future
+
+        self._ensure_batcher()
+        self._queue.put((texts, digests, cached, future))
+        return future
+
+    def embed(self, texts: list[str]):
+        """Blocking embed; returns a (len(texts), dim) float32 array."""
+        return self.submit(texts).result()
+
+    def embed_one(self, text: str):
+        """Blocking embed of a single text; returns a (dim,) float32 array."""
+        return self.embed([text])[0]
+
+    async def embed_async(self, texts: list[str]):
+        """Awaitable embed that never blocks the event loop on inference."""
+        return await asyncio.wrap_future(self.submit(texts))
+
+    async def embed_one_async(self, text: str):
+        return (await self.embed_async([text]))[0]
+
+    def shutdown(self):
+        """Stop the batcher thread (it restarts on the next request)."""
+        with self._batcher_lock:
+            if self._batcher is not None:
+                self._queue.put(None)
+                self._batcher.join(timeout=2.0)
+                self._batcher = None
+
+    # -------------------------------------------------------------------------
+    # Micro-batching
+    # -------------------------------------------------------------------------
+
+    def _ensure_batcher(self):
+        with self._batcher_lock:
+            if self._batcher is None or not self._batcher.is_alive():
+                self._batcher = threading.Thread(
+                    target=self._batch_loop, name=f"embedding-{self.model_name}", daemon=True
+                )
+                self._batcher.start()
+
+    def _batch_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            pending = [item]
+            size = len(item[0])
+            deadline = time.monotonic() + self.max_wait_seconds
+            # Coalesce whatever else arrives within the wait window
+            while size < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._run_batch(pending)
+                    return
+                pending.append(item)
+                size += len(item[0])
+            self._run_batch(pending)
+
+    def _run_batch(self, pending: list[tuple]):
+        """Encode the unique uncached texts of all pending requests in one call."""
+        import numpy as np
+
+        to_encode: dict[str, str] = {}
+        for texts, digests, cached, _future in pending:
+            for text, digest in zip(texts, digests, strict=True):
+                if digest not in cached:
+                    to_encode.setdefault(digest, text)
+
+        try:
+            encoded: dict = {}
+            if to_encode:
+                model = self.load()
+                vectors = model.encode(
+                    list(to_encode.values()),
+                    batch_size=self.max_batch_size,
+                    show_progress_bar=False,
+                    convert_to_numpy=True,
+                )
+                vectors = np.asarray(vectors, dtype=np.float32)
+                encoded = dict(zip(to_encode, vectors, strict=True))
+                self.stats["encoded"] += len(encoded)
+                self.stats["batches"] += 1
+                if self.cache:
+                    self.cache.put_many(self.model_name, list(encoded.items()))
+        except Exception as e:
+            logger.warning(f"Embedding batch failed: {e}")
+            for *_, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for _texts, digests, cached, future in pending:
+            rows = [cached[d] if d in cached else encoded[d] for d in digests]
+            if not future.done():
+                future.set_result(np.stack(rows))
+
+
+_engines: dict[str, EmbeddingEngine] = {}
+_engines_lock = threading.Lock()
+_shared_cache: EmbeddingCache | None = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Process-wide persistent embedding cache."""
+    global _shared_cache
+    with _engines_lock:
+        if _shared_cache is None:
+            _shared_cache = EmbeddingCache()
+        return _shared_cache
+
+
+def get_embedding_engine(model_name: str | None = None) -> EmbeddingEngine:
+    """Get the shared engine for a sentence-transformers model name."""
+    model_name = model_name or DEFAULT_EMBEDDING_MODEL
+    cache = get_embedding_cache()
+    with _engines_lock:
+        engine = _engines.get(model_name)
+        if engine is None:
+            engine = EmbeddingEngine(model_name, cache=cache)
+            _engines[model_name] = engine
+        return engine
+
+
+def reset_embedding_engines():
+    """Stop and forget all shared engines and the shared cache (tests, reconfiguration)."""
+    global _shared_cache
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+        cache, _shared_cache = _shared_cache, None
+    for engine in engines:
+        engine.shutdown()
+    if cache is not None:
+        cache.close()
 
 
 class EmbeddingService:
     """
-    Manages a pool of worker processes for embedding calculation.
+    Async facade over the shared embedding engine.
     """
 
     _instance: Optional["EmbeddingService"] = None
 
-    def __init__(self, max_workers: int = 2):
-        self.max_workers = max_workers
-        self._pool = ProcessPoolExecutor(max_workers=max_workers)
-        logger.info(f"Initialized EmbeddingService with {max_workers} workers.")
+    def __init__(self, model_name: str | None = None):
+        self.engine = get_embedding_engine(model_name)
 
     @classmethod
     def get_instance(cls) -> "EmbeddingService":
@@ -64,21 +392,28 @@ class EmbeddingService:
             cls._instance = cls()
         return cls._instance
 
-    async def compute_embedding(self, text: str) -> list[float] | None:
+    async def compute_embedding(self, text: str):
         """
-        Asynchronously compute embedding for text.
+        Asynchronously compute a float32 embedding for text.
         Returns None if computation fails.
         """
-        loop = asyncio.get_running_loop()
         try:
-            return await loop.run_in_executor(self._pool, _worker_encode, text)
+            return await self.engine.embed_one_async(text)
         except Exception as e:
             logger.warning(f"Failed to compute embedding: {e}")
             return None
 
+    async def compute_embeddings(self, texts: list[str]):
+        """Asynchronously embed many texts as one (n, dim) array, or None on failure."""
+        try:
+            return await self.engine.embed_async(texts)
+        except Exception as e:
+            logger.warning(f"Failed to compute embeddings: {e}")
+            return None
+
     def shutdown(self):
-        """Shutdown the process pool."""
-        self._pool.shutdown(wait=False)
+        """Stop the engine's batcher thread."""
+        self.engine.shutdown()
 
 
 # Convenience global access
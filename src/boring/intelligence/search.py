@@ -3,11 +3,17 @@ Semantic Search Module for Boring V10.23 (True Implementation)
 
 Provides a lightweight, pure-Python search index ("Inverted Index")
 to enable semantic-ish retrieval without heavy dependencies like torch/numpy.
+
+Postings store (doc_id -> term frequency) and the BM25 statistics are kept as
+running totals. Top-k queries use MaxScore pruning: terms are visited from the
+highest score upper bound down, and the scan stops once the remaining terms
+cannot lift an unseen document into the current top k.
 """
 
+import heapq
 import math
 import re
-from collections import Counter, defaultdict
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -69,20 +75,36 @@ class Document:
     doc_id: str
     content: str
     metadata: dict[str, Any] = field(default_factory=dict)
-    tokens: list[str] = field(default_factory=list)
+    length: int = 0  # Token count
 
 
 class InvertedIndex:
     """
     A persistent-capable Inverted Index for keyword-based semantic search.
-    Implements a simplified BM25 scoring algorithm.
+    Implements BM25 scoring with MaxScore top-k pruning.
+
+    Usage:
+        index = InvertedIndex()
+        index.add_document("p1", "retry the request with backoff")
+        index.search("request retry", limit=5)
     """
 
+    # BM25 constants
+    K1 = 1.5
+    B = 0.75
+
     def __init__(self):
         self.documents: dict[str, Document] = {}
-        self.index: dict[str, set[str]] = defaultdict(set)  # token -> set of doc_ids
+        self.index: dict[str, dict[str, int]] = {}  # token -> {doc_id: tf}
         self.doc_lengths: dict[str, int] = {}
-        self.avg_doc_length: float = 0.0
+        self.total_length = 0
+        # Score upper-bound inputs; may be stale in the safe direction (max high, min low)
+        self._max_tf: dict[str, int] = {}
+        self._min_length = 0
+
+    @property
+    def avg_doc_length(self) -> float:
+        return self.total_length / len(self.documents) if self.documents else 0.0
 
     def tokenize(self, text: str) -> list[str]:
         """Simple tokenizer: lowercase, remove non-alphanumeric, remove stops."""
@@ -97,121 +119,137 @@ class InvertedIndex:
 
     def add_document(self, doc_id: str, content: str, metadata: dict | None = None):
         """Add or update a document in the index."""
-        tokens = self.tokenize(content)
-
-        # Remove old if exists
         if doc_id in self.documents:
             self._remove_document_from_index(doc_id)
 
-        doc = Document(doc_id=doc_id, content=content, metadata=metadata or {}, tokens=tokens)
-
-        self.documents[doc_id] = doc
-        self.doc_lengths[doc_id] = len(tokens)
+        term_freqs = Counter(self.tokenize(content))
+        length = sum(term_freqs.values())
+        self.documents[doc_id] = Document(
+            doc_id=doc_id, content=content, metadata=metadata or {}, length=length
+        )
+        self.doc_lengths[doc_id] = length
+        self.total_length += length
+        self._min_length = length if len(self.documents) == 1 else min(self._min_length, length)
 
-        # Index tokens
-        for token in set(tokens):  # Unique tokens for index
-            self.index[token].add(doc_id)
+        for token, tf in term_freqs.items():
+            self.index.setdefault(token, {})[doc_id] = tf
+            if tf > self._max_tf.get(token, 0):
+                self._max_tf[token] = tf
 
-        self._update_stats()
+    def remove_document(self, doc_id: str):
+        """Remove a document (no-op if unknown)."""
+        self._remove_document_from_index(doc_id)
 
     def _remove_document_from_index(self, doc_id: str):
         """Helper to clear a doc from index before update."""
-        if doc_id not in self.documents:
+        doc = self.documents.pop(doc_id, None)
+        if doc is None:
             return
 
-        old_tokens = set(self.documents[doc_id].tokens)
-        for token in old_tokens:
-            if doc_id in self.index[token]:
-                self.index[token].remove(doc_id)
-                if not self.index[token]:
+        self.total_length -= self.doc_lengths.pop(doc_id, 0)
+        for token in set(self.tokenize(doc.content)):
+            postings = self.index.get(token)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
                     del self.index[token]
-
-    def _update_stats(self):
-        """Update global stats for BM25."""
-        if not self.doc_lengths:
-            self.avg_doc_length = 0
-            return
-        self.avg_doc_length = sum(self.doc_lengths.values()) / len(self.doc_lengths)
+                    self._max_tf.pop(token, None)
 
     def search(self, query: str, limit: int = 5) -> list[dict[str, Any]]:
         """
         Search for documents matching query.
-        Returns list of {"doc_id": str, "score": float, "document": Document}
+        Returns list of {"doc_id": str, "score": float, "content": str, "metadata": dict}
         """
-        query_tokens = self.tokenize(query)
-        if not query_tokens:
+        query_tokens = [t for t in dict.fromkeys(self.tokenize(query)) if t in self.index]
+        if not query_tokens or limit <= 0:
             return []
 
-        scores: Counter = Counter()
-
-        # BM25 Constants
-        k1 = 1.5
-        b = 0.75
-        N = len(self.documents)
+        n_docs = len(self.documents)
+        avg_length = self.avg_doc_length or 1.0
+        k1, b = self.K1, self.B
 
+        # (upper bound, idf, postings) per term, best bound first
+        terms = []
         for token in query_tokens:
-            if token not in self.index:
-                continue
-
-            doc_ids = self.index[token]
-            df = len(doc_ids)  # Document Frequency
-
-            # IDF Calculation
-            idf = math.log((N - df + 0.5) / (df + 0.5) + 1)
-
-            for doc_id in doc_ids:
-                tf = self.documents[doc_id].tokens.count(token)  # Term Frequency
-                doc_len = self.doc_lengths[doc_id]
-
-                # BM25 Score term
-                term_score = (
-                    idf
-                    * (tf * (k1 + 1))
-                    / (tf + k1 * (1 - b + b * (doc_len / self.avg_doc_length)))
-                )
-                scores[doc_id] += term_score
+            postings = self.index[token]
+            df = len(postings)
+            idf = math.log((n_docs - df + 0.5) / (df + 0.5) + 1)
+            max_tf = self._max_tf.get(token, 1)
+            bound = (
+                idf
+                * (max_tf * (k1 + 1))
+                / (max_tf + k1 * (1 - b + b * self._min_length / avg_length))
+            )
+            terms.append((bound, idf, postings))
+        terms.sort(key=lambda term: term[0], reverse=True)
+
+        # remaining[i]: best possible score from terms[i:]
+        remaining = [0.0] * (len(terms) + 1)
+        for i in range(len(terms) - 1, -1, -1):
+            remaining[i] = remaining[i + 1] + terms[i][0]
+
+        top: list[tuple[float, str]] = []  # min-heap of (score, doc_id)
+        seen: set[str] = set()
+        for i, (_, _, postings) in enumerate(terms):
+            if len(top) == limit and remaining[i] <= top[0][0]:
+                break  # No unseen document can make the top k
+            for doc_id in postings:
+                if doc_id in seen:
+                    continue
+                seen.add(doc_id)
+                # Earlier terms never contain doc_id, so its score comes from terms[i:]
+                doc_length = self.doc_lengths[doc_id]
+                norm = k1 * (1 - b + b * doc_length / avg_length)
+                score = 0.0
+                for j in range(i, len(terms)):
+                    if len(top) == limit and score + remaining[j] <= top[0][0]:
+                        score = -1.0
+                        break
+                    tf = terms[j][2].get(doc_id)
+                    if tf:
+                        score += terms[j][1] * (tf * (k1 + 1)) / (tf + norm)
+                if score < 0:
+                    continue
+                if len(top) < limit:
+                    heapq.heappush(top, (score, doc_id))
+                elif score > top[0][0]:
+                    heapq.heapreplace(top, (score, doc_id))
 
         # Format results
         results = []
-        for doc_id, score in scores.most_common(limit):
+        for score, doc_id in sorted(top, key=lambda item: (-item[0], item[1])):
+            doc = self.documents[doc_id]
             results.append(
                 {
                     "doc_id": doc_id,
                     "score": round(score, 4),
-                    "content": self.documents[doc_id].content,
-                    "metadata": self.documents[doc_id].metadata,
+                    "content": doc.content,
+                    "metadata": doc.metadata,
                 }
             )
 
         return results
 
     def to_dict(self) -> dict[str, Any]:
-        """Serialize index to a dictionary."""
+        """Serialize index documents to a dictionary (postings are derived on load)."""
         return {
             "documents": {
-                k: {
-                    "doc_id": v.doc_id,
-                    "content": v.content,
-                    "metadata": v.metadata,
-                    "tokens": v.tokens,
-                }
+                k: {"doc_id": v.doc_id, "content": v.content, "metadata": v.metadata}
                 for k, v in self.documents.items()
-            },
-            "index": {k: list(v) for k, v in self.index.items()},
-            "doc_lengths": self.doc_lengths,
-            "avg_doc_length": self.avg_doc_length,
+            }
         }
 
     def from_dict(self, data: dict[str, Any]):
-        """Hydrate index from a dictionary."""
-        self.documents = {k: Document(**v) for k, v in data.get("documents", {}).items()}
-        self.index = defaultdict(set, {k: set(v) for k, v in data.get("index", {}).items()})
-        self.doc_lengths = data.get("doc_lengths", {})
-        self.avg_doc_length = data.get("avg_doc_length", 0.0)
+        """Hydrate index from a dictionary (also accepts the legacy format with token lists)."""
+        self.clear()
+        for k, v in data.get("documents", {}).items():
+            self.add_document(v.get("doc_id", k), v.get("content", ""), v.get("metadata"))
 
     def clear(self):
         """Wipe the index."""
         self.documents.clear()
         self.index.clear()
         self.doc_lengths.clear()
-        self.avg_doc_length = 0.0
+        self.total_length = 0
+        self._max_tf.clear()
+        self._min_length = 0
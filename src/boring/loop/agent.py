@@ -189,14 +189,18 @@ class StatefulAgentLoop:
 
                 retriever = create_rag_retriever(ctx.project_root)
 
-                def on_file_change():
+                def on_files_changed(paths):
                     try:
-                        retriever.build_index(incremental=True)
-                        log_status(ctx.log_dir, "INFO", "[RAG] Incremental index complete")
+                        count = retriever.update_files(paths)
+                        log_status(
+                            ctx.log_dir,
+                            "INFO",
+                            f"[RAG] Re-indexed {len(paths)} changed files ({count} chunks)",
+                        )
                     except Exception as e:
                         log_status(ctx.log_dir, "WARN", f"[RAG] Re-index failed: {e}")
 
-                self._rag_watcher.start(on_change=on_file_change)
+                self._rag_watcher.start(on_files_changed=on_files_changed)
                 log_status(ctx.log_dir, "INFO", "[RAG] File watcher started")
             except ImportError:
                 log_status(ctx.log_dir, "WARN", "[RAG] Watcher disabled (chromadb not installed)")
@@ -51,6 +51,9 @@ class LoopContext:
     verbose: bool = False
     interactive: bool = False
     verification_level: str = "STANDARD"
+    # "changes": verify the loop's change set (+ dependents) each iteration and
+    # sweep the whole project only on exit; "project": full sweep every iteration
+    verification_scope: str = "changes"
     project_root: Path = field(default_factory=lambda: settings.PROJECT_ROOT)
     log_dir: Path = field(default_factory=lambda: settings.LOG_DIR)
     prompt_file: Path = field(default_factory=lambda: settings.PROJECT_ROOT / settings.PROMPT_FILE)
@@ -5,6 +5,10 @@ This state is responsible for:
 1. Syntax checking
 2. Linting (ruff)
 3. Testing (pytest) if FULL mode
+
+Each iteration verifies only the files the loop touched plus their dependents
+(and, in FULL mode, the tests selected for them). The full-project sweep runs
+when the loop is about to exit or when verification_scope is "project".
 """
 
 from ...circuit import record_loop_result
@@ -43,7 +47,14 @@ class VerifyingState(LoopState):
             return StateResult.SUCCESS
 
         # Run verification
-        passed, error_msg = context.verifier.verify_project(context.verification_level)
+        if self._use_change_scope(context):
+            changed = context.files_modified + context.files_created
+            log_status(
+                context.log_dir, "INFO", f"Change-scoped verification of {len(changed)} files"
+            )
+            passed, error_msg = context.verifier.verify_changes(changed, context.verification_level)
+        else:
+            passed, error_msg = context.verifier.verify_project(context.verification_level)
 
         context.verification_passed = passed
         context.verification_error = error_msg
@@ -68,6 +79,15 @@ class VerifyingState(LoopState):
 
             return StateResult.FAILURE
 
+    def _use_change_scope(self, context: LoopContext) -> bool:
+        """Scope to the change set unless a full sweep is requested or the loop is ending."""
+        if context.verification_scope != "changes":
+            return False
+        if not (context.files_modified or context.files_created):
+            # Nothing recorded (e.g. the patcher could not report paths): be safe
+            return False
+        return not (context.should_exit or self._check_plan_complete(context))
+
     def next_state(self, context: LoopContext, result: StateResult) -> LoopState | None:
         """Determine next state based on verification result."""
         # Record telemetry
@@ -3,7 +3,10 @@
 """
 Atomic Transaction Management for Boring V11.0.
 
-Provides Git-based snapshot and rollback capabilities for safe code changes.
+Provides snapshot and rollback capabilities for safe code changes. Checkpoints
+record only the paths Git reports as changed in a content-addressed store, so
+start() and rollback() cost O(changed files) instead of stashing and cleaning
+the whole working tree.
 
 V11.0 Enhancements:
 - Exponential backoff retry mechanism for Windows file locking
@@ -13,10 +16,11 @@ V11.0 Enhancements:
 
 import logging
 import os
+import re
 import subprocess
 import sys
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from functools import wraps
@@ -25,12 +29,20 @@ from typing import TypeVar
 
 from rich.console import Console
 
+from ..paths import get_boring_path
+from ..services.checkpoint_store import CheckpointStore
+
 console = Console()
 logger = logging.getLogger(__name__)
 
 # Type variable for generic retry decorator
 T = TypeVar("T")
 
+CHECKPOINT_KIND = "transaction"
+_GIT_PATHSPEC_CHUNK = 200  # Paths per git invocation, well below argv limits
+_C_ESCAPE = re.compile(rb"\\([0-7]{3}|.)")
+_C_ESCAPE_CHARS = {b"t": b"\t", b"n": b"\n", b"r": b"\r", b'"': b'"', b"\\": b"\\"}
+
 
 class WindowsFileLockError(Exception):
     """Raised when a file is locked by another process on Windows."""
@@ -216,15 +228,16 @@ class TransactionState:
 
     transaction_id: str
     started_at: datetime
-    commit_hash: str  # Git commit or stash reference
+    commit_hash: str  # Git commit, or stash reference for pre-checkpoint transactions
     description: str
     files_changed: list[str] = field(default_factory=list)
     is_active: bool = True
+    checkpoint_id: str = ""  # CheckpointStore id holding the changed files at start
 
 
 class TransactionManager:
     """
-    Manages atomic transactions using Git snapshots.
+    Manages atomic transactions using checkpoints of Git's changed files.
 
     Provides:
     - start() - Create a checkpoint before making changes
@@ -236,6 +249,15 @@ class TransactionManager:
         self.project_root = Path(project_root)
         self.state_file = self.project_root / ".boring_transaction"
         self.current_transaction: TransactionState | None = None
+        self._store: CheckpointStore | None = None
+
+    @property
+    def store(self) -> CheckpointStore:
+        """Checkpoint store shared with loop backups (.boring/backups/cas)."""
+        if self._store is None:
+            backups = get_boring_path(self.project_root, "backups", create=False, warn_legacy=False)
+            self._store = CheckpointStore(backups / "cas")
+        return self._store
 
     def _run_git(self, args: list[str], with_retry: bool = False) -> tuple[bool, str]:
         """
@@ -302,14 +324,21 @@ class TransactionManager:
         error_lower = error_message.lower()
         return any(indicator.lower() in error_lower for indicator in lock_indicators)
 
-    def _check_file_locks_before_operation(self) -> dict:
+    def _check_file_locks_before_operation(self, paths: Iterable[str]) -> dict:
         """
         Check for file locks before performing rollback operation.
 
+        Args:
+            paths: Project-relative paths the rollback is about to touch
+
         Returns:
             Dict with status and any locked files found
         """
-        locked_files = FileLockDetector.find_locked_files(self.project_root)
+        locked_files = [
+            file_path
+            for file_path in (self.project_root / rel for rel in dict.fromkeys(paths))
+            if file_path.is_file() and FileLockDetector.is_file_locked(file_path)
+        ]
 
         if locked_files:
             # Attempt to wait for files to unlock
@@ -327,25 +356,90 @@ class TransactionManager:
 
         return {"status": "ok", "locked_files": []}
 
+    def _warn_if_locked(self, paths: Iterable[str]):
+        """V11.0: Log (but proceed past) locked files among the paths about to be reverted."""
+        lock_check = self._check_file_locks_before_operation(paths)
+        if lock_check["status"] == "warning":
+            logger.warning(
+                f"Proceeding with rollback despite locked files: {lock_check['locked_files']}"
+            )
+
     def _get_current_commit(self) -> str:
         """Get current HEAD commit hash."""
         success, output = self._run_git(["rev-parse", "HEAD"])
         return output if success else ""
 
     def _get_changed_files(self) -> list[str]:
-        """Get list of uncommitted changed files."""
-        success, output = self._run_git(["status", "--porcelain"])
+        """Get list of uncommitted changed files (relative to project_root)."""
+        return [path for _, path in self._get_status_entries()]
+
+    def _get_status_entries(self) -> list[tuple[str, str]]:
+        """
+        (status code, project-relative path) for each changed or untracked file.
+
+        Renames yield both the old and the new path. Boring's own state and
+        backup directories are never part of a transaction.
+        """
+        success, output = self._run_git(
+            ["status", "--porcelain", "--untracked-files=all", "--", "."]
+        )
         if not success or not output:
             return []
-        res = []
+        repo_root = self._repo_root()
+        entries = []
         for line in output.split("\n"):
-            if line:
-                res.append(line[3:])
-        return res
+            if not line:
+                continue
+            # _run_git strips output, which eats the leading blank of " M path"
+            if line[2:3] == " ":
+                code, path = line[:2], line[3:]
+            else:
+                code, path = " " + line[:1], line[2:]
+            paths = path.split(" -> ") if code[0] in "RC" and " -> " in path else [path]
+            for p in paths:
+                rel = self._project_rel(repo_root, self._unquote(p))
+                if rel is not None and not self._is_boring_internal(rel):
+                    entries.append((code, rel))
+        return entries
+
+    @staticmethod
+    def _is_boring_internal(rel: str) -> bool:
+        top = rel.split("/", 1)[0]
+        return top == ".boring" or top.startswith(".boring_")
+
+    def _repo_root(self) -> Path:
+        """Nearest ancestor holding .git (porcelain paths are relative to it)."""
+        for candidate in (self.project_root, *self.project_root.parents):
+            if (candidate / ".git").exists():
+                return candidate
+        return self.project_root
+
+    def _project_rel(self, repo_root: Path, path: str) -> str | None:
+        if repo_root == self.project_root:
+            return path
+        try:
+            return (repo_root / path).relative_to(self.project_root).as_posix()
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _unquote(path: str) -> str:
+        """Undo git's C-style quoting of unusual file names."""
+        if not (len(path) >= 2 and path[0] == '"' and path[-1] == '"'):
+            return path
+
+        def unescape(m: re.Match) -> bytes:
+            seq = m.group(1)
+            return bytes([int(seq, 8)]) if len(seq) == 3 else _C_ESCAPE_CHARS.get(seq, seq)
+
+        raw = _C_ESCAPE.sub(unescape, path[1:-1].encode("utf-8"))
+        return raw.decode("utf-8", errors="surrogateescape")
 
     def start(self, description: str = "Boring transaction") -> dict:
         """
-        Start a new transaction by creating a Git checkpoint.
+        Start a new transaction by checkpointing the files Git reports as changed.
+
+        Clean files need no copy: their checkpoint is the HEAD commit.
 
         Args:
             description: Description of the transaction
@@ -372,14 +466,12 @@ class TransactionManager:
         commit_hash = self._get_current_commit()
         changed_files = self._get_changed_files()
 
-        # Create stash if there are uncommitted changes
-        stash_ref = None
-        if changed_files:
-            success, output = self._run_git(
-                ["stash", "push", "-m", f"boring-transaction-{datetime.now().isoformat()}"]
+        try:
+            checkpoint_id = self.store.create_checkpoint(
+                self.project_root, changed_files, kind=CHECKPOINT_KIND, label=description
             )
-            if success:
-                stash_ref = "stash@{0}"
+        except OSError as e:
+            return {"status": "error", "message": f"Failed to create checkpoint: {e}"}
 
         # Generate transaction ID
         transaction_id = f"tx-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
@@ -388,10 +480,11 @@ class TransactionManager:
         self.current_transaction = TransactionState(
             transaction_id=transaction_id,
             started_at=datetime.now(),
-            commit_hash=stash_ref or commit_hash,
+            commit_hash=commit_hash,
             description=description,
             files_changed=changed_files,
             is_active=True,
+            checkpoint_id=checkpoint_id,
         )
 
         # Save state to file
@@ -401,7 +494,8 @@ class TransactionManager:
             "status": "success",
             "transaction_id": transaction_id,
             "checkpoint": commit_hash,
-            "files_stashed": len(changed_files) if stash_ref else 0,
+            "files_checkpointed": len(changed_files),
+            "files_stashed": len(changed_files),  # Pre-checkpoint name, kept for callers
             "message": "Transaction started. Use rollback to revert if needed.",
         }
 
@@ -417,8 +511,11 @@ class TransactionManager:
 
         transaction_id = self.current_transaction.transaction_id
 
-        # Clear the stash if we created one
-        if self.current_transaction.commit_hash.startswith("stash"):
+        # Drop the checkpoint (blobs are reclaimed by backup GC)
+        if self.current_transaction.checkpoint_id:
+            self.store.delete_checkpoint(self.current_transaction.checkpoint_id)
+        # Clear the stash if a pre-checkpoint version created one
+        elif self.current_transaction.commit_hash.startswith("stash"):
             self._run_git(["stash", "drop", "stash@{0}"])
 
         # Mark transaction as complete
@@ -447,83 +544,182 @@ class TransactionManager:
             return {"status": "error", "message": "No active transaction to rollback"}
 
         transaction_id = self.current_transaction.transaction_id
-        checkpoint = self.current_transaction.commit_hash
 
-        # V11.0: Check for file locks before operation
-        lock_check = self._check_file_locks_before_operation()
-        if lock_check["status"] == "warning":
-            logger.warning(
-                f"Proceeding with rollback despite locked files: {lock_check['locked_files']}"
-            )
+        try:
+            if self.current_transaction.checkpoint_id:
+                return self._rollback_checkpoint(transaction_id)
+            return self._rollback_git(transaction_id)
+        except Exception as e:
+            logger.error(f"Rollback encountered an unexpected error: {e}")
+            return {
+                "status": "error",
+                "transaction_id": transaction_id,
+                "message": f"Rollback failed with error: {e}",
+            }
 
-        # Track rollback progress for graceful recovery
-        rollback_state = {"checkout_done": False, "clean_done": False, "restore_done": False}
+    def _rollback_checkpoint(self, transaction_id: str) -> dict:
+        """
+        Revert only what changed: paths dirty at start come back from the
+        checkpoint store, other changed tracked paths from the start commit,
+        and files created since start are deleted.
+        """
+        tx = self.current_transaction
+        rollback_state = {"head_restored": False, "tracked_restored": False, "restore_done": False}
 
-        try:
-            # Discard all current changes (with retry for file locks)
-            success, output = self._run_git(["checkout", "--", "."], with_retry=True)
+        # Commits made during the transaction: move HEAD back, keep the working tree
+        head = self._get_current_commit()
+        if tx.commit_hash and head and head != tx.commit_hash:
+            success, output = self._run_git(
+                ["reset", "--mixed", "-q", tx.commit_hash], with_retry=True
+            )
             if not success:
                 return {
                     "status": "error",
                     "transaction_id": transaction_id,
-                    "message": f"Failed to checkout: {output}",
+                    "message": f"Failed to reset to checkpoint commit: {output}",
                     "partial_state": rollback_state,
                 }
-            rollback_state["checkout_done"] = True
+        rollback_state["head_restored"] = True
 
-            success, output = self._run_git(["clean", "-fd"], with_retry=True)
+        manifest = self.store.load_checkpoint(tx.checkpoint_id)
+        if manifest is None:
+            return {
+                "status": "error",
+                "transaction_id": transaction_id,
+                "message": f"Checkpoint {tx.checkpoint_id} is missing; nothing was reverted.",
+                "partial_state": rollback_state,
+            }
+        checkpointed = set(manifest["entries"])
+
+        tracked, created = [], []
+        for code, path in self._get_status_entries():
+            if path in checkpointed:
+                continue
+            (created if code == "??" else tracked).append(path)
+        self._warn_if_locked([*tracked, *created, *checkpointed])
+
+        source = tx.commit_hash or "HEAD"
+        for start in range(0, len(tracked), _GIT_PATHSPEC_CHUNK):
+            chunk = tracked[start : start + _GIT_PATHSPEC_CHUNK]
+            success, output = self._run_git(
+                ["restore", f"--source={source}", "--staged", "--worktree", "--", *chunk],
+                with_retry=True,
+            )
             if not success:
-                logger.warning(f"Clean operation had issues: {output}")
-            rollback_state["clean_done"] = True
-
-            # Restore stashed changes if applicable
-            if checkpoint.startswith("stash"):
-                success, output = self._run_git(["stash", "pop"], with_retry=True)
-                if not success:
-                    # Attempt graceful recovery: try stash apply instead
-                    success, output = self._run_git(["stash", "apply", "stash@{0}"])
-                    if success:
-                        # Apply worked, drop the stash
-                        self._run_git(["stash", "drop", "stash@{0}"])
-                    else:
-                        return {
-                            "status": "partial",
-                            "transaction_id": transaction_id,
-                            "message": f"Rolled back but stash restore failed: {output}. "
-                            "Your changes are still in the stash.",
-                            "partial_state": rollback_state,
-                        }
-                rollback_state["restore_done"] = True
-            else:
-                # Hard reset to the commit (with retry)
-                success, output = self._run_git(["reset", "--hard", checkpoint], with_retry=True)
-                if not success:
-                    return {
-                        "status": "partial",
-                        "transaction_id": transaction_id,
-                        "message": f"Reset failed: {output}",
-                        "partial_state": rollback_state,
-                    }
-                rollback_state["restore_done"] = True
+                return {
+                    "status": "error",
+                    "transaction_id": transaction_id,
+                    "message": f"Failed to restore tracked files: {output}",
+                    "partial_state": rollback_state,
+                }
+        rollback_state["tracked_restored"] = True
 
-            # Clear transaction
-            self.current_transaction.is_active = False
-            self._clear_state()
+        for path in created:
+            self._remove_created(path)
 
+        report = self.store.restore_checkpoint(tx.checkpoint_id)
+        if not report.ok:
+            # Keep the transaction (and checkpoint) so rollback can be retried
             return {
-                "status": "success",
+                "status": "partial",
                 "transaction_id": transaction_id,
-                "message": "Transaction rolled back. All changes since start() have been reverted.",
+                "message": f"Rolled back but could not restore: {', '.join(report.failed)}",
+                "partial_state": rollback_state,
             }
+        rollback_state["restore_done"] = True
 
-        except Exception as e:
-            logger.error(f"Rollback encountered an unexpected error: {e}")
+        self.store.delete_checkpoint(tx.checkpoint_id)
+        tx.is_active = False
+        self._clear_state()
+
+        return {
+            "status": "success",
+            "transaction_id": transaction_id,
+            "files_reverted": len(tracked)
+            + len(created)
+            + len(report.restored)
+            + len(report.removed),
+            "message": "Transaction rolled back. All changes since start() have been reverted.",
+        }
+
+    def _remove_created(self, rel_path: str):
+        """Delete a file created during the transaction, and any directories it emptied."""
+        path = self.project_root / rel_path
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return
+        parent = path.parent
+        while parent != self.project_root and self.project_root in parent.parents:
+            try:
+                parent.rmdir()
+            except OSError:
+                break
+            parent = parent.parent
+
+    def _rollback_git(self, transaction_id: str) -> dict:
+        """Rollback for transactions started before checkpoints (stash or commit)."""
+        checkpoint = self.current_transaction.commit_hash
+
+        # Track rollback progress for graceful recovery
+        rollback_state = {"checkout_done": False, "clean_done": False, "restore_done": False}
+        self._warn_if_locked(self.current_transaction.files_changed)
+
+        # Discard all current changes (with retry for file locks)
+        success, output = self._run_git(["checkout", "--", "."], with_retry=True)
+        if not success:
             return {
                 "status": "error",
                 "transaction_id": transaction_id,
-                "message": f"Rollback failed with error: {e}",
+                "message": f"Failed to checkout: {output}",
                 "partial_state": rollback_state,
             }
+        rollback_state["checkout_done"] = True
+
+        success, output = self._run_git(["clean", "-fd"], with_retry=True)
+        if not success:
+            logger.warning(f"Clean operation had issues: {output}")
+        rollback_state["clean_done"] = True
+
+        # Restore stashed changes if applicable
+        if checkpoint.startswith("stash"):
+            success, output = self._run_git(["stash", "pop"], with_retry=True)
+            if not success:
+                # Attempt graceful recovery: try stash apply instead
+                success, output = self._run_git(["stash", "apply", "stash@{0}"])
+                if success:
+                    # Apply worked, drop the stash
+                    self._run_git(["stash", "drop", "stash@{0}"])
+                else:
+                    return {
+                        "status": "partial",
+                        "transaction_id": transaction_id,
+                        "message": f"Rolled back but stash restore failed: {output}. "
+                        "Your changes are still in the stash.",
+                        "partial_state": rollback_state,
+                    }
+            rollback_state["restore_done"] = True
+        else:
+            # Hard reset to the commit (with retry)
+            success, output = self._run_git(["reset", "--hard", checkpoint], with_retry=True)
+            if not success:
+                return {
+                    "status": "partial",
+                    "transaction_id": transaction_id,
+                    "message": f"Reset failed: {output}",
+                    "partial_state": rollback_state,
+                }
+            rollback_state["restore_done"] = True
+
+        # Clear transaction
+        self.current_transaction.is_active = False
+        self._clear_state()
+
+        return {
+            "status": "success",
+            "transaction_id": transaction_id,
+            "message": "Transaction rolled back. All changes since start() have been reverted.",
+        }
 
     def status(self) -> dict:
         """Get current transaction status."""
@@ -553,6 +749,7 @@ class TransactionManager:
                 "description": self.current_transaction.description,
                 "files_changed": self.current_transaction.files_changed,
                 "is_active": self.current_transaction.is_active,
+                "checkpoint_id": self.current_transaction.checkpoint_id,
             }
             self.state_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
 
@@ -570,6 +767,7 @@ class TransactionManager:
                     description=data["description"],
                     files_changed=data.get("files_changed", []),
                     is_active=data.get("is_active", True),
+                    checkpoint_id=data.get("checkpoint_id", ""),
                 )
             except Exception:
                 self.current_transaction = None
@@ -622,6 +622,11 @@ def run(
     multi_agent: bool = typer.Option(
         False, "--multi-agent", "-M", help="Enable Multi-Agent Orchestration"
     ),
+    prompt_file: Path | None = typer.Option(
+        None,
+        "--prompt-file",
+        help="Temporary prompt file to use (give concurrent runs distinct files)",
+    ),
 ):
     """
     Execute a single instruction immediately (One-Shot Mode).
@@ -637,6 +642,7 @@ def run(
         self_heal=self_heal,
         multi_agent=multi_agent,
         command_name="run",
+        prompt_file=prompt_file,
     )
 
 
@@ -652,10 +658,14 @@ def _run_one_shot(
     multi_agent: bool = False,
     command_name: str | None = None,
     context_files: list[str] = None,
+    prompt_file: Path | None = None,
 ):
     """
     Helper to run a one-shot autonomous loop with a specific instruction.
     Injects context awareness (session memory).
+
+    prompt_file: where the generated prompt is written (and removed afterwards);
+    concurrent runs in one project must each pass their own.
     """
     from datetime import datetime
 
@@ -687,7 +697,7 @@ def _run_one_shot(
         raise typer.Exit(code=1)
 
     # Create temporary prompt file
-    tmp_prompt = Path(".boring_run_prompt.md")
+    tmp_prompt = Path(prompt_file or ".boring_run_prompt.md")
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     # Use the full_instruction which includes context
@@ -1933,8 +1943,13 @@ def rag_index(
         True, "--incremental/--full", "-i/-F", help="Incremental indexing (default)"
     ),
     project: str = typer.Option(None, "--project", "-p", help="Explicit project root path"),
+    workers: int = typer.Option(
+        None, "--workers", "-w", help="Parser processes for chunking (default: auto, 1 = serial)"
+    ),
 ):
     """Index the codebase for RAG retrieval."""
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
+
     from boring.rag import create_rag_retriever
 
     root = Path(project) if project else settings.PROJECT_ROOT
@@ -1949,7 +1964,24 @@ def rag_index(
     if force:
         incremental = False
 
-    count = retriever.build_index(force=force, incremental=incremental)
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("{task.completed}/{task.total}"),
+        transient=True,
+    ) as progress:
+        task_id = progress.add_task("Indexing files...", total=None)
+
+        def _on_progress(done: int, total: int) -> None:
+            progress.update(task_id, completed=done, total=total)
+
+        count = retriever.build_index(
+            force=force,
+            incremental=incremental,
+            workers=workers,
+            progress_callback=_on_progress,
+        )
     stats = retriever.get_stats()
 
     if stats.index_stats:
@@ -1960,6 +1992,16 @@ def rag_index(
         console.print(T("rag_index_functions", count=idx.functions))
         console.print(T("rag_index_classes", count=idx.classes))
         console.print(T("rag_index_script_chunks", count=getattr(idx, "script_chunks", 0)))
+        if getattr(idx, "elapsed_seconds", 0):
+            console.print(
+                T(
+                    "rag_index_throughput",
+                    seconds=f"{idx.elapsed_seconds:.1f}",
+                    workers=idx.workers,
+                    files_per_sec=f"{idx.files_per_second:.1f}",
+                    chunks_per_sec=f"{idx.chunks_per_second:.1f}",
+                )
+            )
     else:
         console.print(T("rag_index_built", count=count))
 
@@ -0,0 +1,90 @@
+# Copyright 2026 Boring for Gemini Authors
+# SPDX-License-Identifier: Apache-2.0
+"""
+Multi-pattern keyword matcher (Aho-Corasick) for the tool router.
+
+All keywords (English and CJK alike) are compiled into one automaton, so
+finding every keyword in a query is a single pass over its characters instead
+of one substring search per keyword.
+"""
+
+from collections import deque
+from collections.abc import Iterable
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same character class as the regex ``\\w`` for str patterns."""
+    return ch.isalnum() or ch == "_"
+
+
+def _at_word_boundary(text: str, pos: int) -> bool:
+    """Whether the regex ``\\b`` matches at `pos`."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over a fixed keyword set.
+
+    Usage:
+        automaton = KeywordAutomaton(["search", "搜尋", "save as"])
+        automaton.scan("please search the code")  # {0: True}
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: list[str] = list(dict.fromkeys(p for p in patterns if p))
+        self.index = {pattern: i for i, pattern in enumerate(self.patterns)}
+
+        # Trie
+        self._goto: list[dict[str, int]] = [{}]
+        self._output: list[tuple[int, ...]] = [()]
+        for pattern_id, pattern in enumerate(self.patterns):
+            node = 0
+            for ch in pattern:
+                child = self._goto[node].get(ch)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto[node][ch] = child
+                    self._goto.append({})
+                    self._output.append(())
+                node = child
+            self._output[node] += (pattern_id,)
+
+        # Failure links (breadth-first); outputs inherit their failure node's outputs
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(ch, 0)
+                self._output[child] += self._output[self._fail[child]]
+
+    def scan(self, text: str) -> dict[int, bool]:
+        """
+        Find every pattern occurring in `text`.
+
+        Returns:
+            pattern id -> True if some occurrence is delimited by word
+            boundaries (as ``re.search(rf"\\b{pattern}\\b", text)`` would find)
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        found: dict[int, bool] = {}
+        node = 0
+        for end, ch in enumerate(text, start=1):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for pattern_id in output[node]:
+                if found.get(pattern_id):
+                    continue
+                start = end - len(self.patterns[pattern_id])
+                found[pattern_id] = _at_word_boundary(text, start) and _at_word_boundary(text, end)
+        return found
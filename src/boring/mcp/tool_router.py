@@ -26,11 +26,14 @@ V14.0 Enhancement:
 - BORING_ENABLE_CONTEXT7=false disables Context7 routing
 """
 
+import itertools
 import logging
 import re
 from collections.abc import Callable
 from dataclasses import dataclass, field
 
+from .keyword_automaton import KeywordAutomaton
+
 # V14.0: Import unified environment settings
 try:
     from ..core.environment import is_extension_enabled
@@ -735,6 +738,64 @@ TOOL_CATEGORIES = {
 }
 
 
+# V10.31: Global Safety Checkpoint Boost
+# Category name -> [(score, keywords)]; each entry counts once if any keyword matches
+CATEGORY_BOOSTS = {
+    "Git & Version Control": [
+        (
+            10.0,
+            [
+                "checkpoint",
+                "還原",
+                "回退",
+                "存檔",
+                "rollback",
+                "revert",
+                "restore",
+                "save as",
+            ],
+        )
+    ],
+}
+
+# Tool-specific keywords for selecting a tool within its category
+# Tool name -> [(score, keywords)]; each entry counts once if any keyword matches
+TOOL_BOOSTS = {
+    "boring_checkpoint": [
+        (3.0, ["checkpoint", "save", "save as", "存檔", "備份"]),
+        # V10.31: Specific Cross-Keyword Boost (high boost for specific checkpoint intent)
+        (
+            5.0,
+            [
+                "checkpoint",
+                "restore",
+                "rollback",
+                "revert",
+                "save",
+                "還原",
+                "回退",
+                "存檔",
+                "救命",
+                "還原到",
+                "回退到",
+                "建立",
+                "標記",
+                "狀態",
+                "備份",
+                "清單",
+                "列表",
+                "叫做",
+                "叫作",
+            ],
+        ),
+    ],
+    "boring_evaluation_metrics": [(2.0, ["metrics", "指標", "數據"])],
+    "boring_bias_report": [(2.0, ["bias", "偏見", "報告"])],
+    "boring_generate_rubric": [(2.0, ["rubric", "量表", "標準"])],
+    "boring_commit": [(2.0, ["commit", "提交", "推送", "push"])],  # Direct commit intent
+}
+
+
 class ToolRouter:
     """
     Smart router that directs natural language requests to appropriate tools.
@@ -788,6 +849,50 @@ class ToolRouter:
 
             self.categories[cat_name] = category
 
+        self._compile_keyword_tables()
+
+    def _compile_keyword_tables(self) -> None:
+        """
+        Compile every routing keyword into one automaton.
+
+        Each pattern carries the score rules it feeds:
+        - category rules (category, slot, score, word-boundary bonus)
+        - tool rules (category, tool, slot, score)
+        A slot is one scoring term; keywords of an "any of" list share a slot,
+        so the term counts once however many of them match.
+        """
+        category_rules: dict[str, list[tuple[str, int, float, float]]] = {}
+        tool_rules: dict[str, list[tuple[str, str, int, float]]] = {}
+
+        for cat_name, category in self.categories.items():
+            slots = itertools.count()
+            # 長關鍵字獲得更高權重 (Vibe Coder 友善): base score + length bonus,
+            # plus a bonus for an exact (English) word match
+            for keyword in category.keywords:
+                rule = (cat_name, next(slots), 1.0 + len(keyword) / 5, 0.5)
+                category_rules.setdefault(keyword, []).append(rule)
+            # Tool name matching (if user mentions specific tool)
+            for tool in category.tools:
+                rule = (cat_name, next(slots), 2.0, 0.0)
+                category_rules.setdefault(tool.replace("boring_", ""), []).append(rule)
+            for score, keywords in CATEGORY_BOOSTS.get(category.name, []):
+                slot = next(slots)
+                for keyword in keywords:
+                    category_rules.setdefault(keyword, []).append((cat_name, slot, score, 0.0))
+
+            for tool in category.tools:
+                slots = itertools.count()
+                for word in tool.replace("boring_", "").split("_"):
+                    tool_rules.setdefault(word, []).append((cat_name, tool, next(slots), 1.0))
+                for score, keywords in TOOL_BOOSTS.get(tool, []):
+                    slot = next(slots)
+                    for keyword in keywords:
+                        tool_rules.setdefault(keyword, []).append((cat_name, tool, slot, score))
+
+        self._automaton = KeywordAutomaton([*category_rules, *tool_rules])
+        self._category_rules = [category_rules.get(p, []) for p in self._automaton.patterns]
+        self._tool_rules = [tool_rules.get(p, []) for p in self._automaton.patterns]
+
     def route(self, query: str) -> RoutingResult:
         """
         Route a natural language query to the appropriate tool.
@@ -800,12 +905,11 @@ class ToolRouter:
         """
         query_lower = query.lower()
 
+        # One pass over the query finds every keyword of every category
+        matches = self._automaton.scan(query_lower)
+
         # Score each category
-        category_scores: dict[str, float] = {}
-        for cat_name, category in self.categories.items():
-            score = self._score_category(query_lower, category)
-            if score > 0:
-                category_scores[cat_name] = score
+        category_scores = self._score_categories(matches)
 
         if not category_scores:
             # Default to RAG search for unknown queries
@@ -822,7 +926,7 @@ class ToolRouter:
         category = self.categories[best_cat[0]]
 
         # Select best tool within category
-        best_tool = self._select_tool_in_category(query_lower, category)
+        best_tool = self._select_tool_in_category(best_cat[0], matches)
 
         # Extract parameters from query
         params = self._extract_params(query, best_tool)
@@ -895,111 +999,46 @@ class ToolRouter:
 
         return min(score, 1.0)
 
-    def _score_category(self, query: str, category: ToolCategory) -> float:
-        """Score how well a query matches a category."""
+    @staticmethod
+    def _sum_slots(slots: dict[int, tuple[float, float]]) -> float:
+        """Add up matched scoring terms in table order."""
         score = 0.0
-
-        # Keyword matching
-        # 長關鍵字獲得更高權重 (Vibe Coder 友善)
-        for keyword in category.keywords:
-            if keyword in query:
-                # 基礎分數 + 長度加成（複合詞優先）
-                length_bonus = len(keyword) / 5  # 長關鍵字權重更高
-                score += 1.0 + length_bonus
-
-                # Bonus for exact word match (英文)
-                if re.search(rf"\b{keyword}\b", query):
-                    score += 0.5
-
-        # Tool name matching (if user mentions specific tool)
-        for tool in category.tools:
-            tool_short = tool.replace("boring_", "")
-            if tool_short in query:
-                score += 2.0
-
-        # V10.31: Global Safety Checkpoint Boost
-        if category.name == "Git & Version Control" and any(
-            kw in query
-            for kw in [
-                "checkpoint",
-                "還原",
-                "回退",
-                "存檔",
-                "rollback",
-                "revert",
-                "restore",
-                "save as",
-            ]
-        ):
-            score += 10.0
-
+        for slot in sorted(slots):
+            base, bonus = slots[slot]
+            score += base
+            if bonus:
+                score += bonus
         return score
 
-    def _select_tool_in_category(self, query: str, category: ToolCategory) -> str:
+    def _score_categories(self, matches: dict[int, bool]) -> dict[str, float]:
+        """Score every category that has a matching keyword (positive scores only)."""
+        hits: dict[str, dict[int, tuple[float, float]]] = {}
+        for pattern_id, on_word_boundary in matches.items():
+            for cat_name, slot, score, bonus in self._category_rules[pattern_id]:
+                hits.setdefault(cat_name, {})[slot] = (score, bonus if on_word_boundary else 0.0)
+
+        category_scores: dict[str, float] = {}
+        for cat_name in self.categories:
+            if cat_name in hits:
+                score = self._sum_slots(hits[cat_name])
+                if score > 0:
+                    category_scores[cat_name] = score
+        return category_scores
+
+    def _select_tool_in_category(self, cat_name: str, matches: dict[int, bool]) -> str:
         """Select the best tool within a category."""
+        category = self.categories[cat_name]
         if len(category.tools) == 1:
             return category.tools[0]
 
+        hits: dict[str, dict[int, tuple[float, float]]] = {}
+        for pattern_id in matches:
+            for rule_cat, tool, slot, score in self._tool_rules[pattern_id]:
+                if rule_cat == cat_name:
+                    hits.setdefault(tool, {})[slot] = (score, 0.0)
+
         # Score each tool
-        tool_scores = {}
-        for tool in category.tools:
-            score = 0.0
-            tool_words = tool.replace("boring_", "").split("_")
-
-            for word in tool_words:
-                if word in query:
-                    score += 1.0
-
-            # Additional tool-specific keyword mapping for selection
-            if tool == "boring_checkpoint":
-                if any(kw in query for kw in ["checkpoint", "save", "save as", "存檔", "備份"]):
-                    score += 3.0
-
-            # V10.31: Specific Cross-Keyword Boost
-            if tool == "boring_checkpoint":
-                if any(
-                    kw in query
-                    for kw in [
-                        "checkpoint",
-                        "restore",
-                        "rollback",
-                        "revert",
-                        "save",
-                        "還原",
-                        "回退",
-                        "存檔",
-                        "救命",
-                        "還原到",
-                        "回退到",
-                        "建立",
-                        "標記",
-                        "狀態",
-                        "備份",
-                        "清單",
-                        "列表",
-                        "叫做",
-                        "叫作",
-                    ]
-                ):
-                    score += 5.0  # High boost for specific checkpoint intent
-
-            if tool == "boring_evaluation_metrics":
-                if any(kw in query for kw in ["metrics", "指標", "數據"]):
-                    score += 2.0
-
-            if tool == "boring_bias_report":
-                if any(kw in query for kw in ["bias", "偏見", "報告"]):
-                    score += 2.0
-
-            if tool == "boring_generate_rubric":
-                if any(kw in query for kw in ["rubric", "量表", "標準"]):
-                    score += 2.0
-
-            if tool == "boring_commit":
-                if any(kw in query for kw in ["commit", "提交", "推送", "push"]):
-                    score += 2.0  # Boost for direct commit intent
-
-            tool_scores[tool] = score
+        tool_scores = {tool: self._sum_slots(hits.get(tool, {})) for tool in category.tools}
 
         # Return best scoring tool, or first if no matches
         if all(s == 0 for s in tool_scores.values()):
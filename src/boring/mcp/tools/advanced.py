@@ -163,8 +163,8 @@ def boring_transaction(
     Manage atomic transactions with Git checkpoints.
 
     Actions:
-    - start: Create a checkpoint (stash changes)
-    - commit: Confirm changes (drop stash)
+    - start: Create a checkpoint (snapshot changed files)
+    - commit: Confirm changes (drop checkpoint)
     - rollback: Revert code to checkpoint
     - status: Check if a transaction is active
     """
@@ -1,4 +1,7 @@
+import inspect
 import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Annotated, Any
 
 from pydantic import Field
@@ -9,147 +12,310 @@ from ..instance import MCP_AVAILABLE, mcp
 
 logger = logging.getLogger(__name__)
 
+# Whole-string argument values of the form "$steps.<id>[.<key>...]" are replaced
+# by (part of) that step's result, e.g. "$steps.search.output.data"
+STEP_REF_PREFIX = "$steps."
+DEFAULT_MAX_PARALLEL = 4
+
+
+def _step_refs(value: Any) -> set[str]:
+    """Step ids referenced anywhere inside an args value."""
+    if isinstance(value, str) and value.startswith(STEP_REF_PREFIX):
+        return {value[len(STEP_REF_PREFIX) :].split(".", 1)[0]}
+    if isinstance(value, dict):
+        return set().union(*(_step_refs(v) for v in value.values()))
+    if isinstance(value, list):
+        return set().union(*(_step_refs(v) for v in value))
+    return set()
+
+
+def _resolve_refs(value: Any, results_by_id: dict[str, dict]) -> Any:
+    """Substitute step references with values from earlier results."""
+    if isinstance(value, str) and value.startswith(STEP_REF_PREFIX):
+        step_id, _, path = value[len(STEP_REF_PREFIX) :].partition(".")
+        current: Any = results_by_id[step_id]
+        for key in path.split(".") if path else []:
+            if isinstance(current, list):
+                current = current[int(key)]
+            elif isinstance(current, dict):
+                current = current[key]
+            else:
+                raise KeyError(f"Cannot resolve '{key}' in {value}")
+        return current
+    if isinstance(value, dict):
+        return {k: _resolve_refs(v, results_by_id) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_resolve_refs(v, results_by_id) for v in value]
+    return value
+
+
+def _execute_step(i: int, tool_name: str | None, args: Any, registry: dict) -> dict:
+    """Run one step and describe the outcome (never raises)."""
+    if not tool_name:
+        return {"step": i, "status": "error", "message": "Missing 'tool' name in step definition."}
+
+    # Look up tool
+    tool_def = registry.get(tool_name)
+    if not tool_def:
+        return {
+            "step": i,
+            "tool": tool_name,
+            "status": "error",
+            "message": f"Tool '{tool_name}' not found in registry.",
+        }
+
+    try:
+        # FastMCP Tool object has a .fn callable. Calling it directly bypasses
+        # FastMCP's JSON-RPC validation, but the tool's own @audited wrapper and
+        # Shadow Mode checks still run for every step.
+        func = tool_def.fn
+
+        if inspect.iscoroutinefunction(func):
+            return {
+                "step": i,
+                "tool": tool_name,
+                "status": "error",
+                "message": f"Async tool '{tool_name}' execution not supported in sync batch.",
+            }
+
+        try:
+            # If args is not a dict, this will fail.
+            if not isinstance(args, dict):
+                raise ValueError("Args must be a dictionary")
+
+            output = func(**args)
+
+            # Tools return BoringResult (dict) or plain value
+            return {"step": i, "tool": tool_name, "status": "success", "output": output}
+
+        except Exception as e:
+            # Execution error (inside tool)
+            return {
+                "step": i,
+                "tool": tool_name,
+                "status": "failure",  # Tool ran but threw exception
+                "error": str(e),
+            }
+
+    except Exception as e:
+        # System error
+        return {"step": i, "tool": tool_name, "status": "system_error", "error": str(e)}
+
+
+def _timed_step(i: int, tool_name: str | None, args: Any, registry: dict, t0: float) -> dict:
+    start = time.perf_counter()
+    result = _execute_step(i, tool_name, args, registry)
+    end = time.perf_counter()
+    result["started_ms"] = round((start - t0) * 1000, 2)
+    result["duration_ms"] = round((end - start) * 1000, 2)
+    return result
+
+
+def _plan_dependencies(
+    steps: list[dict[str, Any]], parallel: bool
+) -> tuple[list[str], list[set[int]], list[set[int]], dict[int, str]]:
+    """
+    Work out what each step waits for.
+
+    Returns (ids, order_deps, data_deps, errors):
+    - order_deps: steps that must finish first (data deps, plus the previous
+      step for sequential steps without depends_on)
+    - data_deps: explicit depends_on and $steps references; if one of these
+      fails the step is skipped
+    - errors: invalid step definitions by index
+    """
+    ids: list[str] = []
+    index_of: dict[str, int] = {}
+    errors: dict[int, str] = {}
+    order_deps: list[set[int]] = []
+    data_deps: list[set[int]] = []
+
+    for i, step in enumerate(steps):
+        step_id = str(step.get("id", i))
+        if step_id in index_of:
+            errors[i] = f"Duplicate step id '{step_id}'."
+        else:
+            index_of[step_id] = i
+        ids.append(step_id)
+
+        declared = step.get("depends_on")
+        names = [declared] if isinstance(declared, str | int) else list(declared or [])
+        names += sorted(_step_refs(step.get("args", {})))
+
+        hard: set[int] = set()
+        for name in names:
+            j = index_of.get(str(name))
+            if j is None or j >= i:
+                errors.setdefault(i, f"Step dependency '{name}' must name an earlier step.")
+            else:
+                hard.add(j)
+
+        is_parallel = step.get("parallel", parallel)
+        soft = {i - 1} if i > 0 and declared is None and not is_parallel else set()
+        data_deps.append(hard)
+        order_deps.append(hard | soft)
+
+    return ids, order_deps, data_deps, errors
+
 
 @audited
 def boring_batch(
     steps: Annotated[
         list[dict[str, Any]],
         Field(
-            description="List of tool calls. Each dict must have 'tool' (name) and 'args' (dict)."
+            description=(
+                "List of tool calls. Each dict must have 'tool' (name) and 'args' (dict). "
+                "Optional: 'id', 'depends_on' (ids of earlier steps), 'parallel' (bool). "
+                "An args value '$steps.<id>.output...' is replaced by that step's result."
+            )
         ),
     ],
     continue_on_error: Annotated[
         bool, Field(description="If True, continue executing remaining steps even if one fails.")
     ] = False,
+    parallel: Annotated[
+        bool,
+        Field(
+            description="Default for steps without 'parallel': run independent steps concurrently."
+        ),
+    ] = False,
+    max_parallel: Annotated[
+        int, Field(description="Maximum number of steps running at the same time.")
+    ] = DEFAULT_MAX_PARALLEL,
 ) -> BoringResult:
     """
     Execute multiple MCP tools in a single batch request to reduce latency.
 
     Processing:
-    - Executes tools sequentially.
-    - If a step fails and continue_on_error is False, stops and returns results up to that point.
+    - By default executes tools sequentially.
+    - Steps marked parallel (or with explicit depends_on) start as soon as the
+      steps they depend on finish, on a bounded thread pool.
+    - Steps may reference earlier results with "$steps.<id>.output..." args;
+      a step whose dependency failed is skipped.
+    - If a step fails and continue_on_error is False, no new steps start and
+      results up to that point are returned.
     - Each internal tool call is subject to its own security/audit checks (Shadow Mode).
 
     Args:
-        steps: List of {"tool": "name", "args": {...}}
+        steps: List of {"tool": "name", "args": {...}, "id"?, "depends_on"?, "parallel"?}
         continue_on_error: Whether to proceed after failures.
+        parallel: Default 'parallel' flag for steps.
+        max_parallel: Concurrency bound.
 
     Returns:
-        Aggregation of all tool results.
+        Aggregation of all tool results, each with started_ms/duration_ms timings.
     """
     if not MCP_AVAILABLE or mcp is None:
         return create_error_result("MCP server not initialized.")
 
-    results = []
-    success_count = 0
-    failure_count = 0
-
     # Access the tool registry robustly
     # FastMCP uses _tools mapping name -> Tool object
     registry = getattr(mcp, "_tools", {})
     if not registry and hasattr(mcp, "_tool_manager"):
         registry = getattr(mcp._tool_manager, "_tools", {})
 
-    for i, step in enumerate(steps):
-        tool_name = step.get("tool")
-        args = step.get("args", {})
+    ids, order_deps, data_deps, errors = _plan_dependencies(steps, parallel)
+    concurrent = any(
+        step.get("parallel", parallel) or step.get("depends_on") is not None for step in steps
+    )
+    width = max(1, max_parallel) if concurrent else 1
 
-        if not tool_name:
-            results.append(
-                {"step": i, "status": "error", "message": "Missing 'tool' name in step definition."}
-            )
-            failure_count += 1
-            if not continue_on_error:
-                break
-            continue
-
-        # Look up tool
-        tool_def = registry.get(tool_name)
-        if not tool_def:
-            results.append(
-                {
-                    "step": i,
-                    "tool": tool_name,
-                    "status": "error",
-                    "message": f"Tool '{tool_name}' not found in registry.",
-                }
-            )
-            failure_count += 1
+    t0 = time.perf_counter()
+    results: dict[int, dict] = {}
+    failed: set[int] = set()
+    pending = list(range(len(steps)))
+    running: dict[Future, int] = {}
+    stop = False
+
+    def finish(i: int, result: dict):
+        nonlocal stop
+        result["id"] = ids[i]
+        results[i] = result
+        if result["status"] != "success":
+            failed.add(i)
             if not continue_on_error:
-                break
-            continue
+                stop = True
 
-        # Execute
-        try:
-            # FastMCP Tool object has a .fn callable
-            # We call it directly.
-            # Note: This bypasses FastMCP's JSON-RPC validation but invokes the python function directly.
-            # If the python function is decorated with @audited, that decorator runs.
-            # If it's async, we might have an issue if we are sync.
-            # Most boring tools are sync defs due to audited decorator.
-
-            func = tool_def.fn
-
-            # Check for async - simple check
-            import inspect
-
-            if inspect.iscoroutinefunction(func):
-                results.append(
-                    {
-                        "step": i,
-                        "tool": tool_name,
-                        "status": "error",
-                        "message": f"Async tool '{tool_name}' execution not supported in sync batch.",
-                    }
-                )
-                failure_count += 1
-                if not continue_on_error:
-                    break
-                continue
-
-            # Call
-            # We unpack args. FastMCP usually handles signature binding.
-            # Here we try passing as kwargs.
-            try:
-                # If args is not a dict, this will fail.
-                if not isinstance(args, dict):
-                    raise ValueError("Args must be a dictionary")
-
-                output = func(**args)
-
-                # Normalize output
-                # Tools return BoringResult (dict) or plain value
-                results.append(
-                    {"step": i, "tool": tool_name, "status": "success", "output": output}
-                )
-                success_count += 1
-
-            except Exception as e:
-                # Execution error (inside tool)
-                results.append(
-                    {
-                        "step": i,
-                        "tool": tool_name,
-                        "status": "failure",  # Tool ran but threw exception
-                        "error": str(e),
-                    }
-                )
-                failure_count += 1
-                if not continue_on_error:
-                    break
+    def submit(i: int, pool: ThreadPoolExecutor | None) -> Future:
+        step = steps[i]
+        args = _resolve_refs(step.get("args", {}), {ids[j]: results[j] for j in data_deps[i]})
+        if pool is not None:
+            return pool.submit(_timed_step, i, step.get("tool"), args, registry, t0)
+        future: Future = Future()
+        future.set_result(_timed_step(i, step.get("tool"), args, registry, t0))
+        return future
 
-        except Exception as e:
-            # System error
-            results.append(
-                {"step": i, "tool": tool_name, "status": "system_error", "error": str(e)}
-            )
-            failure_count += 1
-            if not continue_on_error:
+    pool = (
+        ThreadPoolExecutor(max_workers=width, thread_name_prefix="boring-batch")
+        if concurrent
+        else None
+    )
+    try:
+        while True:
+            # Start (or settle) every step whose prerequisites are done
+            progressed = True
+            while progressed and not stop:
+                progressed = False
+                for i in list(pending):
+                    if len(running) >= width or stop:
+                        break
+                    if not order_deps[i] <= results.keys():
+                        continue
+                    pending.remove(i)
+                    progressed = True
+                    tool_name = steps[i].get("tool")
+                    if i in errors:
+                        finish(
+                            i,
+                            {"step": i, "tool": tool_name, "status": "error", "message": errors[i]},
+                        )
+                    elif data_deps[i] & failed:
+                        bad = ", ".join(ids[j] for j in sorted(data_deps[i] & failed))
+                        finish(
+                            i,
+                            {
+                                "step": i,
+                                "tool": tool_name,
+                                "status": "skipped",
+                                "message": f"Skipped: dependency {bad} failed.",
+                            },
+                        )
+                    else:
+                        try:
+                            running[submit(i, pool)] = i
+                        except (KeyError, IndexError, ValueError) as e:
+                            finish(
+                                i,
+                                {
+                                    "step": i,
+                                    "tool": tool_name,
+                                    "status": "error",
+                                    "message": f"Could not resolve step reference: {e}",
+                                },
+                            )
+
+            if not running:
                 break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                finish(running.pop(future), future.result())
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    ordered = [results[i] for i in sorted(results)]
+    success_count = sum(1 for r in ordered if r["status"] == "success")
+    failure_count = len(ordered) - success_count
 
     return create_success_result(
         message=f"Batch execution completed. Success: {success_count}, Failures: {failure_count}",
-        data={"total_steps": len(steps), "executed_steps": len(results), "results": results},
+        data={
+            "total_steps": len(steps),
+            "executed_steps": len(ordered),
+            "results": ordered,
+            "wall_ms": round((time.perf_counter() - t0) * 1000, 2),
+            "sum_step_ms": round(sum(r.get("duration_ms", 0.0) for r in ordered), 2),
+        },
     )
 
 
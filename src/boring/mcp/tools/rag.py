@@ -456,6 +456,17 @@ def register_rag_tools(mcp: Any, helpers: dict):
                     report.append("\n**Dependency Graph:**\n")
                     report.append(f"- Nodes: {graph.total_nodes}\n")
                     report.append(f"- Edges: {graph.total_edges}\n")
+
+                hits = getattr(stats, "query_cache_hits", 0)
+                lookups = hits + getattr(stats, "query_cache_misses", 0)
+                if lookups:
+                    report.append("\n**Query Cache:**\n")
+                    report.append(f"- Hit rate: {hits / lookups:.0%} ({hits}/{lookups})\n")
+                    report.append(
+                        f"- Entries: {stats.query_cache_entries} "
+                        f"({stats.query_cache_bytes / 1024:.0f} KB), "
+                        f"evictions: {stats.query_cache_evictions}\n"
+                    )
         else:
             report.append("## ❌ Collection Not Initialized\n")
             report.append("Run `boring_rag_index` to create the index.\n")
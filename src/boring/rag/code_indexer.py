@@ -66,6 +66,34 @@ class IndexStats:
     methods: int = 0
     script_chunks: int = 0
     skipped_files: int = 0
+    # Pipeline throughput (populated by RAGRetriever.build_index)
+    workers: int = 1
+    upsert_batches: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        """Indexed files per second of wall time."""
+        return self.total_files / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        """Produced chunks per second of wall time."""
+        return self.total_chunks / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def record_file(self, chunks: list["CodeChunk"]) -> None:
+        """Account for one successfully indexed file and its chunks."""
+        self.total_files += 1
+        for chunk in chunks:
+            self.total_chunks += 1
+            if chunk.chunk_type == "function":
+                self.functions += 1
+            elif chunk.chunk_type == "class":
+                self.classes += 1
+            elif chunk.chunk_type == "method":
+                self.methods += 1
+            elif chunk.chunk_type == "script":
+                self.script_chunks += 1
 
 
 class CodeIndexer:
@@ -133,6 +161,7 @@ class CodeIndexer:
         self.max_chunk_tokens = max_chunk_tokens
         self.include_init_files = include_init_files
         self.stats = IndexStats()
+        self._ts_parser = None  # Shared TreeSitterParser (query/tree caches), created lazily
 
     def get_changed_files(self, since_commit: str) -> list[Path]:
         """
@@ -212,14 +241,33 @@ class CodeIndexer:
                 logger.warning(f"Failed to index {file_path}: {e}")
                 self.stats.skipped_files += 1
 
-    def index_file(self, file_path: Path) -> Iterator[CodeChunk]:
+    def index_file(self, file_path: Path, incremental: bool = False) -> Iterator[CodeChunk]:
         """
         Extract chunks from a file (AST for Python, line-based for others).
+
+        incremental=True keeps the Tree-sitter tree so the next re-index of this
+        file after an edit only re-parses the changed region.
         """
         if file_path.suffix.lower() == ".py":
             yield from self._index_python_file(file_path)
         else:
-            yield from self._index_universal_file(file_path)
+            yield from self._index_universal_file(file_path, incremental)
+
+    def forget(self, file_path: Path) -> None:
+        """Drop per-file parser state (the cached Tree-sitter tree) for a removed file."""
+        if self._ts_parser is not None:
+            self._ts_parser.forget(file_path)
+
+    def _get_ts_parser(self):
+        """Shared Tree-sitter parser, or None if the wrapper cannot be imported."""
+        if self._ts_parser is None:
+            try:
+                from .parser import TreeSitterParser
+
+                self._ts_parser = TreeSitterParser()
+            except ImportError:
+                return None
+        return self._ts_parser
 
     def _should_skip_dir(self, dir_name: str) -> bool:
         """Helper to check if a directory should be skipped during walk."""
@@ -235,7 +283,9 @@ class CodeIndexer:
         except ValueError:
             return str(file_path).replace("\\", "/")
 
-    def _index_universal_file(self, file_path: Path) -> Iterator[CodeChunk]:
+    def _index_universal_file(
+        self, file_path: Path, incremental: bool = False
+    ) -> Iterator[CodeChunk]:
         """
         Smart chunking for non-Python files using Tree-sitter or regex fallback.
         Supports C-style languages (JS, TS, Java, C++, Go, Rust) and Markdown.
@@ -244,12 +294,7 @@ class CodeIndexer:
         """
         import re
 
-        try:
-            from .parser import TreeSitterParser
-
-            ts_parser = TreeSitterParser()
-        except ImportError:
-            ts_parser = None
+        ts_parser = self._get_ts_parser()
 
         try:
             content = file_path.read_text(encoding="utf-8")
@@ -261,7 +306,7 @@ class CodeIndexer:
 
         # 1. Try Tree-sitter Parsing (V11.0 Enhanced)
         if ts_parser and ts_parser.is_available():
-            ts_chunks = ts_parser.parse_file(file_path)
+            ts_chunks = ts_parser.parse_file(file_path, incremental=incremental)
             if ts_chunks:
                 for chunk in ts_chunks:
                     # V11.0: Map parser chunk types to indexer chunk types
@@ -685,6 +730,27 @@ class CodeIndexer:
         return self.stats
 
 
+# =============================================================================
+# Process-pool worker entry point (parallel index build)
+# =============================================================================
+
+# Per-process indexer, created lazily inside each pool worker
+_WORKER_INDEXER: CodeIndexer | None = None
+
+
+def index_file_in_worker(project_root: str, file_path: str) -> tuple[str, list[CodeChunk]]:
+    """
+    Parse and chunk a single file inside a process-pool worker.
+
+    Keeps one CodeIndexer per worker process so Tree-sitter setup is paid once.
+    Exceptions propagate to the parent, which counts the file as skipped.
+    """
+    global _WORKER_INDEXER
+    if _WORKER_INDEXER is None or str(_WORKER_INDEXER.project_root) != project_root:
+        _WORKER_INDEXER = CodeIndexer(Path(project_root))
+    return file_path, list(_WORKER_INDEXER.index_file(Path(file_path)))
+
+
 # =============================================================================
 # V11.0 Structured Validation Tests
 # V11.1: Fixed JavaScript test cases (removed JSX, use pure JS syntax)
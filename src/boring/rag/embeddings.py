@@ -13,10 +13,12 @@ logger = logging.getLogger(__name__)
 class LocalEmbeddings:
     """
     Wrapper for sentence-transformers to provide local embeddings.
+
+    Backed by the shared embedding engine, so the model is loaded once per
+    process and vectors for previously seen texts come from the embedding cache.
     """
 
     _instance: Optional["LocalEmbeddings"] = None
-    _model = None
 
     def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
         self.model_name = model_name
@@ -43,30 +45,21 @@ class LocalEmbeddings:
 
         return self._available
 
-    def _ensure_loaded(self):
-        """Lazy load the model."""
-        if self._model:
-            return
-
+    def _engine(self):
+        """Shared engine for this model."""
         if not self.is_available:
             raise ImportError(
                 "sentence-transformers not installed. Run `pip install boring-aicoding[vector]`"
             )
 
-        from sentence_transformers import SentenceTransformer
+        from ..intelligence.embedding_service import get_embedding_engine
 
-        logger.info(f"Loading local embedding model: {self.model_name}...")
-        self._model = SentenceTransformer(self.model_name)
-        logger.info("Local embedding model loaded.")
+        return get_embedding_engine(self.model_name)
 
-    def embed_documents(self, texts: list[str]) -> list[list[float]]:
-        """Embed a list of documents."""
-        self._ensure_loaded()
-        embeddings = self._model.encode(texts)
-        return embeddings.tolist()
+    def embed_documents(self, texts: list[str]):
+        """Embed a list of documents as a (len(texts), dim) float32 array."""
+        return self._engine().embed(texts)
 
-    def embed_query(self, text: str) -> list[float]:
-        """Embed a single query."""
-        self._ensure_loaded()
-        embedding = self._model.encode(text)
-        return embedding.tolist()
+    def embed_query(self, text: str):
+        """Embed a single query as a (dim,) float32 array."""
+        return self._engine().embed_one(text)
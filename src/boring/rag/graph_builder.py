@@ -4,13 +4,41 @@ Code Dependency Graph Builder
 Creates call graph between functions/classes for Graph RAG.
 Enables "impact zone" analysis - when modifying function A,
 automatically include all callers/callees in context.
+
+Storage layout (V14):
+- Chunk IDs are interned to dense integers.
+- Edges live in two CSR (compressed sparse row) arrays, callees and callers,
+  so traversals walk int32 slices instead of per-node Python sets.
+- Per-file updates are applied to a small overlay (tombstoned nodes + extra
+  edges) that is folded back into CSR by compact().
+- save()/load() use a binary snapshot whose edge arrays are mmap'd on load.
 """
 
+import json
+import logging
+import mmap
+import struct
+import sys
+from array import array
 from collections import defaultdict
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
 
 from .code_indexer import CodeChunk
 
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk snapshot layout changes
+_SNAPSHOT_VERSION = 2
+_SNAPSHOT_MAGIC = b"BGRF"
+# magic, version, node count, edge count, fingerprint length, node table length
+_HEADER = struct.Struct("<4sIIIII")
+
+# Fold the overlay back into CSR once it holds this share of the graph
+_COMPACT_RATIO = 0.25
+_COMPACT_MIN_OPS = 1024
+
 
 @dataclass
 class GraphStats:
@@ -23,27 +51,67 @@ class GraphStats:
     max_callees: int = 0
 
 
+class _CSR:
+    """Immutable adjacency: neighbors of node i are indices[indptr[i]:indptr[i + 1]]."""
+
+    __slots__ = ("indptr", "indices")
+
+    def __init__(self, indptr: Sequence[int] | None = None, indices: Sequence[int] | None = None):
+        self.indptr: Sequence[int] = indptr if indptr is not None else array("i", [0])
+        self.indices: Sequence[int] = indices if indices is not None else array("i")
+
+    @classmethod
+    def from_adjacency(cls, adjacency: list[Iterable[int]]) -> "_CSR":
+        indptr = array("i", [0])
+        indices = array("i")
+        for neighbors in adjacency:
+            indices.extend(sorted(neighbors))
+            indptr.append(len(indices))
+        return cls(indptr, indices)
+
+    @property
+    def node_count(self) -> int:
+        return len(self.indptr) - 1
+
+    def neighbors(self, node: int) -> Sequence[int]:
+        if node >= self.node_count:
+            return ()
+        return self.indices[self.indptr[node] : self.indptr[node + 1]]
+
+
 class DependencyGraph:
     """
     Bidirectional dependency graph for code chunks.
 
     Edges:
-    - callers[A] = {B, C} means B and C call A
-    - callees[A] = {X, Y} means A calls X and Y
+    - callers(A) = {B, C} means B and C call A
+    - callees(A) = {X, Y} means A calls X and Y
 
     Usage:
         graph = DependencyGraph(chunks)
         callers = graph.get_callers(chunk_id)  # Who calls this?
         impact = graph.get_impact_zone(chunk_id)  # What might break?
+        graph.update_file("src/app.py", new_chunks)  # Patch one file
     """
 
     def __init__(self, chunks: list[CodeChunk] | None = None):
         self._chunks: dict[str, CodeChunk] = {}
         self._name_to_ids: dict[str, set[str]] = defaultdict(set)  # name -> chunk_ids
+        self._file_to_ids: dict[str, list[str]] = defaultdict(list)  # file_path -> chunk_ids
+
+        # Intern table: dense int <-> chunk_id
+        self._ids: list[str] = []
+        self._index: dict[str, int] = {}
 
-        # Adjacency lists
-        self.callers: dict[str, set[str]] = defaultdict(set)  # who calls this
-        self.callees: dict[str, set[str]] = defaultdict(set)  # this calls who
+        # Base adjacency (CSR) plus the overlay written by incremental updates
+        self._out = _CSR()
+        self._in = _CSR()
+        self._dead: set[int] = set()
+        self._extra_out: dict[int, set[int]] = defaultdict(set)
+        self._extra_in: dict[int, set[int]] = defaultdict(set)
+        self._overlay_ops = 0
+
+        self._mmap: mmap.mmap | None = None
 
         if chunks:
             self._build(chunks)
@@ -52,42 +120,245 @@ class DependencyGraph:
         """Build the graph from chunks."""
         # First pass: register all chunks by name
         for chunk in chunks:
-            self._chunks[chunk.chunk_id] = chunk
+            self._register(chunk)
 
-            # Register by simple name
-            self._name_to_ids[chunk.name].add(chunk.chunk_id)
+        # Second pass: resolve dependencies into integer adjacency
+        out_adj: list[set[int]] = [set() for _ in self._ids]
+        in_adj: list[set[int]] = [set() for _ in self._ids]
+        for node, chunk_id in enumerate(self._ids):
+            for dep_id in self._resolve(self._chunks[chunk_id]):
+                target = self._index[dep_id]
+                out_adj[node].add(target)
+                in_adj[target].add(node)
 
-            # Also register by qualified name (ClassName.method)
-            if chunk.parent:
-                qualified = f"{chunk.parent}.{chunk.name}"
-                self._name_to_ids[qualified].add(chunk.chunk_id)
+        self._out = _CSR.from_adjacency(out_adj)
+        self._in = _CSR.from_adjacency(in_adj)
 
-        # Second pass: build edges based on dependencies
-        for chunk in chunks:
-            for dep_name in chunk.dependencies:
-                # Find all chunks matching this dependency name
-                dep_ids = self._name_to_ids.get(dep_name, set())
-
-                for dep_id in dep_ids:
-                    # chunk calls dep
-                    self.callees[chunk.chunk_id].add(dep_id)
-                    self.callers[dep_id].add(chunk.chunk_id)
+    # -------------------------------------------------------------------------
+    # Mutation
+    # -------------------------------------------------------------------------
 
     def add_chunk(self, chunk: CodeChunk) -> None:
-        """Add a single chunk to the graph."""
-        self._chunks[chunk.chunk_id] = chunk
-        self._name_to_ids[chunk.name].add(chunk.chunk_id)
+        """Add a single chunk to the graph (replacing one with the same ID)."""
+        callers: list[int] = []
+        if chunk.chunk_id in self._index:
+            callers = list(self._neighbors(self._index[chunk.chunk_id], self._in))
+            self._remove_node(chunk.chunk_id)
+        node = self._register(chunk)
+        for dep_id in self._resolve(chunk):
+            self._add_edge(node, self._index[dep_id])
+        for caller in callers:
+            if caller not in self._dead:
+                self._add_edge(caller, node)
+        self._maybe_compact()
+
+    def remove_file(self, file_path: str) -> list[str]:
+        """
+        Drop every chunk that belongs to file_path.
 
-        if chunk.parent:
-            qualified = f"{chunk.parent}.{chunk.name}"
-            self._name_to_ids[qualified].add(chunk.chunk_id)
+        Returns:
+            The removed chunk IDs
+        """
+        removed = self._drop_file(file_path)
+        self._maybe_compact()
+        return removed
 
-        # Build edges for this chunk
-        for dep_name in chunk.dependencies:
-            dep_ids = self._name_to_ids.get(dep_name, set())
-            for dep_id in dep_ids:
-                self.callees[chunk.chunk_id].add(dep_id)
-                self.callers[dep_id].add(chunk.chunk_id)
+    def update_file(self, file_path: str, chunks: list[CodeChunk]) -> None:
+        """
+        Replace the chunks of one file and re-link edges in both directions.
+
+        Callers in other files are carried over when a chunk keeps its
+        name and parent; any other chunk triggers a scan of the remaining
+        chunks' dependencies for its names.
+        """
+        old_callers: dict[tuple[str, str | None], set[int]] = defaultdict(set)
+        for chunk_id in self._file_to_ids.get(file_path, []):
+            node = self._index.get(chunk_id)
+            chunk = self._chunks.get(chunk_id)
+            if node is None or chunk is None:
+                continue
+            old_callers[(chunk.name, chunk.parent)].update(self._neighbors(node, self._in))
+
+        self._drop_file(file_path)
+
+        new_nodes = [self._register(chunk) for chunk in chunks]
+
+        for node, chunk in zip(new_nodes, chunks, strict=True):
+            for dep_id in self._resolve(chunk):
+                self._add_edge(node, self._index[dep_id])
+
+        new_ids = {chunk.chunk_id for chunk in chunks}
+        relink_names: dict[str, list[int]] = defaultdict(list)
+        for node, chunk in zip(new_nodes, chunks, strict=True):
+            inherited = old_callers.get((chunk.name, chunk.parent))
+            if inherited is not None:
+                for caller in inherited:
+                    if caller not in self._dead:
+                        self._add_edge(caller, node)
+                continue
+            for name in self._names_of(chunk):
+                relink_names[name].append(node)
+
+        if relink_names:
+            for caller_id, caller in self._chunks.items():
+                if caller_id in new_ids:
+                    continue
+                for dep_name in caller.dependencies:
+                    for target in relink_names.get(dep_name, ()):
+                        self._add_edge(self._index[caller_id], target)
+
+        self._maybe_compact()
+
+    def compact(self) -> None:
+        """Fold the overlay into fresh CSR arrays and renumber live nodes."""
+        live = [node for node in range(len(self._ids)) if node not in self._dead]
+        remap = {old: new for new, old in enumerate(live)}
+
+        out_adj = [[remap[n] for n in self._neighbors(old, self._out)] for old in live]
+        in_adj = [[remap[n] for n in self._neighbors(old, self._in)] for old in live]
+
+        self._ids = [self._ids[old] for old in live]
+        self._index = {chunk_id: node for node, chunk_id in enumerate(self._ids)}
+        self._out = _CSR.from_adjacency(out_adj)
+        self._in = _CSR.from_adjacency(in_adj)
+        self._dead.clear()
+        self._extra_out.clear()
+        self._extra_in.clear()
+        self._overlay_ops = 0
+        self._release_mmap()
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def save(self, path: Path, fingerprint: str = "") -> bool:
+        """
+        Persist nodes (without content bodies) and CSR edges to disk.
+
+        Args:
+            path: Snapshot file
+            fingerprint: Opaque index version; load() rejects mismatches
+
+        Returns:
+            True if written
+        """
+        # The snapshot holds CSR only; fold the overlay in if there is one
+        if self._dead or self._extra_out:
+            self.compact()
+
+        nodes = []
+        for chunk_id in self._ids:
+            node = asdict(self._chunks[chunk_id])
+            node["content"] = ""
+            nodes.append(node)
+        node_table = json.dumps(nodes).encode("utf-8")
+        fingerprint_bytes = fingerprint.encode("utf-8")
+        header = _HEADER.pack(
+            _SNAPSHOT_MAGIC,
+            _SNAPSHOT_VERSION,
+            len(self._ids),
+            len(self._out.indices),
+            len(fingerprint_bytes),
+            len(node_table),
+        )
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(header)
+                f.write(_pad4(fingerprint_bytes))
+                for values in (
+                    self._out.indptr,
+                    self._out.indices,
+                    self._in.indptr,
+                    self._in.indices,
+                ):
+                    f.write(_int32_bytes(values))
+                f.write(node_table)
+            tmp_path.replace(path)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to save graph snapshot: {e}")
+            return False
+
+    @classmethod
+    def load(cls, path: Path, fingerprint: str | None = "") -> "DependencyGraph | None":
+        """
+        Load a snapshot written by save(), mapping the edge arrays from disk.
+
+        Pass fingerprint=None to accept a snapshot built from any index version.
+
+        Returns:
+            The graph, or None if missing, unreadable or built for another fingerprint.
+            Chunk contents are empty and must be fetched on demand.
+        """
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to read graph snapshot: {e}")
+            return None
+
+        graph = cls()
+        try:
+            if len(buf) < _HEADER.size:
+                raise ValueError("truncated header")
+            magic, version, n_nodes, n_edges, fp_len, table_len = _HEADER.unpack_from(buf, 0)
+            if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION:
+                buf.close()
+                return None
+            offset = _HEADER.size
+            stored = bytes(buf[offset : offset + fp_len]).decode("utf-8")
+            if fingerprint is not None and stored != fingerprint:
+                buf.close()
+                return None
+            offset += fp_len + (-fp_len % 4)
+
+            view = memoryview(buf)
+            arrays = []
+            for count in (n_nodes + 1, n_edges, n_nodes + 1, n_edges):
+                arrays.append(_int32_view(view[offset : offset + 4 * count]))
+                offset += 4 * count
+            nodes = json.loads(bytes(buf[offset : offset + table_len]).decode("utf-8"))
+            if len(nodes) != n_nodes:
+                raise ValueError("node table does not match header")
+        except Exception as e:
+            logger.warning(f"Failed to read graph snapshot: {e}")
+            arrays = view = None
+            try:
+                buf.close()
+            except BufferError:
+                pass
+            return None
+
+        for node in nodes:
+            graph._register(CodeChunk(**node))
+        graph._out = _CSR(arrays[0], arrays[1])
+        graph._in = _CSR(arrays[2], arrays[3])
+        graph._mmap = buf
+        return graph
+
+    def _release_mmap(self) -> None:
+        """Close the snapshot mapping once no CSR array refers to it."""
+        if self._mmap is None:
+            return
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Still exported through a view held elsewhere; let GC close it
+            pass
+        self._mmap = None
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def get_chunks(self) -> list[CodeChunk]:
+        """All chunks in the graph."""
+        return list(self._chunks.values())
 
     def get_chunk(self, chunk_id: str) -> CodeChunk | None:
         """Get chunk by ID."""
@@ -104,8 +375,10 @@ class DependencyGraph:
 
         Use case: "Who depends on this function?"
         """
-        caller_ids = self.callers.get(chunk_id, set())
-        return [self._chunks[cid] for cid in caller_ids if cid in self._chunks]
+        node = self._index.get(chunk_id)
+        if node is None:
+            return []
+        return [self._chunks[self._ids[n]] for n in self._neighbors(node, self._in)]
 
     def get_callees(self, chunk_id: str) -> list[CodeChunk]:
         """
@@ -113,8 +386,10 @@ class DependencyGraph:
 
         Use case: "What does this function depend on?"
         """
-        callee_ids = self.callees.get(chunk_id, set())
-        return [self._chunks[cid] for cid in callee_ids if cid in self._chunks]
+        node = self._index.get(chunk_id)
+        if node is None:
+            return []
+        return [self._chunks[self._ids[n]] for n in self._neighbors(node, self._out)]
 
     def get_related_chunks(
         self, seed_chunks: list[CodeChunk], depth: int = 1, direction: str = "both"
@@ -130,28 +405,19 @@ class DependencyGraph:
         Returns:
             Related chunks (excluding seeds)
         """
-        visited: set[str] = {c.chunk_id for c in seed_chunks}
-        frontier: set[str] = {c.chunk_id for c in seed_chunks}
+        frontier = [self._index[c.chunk_id] for c in seed_chunks if c.chunk_id in self._index]
+        visited: set[int] = set(frontier)
         related: list[CodeChunk] = []
 
         for _ in range(depth):
-            next_frontier: set[str] = set()
-
-            for chunk_id in frontier:
-                neighbors: set[str] = set()
+            next_frontier: list[int] = []
 
-                if direction in ("callers", "both"):
-                    neighbors.update(self.callers.get(chunk_id, set()))
-
-                if direction in ("callees", "both"):
-                    neighbors.update(self.callees.get(chunk_id, set()))
-
-                for neighbor_id in neighbors:
-                    if neighbor_id not in visited:
-                        visited.add(neighbor_id)
-                        next_frontier.add(neighbor_id)
-                        if neighbor_id in self._chunks:
-                            related.append(self._chunks[neighbor_id])
+            for node in frontier:
+                for neighbor in self._adjacent(node, direction):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        next_frontier.append(neighbor)
+                        related.append(self._chunks[self._ids[neighbor]])
 
             frontier = next_frontier
 
@@ -180,6 +446,24 @@ class DependencyGraph:
         seed = [self._chunks[modified_chunk_id]]
         return self.get_related_chunks(seed, depth=depth, direction="callers")
 
+    def get_file_impact_zone(self, file_paths: Iterable[str], depth: int = 1) -> list[str]:
+        """
+        Files containing callers of any chunk in file_paths (excluding those files).
+
+        Args:
+            file_paths: Changed files, as stored in CodeChunk.file_path
+            depth: How many levels of callers to include (default 1)
+
+        Returns:
+            Sorted list of dependent file paths
+        """
+        changed = set(file_paths)
+        seeds = [self._chunks[cid] for f in changed for cid in self._file_to_ids.get(f, [])]
+        if not seeds:
+            return []
+        dependents = {c.file_path for c in self.get_related_chunks(seeds, depth, "callers")}
+        return sorted(dependents - changed)
+
     def get_context_for_modification(self, modified_chunk_id: str) -> dict[str, list[CodeChunk]]:
         """
         Get comprehensive context for modifying a chunk.
@@ -197,8 +481,9 @@ class DependencyGraph:
 
         chunk = self._chunks.get(modified_chunk_id)
         if chunk and chunk.parent:
-            # Find other methods in the same class
-            for cid, c in self._chunks.items():
+            # Other methods of the same class live in the same file
+            for cid in self._file_to_ids.get(chunk.file_path, []):
+                c = self._chunks[cid]
                 if c.parent == chunk.parent and cid != modified_chunk_id:
                     result["siblings"].append(c)
 
@@ -206,11 +491,16 @@ class DependencyGraph:
 
     def get_stats(self) -> GraphStats:
         """Get graph statistics."""
-        total_edges = sum(len(callees) for callees in self.callees.values())
         total_nodes = len(self._chunks)
-
-        max_callers = max((len(c) for c in self.callers.values()), default=0)
-        max_callees = max((len(c) for c in self.callees.values()), default=0)
+        total_edges = 0
+        max_callers = 0
+        max_callees = 0
+        for node in self._live_nodes():
+            out_degree = sum(1 for _ in self._neighbors(node, self._out))
+            in_degree = sum(1 for _ in self._neighbors(node, self._in))
+            total_edges += out_degree
+            max_callees = max(max_callees, out_degree)
+            max_callers = max(max_callers, in_degree)
 
         return GraphStats(
             total_nodes=total_nodes,
@@ -232,28 +522,30 @@ class DependencyGraph:
         if from_id == to_id:
             return [from_id]
 
-        # BFS
-        visited = {from_id}
-        queue = [(from_id, [from_id])]
+        # BFS over integer IDs, remembering each node's predecessor
+        start, goal = self._index[from_id], self._index[to_id]
+        parent: dict[int, int] = {start: start}
+        frontier = [start]
 
         for _ in range(max_depth):
-            if not queue:
+            if not frontier:
                 break
 
-            next_queue = []
-            for current, path in queue:
+            next_frontier: list[int] = []
+            for current in frontier:
                 # Check all neighbors (both callers and callees)
-                neighbors = self.callers.get(current, set()) | self.callees.get(current, set())
-
-                for neighbor in neighbors:
-                    if neighbor == to_id:
-                        return path + [neighbor]
+                for neighbor in self._adjacent(current, "both"):
+                    if neighbor in parent:
+                        continue
+                    parent[neighbor] = current
+                    if neighbor == goal:
+                        path = [goal]
+                        while path[-1] != start:
+                            path.append(parent[path[-1]])
+                        return [self._ids[n] for n in reversed(path)]
+                    next_frontier.append(neighbor)
 
-                    if neighbor not in visited:
-                        visited.add(neighbor)
-                        next_queue.append((neighbor, path + [neighbor]))
-
-            queue = next_queue
+            frontier = next_frontier
 
         return None  # No path found within max_depth
 
@@ -269,14 +561,12 @@ class DependencyGraph:
             String representation of the graph
         """
         if format == "json":
-            import json
-
             nodes = []
             edges = []
             for cid, chunk in list(self._chunks.items())[:max_nodes]:
                 nodes.append({"id": cid, "name": chunk.name, "type": chunk.chunk_type})
-                for callee in self.callees.get(cid, set()):
-                    edges.append({"from": cid, "to": callee})
+                for callee in self.get_callees(cid):
+                    edges.append({"from": cid, "to": callee.chunk_id})
             return json.dumps({"nodes": nodes, "edges": edges}, indent=2)
 
         # Mermaid format
@@ -291,9 +581,118 @@ class DependencyGraph:
 
         # Add edges
         for cid in added:
-            for callee in self.callees.get(cid, set()):
-                if callee in added:
-                    lines.append(f"    {cid[:8]} --> {callee[:8]}")
+            for callee in self.get_callees(cid):
+                if callee.chunk_id in added:
+                    lines.append(f"    {cid[:8]} --> {callee.chunk_id[:8]}")
 
         lines.append("```")
         return "\n".join(lines)
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _names_of(chunk: CodeChunk) -> list[str]:
+        """Names a dependency can use to refer to this chunk."""
+        if chunk.parent:
+            return [chunk.name, f"{chunk.parent}.{chunk.name}"]
+        return [chunk.name]
+
+    def _register(self, chunk: CodeChunk) -> int:
+        """Intern a chunk and index it by name and file; returns its node id."""
+        node = len(self._ids)
+        self._ids.append(chunk.chunk_id)
+        self._index[chunk.chunk_id] = node
+        self._chunks[chunk.chunk_id] = chunk
+        for name in self._names_of(chunk):
+            self._name_to_ids[name].add(chunk.chunk_id)
+        self._file_to_ids[chunk.file_path].append(chunk.chunk_id)
+        return node
+
+    def _drop_file(self, file_path: str) -> list[str]:
+        removed = self._file_to_ids.pop(file_path, [])
+        for chunk_id in list(removed):
+            self._remove_node(chunk_id)
+        return removed
+
+    def _remove_node(self, chunk_id: str) -> None:
+        node = self._index.pop(chunk_id, None)
+        chunk = self._chunks.pop(chunk_id, None)
+        if node is None or chunk is None:
+            return
+        self._dead.add(node)
+        self._overlay_ops += 1
+        for name in self._names_of(chunk):
+            ids = self._name_to_ids.get(name)
+            if ids is not None:
+                ids.discard(chunk_id)
+                if not ids:
+                    del self._name_to_ids[name]
+        file_ids = self._file_to_ids.get(chunk.file_path)
+        if file_ids and chunk_id in file_ids:
+            file_ids.remove(chunk_id)
+        for target in self._extra_out.pop(node, ()):
+            self._extra_in.get(target, set()).discard(node)
+        for source in self._extra_in.pop(node, ()):
+            self._extra_out.get(source, set()).discard(node)
+
+    def _resolve(self, chunk: CodeChunk) -> set[str]:
+        """Chunk IDs referenced by this chunk's dependency names."""
+        targets: set[str] = set()
+        for dep_name in chunk.dependencies:
+            targets.update(self._name_to_ids.get(dep_name, ()))
+        return targets
+
+    def _add_edge(self, source: int, target: int) -> None:
+        if target in self._extra_out.get(source, ()):
+            return
+        self._extra_out[source].add(target)
+        self._extra_in[target].add(source)
+        self._overlay_ops += 1
+
+    def _neighbors(self, node: int, csr: _CSR) -> Iterator[int]:
+        """Live neighbors from the CSR base and the overlay, without duplicates."""
+        extra = (self._extra_out if csr is self._out else self._extra_in).get(node, set())
+        dead = self._dead
+        for neighbor in csr.neighbors(node):
+            if neighbor not in dead and neighbor not in extra:
+                yield neighbor
+        yield from extra
+
+    def _adjacent(self, node: int, direction: str) -> Iterator[int]:
+        if direction in ("callers", "both"):
+            yield from self._neighbors(node, self._in)
+        if direction in ("callees", "both"):
+            yield from self._neighbors(node, self._out)
+
+    def _live_nodes(self) -> Iterator[int]:
+        return (node for node in range(len(self._ids)) if node not in self._dead)
+
+    def _maybe_compact(self) -> None:
+        threshold = max(_COMPACT_MIN_OPS, int(len(self._ids) * _COMPACT_RATIO))
+        if self._overlay_ops > threshold:
+            self.compact()
+
+
+def _pad4(data: bytes) -> bytes:
+    """Pad to a 4-byte boundary so the int32 arrays that follow stay aligned."""
+    return data + b"\0" * (-len(data) % 4)
+
+
+def _int32_bytes(values: Sequence[int]) -> bytes:
+    """Little-endian int32 encoding used by the snapshot."""
+    out = values if isinstance(values, array) else array("i", values)
+    if sys.byteorder == "big":
+        out = array("i", out)
+        out.byteswap()
+    return out.tobytes()
+
+
+def _int32_view(view: memoryview) -> Sequence[int]:
+    """Zero-copy int32 view over mapped bytes (copied on big-endian hosts)."""
+    if sys.byteorder == "big":
+        values = array("i", bytes(view))
+        values.byteswap()
+        return values
+    return view.cast("i")
@@ -1,9 +1,13 @@
-import hashlib
 import json
 import logging
+import os
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 from ..config import settings
+from ..core.fingerprint import get_fingerprint_store
 
 logger = logging.getLogger(__name__)
 
@@ -15,16 +19,29 @@ class IndexState:
     Stores a mapping of:
     file_rel_path -> {
         "hash": "sha256_hash_of_content",
-        "chunks": ["chunk_id_1", "chunk_id_2", ...]
+        "chunks": ["chunk_id_1", "chunk_id_2", ...],
+        "stat": [mtime_ns, size, inode]
     }
+
+    Persistence is an SQLite table with one row per file. Only rows touched
+    since the last save are written, so an incremental save costs O(changed files).
+    Files whose (mtime_ns, size, inode) are unchanged are never re-hashed.
     """
 
-    CACHE_FILENAME = "rag_index_state.json"
+    DB_FILENAME = "rag_index_state.db"
+    LEGACY_FILENAME = "rag_index_state.json"
+    # Kept for callers that referenced the old JSON location
+    CACHE_FILENAME = LEGACY_FILENAME
 
     def __init__(self, project_root: Path | None = None):
         self.project_root = project_root or settings.PROJECT_ROOT
         self.cache_dir = settings.CACHE_DIR
-        self.cache_path = self.cache_dir / self.CACHE_FILENAME
+        self.db_path = self.cache_dir / self.DB_FILENAME
+        self.cache_path = self.cache_dir / self.LEGACY_FILENAME
+        self._meta: dict[str, str] = {}
+        self._dirty: set[str] = set()
+        self._removed: set[str] = set()
+        self._meta_dirty = False
         self.state: dict[str, dict] = self._load()
 
     def get_changed_files(self, current_files: list[Path]) -> list[Path]:
@@ -38,16 +55,31 @@ class IndexState:
             List of paths that are either new or modified since last index.
         """
         changed = []
+        suspects = []
         for file_path in current_files:
             rel_path = self._get_rel_path(file_path)
-            current_hash = self._compute_hash(file_path)
-
-            if rel_path not in self.state:
+            entry = self.state.get(rel_path)
+            if entry is None:
                 # New file
                 changed.append(file_path)
-            elif self.state[rel_path].get("hash") != current_hash:
+                continue
+
+            stat_key = self._stat_key(file_path)
+            if stat_key is not None and entry.get("stat") == stat_key:
+                # Fast path: metadata unchanged, skip hashing
+                continue
+            suspects.append((file_path, rel_path, entry, stat_key))
+
+        # Hash everything whose metadata moved in one bulk call
+        digests = self._compute_hashes([s[0] for s in suspects]) if suspects else {}
+        for file_path, rel_path, entry, stat_key in suspects:
+            if entry.get("hash") != digests.get(file_path, ""):
                 # Modified file
                 changed.append(file_path)
+            elif stat_key is not None:
+                # Touched but identical content: remember the new stat
+                entry["stat"] = stat_key
+                self._mark_dirty(rel_path)
 
         return changed
 
@@ -73,52 +105,202 @@ class IndexState:
     def update(self, file_path: Path, chunk_ids: list[str]):
         """Update state for a successfully indexed file."""
         rel_path = self._get_rel_path(file_path)
-        file_hash = self._compute_hash(file_path)
+        stat_key = self._stat_key(file_path)
+        previous = self.state.get(rel_path, {})
 
-        self.state[rel_path] = {"hash": file_hash, "chunks": chunk_ids}
+        if stat_key is not None and previous.get("stat") == stat_key and previous.get("hash"):
+            file_hash = previous["hash"]
+        else:
+            file_hash = self._compute_hash(file_path)
+
+        self.state[rel_path] = {"hash": file_hash, "chunks": chunk_ids, "stat": stat_key}
+        self._mark_dirty(rel_path)
 
     def remove(self, rel_path: str):
         """Remove file from state."""
         if rel_path in self.state:
             del self.state[rel_path]
+        self._dirty.discard(rel_path)
+        self._removed.add(rel_path)
 
-            if rel_path in self.state:
-                del self.state[rel_path]
+    def clear(self):
+        """Forget every tracked file (used by forced rebuilds)."""
+        self._removed.update(self.state)
+        self._dirty.clear()
+        self.state.clear()
+        # Keep the generation counter monotonic across rebuilds
+        generation = self._meta.get("generation")
+        self._meta.clear()
+        if generation is not None:
+            self._meta["generation"] = generation
+        self._meta_dirty = True
 
     def get_last_commit(self) -> str:
         """Get the commit hash of the last successful index."""
-        return self.state.get("__meta__", {}).get("commit", "")
+        return self._meta.get("commit", "")
 
     def update_commit(self, commit_hash: str):
         """Update the last indexed commit hash."""
-        if "__meta__" not in self.state:
-            self.state["__meta__"] = {}
-        self.state["__meta__"]["commit"] = commit_hash
+        self._meta["commit"] = commit_hash
+        self._meta_dirty = True
+
+    def get_generation(self) -> int:
+        """Monotonic counter bumped by every save that changed file rows."""
+        try:
+            return int(self._meta.get("generation", 0))
+        except ValueError:
+            return 0
 
     def save(self):
-        """Persist state to disk."""
+        """Persist rows changed since the last save."""
+        if not (self._dirty or self._removed or self._meta_dirty):
+            return
+        if self._dirty or self._removed:
+            self._meta["generation"] = str(self.get_generation() + 1)
+            self._meta_dirty = True
         try:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
-            self.cache_path.write_text(json.dumps(self.state, indent=2), encoding="utf-8")
+            with self._connect() as conn:
+                if self._removed:
+                    conn.executemany(
+                        "DELETE FROM files WHERE rel_path = ?",
+                        [(p,) for p in self._removed],
+                    )
+                if self._dirty:
+                    conn.executemany(
+                        """
+                        INSERT OR REPLACE INTO files
+                        (rel_path, hash, chunks, mtime_ns, size, inode)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        """,
+                        [self._to_row(p, self.state[p]) for p in self._dirty if p in self.state],
+                    )
+                if self._meta_dirty:
+                    conn.execute("DELETE FROM meta")
+                    conn.executemany(
+                        "INSERT INTO meta (key, value) VALUES (?, ?)", list(self._meta.items())
+                    )
+            self._dirty.clear()
+            self._removed.clear()
+            self._meta_dirty = False
         except Exception as e:
             logger.warning(f"Failed to save index state: {e}")
 
     def _load(self) -> dict[str, dict]:
-        """Load state from disk."""
-        if not self.cache_path.exists():
-            return {}
+        """Load state from disk, migrating the legacy JSON file if present."""
+        state: dict[str, dict] = {}
+        if not self.db_path.exists():
+            return self._migrate_legacy_json() if self.cache_path.exists() else {}
         try:
-            return json.loads(self.cache_path.read_text(encoding="utf-8"))
+            with self._connect() as conn:
+                for rel_path, file_hash, chunks, mtime_ns, size, inode in conn.execute(
+                    "SELECT rel_path, hash, chunks, mtime_ns, size, inode FROM files"
+                ):
+                    state[rel_path] = {
+                        "hash": file_hash,
+                        "chunks": json.loads(chunks) if chunks else [],
+                        "stat": [mtime_ns, size, inode] if mtime_ns is not None else None,
+                    }
+                self._meta = dict(conn.execute("SELECT key, value FROM meta"))
         except Exception as e:
             logger.warning(f"Failed to load index state: {e}")
             return {}
+        return state
+
+    def _migrate_legacy_json(self) -> dict[str, dict]:
+        """Import a pre-SQLite rag_index_state.json once, then drop it."""
+        try:
+            legacy = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning(f"Failed to load legacy index state: {e}")
+            return {}
+
+        meta = legacy.pop("__meta__", {}) or {}
+        self._meta = {k: str(v) for k, v in meta.items()}
+        self._meta_dirty = True
+        state = {}
+        for rel_path, entry in legacy.items():
+            state[rel_path] = {
+                "hash": entry.get("hash", ""),
+                "chunks": entry.get("chunks", []),
+                "stat": None,
+            }
+            self._dirty.add(rel_path)
+
+        self.state = state
+        self.save()
+        if not self._dirty:
+            try:
+                self.cache_path.unlink()
+            except OSError:
+                pass
+        logger.info(f"Migrated {len(state)} entries from legacy index state JSON")
+        return state
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the state database (one transaction), creating the schema on first use."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            self._init_schema(conn)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _init_schema(conn: sqlite3.Connection):
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS files (
+                rel_path TEXT PRIMARY KEY,
+                hash TEXT NOT NULL,
+                chunks TEXT,  -- JSON array of chunk IDs
+                mtime_ns INTEGER,
+                size INTEGER,
+                inode INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+
+    def _mark_dirty(self, rel_path: str):
+        self._dirty.add(rel_path)
+        self._removed.discard(rel_path)
+
+    @staticmethod
+    def _to_row(rel_path: str, entry: dict) -> tuple:
+        stat_key = entry.get("stat") or [None, None, None]
+        return (
+            rel_path,
+            entry.get("hash", ""),
+            json.dumps(entry.get("chunks", [])),
+            *stat_key,
+        )
+
+    @staticmethod
+    def _stat_key(path: Path) -> list[int] | None:
+        """(mtime_ns, size, inode) used to skip hashing unchanged files."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return [st.st_mtime_ns, st.st_size, st.st_ino]
 
     def _compute_hash(self, path: Path) -> str:
-        """Calculate SHA256 hash."""
+        """Calculate SHA256 hash (via the shared fingerprint service)."""
+        return self._compute_hashes([path]).get(path, "")
+
+    def _compute_hashes(self, paths: list[Path]) -> dict[Path, str]:
+        """Bulk SHA256 for many files; unreadable files are omitted."""
         try:
-            return hashlib.sha256(path.read_bytes()).hexdigest()
-        except Exception:
-            return ""
+            return get_fingerprint_store(self.cache_dir).fingerprint_many(paths)
+        except Exception as e:
+            logger.debug(f"Fingerprint service failed: {e}")
+            return {}
 
     def _get_rel_path(self, path: Path) -> str:
         """Get relative path key."""
@@ -0,0 +1,385 @@
+"""
+Lexical (BM25) index over code chunks.
+
+Complements vector search for queries that name things: identifiers are split
+on snake_case and camelCase boundaries (``getUserName`` -> ``getusername``,
+``get``, ``user``, ``name``) so both the exact symbol and its parts match.
+
+Postings, document lengths and the running corpus statistics live in SQLite
+next to the Chroma collection and are updated per chunk, so an incremental
+index update only touches the chunks of the files that changed.
+
+Search reads posting lists rarest term first and stops reading whole lists
+once the remaining (common) terms can no longer lift an unseen chunk into the
+top k (MaxScore); from then on those terms are only looked up for the chunks
+still in contention.
+"""
+
+import heapq
+import logging
+import math
+import re
+import sqlite3
+import threading
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from .code_indexer import CodeChunk
+
+logger = logging.getLogger(__name__)
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Term-frequency weight per field (a match in the name outweighs one in the body)
+_NAME_WEIGHT = 3
+_SIGNATURE_WEIGHT = 2
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*|\d+")
+_WORD_PART = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+_SYMBOL_QUERY = re.compile(r"^[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*(?:\(\))?$")
+
+
+def tokenize_code(text: str) -> list[str]:
+    """
+    Split text into lowercase search terms.
+
+    Every identifier yields its full form plus its snake_case/camelCase parts;
+    single-character parts are dropped.
+    """
+    tokens: list[str] = []
+    for match in _IDENTIFIER.finditer(text):
+        word = match.group()
+        full = word.lower()
+        parts = [p.lower() for piece in word.split("_") for p in _WORD_PART.findall(piece)]
+        if full not in parts and len(full) > 1:
+            tokens.append(full)
+        tokens.extend(p for p in parts if len(p) > 1)
+    return tokens
+
+
+def symbol_from_query(query: str) -> str | None:
+    """The identifier a query names exactly (``Class.method`` -> ``method``), if any."""
+    query = query.strip()
+    if not _SYMBOL_QUERY.match(query):
+        return None
+    return query.removesuffix("()").rsplit(".", 1)[-1]
+
+
+class LexicalIndex:
+    """
+    Persistent BM25 index keyed by chunk ID.
+
+    Usage:
+        index = LexicalIndex(persist_dir / "lexical_index.db")
+        index.add_chunks(chunks)
+        hits = index.search("parse config file", k=20)  # [(chunk_id, score)]
+        ids = index.lookup_symbol("parseConfig")
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+
+    @staticmethod
+    def chunk_terms(chunk: CodeChunk) -> Counter:
+        """Weighted term frequencies for one chunk."""
+        terms: Counter = Counter()
+        for term in tokenize_code(chunk.name or ""):
+            terms[term] += _NAME_WEIGHT
+        for term in tokenize_code(chunk.signature or ""):
+            terms[term] += _SIGNATURE_WEIGHT
+        terms.update(tokenize_code(chunk.docstring or ""))
+        terms.update(tokenize_code(chunk.content or ""))
+        return terms
+
+    def add_chunks(self, chunks: Iterable[CodeChunk]) -> int:
+        """Index (or re-index) chunks; returns how many were written."""
+        chunks = list(chunks)
+        if not chunks:
+            return 0
+        docs = []
+        postings = []
+        for chunk in chunks:
+            terms = self.chunk_terms(chunk)
+            docs.append(
+                (
+                    chunk.chunk_id,
+                    chunk.file_path,
+                    chunk.chunk_type,
+                    chunk.name,
+                    sum(terms.values()),
+                )
+            )
+            postings.extend((term, chunk.chunk_id, tf) for term, tf in terms.items())
+
+        try:
+            with self._connect() as conn:
+                self._delete(conn, [c.chunk_id for c in chunks])
+                conn.executemany(
+                    "INSERT INTO docs (chunk_id, file_path, chunk_type, name, length) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    docs,
+                )
+                conn.executemany(
+                    "INSERT INTO postings (term, chunk_id, tf) VALUES (?, ?, ?)", postings
+                )
+                self._adjust_stats(conn, len(docs), sum(d[4] for d in docs))
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to update lexical index: {e}")
+            return 0
+        return len(docs)
+
+    def remove_chunks(self, chunk_ids: Iterable[str]) -> None:
+        """Drop chunks from the index (unknown IDs are ignored)."""
+        chunk_ids = list(chunk_ids)
+        if not chunk_ids:
+            return
+        try:
+            with self._connect() as conn:
+                self._delete(conn, chunk_ids)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to update lexical index: {e}")
+
+    def clear(self) -> None:
+        """Remove every document and reset the statistics."""
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM postings")
+                conn.execute("DELETE FROM docs")
+                conn.execute("DELETE FROM meta")
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to clear lexical index: {e}")
+
+    def search(
+        self,
+        query: str,
+        k: int = 20,
+        file_filter: str | None = None,
+        chunk_types: list[str] | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Top-k chunks by BM25 score.
+
+        Args:
+            query: Free text; tokenized like the indexed chunks
+            k: Maximum hits
+            file_filter: Keep only chunks whose path contains this substring
+            chunk_types: Keep only these chunk types
+
+        Returns:
+            (chunk_id, score) pairs, best first
+        """
+        terms = sorted(set(tokenize_code(query)))
+        if not terms or k <= 0:
+            return []
+
+        filters = ""
+        filter_params: list = []
+        if file_filter:
+            filters += " AND instr(d.file_path, ?) > 0"
+            filter_params.append(file_filter)
+        if chunk_types:
+            filters += f" AND d.chunk_type IN ({','.join('?' * len(chunk_types))})"
+            filter_params.extend(chunk_types)
+
+        scores: dict[str, float] = {}
+        try:
+            with self._connect() as conn:
+                doc_count, total_length = self._stats(conn)
+                if not doc_count:
+                    return []
+                doc_freq = dict(
+                    conn.execute(
+                        "SELECT term, COUNT(*) FROM postings "
+                        f"WHERE term IN ({','.join('?' * len(terms))}) GROUP BY term",
+                        terms,
+                    )
+                )
+                avg_length = total_length / doc_count
+                idf = {
+                    term: math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+                    for term, df in doc_freq.items()
+                }
+                # Rarest first; bounds[i] = the most terms i.. can add to any one chunk
+                ordered = sorted(idf, key=idf.__getitem__, reverse=True)
+                bounds = [0.0] * (len(ordered) + 1)
+                for i in range(len(ordered) - 1, -1, -1):
+                    bounds[i] = bounds[i + 1] + idf[ordered[i]] * (BM25_K1 + 1)
+
+                for i, term in enumerate(ordered):
+                    threshold = heapq.nlargest(k, scores.values())[-1] if len(scores) >= k else 0.0
+                    if len(scores) < k or bounds[i] > threshold:
+                        rows = conn.execute(
+                            "SELECT p.chunk_id, p.tf, d.length "
+                            "FROM postings p JOIN docs d ON d.chunk_id = p.chunk_id "
+                            f"WHERE p.term = ?{filters}",
+                            [term, *filter_params],
+                        ).fetchall()
+                    else:
+                        # No unseen chunk can reach the top k any more
+                        contenders = [
+                            chunk_id
+                            for chunk_id, score in scores.items()
+                            if score + bounds[i] > threshold
+                        ]
+                        rows = []
+                        for start in range(0, len(contenders), 500):
+                            part = contenders[start : start + 500]
+                            rows.extend(
+                                conn.execute(
+                                    "SELECT p.chunk_id, p.tf, d.length "
+                                    "FROM postings p JOIN docs d ON d.chunk_id = p.chunk_id "
+                                    f"WHERE p.term = ? AND p.chunk_id IN "
+                                    f"({','.join('?' * len(part))})",
+                                    [term, *part],
+                                )
+                            )
+                    term_idf = idf[term]
+                    for chunk_id, tf, length in rows:
+                        norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+                        scores[chunk_id] = (
+                            scores.get(chunk_id, 0.0) + term_idf * tf * (BM25_K1 + 1) / norm
+                        )
+        except sqlite3.Error as e:
+            logger.warning(f"Lexical search failed: {e}")
+            return []
+
+        return heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+
+    def lookup_symbol(
+        self,
+        symbol: str,
+        file_filter: str | None = None,
+        chunk_types: list[str] | None = None,
+        limit: int = 50,
+    ) -> list[str]:
+        """Chunks named exactly `symbol` (one posting-list read)."""
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT d.chunk_id, d.file_path, d.chunk_type "
+                    "FROM postings p JOIN docs d ON d.chunk_id = p.chunk_id "
+                    "WHERE p.term = ? AND d.name = ? ORDER BY d.file_path, d.chunk_id",
+                    (symbol.lower(), symbol),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Lexical lookup failed: {e}")
+            return []
+        return [
+            chunk_id
+            for chunk_id, file_path, chunk_type in rows
+            if (not file_filter or file_filter in file_path)
+            and (not chunk_types or chunk_type in chunk_types)
+        ][:limit]
+
+    def __len__(self) -> int:
+        try:
+            with self._connect() as conn:
+                return self._stats(conn)[0]
+        except sqlite3.Error:
+            return 0
+
+    @property
+    def generation(self) -> str:
+        """IndexState generation this index was last synced with ("" if never)."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()
+        except sqlite3.Error:
+            return ""
+        return row[0] if row else ""
+
+    def set_generation(self, generation: int | str) -> None:
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('generation', ?)",
+                    (str(generation),),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to update lexical index: {e}")
+
+    # -------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """One transaction on the instance's connection (opened, with schema, on first use)."""
+        with self._lock:
+            if self._conn is None:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+                try:
+                    self._init_schema(conn)
+                except sqlite3.Error:
+                    conn.close()
+                    raise
+                self._conn = conn
+            with self._conn:
+                yield self._conn
+
+    @staticmethod
+    def _init_schema(conn: sqlite3.Connection):
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS docs (
+                chunk_id TEXT PRIMARY KEY,
+                file_path TEXT NOT NULL,
+                chunk_type TEXT,
+                name TEXT,
+                length INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT NOT NULL,
+                chunk_id TEXT NOT NULL,
+                tf INTEGER NOT NULL,
+                PRIMARY KEY (term, chunk_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_postings_chunk ON postings(chunk_id);
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+
+    def _delete(self, conn: sqlite3.Connection, chunk_ids: list[str]) -> None:
+        removed = 0
+        removed_length = 0
+        for chunk_id in chunk_ids:
+            row = conn.execute("SELECT length FROM docs WHERE chunk_id = ?", (chunk_id,)).fetchone()
+            if row is None:
+                continue
+            conn.execute("DELETE FROM postings WHERE chunk_id = ?", (chunk_id,))
+            conn.execute("DELETE FROM docs WHERE chunk_id = ?", (chunk_id,))
+            removed += 1
+            removed_length += row[0]
+        if removed:
+            self._adjust_stats(conn, -removed, -removed_length)
+
+    @staticmethod
+    def _stats(conn: sqlite3.Connection) -> tuple[int, int]:
+        """(document count, total document length), maintained incrementally."""
+        meta = dict(
+            conn.execute("SELECT key, value FROM meta WHERE key IN ('doc_count', 'total_length')")
+        )
+        return int(meta.get("doc_count", 0)), int(meta.get("total_length", 0))
+
+    def _adjust_stats(self, conn: sqlite3.Connection, docs: int, length: int) -> None:
+        doc_count, total_length = self._stats(conn)
+        conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [("doc_count", str(doc_count + docs)), ("total_length", str(total_length + length))],
+        )
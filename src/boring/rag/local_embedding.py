@@ -8,7 +8,7 @@ Features:
 - Zero-network operation after model download
 - Multiple model options (small to large)
 - Automatic model caching
-- Memory-efficient batch processing
+- Memory-efficient batch processing (shared engine, persistent embedding cache)
 - GPU acceleration when available
 """
 
@@ -72,7 +72,7 @@ class LocalEmbedding:
 
     def __init__(self, model_name: str | None = None):
         self.model_name = model_name or self._get_configured_model()
-        self._model = None
+        self._engine = None
         self._available: bool | None = None
 
     @classmethod
@@ -114,16 +114,23 @@ class LocalEmbedding:
 
         return self._available
 
+    @property
+    def _model(self):
+        """Loaded sentence-transformers model, if any (owned by the shared engine)."""
+        if self._engine is None:
+            return None
+        return self._engine._model
+
     def _ensure_loaded(self) -> bool:
-        """Ensure the model is loaded."""
-        if self._model is not None:
+        """Ensure the shared engine for this model is loaded."""
+        if self._engine is not None and self._engine.is_loaded:
             return True
 
         if not self.is_available:
             return False
 
         try:
-            from sentence_transformers import SentenceTransformer
+            from ..intelligence.embedding_service import get_embedding_engine
 
             # Resolve model name from config
             if self.model_name in EMBEDDING_MODELS:
@@ -131,14 +138,13 @@ class LocalEmbedding:
             else:
                 actual_model = self.model_name
 
-            logger.info(f"Loading embedding model: {actual_model}")
-
             # Set cache directory
             cache_dir = self._get_cache_dir()
             if cache_dir:
                 os.environ.setdefault("SENTENCE_TRANSFORMERS_HOME", str(cache_dir))
 
-            self._model = SentenceTransformer(actual_model)
+            self._engine = get_embedding_engine(actual_model)
+            self._engine.load()
             logger.info("Embedding model loaded successfully")
             return True
 
@@ -160,37 +166,34 @@ class LocalEmbedding:
         texts: list[str],
         batch_size: int = 32,
         show_progress: bool = False,
-    ) -> list[list[float]] | None:
+    ):
         """
         Generate embeddings for a list of texts.
 
+        Requests from concurrent callers are coalesced into shared model batches,
+        and texts embedded before are served from the persistent embedding cache.
+
         Args:
             texts: List of text strings to embed
-            batch_size: Batch size for processing
-            show_progress: Show progress bar
+            batch_size: Unused; batching is done by the shared engine
+            show_progress: Unused; kept for API compatibility
 
         Returns:
-            List of embedding vectors or None if unavailable
+            (len(texts), dim) float32 array or None if unavailable
         """
         if not self._ensure_loaded():
             return None
 
         try:
-            embeddings = self._model.encode(
-                texts,
-                batch_size=batch_size,
-                show_progress_bar=show_progress,
-                convert_to_numpy=True,
-            )
-            return embeddings.tolist()
+            return self._engine.embed(texts)
         except Exception as e:
             logger.error(f"Embedding generation failed: {e}")
             return None
 
-    def embed_single(self, text: str) -> list[float] | None:
-        """Embed a single text string."""
+    def embed_single(self, text: str):
+        """Embed a single text string as a (dim,) float32 array."""
         result = self.embed([text])
-        if result:
+        if result is not None and len(result):
             return result[0]
         return None
 
@@ -201,19 +204,15 @@ class LocalEmbedding:
             return EMBEDDING_MODELS[self.model_name]["dimensions"]
 
         # Try to detect from loaded model
-        if self._model is not None:
-            try:
-                return self._model.get_sentence_embedding_dimension()
-            except Exception:
-                pass
+        if self._engine is not None and self._engine.dimensions:
+            return self._engine.dimensions
 
         return 384  # Default for MiniLM
 
     def unload(self) -> None:
         """Unload the model to free memory."""
-        if self._model is not None:
-            del self._model
-            self._model = None
+        if self._engine is not None and self._engine.is_loaded:
+            self._engine.unload()
             logger.info("Embedding model unloaded")
 
 
@@ -305,7 +304,8 @@ class ChromaLocalEmbeddingFunction:
         if result is None:
             raise RuntimeError("Embedding generation failed")
 
-        return result
+        # Chroma < 0.5 only accepts nested lists
+        return result.tolist()
 
 
 def get_chroma_embedding_function(offline_mode: bool = False):
@@ -10,11 +10,17 @@ V11.0 Enhancements:
 - TypeScript interface and type alias support
 - C++ namespace and template support
 - Structured validation for cross-language precision
+
+Compiled queries are cached per language, and trees of recently re-indexed files
+are kept so an edited file is reparsed incrementally (tree.edit + reparse).
 """
 
 import logging
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +39,41 @@ except ImportError:
     )
 
 
+def _common_prefix(a: bytes, b: bytes, block: int = 4096) -> int:
+    """Length of the common prefix (compares whole blocks first)."""
+    limit = min(len(a), len(b))
+    i = 0
+    while i + block <= limit and a[i : i + block] == b[i : i + block]:
+        i += block
+    while i < limit and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _point(source: bytes, offset: int) -> tuple[int, int]:
+    """(row, byte column) of a byte offset, as tree-sitter expects."""
+    row = source.count(b"\n", 0, offset)
+    return row, offset - (source.rfind(b"\n", 0, offset) + 1)
+
+
+def _edit_tree(tree: Any, old: bytes, new: bytes) -> None:
+    """Record the single changed byte range between `old` and `new` on `tree`."""
+    start = _common_prefix(old, new)
+    # Common suffix, not overlapping the prefix
+    max_suffix = min(len(old), len(new)) - start
+    suffix = min(_common_prefix(old[::-1], new[::-1]), max_suffix)
+    old_end = len(old) - suffix
+    new_end = len(new) - suffix
+    tree.edit(
+        start_byte=start,
+        old_end_byte=old_end,
+        new_end_byte=new_end,
+        start_point=_point(old, start),
+        old_end_point=_point(old, old_end),
+        new_end_point=_point(new, new_end),
+    )
+
+
 @dataclass
 class ParsedChunk:
     """A semantic chunk of code."""
@@ -303,8 +344,16 @@ class TreeSitterParser:
         """,
     }
 
-    def __init__(self):
+    # Files whose last tree is kept for incremental reparsing
+    TREE_CACHE_SIZE = 64
+
+    def __init__(self, tree_cache_size: int = TREE_CACHE_SIZE):
         self.parsers = {}
+        self.queries = {}  # language -> compiled query
+        # path -> (language, tree, source bytes), least recently used first
+        self._trees: OrderedDict[str, tuple[str, Any, bytes]] = OrderedDict()
+        self._tree_cache_size = tree_cache_size
+        self._lock = threading.Lock()
 
     def is_available(self) -> bool:
         """Check if tree-sitter is available."""
@@ -314,10 +363,13 @@ class TreeSitterParser:
         """Determine language from file extension."""
         return self.EXT_TO_LANG.get(file_path.suffix.lower())
 
-    def parse_file(self, file_path: Path) -> list[ParsedChunk]:
+    def parse_file(self, file_path: Path, incremental: bool = False) -> list[ParsedChunk]:
         """
         Parse a file and extract semantic chunks.
         Returns empty list if language not supported or parser fails.
+
+        With incremental=True the tree is kept (bounded LRU) and the next parse
+        of the same path only re-parses the edited region.
         """
         if not HAS_TREE_SITTER:
             return []
@@ -332,32 +384,37 @@ class TreeSitterParser:
             logger.warning(f"Failed to read file {file_path}: {e}")
             return []
 
-        return self.extract_chunks(content, lang_name)
+        cache_key = str(file_path.resolve()) if incremental else None
+        return self.extract_chunks(content, lang_name, cache_key=cache_key)
+
+    def forget(self, file_path: Path) -> None:
+        """Drop the cached tree of a file (e.g. after it was deleted)."""
+        with self._lock:
+            self._trees.pop(str(Path(file_path).resolve()), None)
 
-    def extract_chunks(self, code: str, language: str) -> list[ParsedChunk]:
+    def extract_chunks(
+        self, code: str, language: str, cache_key: str | None = None
+    ) -> list[ParsedChunk]:
         """
         Extract chunks from code string using tree-sitter.
 
         V11.0: Enhanced to handle interface, type_alias, namespace, and Go method receivers.
+
+        Args:
+            code: Source text
+            language: Tree-sitter language name
+            cache_key: Reuse/keep this key's previous tree for an incremental parse
         """
         if not HAS_TREE_SITTER:
             return []
 
         try:
-            # Lazy load parser
-            if language not in self.parsers:
-                self.parsers[language] = get_parser(language)
-
-            parser = self.parsers[language]
-            tree = parser.parse(bytes(code, "utf8"))
+            tree = self._parse(code.encode("utf8"), language, cache_key)
 
-            query_str = self.QUERIES.get(language)
-            if not query_str:
+            query = self._get_query(language)
+            if query is None:
                 return []
 
-            ts_language = get_language(language)
-            query = ts_language.query(query_str)
-
             chunk_types = {
                 "function",
                 "class",
@@ -469,6 +526,42 @@ class TreeSitterParser:
             logger.error(f"Tree-sitter match failure for {language}: {e}")
             return []
 
+    def _get_query(self, language: str) -> Any:
+        """Compiled query for a language (compiled once per parser instance)."""
+        query = self.queries.get(language)
+        if query is None:
+            query_str = self.QUERIES.get(language)
+            if not query_str:
+                return None
+            query = self.queries[language] = get_language(language).query(query_str)
+        return query
+
+    def _parse(self, source: bytes, language: str, cache_key: str | None) -> Any:
+        """Parse source, incrementally from the cached tree of `cache_key` if there is one."""
+        with self._lock:
+            # Lazy load parser
+            if language not in self.parsers:
+                self.parsers[language] = get_parser(language)
+            parser = self.parsers[language]
+
+            if cache_key is None:
+                return parser.parse(source)
+
+            cached = self._trees.pop(cache_key, None)
+            if cached and cached[0] == language and cached[2] == source:
+                tree = cached[1]
+            elif cached and cached[0] == language:
+                old_tree = cached[1]
+                _edit_tree(old_tree, cached[2], source)
+                tree = parser.parse(source, old_tree)
+            else:
+                tree = parser.parse(source)
+
+            self._trees[cache_key] = (language, tree, source)
+            while len(self._trees) > self._tree_cache_size:
+                self._trees.popitem(last=False)
+            return tree
+
     def validate_language_support(self, language: str, test_code: str) -> dict:
         """
         Validate that Tree-sitter queries work correctly for a given language.
@@ -2,7 +2,8 @@
 RAG Retriever - Hybrid Search Engine for Code (V10.23 Enhanced)
 
 Combines:
-1. Vector search (semantic similarity via ChromaDB)
+1. Vector search (semantic similarity via ChromaDB), fused with BM25 over
+   identifiers via reciprocal-rank fusion
 2. Graph traversal (dependency-aware context expansion)
 3. Recency weighting (recent edits rank higher)
 4. Intelligent ranking (usage-based learning) - V10.22
@@ -15,6 +16,7 @@ Performance optimizations (V10.15):
 - Batch upsert operations
 - Lazy graph building
 - Connection pooling for ChromaDB
+- Pipelined index build: process-pool chunking feeding a batching writer thread
 
 Intelligence enhancements (V10.22):
 - IntelligentRanker integration for usage-based re-ranking
@@ -29,25 +31,54 @@ V10.23 enhancements:
 Per user decision: 1-layer graph expansion with smart jump capability.
 """
 
+import atexit
 import logging
+import os
+import queue
 import threading
 import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
 from .code_indexer import CodeChunk, CodeIndexer, IndexStats
-from .graph_rag import GraphRAG, GraphStats
+from .graph_builder import DependencyGraph, GraphStats
 from .hyde import HyDEResult, get_hyde_expander
 from .index_state import IndexState
-
-# from .graph_builder import DependencyGraph # Deprecated
+from .lexical_index import LexicalIndex, symbol_from_query
 from .reranker import get_ensemble_reranker
 
 logger = logging.getLogger(__name__)
 
 # Constants
 _QUERY_CACHE_TTL = 300  # 5 minutes
+_QUERY_CACHE_MAX_ENTRIES = 512
+_QUERY_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Approximate size of cached chunk text
+_RESULT_OVERHEAD_BYTES = 256  # Rough per-result cost beyond chunk content
+
+# Index pipeline tuning
+_UPSERT_BATCH_SIZE = 100  # Chunks per Chroma upsert (embedding batch)
+_PIPELINE_QUEUE_SIZE = 256  # Parsed files buffered between parse and write stages
+_PARALLEL_MIN_FILES = 64  # Below this, process-pool startup outweighs the gain
+_MAX_AUTO_WORKERS = 8
+_INFLIGHT_PER_WORKER = 4  # Submitted-but-unfinished files per worker
+
+# Index location when no persist_dir is given (relative to the project root)
+_DEFAULT_PERSIST_DIR = Path(".boring_memory") / "rag_db"
+
+# Startup hydration
+_HYDRATION_PAGE_SIZE = 2000  # Metadata rows fetched per Chroma get()
+_GRAPH_SNAPSHOT_FILENAME = "graph_snapshot.bin"
+_GRAPH_SNAPSHOT_EVERY = 50  # Incremental file updates between graph snapshot writes
+# Bumped when snapshots from older releases must not be reused (2: dependency backfill)
+_GRAPH_SNAPSHOT_VERSION = 2
+
+# Lexical (BM25) index fused with vector hits
+_LEXICAL_INDEX_FILENAME = "lexical_index.db"
+_RRF_K = 60  # Reciprocal-rank fusion constant
 
 # =============================================================================
 # Intelligence: Optional IntelligentRanker integration (V10.23 Enhanced)
@@ -108,8 +139,100 @@ def clear_session_context():
 # =============================================================================
 # Performance: Query result cache (V13.1: Configurable TTL)
 # =============================================================================
-_query_cache: dict[str, tuple[list, float]] = {}  # query_hash -> (results, timestamp)
+class _QueryResultCache:
+    """
+    LRU cache of retrieval results, bounded by entry count and approximate bytes.
+
+    Keys start with an index scope (persist dir + collection) and that scope's
+    generation; bump_generation() is called on every index write, which makes
+    older entries unreachable and drops them eagerly.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = _QUERY_CACHE_MAX_ENTRIES,
+        max_bytes: int = _QUERY_CACHE_MAX_BYTES,
+        ttl: float = _QUERY_CACHE_TTL,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # key -> (results, timestamp, size_bytes)
+        self._entries: OrderedDict[tuple, tuple[list, float, int]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def generation(self, scope: str) -> int:
+        with _cache_lock:
+            return self._generations.get(scope, 0)
+
+    def bump_generation(self, scope: str) -> None:
+        """Invalidate every cached result for an index scope."""
+        with _cache_lock:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+            for key in [k for k in self._entries if k[0] == scope]:
+                self._discard(key)
+
+    def get(self, key: tuple) -> list | None:
+        with _cache_lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if time.time() - entry[1] >= self.ttl:
+                self._discard(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: tuple, results: list) -> None:
+        size = sum(
+            len(getattr(getattr(r, "chunk", None), "content", "") or "") + _RESULT_OVERHEAD_BYTES
+            for r in results
+        )
+        with _cache_lock:
+            if key in self._entries:
+                self._discard(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (results, time.time(), size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with _cache_lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        with _cache_lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def _discard(self, key: tuple) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 _cache_lock = threading.RLock()
+_query_cache = _QueryResultCache()
 
 
 def _get_cache_ttl() -> float:
@@ -124,9 +247,7 @@ def _get_cache_ttl() -> float:
 
 def _clear_query_cache():
     """Clear the query cache (for testing or cache invalidation)."""
-    global _query_cache
-    with _cache_lock:
-        _query_cache.clear()
+    _query_cache.clear()
 
 
 from ..core.dependencies import DependencyManager
@@ -141,7 +262,7 @@ class RetrievalResult:
 
     chunk: CodeChunk
     score: float
-    retrieval_method: str  # "vector", "graph", "keyword", "session"
+    retrieval_method: str  # "vector", "hybrid", "graph", "keyword", "session"
     distance: float | None = None
     # V10.23: Enhanced metadata
     session_boost: float = 0.0  # Boost from session context
@@ -160,6 +281,12 @@ class RAGStats:
     # V10.23: Session stats
     session_context_active: bool = False
     session_boosts_applied: int = 0
+    # Query result cache
+    query_cache_hits: int = 0
+    query_cache_misses: int = 0
+    query_cache_evictions: int = 0
+    query_cache_entries: int = 0
+    query_cache_bytes: int = 0
 
 
 class RAGRetriever:
@@ -194,7 +321,7 @@ class RAGRetriever:
         additional_roots: list[Path] | None = None,
     ):
         self.project_root = Path(project_root)
-        self.persist_dir = persist_dir or (self.project_root / ".boring_memory" / "rag_db")
+        self.persist_dir = persist_dir or (self.project_root / _DEFAULT_PERSIST_DIR)
         self.collection_name = collection_name or self.COLLECTION_NAME
 
         # Multi-project support: list of all project roots to index
@@ -208,9 +335,14 @@ class RAGRetriever:
         # Components
         self.indexer = CodeIndexer(self.project_root)
         self.index_state = IndexState(self.project_root)
-        self.graph: GraphRAG | None = None
+        self.lexical_index = LexicalIndex(self.persist_dir / _LEXICAL_INDEX_FILENAME)
+        self.graph: DependencyGraph | None = None
+        self._graph_dirty_updates = 0  # Incremental updates not yet in the graph snapshot
+        self._graph_flush_registered = False
         self._chunks: dict[str, CodeChunk] = {}
         self._file_to_chunks: dict[str, list[str]] = {}  # file_path -> chunk_ids
+        # Chunks hydrated from metadata only; bodies are fetched on first use
+        self._lazy_content_ids: set[str] = set()
 
         # ChromaDB client
         self.client = None
@@ -279,13 +411,21 @@ class RAGRetriever:
         """Check if RAG system is available."""
         return CHROMA_AVAILABLE and self.collection is not None
 
-    def build_index(self, force: bool = False, incremental: bool = True) -> int:
+    def build_index(
+        self,
+        force: bool = False,
+        incremental: bool = True,
+        workers: int | None = None,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> int:
         """
         Index the entire codebase.
 
         Args:
             force: If True, rebuild even if index exists
             incremental: If True (and not force), only index changed files.
+            workers: Parser processes for chunking (None = auto, 1 = serial)
+            progress_callback: Called as (files_done, files_total) while indexing
 
         Returns:
             Number of chunks indexed
@@ -303,19 +443,17 @@ class RAGRetriever:
                 self.collection = self.client.create_collection(
                     name=self.collection_name, metadata={"hnsw:space": "cosine"}
                 )
-                self.index_state = IndexState(self.project_root)  # Reset state
-                # Clear state file explicitly?
-                # IndexState loads from disk. We should clear it.
-                # But IndexState doesn't have clear method yet beyond remove items.
-                # For now we just ignore load?
-                # Better: implement clear() in IndexState later or just iterate deletions.
-                # Here we assume starting fresh means empty DB, but IndexState might still have data on disk.
-                # We should probably clear cached state file too.
-                # self.index_state.clear() # user needs to add this method or we assume overwrite updates.
-                pass
+                self.index_state.clear()
+                self.lexical_index.clear()
+                self._save_index_state()
             except Exception as e:
                 logger.error(f"Failed to clear collection: {e}")
                 return 0
+        elif existing_count and self.lexical_index.generation != str(
+            self.index_state.get_generation()
+        ):
+            # Index predates the lexical index or an update was interrupted
+            self._rebuild_lexical_index()
 
         # 2. Collect Files from all project roots (multi-project support)
         all_files = []
@@ -383,78 +521,21 @@ class RAGRetriever:
                     self.collection.delete(ids=chunk_ids)
                 except Exception:
                     pass
+                self.lexical_index.remove_chunks(chunk_ids)
             self.index_state.remove(rel_path)
+            self.indexer.forget(self.project_root / rel_path)
             logger.info(f"Removed stale file: {rel_path}")
 
-        # 5. Handle Indexing
-        new_chunks_buffer = []
-        total_indexed = 0
-
-        # Reset indexer stats for accurate reporting
-        self.indexer.stats = IndexStats()
-
-        for file_path in files_to_index:
-            # Clear old chunks for modified file
-            rel_path = self.index_state._get_rel_path(file_path)
-            old_ids = self.index_state.get_chunks_for_file(file_path)
-            if old_ids:
-                try:
-                    self.collection.delete(ids=old_ids)
-                except Exception:
-                    pass
-
-            # Generate new chunks
-            try:
-                chunks = list(self.indexer.index_file(file_path))
-            except Exception as e:
-                logger.warning(f"Failed to index {file_path}: {e}")
-                self.indexer.stats.skipped_files += 1
-                continue
-
-            if not chunks:
-                continue
-
-            # Track stats per file
-            self.indexer.stats.total_files += 1
-            for chunk in chunks:
-                self.indexer.stats.total_chunks += 1
-                if chunk.chunk_type == "function":
-                    self.indexer.stats.functions += 1
-                elif chunk.chunk_type == "class":
-                    self.indexer.stats.classes += 1
-                elif chunk.chunk_type == "method":
-                    self.indexer.stats.methods += 1
-                elif chunk.chunk_type == "script":
-                    self.indexer.stats.script_chunks += 1
-
-            # Batch upsert logic preparation
-            new_chunks_buffer.extend(chunks)
-
-            # Update state with new IDs
-            ids = [c.chunk_id for c in chunks]
-            self.index_state.update(file_path, ids)
-            total_indexed += len(chunks)
-
-        # 6. Bulk Upsert to Chroma
-        if new_chunks_buffer:
-            ids = [c.chunk_id for c in new_chunks_buffer]
-            documents = [self._chunk_to_document(c) for c in new_chunks_buffer]
-            metadatas = [self._chunk_to_metadata(c) for c in new_chunks_buffer]
-
-            batch_size = 100
-            for i in range(0, len(new_chunks_buffer), batch_size):
-                end = min(i + batch_size, len(new_chunks_buffer))
-                try:
-                    self.collection.upsert(
-                        ids=ids[i:end], documents=documents[i:end], metadatas=metadatas[i:end]
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to upsert batch: {e}")
+        # 5-6. Parse/chunk files and upsert to Chroma as batches fill
+        total_indexed = self._run_index_pipeline(
+            files_to_index, workers=workers, progress_callback=progress_callback
+        )
 
         # 7. Persist State
         if current_commit:
             self.index_state.update_commit(current_commit)
-        self.index_state.save()
+        self._save_index_state()
+        self._invalidate_query_cache()
 
         # 8. Reload fully for graph building (Hybrid RAG needs graph)
         # Note: In a huge repo, loading all chunks might be heavy.
@@ -465,8 +546,11 @@ class RAGRetriever:
         # Update graph with new/all chunks
         # _load_chunks_from_db handles rebuilding self._chunks and self.graph
 
+        stats = self.indexer.stats
         logger.info(
-            f"Indexed {len(files_to_index)} files ({total_indexed} chunks). Removed {len(stale_files_rel)} stale files."
+            f"Indexed {len(files_to_index)} files ({total_indexed} chunks) in "
+            f"{stats.elapsed_seconds:.2f}s with {stats.workers} worker(s) "
+            f"({stats.files_per_second:.1f} files/s). Removed {len(stale_files_rel)} stale files."
         )
 
         return self.collection.count()
@@ -502,14 +586,21 @@ class RAGRetriever:
             return []
 
         # Generate cache key
-        cache_key = f"{query}:{n_results}:{expand_graph}:{file_filter}:{chunk_types}:{threshold}:{use_hyde}:{use_rerank}"
+        cache_key = self._query_cache_key(
+            query,
+            n_results,
+            expand_graph,
+            file_filter,
+            chunk_types,
+            threshold,
+            use_hyde,
+            use_rerank,
+        )
 
         # Check cache
-        with _cache_lock:
-            if cache_key in _query_cache:
-                cached_results, cache_time = _query_cache[cache_key]
-                if time.time() - cache_time < _QUERY_CACHE_TTL:
-                    return cached_results
+        cached_results = _query_cache.get(cache_key)
+        if cached_results is not None:
+            return cached_results
 
         # Perform actual retrieval
         results = self._retrieve_impl(
@@ -524,11 +615,118 @@ class RAGRetriever:
         )
 
         # Update cache
-        with _cache_lock:
-            _query_cache[cache_key] = (results, time.time())
+        _query_cache.put(cache_key, results)
 
         return results
 
+    def retrieve_many(
+        self,
+        queries: list[str],
+        n_results: int = 10,
+        expand_graph: bool = True,
+        file_filter: str | None = None,
+        chunk_types: list[str] | None = None,
+        threshold: float = 0.0,
+        use_hyde: bool = True,
+        use_rerank: bool = True,
+    ) -> list[list[RetrievalResult]]:
+        """
+        Retrieve for several queries in one round trip.
+
+        All uncached queries share a single multi-query vector search (the
+        embedding function sees one batch), one content fetch for the union of
+        hit chunks, and one cross-encoder batch for reranking.
+
+        Args:
+            queries: Queries to run; results are returned in the same order
+            (other arguments as in retrieve())
+
+        Returns:
+            One result list per query
+        """
+        if not self.is_available or not queries:
+            return [[] for _ in queries]
+
+        results: list[list[RetrievalResult] | None] = []
+        pending: dict[str, list[int]] = {}  # unique uncached query -> positions
+        for i, query in enumerate(queries):
+            cache_key = self._query_cache_key(
+                query,
+                n_results,
+                expand_graph,
+                file_filter,
+                chunk_types,
+                threshold,
+                use_hyde,
+                use_rerank,
+            )
+            cached = _query_cache.get(cache_key)
+            results.append(cached)
+            if cached is None:
+                pending.setdefault(query, []).append(i)
+
+        if pending:
+            unique = list(pending)
+            fresh = self._retrieve_many_impl(
+                unique,
+                n_results,
+                expand_graph,
+                file_filter,
+                chunk_types,
+                threshold,
+                use_hyde=use_hyde,
+                use_rerank=use_rerank,
+            )
+            for query, query_results in zip(unique, fresh, strict=True):
+                cache_key = self._query_cache_key(
+                    query,
+                    n_results,
+                    expand_graph,
+                    file_filter,
+                    chunk_types,
+                    threshold,
+                    use_hyde,
+                    use_rerank,
+                )
+                _query_cache.put(cache_key, query_results)
+                for i in pending[query]:
+                    results[i] = query_results
+
+        return [r if r is not None else [] for r in results]
+
+    def _query_cache_key(
+        self,
+        query: str,
+        n_results: int,
+        expand_graph: bool,
+        file_filter: str | None,
+        chunk_types: list[str] | None,
+        threshold: float,
+        use_hyde: bool,
+        use_rerank: bool,
+    ) -> tuple:
+        """Normalized cache key, tied to this index's current generation."""
+        return (
+            self._cache_scope,
+            _query_cache.generation(self._cache_scope),
+            " ".join(query.split()),
+            n_results,
+            expand_graph,
+            file_filter or None,
+            tuple(sorted(chunk_types)) if chunk_types else None,
+            float(threshold),
+            use_hyde,
+            use_rerank,
+        )
+
+    @property
+    def _cache_scope(self) -> str:
+        return f"{self.persist_dir}::{self.collection_name}"
+
+    def _invalidate_query_cache(self) -> None:
+        """Called after every write to the collection."""
+        _query_cache.bump_generation(self._cache_scope)
+
     def _retrieve_impl(
         self,
         query: str,
@@ -543,79 +741,331 @@ class RAGRetriever:
         """
         Internal implementation of retrieve without caching.
         """
+        seen_ids: set[str] = set()
+
+        # Exact identifier with enough hits: answered from one posting list, no embedding call
+        symbol_hits = self._symbol_results(query, n_results, file_filter, chunk_types)
+        if len(symbol_hits) >= n_results:
+            retrieved = symbol_hits
+            seen_ids.update(r.chunk.chunk_id for r in symbol_hits)
+        else:
+            # 1. HyDE Expansion (V10.24+)
+            search_query = self._expand_query(query, use_hyde)
 
-        # 1. HyDE Expansion (V10.24+)
-        search_query = query
-        hyde_result: HyDEResult | None = None
-        if use_hyde:
+            # Build ChromaDB filter
+            where_filter = self._build_where_filter(file_filter, chunk_types)
+
+            # Vector search
             try:
-                expander = get_hyde_expander()
-                hyde_result = expander.expand_query(query)
-                search_query = hyde_result.hypothetical_code
-                logger.debug(f"HyDE expansion applied for query: {query[:50]}...")
+                results = self.collection.query(
+                    query_texts=[search_query],
+                    n_results=min(n_results * 2, 50),  # Fetch extra for graph expansion/reranking
+                    where=where_filter,
+                )
             except Exception as e:
-                logger.warning(f"HyDE expansion failed: {e}")
+                logger.error(f"ChromaDB query failed: {e}")
+                return []
+
+            retrieved = self._collect_vector_results(results, 0, threshold, seen_ids, {})
+            retrieved = self._fuse_lexical(
+                retrieved,
+                self._lexical_hits(query, n_results, file_filter, chunk_types, symbol_hits),
+                seen_ids,
+            )
 
-        # Build ChromaDB filter
-        where_filter = self._build_where_filter(file_filter, chunk_types)
+        # 1-layer graph expansion (per user decision)
+        if expand_graph:
+            self._expand_with_graph(retrieved, seen_ids)
 
-        # Vector search
-        try:
-            results = self.collection.query(
-                query_texts=[search_query],
-                n_results=min(n_results * 2, 50),  # Fetch extra for graph expansion/reranking
-                where=where_filter,
+        self._ensure_content([r.chunk for r in retrieved])
+
+        retrieved = self._boost_and_rank(query, retrieved, n_results)
+
+        # =================================================================
+        # HYBRID RAG: Cross-Encoder Reranking (V10.24+)
+        # =================================================================
+        if use_rerank and len(retrieved) > 1:
+            try:
+                reranker = get_ensemble_reranker()
+                # Use ensemble reranker to combine semantic CE scores with metadata
+                reranked_indices = reranker.rerank(
+                    query=query,
+                    chunks=[r.chunk for r in retrieved],
+                    original_scores=[r.score for r in retrieved],
+                    top_k=n_results,
+                )
+                retrieved = self._apply_rerank(retrieved, reranked_indices)
+                logger.debug(f"Cross-Encoder reranking applied to {len(retrieved)} results")
+            except Exception as e:
+                logger.warning(f"Reranking failed: {e}")
+
+        # Sort by score and limit
+        retrieved.sort(key=lambda x: x.score, reverse=True)
+        return retrieved[:n_results]
+
+    def _retrieve_many_impl(
+        self,
+        queries: list[str],
+        n_results: int,
+        expand_graph: bool,
+        file_filter: str | None,
+        chunk_types: list[str] | None,
+        threshold: float,
+        use_hyde: bool = True,
+        use_rerank: bool = True,
+    ) -> list[list[RetrievalResult]]:
+        """Batched counterpart of _retrieve_impl (no caching)."""
+        seen: list[set[str]] = [set() for _ in queries]
+        symbol_hits = [
+            self._symbol_results(query, n_results, file_filter, chunk_types) for query in queries
+        ]
+        # Exact-symbol queries with enough hits skip the vector search entirely
+        vector_rows = {
+            qi: row
+            for row, qi in enumerate(
+                i for i, hits in enumerate(symbol_hits) if len(hits) < n_results
             )
+        }
+
+        results: dict = {}
+        if vector_rows:
+            search_queries = [self._expand_query(queries[qi], use_hyde) for qi in vector_rows]
+            where_filter = self._build_where_filter(file_filter, chunk_types)
+            try:
+                results = self.collection.query(
+                    query_texts=search_queries,
+                    n_results=min(n_results * 2, 50),
+                    where=where_filter,
+                )
+            except Exception as e:
+                logger.error(f"ChromaDB query failed: {e}")
+                return [[] for _ in queries]
+
+        # Chunks reconstructed for one query are reused by the others
+        shared: dict[str, CodeChunk] = {}
+        per_query: list[list[RetrievalResult]] = []
+        for qi, seen_ids in enumerate(seen):
+            if qi in vector_rows:
+                retrieved = self._collect_vector_results(
+                    results, vector_rows[qi], threshold, seen_ids, shared
+                )
+                retrieved = self._fuse_lexical(
+                    retrieved,
+                    self._lexical_hits(
+                        queries[qi], n_results, file_filter, chunk_types, symbol_hits[qi]
+                    ),
+                    seen_ids,
+                )
+            else:
+                retrieved = symbol_hits[qi]
+                seen_ids.update(r.chunk.chunk_id for r in retrieved)
+            if expand_graph:
+                self._expand_with_graph(retrieved, seen_ids)
+            per_query.append(retrieved)
+
+        unique_chunks = {r.chunk.chunk_id: r.chunk for rs in per_query for r in rs}
+        self._ensure_content(list(unique_chunks.values()))
+
+        per_query = [
+            self._boost_and_rank(query, retrieved, n_results)
+            for query, retrieved in zip(queries, per_query, strict=True)
+        ]
+
+        if use_rerank:
+            batch = [i for i, retrieved in enumerate(per_query) if len(retrieved) > 1]
+            if batch:
+                try:
+                    reranked = get_ensemble_reranker().rerank_many(
+                        [
+                            (
+                                queries[i],
+                                [r.chunk for r in per_query[i]],
+                                [r.score for r in per_query[i]],
+                            )
+                            for i in batch
+                        ],
+                        top_k=n_results,
+                    )
+                    for i, reranked_indices in zip(batch, reranked, strict=True):
+                        per_query[i] = self._apply_rerank(per_query[i], reranked_indices)
+                except Exception as e:
+                    logger.warning(f"Reranking failed: {e}")
+
+        output = []
+        for retrieved in per_query:
+            retrieved.sort(key=lambda x: x.score, reverse=True)
+            output.append(retrieved[:n_results])
+        return output
+
+    def _expand_query(self, query: str, use_hyde: bool) -> str:
+        """Return the text to embed for a query (HyDE code when enabled)."""
+        if not use_hyde:
+            return query
+        try:
+            expander = get_hyde_expander()
+            hyde_result: HyDEResult = expander.expand_query(query)
+            logger.debug(f"HyDE expansion applied for query: {query[:50]}...")
+            return hyde_result.hypothetical_code
         except Exception as e:
-            logger.error(f"ChromaDB query failed: {e}")
-            return []
+            logger.warning(f"HyDE expansion failed: {e}")
+            return query
 
+    def _collect_vector_results(
+        self,
+        results: dict,
+        query_index: int,
+        threshold: float,
+        seen_ids: set[str],
+        shared: dict[str, CodeChunk],
+    ) -> list[RetrievalResult]:
+        """Turn one query's rows of a Chroma result into RetrievalResults."""
         retrieved: list[RetrievalResult] = []
-        seen_ids: set[str] = set()
+        if not results or not results.get("ids"):
+            return retrieved
+
+        # Narrow the batched response to this query's row
+        row = {
+            key: [value[query_index]]
+            for key, value in results.items()
+            if isinstance(value, list) and len(value) > query_index
+        }
+        if "ids" not in row:
+            return retrieved
 
-        # Process vector search results
-        if results and results.get("ids"):
-            for i, chunk_id in enumerate(results["ids"][0]):
-                if chunk_id in seen_ids:
-                    continue
-                seen_ids.add(chunk_id)
+        for i, chunk_id in enumerate(row["ids"][0]):
+            if chunk_id in seen_ids:
+                continue
+            seen_ids.add(chunk_id)
 
-                # Calculate score from distance
-                distance = results["distances"][0][i] if results.get("distances") else 0.5
-                score = 1.0 - min(distance, 1.0)  # Convert distance to similarity
+            # Calculate score from distance
+            distance = row["distances"][0][i] if row.get("distances") else 0.5
+            score = 1.0 - min(distance, 1.0)  # Convert distance to similarity
 
-                # Filter by threshold
-                if score < threshold:
-                    continue
+            # Filter by threshold
+            if score < threshold:
+                continue
 
-                # Get chunk from cache or reconstruct
-                chunk = self._get_or_reconstruct_chunk(chunk_id, results, i)
-                if not chunk:
-                    continue
+            # Get chunk from cache or reconstruct
+            chunk = shared.get(chunk_id) or self._get_or_reconstruct_chunk(chunk_id, row, i)
+            if not chunk:
+                continue
+            shared[chunk_id] = chunk
+
+            retrieved.append(
+                RetrievalResult(
+                    chunk=chunk, score=score, retrieval_method="vector", distance=distance
+                )
+            )
+        return retrieved
+
+    def _symbol_results(
+        self,
+        query: str,
+        n_results: int,
+        file_filter: str | None,
+        chunk_types: list[str] | None,
+    ) -> list[RetrievalResult]:
+        """Chunks named exactly by an identifier query (empty for anything else)."""
+        symbol = symbol_from_query(query)
+        if not symbol:
+            return []
+        chunk_ids = self.lexical_index.lookup_symbol(
+            symbol, file_filter, chunk_types, limit=min(n_results * 2, 50)
+        )
+        return [
+            RetrievalResult(chunk=chunk, score=1.0, retrieval_method="keyword")
+            for chunk in self._chunks_by_id(chunk_ids)
+        ]
+
+    def _lexical_hits(
+        self,
+        query: str,
+        n_results: int,
+        file_filter: str | None,
+        chunk_types: list[str] | None,
+        symbol_hits: list[RetrievalResult],
+    ) -> list[tuple[str, float]]:
+        """BM25 ranking for fusion, led by any exact-symbol hits."""
+        exact = {r.chunk.chunk_id: 1.0 for r in symbol_hits}
+        hits = self.lexical_index.search(query, min(n_results * 2, 50), file_filter, chunk_types)
+        return list(exact.items()) + [hit for hit in hits if hit[0] not in exact]
+
+    def _fuse_lexical(
+        self,
+        vector_results: list[RetrievalResult],
+        lexical_hits: list[tuple[str, float]],
+        seen_ids: set[str],
+    ) -> list[RetrievalResult]:
+        """
+        Merge BM25 hits into the vector ranking with reciprocal-rank fusion.
 
+        A chunk's fused score is sum(1 / (k + rank)) over the lists it appears
+        in, scaled so rank 1 in both lists scores 1.0.
+        """
+        if not lexical_hits:
+            return vector_results
+
+        fused: dict[str, float] = {}
+        for rank, result in enumerate(vector_results, start=1):
+            fused[result.chunk.chunk_id] = 1.0 / (_RRF_K + rank)
+        for rank, (chunk_id, _) in enumerate(lexical_hits, start=1):
+            fused[chunk_id] = fused.get(chunk_id, 0.0) + 1.0 / (_RRF_K + rank)
+
+        by_id = {r.chunk.chunk_id: r for r in vector_results}
+        for chunk in self._chunks_by_id([cid for cid, _ in lexical_hits if cid not in by_id]):
+            by_id[chunk.chunk_id] = RetrievalResult(
+                chunk=chunk, score=0.0, retrieval_method="keyword"
+            )
+
+        lexical_ids = {chunk_id for chunk_id, _ in lexical_hits}
+        for chunk_id, result in by_id.items():
+            if chunk_id in lexical_ids and result.retrieval_method == "vector":
+                result.retrieval_method = "hybrid"
+            result.score = min(1.0, fused[chunk_id] * (_RRF_K + 1) / 2)
+            seen_ids.add(chunk_id)
+        return sorted(by_id.values(), key=lambda r: fused[r.chunk.chunk_id], reverse=True)
+
+    def _chunks_by_id(self, chunk_ids: list[str]) -> list[CodeChunk]:
+        """Resolve chunk IDs (in order), fetching ones not hydrated yet from Chroma."""
+        missing = [cid for cid in chunk_ids if cid not in self._chunks]
+        if missing and self.collection:
+            try:
+                found = self.collection.get(ids=missing, include=["metadatas", "documents"])
+            except Exception as e:
+                logger.warning(f"Failed to fetch chunks: {e}")
+                found = {}
+            documents = found.get("documents") or []
+            for i, chunk_id in enumerate(found.get("ids") or []):
+                meta = (found.get("metadatas") or [{}])[i] or {}
+                doc = documents[i] if i < len(documents) else ""
+                self._chunks[chunk_id] = self._chunk_from_metadata(
+                    chunk_id, meta, self._content_from_document(doc or "")
+                )
+        return [self._chunks[cid] for cid in chunk_ids if cid in self._chunks]
+
+    def _expand_with_graph(self, retrieved: list[RetrievalResult], seen_ids: set[str]) -> None:
+        """Append 1-hop graph neighbours of the top results."""
+        if not self.graph or not retrieved:
+            return
+        # Expand from top 3 results only (to limit context size)
+        top_chunks = [r.chunk for r in retrieved[:3]]
+        related = self.graph.get_related_chunks(top_chunks, depth=1)
+
+        for chunk in related:
+            if chunk.chunk_id not in seen_ids:
+                seen_ids.add(chunk.chunk_id)
                 retrieved.append(
                     RetrievalResult(
-                        chunk=chunk, score=score, retrieval_method="vector", distance=distance
+                        chunk=chunk,
+                        score=0.5,  # Lower score for graph-expanded
+                        retrieval_method="graph",
                     )
                 )
 
-        # 1-layer graph expansion (per user decision)
-        if expand_graph and self.graph and retrieved:
-            # Expand from top 3 results only (to limit context size)
-            top_chunks = [r.chunk for r in retrieved[:3]]
-            related = self.graph.get_related_chunks(top_chunks, depth=1)
-
-            for chunk in related:
-                if chunk.chunk_id not in seen_ids:
-                    seen_ids.add(chunk.chunk_id)
-                    retrieved.append(
-                        RetrievalResult(
-                            chunk=chunk,
-                            score=0.5,  # Lower score for graph-expanded
-                            retrieval_method="graph",
-                        )
-                    )
-
+    def _boost_and_rank(
+        self, query: str, retrieved: list[RetrievalResult], n_results: int
+    ) -> list[RetrievalResult]:
+        """Keyword/session boosting followed by usage-based ranking."""
         # =================================================================
         # HYBRID SEARCH: Keyword boosting for better accuracy
         # =================================================================
@@ -692,35 +1142,19 @@ class RAGRetriever:
             context = {"session": session_ctx} if session_ctx else None
             retrieved = ranker.rerank(query, retrieved, top_k=n_results * 2, context=context)
 
-        # =================================================================
-        # HYBRID RAG: Cross-Encoder Reranking (V10.24+)
-        # =================================================================
-        if use_rerank and len(retrieved) > 1:
-            try:
-                reranker = get_ensemble_reranker()
-                # Use ensemble reranker to combine semantic CE scores with metadata
-                reranked_indices = reranker.rerank(
-                    query=query,
-                    chunks=[r.chunk for r in retrieved],
-                    original_scores=[r.score for r in retrieved],
-                    top_k=n_results,
-                )
-
-                # Reconstruct RetrievalResult list in new order
-                new_retrieved = []
-                for original_idx, score in reranked_indices:
-                    res = retrieved[original_idx]
-                    res.score = score  # Update with reranked score
-                    new_retrieved.append(res)
-
-                retrieved = new_retrieved
-                logger.debug(f"Cross-Encoder reranking applied to {len(retrieved)} results")
-            except Exception as e:
-                logger.warning(f"Reranking failed: {e}")
+        return retrieved
 
-        # Sort by score and limit
-        retrieved.sort(key=lambda x: x.score, reverse=True)
-        return retrieved[:n_results]
+    @staticmethod
+    def _apply_rerank(
+        retrieved: list[RetrievalResult], reranked_indices: list[tuple[int, float]]
+    ) -> list[RetrievalResult]:
+        """Reconstruct RetrievalResult list in reranked order."""
+        new_retrieved = []
+        for original_idx, score in reranked_indices:
+            res = retrieved[original_idx]
+            res.score = score  # Update with reranked score
+            new_retrieved.append(res)
+        return new_retrieved
 
     def record_user_selection(self, chunk_id: str, query: str, session_id: str = ""):
         """
@@ -803,6 +1237,9 @@ class RAGRetriever:
 
         # Get context from graph
         context = self.graph.get_context_for_modification(target.chunk_id)
+        self._ensure_content(
+            [target, *context["callers"], *context["callees"], *context["siblings"]]
+        )
 
         for caller in context["callers"]:
             result["callers"].append(
@@ -843,6 +1280,7 @@ class RAGRetriever:
             return []
 
         related = self.graph.get_related_chunks([chunk], depth=depth)
+        self._ensure_content(related)
 
         return [
             RetrievalResult(
@@ -907,20 +1345,29 @@ class RAGRetriever:
 
     def get_stats(self) -> RAGStats:
         """Get combined RAG statistics."""
+        cache_stats = _query_cache.stats()
         return RAGStats(
             index_stats=self.indexer.get_stats() if self.indexer else None,
             graph_stats=self.graph.get_stats() if self.graph else None,
             total_chunks_indexed=len(self._chunks),
             last_index_time=datetime.now().isoformat() if self._chunks else None,
             chroma_available=CHROMA_AVAILABLE,
+            query_cache_hits=cache_stats["hits"],
+            query_cache_misses=cache_stats["misses"],
+            query_cache_evictions=cache_stats["evictions"],
+            query_cache_entries=cache_stats["entries"],
+            query_cache_bytes=cache_stats["bytes"],
         )
 
-    def update_file(self, file_path: Path) -> int:
+    def update_file(self, file_path: Path, save_state: bool = True) -> int:
         """
         Incrementally update index for a single changed file.
 
+        A path that no longer exists is removed from the index.
+
         Args:
-            file_path: Path to the modified file
+            file_path: Path to the modified (or deleted) file
+            save_state: Persist IndexState afterwards (batch callers save once)
 
         Returns:
             Number of chunks updated
@@ -928,6 +1375,7 @@ class RAGRetriever:
         if not self.is_available:
             return 0
 
+        file_path = Path(file_path)
         try:
             rel_path = str(file_path.relative_to(self.project_root))
             # Normalize to forward slashes for cross-platform consistency
@@ -936,28 +1384,49 @@ class RAGRetriever:
             rel_path = str(file_path).replace("\\", "/")
 
         # Remove old chunks for this file
-        old_chunk_ids = self._file_to_chunks.get(rel_path, [])
+        old_chunk_ids = list(self._file_to_chunks.get(rel_path, []))
+        for chunk_id in self.index_state.get_chunks_for_file(file_path):
+            if chunk_id not in old_chunk_ids:
+                old_chunk_ids.append(chunk_id)
         if old_chunk_ids:
             try:
                 self.collection.delete(ids=old_chunk_ids)
             except Exception as e:
                 logger.warning(f"Failed to delete old chunks: {e}")
+            for chunk_id in old_chunk_ids:
+                self._chunks.pop(chunk_id, None)
+            self.lexical_index.remove_chunks(old_chunk_ids)
+            self._invalidate_query_cache()
+
+        if not file_path.exists():
+            self._file_to_chunks.pop(rel_path, None)
+            if self.graph:
+                self.graph.remove_file(rel_path)
+            self.index_state.remove(self.index_state._get_rel_path(file_path))
+            self.indexer.forget(file_path)
+            if save_state:
+                self._save_index_state()
+                self._save_graph_snapshot()
+            return 0
 
         # Re-index the file
         try:
-            new_chunks = list(self.indexer.index_file(file_path))
+            new_chunks = list(self.indexer.index_file(file_path, incremental=True))
         except Exception as e:
             logger.warning(f"Failed to index {file_path}: {e}")
-            return 0
+            new_chunks = []
 
         if not new_chunks:
+            self._file_to_chunks.pop(rel_path, None)
+            if self.graph:
+                self.graph.remove_file(rel_path)
             return 0
 
         # Update in-memory structures
         for chunk in new_chunks:
             self._chunks[chunk.chunk_id] = chunk
-            if self.graph:
-                self.graph.add_chunk(chunk)
+        if self.graph:
+            self.graph.update_file(rel_path, new_chunks)
 
         self._file_to_chunks[rel_path] = [c.chunk_id for c in new_chunks]
 
@@ -971,9 +1440,33 @@ class RAGRetriever:
         except Exception as e:
             logger.error(f"Failed to upsert chunks: {e}")
             return 0
+        self.lexical_index.add_chunks(new_chunks)
+        self._invalidate_query_cache()
+
+        self.index_state.update(file_path, [c.chunk_id for c in new_chunks])
+        if save_state:
+            self._save_index_state()
+            self._save_graph_snapshot()
 
         return len(new_chunks)
 
+    def update_files(self, file_paths: list[Path]) -> int:
+        """
+        Re-index an exact set of changed/deleted files (e.g. from RAGWatcher).
+
+        Returns:
+            Total number of chunks written
+        """
+        if not self.is_available:
+            return 0
+
+        total = 0
+        for file_path in file_paths:
+            total += self.update_file(Path(file_path), save_state=False)
+        self._save_index_state()
+        self._save_graph_snapshot(updates=len(file_paths))
+        return total
+
     def clear(self) -> None:
         """Clear all indexed data."""
         if self.client and self.collection:
@@ -985,14 +1478,236 @@ class RAGRetriever:
             except Exception as e:
                 logger.error(f"Failed to clear collection: {e}")
 
+        self.lexical_index.clear()
         self._chunks.clear()
         self._file_to_chunks.clear()
+        self._lazy_content_ids.clear()
         self.graph = None
+        self._invalidate_query_cache()
 
     # -------------------------------------------------------------------------
     # Private helpers
     # -------------------------------------------------------------------------
 
+    def _save_index_state(self) -> None:
+        """Persist IndexState and mark the lexical index as in sync with it."""
+        self.index_state.save()
+        self.lexical_index.set_generation(self.index_state.get_generation())
+
+    def _rebuild_lexical_index(self) -> None:
+        """Re-create the lexical index from the documents stored in Chroma."""
+        logger.info("Rebuilding lexical index from the vector store")
+        self.lexical_index.clear()
+        offset = 0
+        try:
+            while True:
+                page = self.collection.get(
+                    limit=_HYDRATION_PAGE_SIZE,
+                    offset=offset,
+                    include=["metadatas", "documents"],
+                )
+                ids = (page or {}).get("ids") or []
+                metadatas = page.get("metadatas") or []
+                documents = page.get("documents") or []
+                self.lexical_index.add_chunks(
+                    self._chunk_from_metadata(
+                        chunk_id,
+                        (metadatas[i] if i < len(metadatas) else None) or {},
+                        self._content_from_document(
+                            (documents[i] if i < len(documents) else None) or ""
+                        ),
+                    )
+                    for i, chunk_id in enumerate(ids)
+                )
+                if len(ids) < _HYDRATION_PAGE_SIZE:
+                    break
+                offset += _HYDRATION_PAGE_SIZE
+        except Exception as e:
+            logger.warning(f"Failed to rebuild lexical index: {e}")
+            return
+        self.lexical_index.set_generation(self.index_state.get_generation())
+
+    def _resolve_workers(self, workers: int | None, file_count: int) -> int:
+        """Pick the number of parser processes for a build."""
+        if workers is None:
+            if file_count < _PARALLEL_MIN_FILES:
+                return 1
+            workers = min(os.cpu_count() or 1, _MAX_AUTO_WORKERS)
+        return max(1, min(workers, file_count or 1))
+
+    def _run_index_pipeline(
+        self,
+        files_to_index: list[Path],
+        workers: int | None = None,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> int:
+        """
+        Pipelined index build: parse stage -> bounded queue -> writer stage.
+
+        Files are chunked either serially or in a process pool; a single writer
+        thread deletes stale chunk IDs and upserts (embeds) chunks to Chroma as
+        soon as a batch fills, so parsing and embedding overlap.
+
+        Returns:
+            Number of chunks produced
+        """
+        # Counted from the produced chunks (not the parser's own counters), so serial
+        # and process-pool runs report identical numbers.
+        stats = IndexStats(workers=self._resolve_workers(workers, len(files_to_index)))
+        started = time.perf_counter()
+
+        write_queue: queue.Queue = queue.Queue(maxsize=_PIPELINE_QUEUE_SIZE)
+        writer = threading.Thread(
+            target=self._index_writer, args=(write_queue, stats), name="rag-index-writer"
+        )
+        writer.start()
+
+        total = len(files_to_index)
+        done = 0
+        total_indexed = 0
+        try:
+            for file_path, chunks in self._iter_parsed_files(files_to_index, stats):
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total)
+                old_ids = self.index_state.get_chunks_for_file(file_path)
+                if chunks is None:
+                    # Don't keep serving the pre-edit chunks; dropping the state
+                    # makes the next run retry the file
+                    stats.skipped_files += 1
+                    if old_ids:
+                        write_queue.put((old_ids, []))
+                    self.index_state.remove(self.index_state._get_rel_path(file_path))
+                    continue
+
+                if old_ids or chunks:
+                    write_queue.put((old_ids, chunks))
+                if not chunks:
+                    continue
+
+                stats.record_file(chunks)
+                self.index_state.update(file_path, [c.chunk_id for c in chunks])
+                total_indexed += len(chunks)
+        finally:
+            write_queue.put(None)
+            writer.join()
+            stats.elapsed_seconds = time.perf_counter() - started
+            self.indexer.stats = stats
+
+        return total_indexed
+
+    def _iter_parsed_files(
+        self, files_to_index: list[Path], stats: IndexStats
+    ) -> Iterator[tuple[Path, list[CodeChunk] | None]]:
+        """
+        Yield (file_path, chunks) as files finish parsing; chunks is None on failure.
+
+        Uses a process pool with a bounded in-flight window when more than one
+        worker is configured, and falls back to serial parsing if the pool breaks.
+        """
+        if stats.workers <= 1:
+            yield from self._iter_parsed_serial(files_to_index)
+            return
+
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+        from concurrent.futures.process import BrokenProcessPool
+
+        from .code_indexer import index_file_in_worker
+
+        root = str(self.project_root)
+        pending_files = iter(files_to_index)
+        handled: set[Path] = set()
+        try:
+            with ProcessPoolExecutor(max_workers=stats.workers) as executor:
+                in_flight = {}
+
+                def _submit_next() -> bool:
+                    file_path = next(pending_files, None)
+                    if file_path is None:
+                        return False
+                    future = executor.submit(index_file_in_worker, root, str(file_path))
+                    in_flight[future] = file_path
+                    return True
+
+                for _ in range(stats.workers * _INFLIGHT_PER_WORKER):
+                    if not _submit_next():
+                        break
+
+                while in_flight:
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        file_path = in_flight.pop(future)
+                        try:
+                            _, chunks = future.result()
+                        except BrokenProcessPool:
+                            raise
+                        except Exception as e:
+                            logger.warning(f"Failed to index {file_path}: {e}")
+                            chunks = None
+                        handled.add(file_path)
+                        yield file_path, chunks
+                        _submit_next()
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(f"Index worker pool failed ({e}); continuing serially")
+            stats.workers = 1
+            remaining = [f for f in files_to_index if f not in handled]
+            yield from self._iter_parsed_serial(remaining)
+
+    def _iter_parsed_serial(
+        self, files_to_index: list[Path]
+    ) -> Iterator[tuple[Path, list[CodeChunk] | None]]:
+        """Parse files one by one in this process."""
+        for file_path in files_to_index:
+            try:
+                yield file_path, list(self.indexer.index_file(file_path))
+            except Exception as e:
+                logger.warning(f"Failed to index {file_path}: {e}")
+                yield file_path, None
+
+    def _index_writer(self, write_queue: queue.Queue, stats: IndexStats) -> None:
+        """
+        Writer stage: drain the queue, upserting to Chroma in fixed-size batches.
+
+        Chunk IDs are derived from the file path, so a file's old IDs never collide
+        with other files' pending chunks; deletes are batched and applied just
+        before each upsert.
+        """
+        buffer: list[CodeChunk] = []
+        pending_deletes: list[str] = []
+
+        def _flush() -> None:
+            if pending_deletes:
+                try:
+                    self.collection.delete(ids=list(pending_deletes))
+                except Exception:
+                    pass
+                self.lexical_index.remove_chunks(pending_deletes)
+                pending_deletes.clear()
+            if not buffer:
+                return
+            try:
+                self.collection.upsert(
+                    ids=[c.chunk_id for c in buffer],
+                    documents=[self._chunk_to_document(c) for c in buffer],
+                    metadatas=[self._chunk_to_metadata(c) for c in buffer],
+                )
+                stats.upsert_batches += 1
+                self.lexical_index.add_chunks(buffer)
+            except Exception as e:
+                logger.error(f"Failed to upsert batch: {e}")
+            buffer.clear()
+
+        while True:
+            item = write_queue.get()
+            if item is None:
+                _flush()
+                return
+            old_ids, chunks = item
+            pending_deletes.extend(old_ids)
+            buffer.extend(chunks)
+            if len(buffer) >= _UPSERT_BATCH_SIZE:
+                _flush()
+
     def _chunk_to_document(self, chunk: CodeChunk) -> str:
         """Convert chunk to semantic document for embedding."""
         parts = [f"{chunk.chunk_type}::{chunk.name}"]
@@ -1017,6 +1732,9 @@ class RAGRetriever:
             "end_line": chunk.end_line,
             "parent": chunk.parent or "",
             "has_docstring": bool(chunk.docstring),
+            # Lets the dependency graph be rebuilt from metadata alone
+            "dependencies": ",".join(chunk.dependencies),
+            "signature": chunk.signature or "",
         }
 
     def _build_where_filter(
@@ -1046,56 +1764,206 @@ class RAGRetriever:
         self, chunk_id: str, results: dict, index: int
     ) -> CodeChunk | None:
         """Get chunk from cache or reconstruct from query results."""
+        docs = results.get("documents")
+        doc = docs[0][index] if docs else None
+
         if chunk_id in self._chunks:
-            return self._chunks[chunk_id]
+            chunk = self._chunks[chunk_id]
+            if chunk_id in self._lazy_content_ids and doc is not None:
+                chunk.content = self._content_from_document(doc)
+                self._lazy_content_ids.discard(chunk_id)
+            return chunk
 
         # Reconstruct from metadata
         if not results.get("metadatas"):
             return None
 
         meta = results["metadatas"][0][index]
-        doc = results["documents"][0][index] if results.get("documents") else ""
+        return self._chunk_from_metadata(chunk_id, meta, self._content_from_document(doc or ""))
 
+    @staticmethod
+    def _content_from_document(doc: str) -> str:
+        """Strip the type::name header added by _chunk_to_document."""
+        return doc.split("\n", 2)[-1] if doc else ""
+
+    @staticmethod
+    def _chunk_from_metadata(chunk_id: str, meta: dict, content: str = "") -> CodeChunk:
+        """Build a CodeChunk from Chroma metadata (content optional)."""
+        deps = meta.get("dependencies") or ""
         return CodeChunk(
             chunk_id=chunk_id,
             file_path=meta.get("file_path", "unknown"),
             chunk_type=meta.get("chunk_type", "unknown"),
             name=meta.get("name", "unknown"),
-            content=doc.split("\n", 2)[-1] if doc else "",  # Skip type::name header
+            content=content,
             start_line=meta.get("start_line", 0),
             end_line=meta.get("end_line", 0),
+            dependencies=[d for d in deps.split(",") if d],
             parent=meta.get("parent") or None,
+            signature=meta.get("signature") or None,
+        )
+
+    def _ensure_content(self, chunks: list[CodeChunk]) -> None:
+        """Fetch bodies for metadata-only chunks in one batched Chroma call."""
+        missing = [c.chunk_id for c in chunks if c.chunk_id in self._lazy_content_ids]
+        if not missing or not self.collection:
+            return
+        try:
+            results = self.collection.get(ids=missing, include=["documents"])
+        except Exception as e:
+            logger.warning(f"Failed to fetch chunk contents: {e}")
+            return
+
+        for i, chunk_id in enumerate(results.get("ids") or []):
+            chunk = self._chunks.get(chunk_id)
+            if chunk is None:
+                continue
+            chunk.content = self._content_from_document(results["documents"][i] or "")
+            self._lazy_content_ids.discard(chunk_id)
+
+    def _graph_fingerprint(self) -> str:
+        """Identify the index version a persisted graph was built from."""
+        try:
+            count = int(self.collection.count())
+        except Exception:
+            count = -1
+        return (
+            f"v{_GRAPH_SNAPSHOT_VERSION}:{self.collection_name}:{count}:"
+            f"{self.index_state.get_last_commit()}:{self.index_state.get_generation()}"
         )
 
     def _load_chunks_from_db(self) -> None:
-        """Load chunk metadata from existing ChromaDB collection."""
+        """
+        Hydrate chunk metadata and the dependency graph.
+
+        Uses the persisted graph snapshot when it matches the current index;
+        otherwise pages through the collection fetching metadata only (no
+        documents, no row cap) and persists a new snapshot. Chunk bodies are
+        fetched lazily by _ensure_content().
+        """
         if not self.collection:
             return
 
-        try:
-            # Get all items (limited for memory safety)
-            results = self.collection.get(limit=10000, include=["metadatas", "documents"])
+        snapshot_path = self.persist_dir / _GRAPH_SNAPSHOT_FILENAME
+        fingerprint = self._graph_fingerprint()
 
-            if results and results.get("ids"):
-                for i, chunk_id in enumerate(results["ids"]):
-                    chunk = self._get_or_reconstruct_chunk(chunk_id, results, i)
-                    if chunk:
-                        self._chunks[chunk_id] = chunk
+        graph = DependencyGraph.load(snapshot_path, fingerprint)
+        if graph is not None:
+            chunks = graph.get_chunks()
+        else:
+            legacy: dict[str, dict] = {}
+            try:
+                chunks = self._page_chunk_metadata(legacy)
+            except Exception as e:
+                logger.warning(f"Failed to load chunks from DB: {e}")
+                return
+            if legacy:
+                self._backfill_dependencies(chunks, legacy)
+            graph = DependencyGraph(chunks) if chunks else None
+            if graph is not None:
+                graph.save(snapshot_path, fingerprint)
+
+        self._chunks = {c.chunk_id: c for c in chunks}
+        self._lazy_content_ids = {c.chunk_id for c in chunks if not c.content}
+        self._build_file_index(chunks)
+        if graph is not None:
+            self.graph = graph
+
+        logger.info(f"Loaded {len(self._chunks)} chunks from existing index")
+
+    def _save_graph_snapshot(self, updates: int = 1) -> None:
+        """
+        Note incremental graph updates; persist the snapshot every few of them.
 
-                        # Build file index
-                        if chunk.file_path not in self._file_to_chunks:
-                            self._file_to_chunks[chunk.file_path] = []
-                        self._file_to_chunks[chunk.file_path].append(chunk_id)
+        Rewriting the snapshot costs O(graph), so single-file edits only mark it
+        dirty. It is written once _GRAPH_SNAPSHOT_EVERY updates accumulate, on
+        flush_graph_snapshot() and at interpreter exit. A stale snapshot is
+        safe: its fingerprint no longer matches and startup re-reads metadata.
+        """
+        if self.graph is None or not self.collection:
+            return
+        self._graph_dirty_updates += updates
+        if self._graph_dirty_updates >= _GRAPH_SNAPSHOT_EVERY:
+            self.flush_graph_snapshot()
+        elif not self._graph_flush_registered:
+            self._graph_flush_registered = True
+            atexit.register(_flush_graph_snapshot_at_exit, weakref.ref(self))
+
+    def flush_graph_snapshot(self) -> None:
+        """Write the graph snapshot now if incremental updates are pending."""
+        if not self._graph_dirty_updates or self.graph is None or not self.collection:
+            return
+        self.graph.save(self.persist_dir / _GRAPH_SNAPSHOT_FILENAME, self._graph_fingerprint())
+        self._graph_dirty_updates = 0
 
-                # Rebuild graph
-                if self._chunks:
-                    from .graph_builder import DependencyGraph
+    def _page_chunk_metadata(self, legacy: dict[str, dict] | None = None) -> list[CodeChunk]:
+        """
+        Read every chunk's metadata from Chroma in fixed-size pages.
 
-                    self.graph = DependencyGraph(list(self._chunks.values()))
+        Metadata written before dependencies were stored is collected into
+        legacy (chunk ID -> metadata) when given.
+        """
+        chunks: list[CodeChunk] = []
+        offset = 0
+        while True:
+            page = self.collection.get(
+                limit=_HYDRATION_PAGE_SIZE, offset=offset, include=["metadatas"]
+            )
+            ids = (page or {}).get("ids") or []
+            metadatas = page.get("metadatas") or []
+            for i, chunk_id in enumerate(ids):
+                meta = (metadatas[i] if i < len(metadatas) else None) or {}
+                if legacy is not None and "dependencies" not in meta:
+                    legacy[chunk_id] = meta
+                chunks.append(self._chunk_from_metadata(chunk_id, meta))
+            if len(ids) < _HYDRATION_PAGE_SIZE:
+                return chunks
+            offset += _HYDRATION_PAGE_SIZE
+
+    def _backfill_dependencies(self, chunks: list[CodeChunk], legacy: dict[str, dict]) -> None:
+        """
+        Recover dependencies for chunks indexed before they were kept in metadata.
+
+        Re-parses those chunks' source files once and writes the dependencies
+        back to Chroma, so the graph gets its edges without a re-embedding and
+        later startups skip this step.
+        """
+        logger.info(f"Rebuilding dependencies for {len(legacy)} chunks from an older index")
+        by_id = {c.chunk_id: c for c in chunks if c.chunk_id in legacy}
+        by_file: dict[str, list[CodeChunk]] = {}
+        for chunk in by_id.values():
+            by_file.setdefault(chunk.file_path, []).append(chunk)
+
+        indexers: dict[Path, CodeIndexer] = {}
+        for rel_path, file_chunks in by_file.items():
+            root = next((r for r in self.all_project_roots if (r / rel_path).is_file()), None)
+            if root is None:
+                continue
+            indexer = indexers.setdefault(root, CodeIndexer(root))
+            try:
+                parsed = {c.chunk_id: c for c in indexer.index_file(root / rel_path)}
+            except Exception as e:
+                logger.debug(f"Failed to re-parse {rel_path}: {e}")
+                continue
+            for chunk in file_chunks:
+                if chunk.chunk_id in parsed:
+                    chunk.dependencies = parsed[chunk.chunk_id].dependencies
 
-                logger.info(f"Loaded {len(self._chunks)} chunks from existing index")
+        # Chunks whose file is gone are written back with no dependencies, so
+        # this runs only once per index
+        ids = list(by_id)
+        try:
+            for start in range(0, len(ids), _HYDRATION_PAGE_SIZE):
+                part = ids[start : start + _HYDRATION_PAGE_SIZE]
+                self.collection.update(
+                    ids=part,
+                    metadatas=[
+                        {**legacy[cid], "dependencies": ",".join(by_id[cid].dependencies)}
+                        for cid in part
+                    ],
+                )
         except Exception as e:
-            logger.warning(f"Failed to load chunks from DB: {e}")
+            logger.warning(f"Failed to store rebuilt dependencies: {e}")
 
     def _build_file_index(self, chunks: list[CodeChunk]) -> None:
         """Build file path to chunk ID mapping."""
@@ -1128,3 +1996,12 @@ def create_rag_retriever(
         project_root = Path.cwd()
 
     return RAGRetriever(project_root=project_root, persist_dir=persist_dir)
+
+
+def _flush_graph_snapshot_at_exit(ref: "weakref.ref[RAGRetriever]") -> None:
+    retriever = ref()
+    if retriever is not None:
+        try:
+            retriever.flush_graph_snapshot()
+        except Exception as e:
+            logger.debug(f"Graph snapshot flush at exit failed: {e}")
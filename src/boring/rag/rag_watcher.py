@@ -2,9 +2,18 @@
 RAG Watcher Module for Boring MCP
 
 Automatically detects file changes and triggers incremental RAG re-indexing.
+
+Backends:
+- watchdog (inotify/FSEvents/ReadDirectoryChangesW): event-driven, ignored
+  directories (at any depth) are never registered with the OS watcher.
+- polling: periodic os.walk + stat diff, used when watchdog is unavailable.
+
+Both backends feed the same debounced set of changed paths, which is handed to
+the callback so only the touched files are re-indexed.
 """
 
 import logging
+import os
 import threading
 import time
 from collections.abc import Callable
@@ -12,13 +21,44 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:  # pragma: no cover - watchdog is a core dependency
+    Observer = None
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+
+class _WatchdogHandler(FileSystemEventHandler):
+    """Forwards relevant file system events to the owning RAGWatcher."""
+
+    def __init__(self, watcher: "RAGWatcher"):
+        self.watcher = watcher
+
+    def on_any_event(self, event):
+        if event.event_type not in ("created", "modified", "deleted", "moved"):
+            return
+
+        if event.is_directory:
+            if event.event_type == "created":
+                self.watcher._on_directory_created(Path(event.src_path))
+            return
+
+        self.watcher._record_change(Path(event.src_path))
+        dest_path = getattr(event, "dest_path", "")
+        if dest_path:
+            self.watcher._record_change(Path(dest_path))
+
 
 class RAGWatcher:
     """
     Watches for file changes and triggers RAG re-indexing.
 
-    Uses polling for maximum compatibility (no external dependencies).
-    Debounces changes to avoid excessive re-indexing.
+    Prefers an event-driven watchdog observer and falls back to polling.
+    Debounces bursts of changes into a single callback with the exact paths.
     """
 
     # Extensions to watch
@@ -70,24 +110,49 @@ class RAGWatcher:
         project_root: Path,
         debounce_seconds: float = 2.0,
         poll_interval: float = 1.0,
+        backend: str = "auto",
     ):
+        """
+        Args:
+            project_root: Directory to watch
+            debounce_seconds: Quiet period before a batch of changes is flushed
+            poll_interval: Scan interval for the polling backend
+            backend: "auto" (watchdog if installed), "watchdog" or "polling"
+        """
         self.project_root = Path(project_root)
         self.debounce_seconds = debounce_seconds
         self.poll_interval = poll_interval
+        self.backend = backend
 
         self._running = False
         self._thread: threading.Thread | None = None
+        self._observer = None
+        self._handler: _WatchdogHandler | None = None
+        # Directories watched non-recursively because an ignored directory lies below them
+        self._split_dirs: set[str] = set()
+        self._recursive_watches: dict[str, object] = {}
+        self._active_backend: str | None = None
         self._file_mtimes: dict[str, float] = {}
         self._last_change_time: float = 0
         self._pending_reindex = False
+        self._pending_paths: set[str] = set()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
         self._on_change_callback: Callable[[], None] | None = None
+        self._on_files_changed: Callable[[list[Path]], None] | None = None
 
-    def start(self, on_change: Callable[[], None] | None = None) -> bool:
+    def start(
+        self,
+        on_change: Callable[[], None] | None = None,
+        on_files_changed: Callable[[list[Path]], None] | None = None,
+    ) -> bool:
         """
         Start watching for file changes.
 
         Args:
             on_change: Optional callback when changes are detected
+            on_files_changed: Optional callback receiving the debounced list of
+                created/modified/deleted paths
 
         Returns:
             True if started successfully
@@ -96,13 +161,29 @@ class RAGWatcher:
             return False
 
         self._on_change_callback = on_change
+        self._on_files_changed = on_files_changed
         self._running = True
-        self._file_mtimes = self._scan_files()
+        self._stop_event.clear()
 
-        self._thread = threading.Thread(target=self._watch_loop, daemon=True)
+        self._active_backend = "polling"
+        if self.backend in ("auto", "watchdog") and WATCHDOG_AVAILABLE:
+            try:
+                self._start_observer()
+                self._active_backend = "watchdog"
+            except Exception as e:
+                logger.warning(f"watchdog observer failed ({e}); falling back to polling")
+                self._observer = None
+
+        if self._active_backend == "polling":
+            self._file_mtimes = self._scan_files()
+            target = self._watch_loop
+        else:
+            target = self._flush_loop
+
+        self._thread = threading.Thread(target=target, daemon=True)
         self._thread.start()
 
-        logger.info(f"RAG Watcher started for {self.project_root}")
+        logger.info(f"RAG Watcher started for {self.project_root} ({self._active_backend})")
         return True
 
     def stop(self) -> bool:
@@ -111,6 +192,14 @@ class RAGWatcher:
             return False
 
         self._running = False
+        self._stop_event.set()
+        if self._observer is not None:
+            try:
+                self._observer.stop()
+                self._observer.join(timeout=2.0)
+            except Exception as e:
+                logger.debug(f"Error stopping observer: {e}")
+            self._observer = None
         if self._thread:
             self._thread.join(timeout=2.0)
             self._thread = None
@@ -118,13 +207,134 @@ class RAGWatcher:
         logger.info("RAG Watcher stopped")
         return True
 
+    # -------------------------------------------------------------------------
+    # Event-driven backend
+    # -------------------------------------------------------------------------
+
+    def _start_observer(self):
+        """Schedule OS watches for the project, skipping ignored directories."""
+        self._handler = _WatchdogHandler(self)
+        self._observer = Observer()
+        self._split_dirs = set()
+        self._recursive_watches = {}
+        self._observer.schedule(self._handler, str(self.project_root), recursive=False)
+        self._split_dirs.add(str(self.project_root))
+        for entry in os.scandir(self.project_root):
+            if entry.is_dir(follow_symlinks=False) and entry.name not in self.IGNORED_DIRS:
+                self._watch_tree(Path(entry.path))
+        self._observer.start()
+
+    def _watch_tree(self, directory: Path):
+        """
+        Watch directory and everything below it except ignored directories.
+
+        A subtree without ignored directories gets one recursive watch. A
+        directory with an ignored directory somewhere below it is watched
+        non-recursively and split further, so nested trees like
+        pkg/node_modules or services/api/.venv are never registered with inotify.
+        """
+        children: dict[str, list[str]] = {}
+        split: set[str] = set()
+        for root, dirs, _ in os.walk(directory):
+            kept = [d for d in dirs if d not in self.IGNORED_DIRS]
+            if len(kept) != len(dirs):
+                parent = Path(root)
+                while str(parent) not in split:
+                    split.add(str(parent))
+                    if parent == directory:
+                        break
+                    parent = parent.parent
+            dirs[:] = [d for d in kept if not os.path.islink(os.path.join(root, d))]
+            children[root] = [os.path.join(root, d) for d in dirs]
+
+        if not split:
+            self._schedule(str(directory), recursive=True)
+            return
+        for path in split:
+            self._schedule(path, recursive=False)
+            for child in children.get(path, []):
+                if child not in split:
+                    self._schedule(child, recursive=True)
+        self._split_dirs |= split
+
+    def _schedule(self, path: str, recursive: bool):
+        try:
+            watch = self._observer.schedule(self._handler, path, recursive=recursive)
+        except Exception as e:
+            logger.debug(f"Failed to watch directory {path}: {e}")
+            return
+        if recursive:
+            self._recursive_watches[path] = watch
+
+    def _on_directory_created(self, path: Path):
+        """Start watching a directory created after start()."""
+        if self._observer is None:
+            return
+        if path.name in self.IGNORED_DIRS:
+            # e.g. `npm install` inside a recursively watched package: split that watch
+            for root, watch in list(self._recursive_watches.items()):
+                if path.is_relative_to(root):
+                    del self._recursive_watches[root]
+                    try:
+                        self._observer.unschedule(watch)
+                    except Exception as e:
+                        logger.debug(f"Failed to unwatch directory {root}: {e}")
+                    self._watch_tree(Path(root))
+                    break
+            return
+        if str(path.parent) in self._split_dirs:
+            self._watch_tree(path)
+        # Files may have been moved in together with the directory
+        for root, dirs, files in os.walk(path):
+            dirs[:] = [d for d in dirs if d not in self.IGNORED_DIRS]
+            for name in files:
+                self._record_change(Path(root) / name)
+
+    def _record_change(self, path: Path):
+        """Add a path to the pending (debounced) change set."""
+        if not self._should_watch(path):
+            return
+        with self._lock:
+            self._pending_paths.add(str(path))
+            self._last_change_time = time.time()
+            self._pending_reindex = True
+
+    def _flush_loop(self):
+        """Debounce loop for the event-driven backend."""
+        tick = max(0.05, min(self.debounce_seconds / 2, self.poll_interval))
+        while not self._stop_event.wait(tick):
+            try:
+                self._flush_if_quiet()
+            except Exception as e:
+                logger.error(f"Error in watch loop: {e}")
+
+    def _flush_if_quiet(self):
+        """Fire the callbacks once no change has arrived for debounce_seconds."""
+        with self._lock:
+            if not self._pending_reindex:
+                return
+            if time.time() - self._last_change_time < self.debounce_seconds:
+                return
+            self._pending_reindex = False
+            paths = sorted(self._pending_paths)
+            self._pending_paths.clear()
+        self._trigger_reindex([Path(p) for p in paths])
+
+    # -------------------------------------------------------------------------
+    # Polling backend (fallback)
+    # -------------------------------------------------------------------------
+
     def _scan_files(self) -> dict[str, float]:
         """Scan project files and get their modification times."""
         mtimes = {}
 
         try:
-            for path in self.project_root.rglob("*"):
-                if path.is_file() and self._should_watch(path):
+            for root, dirs, files in os.walk(self.project_root):
+                dirs[:] = [d for d in dirs if d not in self.IGNORED_DIRS]
+                for name in files:
+                    path = Path(root) / name
+                    if path.suffix.lower() not in self.WATCHED_EXTENSIONS:
+                        continue
                     try:
                         mtimes[str(path)] = path.stat().st_mtime
                     except OSError:
@@ -148,30 +358,23 @@ class RAGWatcher:
         return True
 
     def _watch_loop(self):
-        """Main watch loop."""
+        """Main watch loop (polling backend)."""
         while self._running:
             try:
                 current_mtimes = self._scan_files()
                 changed = self._detect_changes(current_mtimes)
 
                 if changed:
-                    self._last_change_time = time.time()
-                    self._pending_reindex = True
                     logger.debug(f"Detected {len(changed)} file changes")
+                    for path in changed:
+                        self._record_change(Path(path))
 
-                # Check debounce and trigger reindex
-                if self._pending_reindex:
-                    elapsed = time.time() - self._last_change_time
-                    if elapsed >= self.debounce_seconds:
-                        self._trigger_reindex()
-                        self._pending_reindex = False
+                self._flush_if_quiet()
 
                 self._file_mtimes = current_mtimes
-                time.sleep(self._poll_interval)
-
             except Exception as e:
                 logger.error(f"Error in watch loop: {e}")
-                time.sleep(self.poll_interval)
+            self._stop_event.wait(self.poll_interval)
 
     def _detect_changes(self, current_mtimes: dict[str, float]) -> list[str]:
         """Detect changed files."""
@@ -191,9 +394,15 @@ class RAGWatcher:
 
         return changed
 
-    def _trigger_reindex(self):
+    def _trigger_reindex(self, paths: list[Path] | None = None):
         """Trigger RAG re-indexing."""
-        logger.info("Triggering incremental RAG re-index")
+        logger.info(f"Triggering incremental RAG re-index ({len(paths or [])} paths)")
+
+        if self._on_files_changed and paths:
+            try:
+                self._on_files_changed(paths)
+            except Exception as e:
+                logger.error(f"Error in change callback: {e}")
 
         if self._on_change_callback:
             try:
@@ -206,6 +415,11 @@ class RAGWatcher:
         """Check if watcher is running."""
         return self._running
 
+    @property
+    def active_backend(self) -> str | None:
+        """Backend in use while running ("watchdog" or "polling")."""
+        return self._active_backend if self._running else None
+
 
 # Singleton instance per project
 _watchers: dict[str, RAGWatcher] = {}
@@ -230,19 +444,22 @@ def start_rag_watch(project_root: Path) -> dict:
         Status result
     """
     watcher = get_rag_watcher(project_root)
+    retriever = None
 
-    def on_change():
-        # Trigger incremental re-index
+    def on_files_changed(paths: list[Path]):
+        # Re-index exactly the touched files
+        nonlocal retriever
         try:
-            from .rag import RAGRetriever
+            if retriever is None:
+                from .rag_retriever import RAGRetriever
 
-            retriever = RAGRetriever(project_root)
-            retriever.build_index(incremental=True)
-            logger.info("Incremental RAG re-index complete")
+                retriever = RAGRetriever(project_root)
+            count = retriever.update_files(paths)
+            logger.info(f"Incremental RAG re-index complete ({len(paths)} files, {count} chunks)")
         except Exception as e:
             logger.error(f"Failed to re-index: {e}")
 
-    if watcher.start(on_change=on_change):
+    if watcher.start(on_files_changed=on_files_changed):
         return {"status": "STARTED", "project": str(project_root)}
     return {"status": "ALREADY_RUNNING", "project": str(project_root)}
 
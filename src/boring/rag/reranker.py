@@ -121,6 +121,49 @@ class CrossEncoderReranker:
         else:
             return self._rerank_heuristic(query, documents, original_scores, top_k, weight_original)
 
+    def rerank_many(
+        self,
+        requests: list[tuple[str, list[str], list[float]]],
+        top_k: int = 10,
+        weight_original: float = 0.3,
+    ) -> list[list[tuple[int, RerankScore]]]:
+        """
+        Rerank several (query, documents, original_scores) requests at once.
+
+        With a model loaded, all query-document pairs go through a single
+        predict() call; scores are then normalized per request.
+
+        Returns:
+            One rerank() result per request, in order
+        """
+        if not self._ensure_model():
+            return [
+                self._rerank_heuristic(q, docs, scores, top_k, weight_original) if docs else []
+                for q, docs, scores in requests
+            ]
+
+        pairs = [(query, doc) for query, documents, _ in requests for doc in documents]
+        try:
+            all_scores = list(self._model.predict(pairs, show_progress_bar=False)) if pairs else []
+        except Exception as e:
+            logger.warning(f"Cross-encoder prediction failed: {e}")
+            return [
+                self._rerank_heuristic(q, docs, scores, top_k, weight_original) if docs else []
+                for q, docs, scores in requests
+            ]
+
+        results = []
+        offset = 0
+        for _, documents, original_scores in requests:
+            scores = all_scores[offset : offset + len(documents)]
+            offset += len(documents)
+            results.append(
+                self._combine_model_scores(scores, original_scores, top_k, weight_original)
+                if documents
+                else []
+            )
+        return results
+
     def _rerank_with_model(
         self,
         query: str,
@@ -140,6 +183,16 @@ class CrossEncoderReranker:
             logger.warning(f"Cross-encoder prediction failed: {e}")
             return self._rerank_heuristic(query, documents, original_scores, top_k, weight_original)
 
+        return self._combine_model_scores(scores, original_scores, top_k, weight_original)
+
+    @staticmethod
+    def _combine_model_scores(
+        scores: list[float],
+        original_scores: list[float],
+        top_k: int,
+        weight_original: float,
+    ) -> list[tuple[int, RerankScore]]:
+        """Normalize raw cross-encoder scores and blend with the original ones."""
         # Normalize scores to [0, 1]
         min_score = min(scores)
         max_score = max(scores)
@@ -286,6 +339,51 @@ class EnsembleReranker:
         ce_results = self.cross_encoder.rerank(query, documents, original_scores, top_k=len(chunks))
         semantic_scores = {idx: score.rerank_score for idx, score in ce_results}
 
+        return self._combine_signals(query, chunks, semantic_scores, usage_scores, top_k)
+
+    def rerank_many(
+        self,
+        requests: list[tuple[str, list, list[float]]],
+        usage_scores: dict[str, float] | None = None,
+        top_k: int = 10,
+    ) -> list[list[tuple[int, float]]]:
+        """
+        Rerank several (query, chunks, original_scores) requests.
+
+        The cross-encoder sees every query-chunk pair in one batch; the
+        remaining signals are computed per request.
+
+        Returns:
+            One rerank() result per request, in order
+        """
+        ce_batches = self.cross_encoder.rerank_many(
+            [
+                (query, [self._chunk_to_text(c) for c in chunks], scores)
+                for query, chunks, scores in requests
+            ],
+            top_k=max((len(chunks) for _, chunks, _ in requests), default=0),
+        )
+
+        results = []
+        for (query, chunks, _), ce_results in zip(requests, ce_batches, strict=True):
+            if not chunks:
+                results.append([])
+                continue
+            semantic_scores = {idx: score.rerank_score for idx, score in ce_results}
+            results.append(
+                self._combine_signals(query, chunks, semantic_scores, usage_scores, top_k)
+            )
+        return results
+
+    def _combine_signals(
+        self,
+        query: str,
+        chunks: list,
+        semantic_scores: dict[int, float],
+        usage_scores: dict[str, float] | None,
+        top_k: int,
+    ) -> list[tuple[int, float]]:
+        """Weighted blend of semantic, keyword, structure and usage signals."""
         # 2. Keyword matching scores
         keyword_scores = self._compute_keyword_scores(query, chunks)
 
@@ -5,16 +5,21 @@ Provides checksum-based verification to detect silent file modifications.
 Integrates with Shadow Mode to ensure system stability.
 """
 
-import hashlib
 import logging
 from pathlib import Path
 
+from ..core.fingerprint import get_fingerprint_store
+
 logger = logging.getLogger(__name__)
 
 
 class FileIntegrityMonitor:
     """
     Monitors file integrity using SHA256 checksums.
+
+    Digests come from the shared fingerprint service, so files whose
+    stat signature (mtime, size, ctime, inode) did not move since any subsystem
+    last hashed them are not re-read.
     """
 
     def __init__(self, project_root: Path):
@@ -25,19 +30,19 @@ class FileIntegrityMonitor:
     def calculate_file_hash(self, file_path: Path) -> str | None:
         """Calculate SHA256 hash of a file."""
         try:
-            if not file_path.exists() or not file_path.is_file():
-                return None
-
-            sha256_hash = hashlib.sha256()
-            with open(file_path, "rb") as f:
-                # Read in 64k chunks
-                for byte_block in iter(lambda: f.read(65536), b""):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
+            return get_fingerprint_store().fingerprint(file_path)
         except Exception as e:
             logger.warning(f"Failed to hash file {file_path}: {e}")
             return None
 
+    def calculate_file_hashes(self, file_paths: list[Path]) -> dict[Path, str]:
+        """Calculate SHA256 hashes of many files in one bulk call (missing files omitted)."""
+        try:
+            return get_fingerprint_store().fingerprint_many(file_paths)
+        except Exception as e:
+            logger.warning(f"Failed to hash files: {e}")
+            return {}
+
     def snapshot_files(self, paths: list[Path]) -> dict[str, str]:
         """
         Take a snapshot of file hashes.
@@ -48,26 +53,23 @@ class FileIntegrityMonitor:
         Returns:
             Dictionary of {relative_path: hash}
         """
-        hashes = {}
         self.monitored_paths = paths
 
+        files = []
         for path in paths:
             if path.is_file():
-                h = self.calculate_file_hash(path)
-                if h:
-                    rel_path = str(path.relative_to(self.project_root))
-                    hashes[rel_path] = h
+                files.append(path)
             elif path.is_dir():
-                for file_path in path.rglob("*"):
-                    if file_path.is_file():
-                        h = self.calculate_file_hash(file_path)
-                        if h:
-                            try:
-                                rel_path = str(file_path.relative_to(self.project_root))
-                                hashes[rel_path] = h
-                            except ValueError:
-                                # Path not relative to project root
-                                hashes[str(file_path)] = h
+                files.extend(f for f in path.rglob("*") if f.is_file())
+
+        hashes = {}
+        for file_path, h in self.calculate_file_hashes(files).items():
+            try:
+                rel_path = str(file_path.relative_to(self.project_root))
+            except ValueError:
+                # Path not relative to project root
+                rel_path = str(file_path)
+            hashes[rel_path] = h
 
         self.baseline_hashes = hashes
         return hashes
@@ -82,9 +84,10 @@ class FileIntegrityMonitor:
         modified_files = []
 
         # Check all previously hashed files
+        full_paths = {rel_path: self.project_root / rel_path for rel_path in self.baseline_hashes}
+        current = self.calculate_file_hashes(list(full_paths.values()))
         for rel_path, old_hash in self.baseline_hashes.items():
-            full_path = self.project_root / rel_path
-            current_hash = self.calculate_file_hash(full_path)
+            current_hash = current.get(full_paths[rel_path])
 
             if current_hash is None:
                 # File deleted
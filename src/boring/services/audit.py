@@ -5,10 +5,13 @@ Provides immutable-audit-log-style tracking for sensitive operations using SQLit
 Integrates with Vibe features (Error Translation, Tutorial Hooks).
 """
 
+import atexit
 import inspect
 import json
 import logging
+import queue
 import sqlite3
+import threading
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -36,11 +39,22 @@ class AuditLogger:
     """
     Manages secure audit logs using SQLite.
     Singleton pattern for global access.
+
+    log() only enqueues the event; a background writer thread sanitizes,
+    serializes and inserts events in batches (one transaction per
+    batch_size events or flush_interval seconds). When the bounded queue is
+    full, events are dropped and counted rather than blocking the tool call.
     """
 
     _instance: Optional["AuditLogger"] = None
 
-    def __init__(self, db_path: Path | None = None):
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        batch_size: int = 64,
+        flush_interval: float = 0.05,
+        max_queue: int = 10000,
+    ):
         if db_path is None:
             # V14.0: Unified Path Management
             try:
@@ -72,13 +86,26 @@ class AuditLogger:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         self.enabled = True
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
+        self._read_lock = threading.Lock()
+        self._closed = False
+        self._written = 0
+        self._dropped = 0
+        self._batches = 0
         self._conn = None
+        self._read_conn = None
         self._init_db()
 
     def _get_conn(self) -> sqlite3.Connection:
         """Get or create cached connection."""
         if self._conn is None:
             self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
         return self._conn
 
     @classmethod
@@ -119,28 +146,152 @@ class AuditLogger:
         actor: str = "agent",
         duration_ms: int = 0,
     ):
-        """Log an event to the audit trail."""
+        """Queue an event for the audit trail (written by the background writer)."""
         if not self.enabled:
             return
 
+        entry = (
+            datetime.now().isoformat(),
+            event_type,
+            resource,
+            action,
+            actor,
+            details,
+            duration_ms,
+        )
+        if self._closed:
+            # Late events after shutdown (e.g. other atexit hooks) are written inline
+            self._write_batch([entry])
+            return
+
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self._dropped += 1
+            if self._dropped == 1 or self._dropped % 1000 == 0:
+                logger.warning(f"Audit queue full, dropped {self._dropped} events so far")
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Writer counters: queued (pending), written, dropped, batches."""
+        return {
+            "queued": self._queue.qsize(),
+            "written": self._written,
+            "dropped": self._dropped,
+            "batches": self._batches,
+        }
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until every event queued so far is committed. Returns False on timeout."""
+        if self._writer is None or not self._writer.is_alive():
+            self._drain_inline()
+            return True
+        marker = threading.Event()
         try:
-            timestamp = datetime.now().isoformat()
-            # Sanitize details
-            sanitized_details = self._sanitize_args(details or {})
-            details_json = json.dumps(sanitized_details)
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.wait(timeout)
+
+    def close(self):
+        """Flush pending events and stop the writer (registered with atexit)."""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            try:
+                self._queue.put(None, timeout=2.0)
+            except queue.Full:
+                pass
+            writer.join(timeout=2.0)
+        self._drain_inline()
+
+    def _ensure_writer(self):
+        if self._writer is not None and self._writer.is_alive():
+            return
+        with self._writer_lock:
+            if self._writer is not None and self._writer.is_alive():
+                return
+            first_start = self._writer is None
+            self._writer = threading.Thread(
+                target=self._run_writer, name="BoringAuditWriter", daemon=True
+            )
+            self._writer.start()
+            if first_start:
+                atexit.register(self.close)
+
+    def _run_writer(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch: list[tuple] = []
+            markers: list[threading.Event] = []
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if isinstance(item, threading.Event):
+                    markers.append(item)  # flush() marker: commit what we have now
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else None
+                except queue.Empty:
+                    item = None
+                if item is None:
+                    break
+            if batch:
+                self._write_batch(batch)
+            for marker in markers:
+                marker.set()
+            if item is None and self._closed:
+                return
+
+    def _drain_inline(self):
+        """Write anything left in the queue on the calling thread."""
+        batch = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is not None:
+                batch.append(item)
+        if batch:
+            self._write_batch(batch)
+
+    def _write_batch(self, batch: list[tuple]):
+        """Sanitize, serialize and insert a batch in a single transaction."""
+        rows = []
+        for timestamp, event_type, resource, action, actor, details, duration_ms in batch:
+            try:
+                details_json = json.dumps(self._sanitize_args(details or {}), default=str)
+            except Exception as e:
+                details_json = json.dumps({"error": f"Unserializable details: {e}"})
+            rows.append((timestamp, event_type, resource, action, actor, details_json, duration_ms))
 
+        try:
             conn = self._get_conn()
-            conn.execute(
-                """
-                INSERT INTO audit_logs (timestamp, event_type, resource, action, actor, details, duration_ms)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (timestamp, event_type, resource, action, actor, details_json, duration_ms),
-            )
-            conn.commit()
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT INTO audit_logs (timestamp, event_type, resource, action, actor, details, duration_ms)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+            self._written += len(rows)
+            self._batches += 1
         except Exception as e:
             # Silent fail to avoid breaking operations
-            logger.warning(f"Failed to write audit log: {e}")
+            logger.warning(f"Failed to write {len(rows)} audit log(s): {e}")
 
     def _sanitize_args(self, args: dict[str, Any]) -> dict[str, Any]:
         """Remove sensitive data using Vault service."""
@@ -166,10 +317,13 @@ class AuditLogger:
             query += " ORDER BY id DESC LIMIT ?"
             params.append(limit)
 
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                rows = conn.execute(query, params).fetchall()
-                return [dict(row) for row in rows]
+            self.flush()
+            with self._read_lock:
+                if self._read_conn is None:
+                    self._read_conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                    self._read_conn.row_factory = sqlite3.Row
+                rows = self._read_conn.execute(query, params).fetchall()
+            return [dict(row) for row in rows]
         except Exception:
             return []
 
@@ -5,13 +5,21 @@ from pathlib import Path
 from rich.console import Console
 
 from boring.core.config import settings
+from boring.services.checkpoint_store import CheckpointStore, GCPolicy
 
 console = Console()
 
+# Content-addressed store shared by loop backups and transactions
+STORE_DIRNAME = "cas"
+CHECKPOINT_KIND = "loop"
+
 
 class BackupManager:
     """
     Manages file snapshots before modification.
+
+    Snapshots are checkpoints in the backup directory's content-addressed store:
+    only the given files are recorded and identical content is stored once.
     """
 
     def __init__(
@@ -20,87 +28,83 @@ class BackupManager:
         self.loop_id = loop_id
         self.project_root = project_root or settings.PROJECT_ROOT
         self.timestamp = time.strftime("%Y%m%d_%H%M%S")
-        backup_base = backup_dir or settings.BACKUP_DIR
-        self.snapshot_dir = backup_base / f"loop_{loop_id}_{self.timestamp}"
+        self.backup_dir = backup_dir or settings.BACKUP_DIR
+        self.store = CheckpointStore(self.backup_dir / STORE_DIRNAME)
+        self.checkpoint_id: str | None = None
 
     def create_snapshot(self, file_paths: list[Path]) -> Path | None:
         """
-        Copies the specified files to the snapshot directory.
-        Returns the path to the snapshot directory if successful, None if no files needed backup.
+        Records the specified files in the checkpoint store.
+        Returns the path to the checkpoint manifest if successful, None if no files needed backup.
         """
         if not file_paths:
             return None
 
-        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
-        backed_up_count = 0
-
-        for file_path in file_paths:
-            if file_path.exists() and file_path.is_file():
-                # Create directory structure in snapshot (with Windows-safe relative_to)
-                try:
-                    rel_path = (
-                        file_path.relative_to(self.project_root)
-                        if file_path.is_absolute()
-                        else file_path
-                    )
-                except ValueError:
-                    # Windows path case mismatch - use just the filename
-                    rel_path = Path(file_path.name)
-                dest_path = self.snapshot_dir / rel_path
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-
-                shutil.copy2(file_path, dest_path)
-                backed_up_count += 1
-
-        if backed_up_count > 0:
-            console.print(
-                f"[dim]Saved backup of {backed_up_count} files to {self.snapshot_dir}[/dim]"
-            )
-            return self.snapshot_dir
-        else:
-            # Cleanup empty dir if nothing backed up
-            if self.snapshot_dir.exists() and not any(self.snapshot_dir.iterdir()):
-                shutil.rmtree(self.snapshot_dir)
+        existing = [Path(p) for p in file_paths if Path(p).is_file()]
+        if not existing:
             return None
 
+        self.checkpoint_id = self.store.create_checkpoint(
+            self.project_root,
+            existing,
+            kind=CHECKPOINT_KIND,
+            label=f"loop_{self.loop_id}_{self.timestamp}",
+        )
+        manifest_path = self.store.manifest_path(self.checkpoint_id)
+        console.print(f"[dim]Saved backup of {len(existing)} files to {manifest_path}[/dim]")
+        return manifest_path
+
     def restore_snapshot(self):
         """
-        Restores files from the snapshot directory.
+        Restores files from this manager's snapshot (or the latest one for its loop).
+
+        Files whose current content still matches the snapshot are skipped.
         """
-        if not self.snapshot_dir.exists():
+        checkpoint_id = self.checkpoint_id or self._latest_checkpoint_for_loop()
+        if checkpoint_id is None:
             console.print("[yellow]No backup found to restore.[/yellow]")
             return
 
-        console.print(f"[bold red]Restoring backup from {self.snapshot_dir}...[/bold red]")
-
-        for file_path in self.snapshot_dir.rglob("*"):
-            if file_path.is_file():
-                rel_path = file_path.relative_to(self.snapshot_dir)
-                original_path = settings.PROJECT_ROOT / rel_path
+        console.print(f"[bold red]Restoring backup {checkpoint_id}...[/bold red]")
+        report = self.store.restore_checkpoint(checkpoint_id)
+        for rel_path in report.restored:
+            console.print(f"[red]Restored: {rel_path}[/red]")
+        for rel_path in report.failed:
+            console.print(f"[yellow]Could not restore: {rel_path}[/yellow]")
 
-                # Ensure parent dir exists
-                original_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(file_path, original_path)
-                console.print(f"[red]Restored: {rel_path}[/red]")
+    def _latest_checkpoint_for_loop(self) -> str | None:
+        prefix = f"loop_{self.loop_id}_"
+        for manifest in reversed(self.store.list_checkpoints(kind=CHECKPOINT_KIND)):
+            if manifest.get("label", "").startswith(prefix):
+                return manifest["id"]
+        return None
 
     @staticmethod
-    def cleanup_old_backups(keep_last: int = 10):
+    def cleanup_old_backups(keep_last: int = 10, policy: GCPolicy | None = None):
         """
-        Removes old backup directories, keeping only the most recent ones.
+        Applies the backup GC policy: keeps the most recent loop snapshots and
+        reclaims blobs no longer referenced by any checkpoint.
+
+        Also removes old full-copy backup directories from earlier versions.
         """
         if not settings.BACKUP_DIR.exists():
             return
 
-        # Get all backup directories sorted by modification time (oldest first)
-        backup_dirs = sorted(
-            [d for d in settings.BACKUP_DIR.iterdir() if d.is_dir()],
+        store = CheckpointStore(settings.BACKUP_DIR / STORE_DIRNAME)
+        result = store.gc(policy or GCPolicy(keep_last=keep_last), kind=CHECKPOINT_KIND)
+        if result["checkpoints_removed"] or result["blobs_removed"]:
+            console.print(
+                f"[dim]Cleaned up {result['checkpoints_removed']} old backups "
+                f"({result['bytes_freed']} bytes)[/dim]"
+            )
+
+        # Legacy loop_<id>_<timestamp> directories, oldest first
+        legacy_dirs = sorted(
+            [d for d in settings.BACKUP_DIR.iterdir() if d.is_dir() and d.name.startswith("loop_")],
             key=lambda x: x.stat().st_mtime,
         )
-
-        # Remove old backups if we have more than keep_last
-        if len(backup_dirs) > keep_last:
-            dirs_to_remove = backup_dirs[:-keep_last]
-            for old_dir in dirs_to_remove:
+        if len(legacy_dirs) > keep_last:
+            for old_dir in legacy_dirs[: len(legacy_dirs) - keep_last]:
                 try:
                     shutil.rmtree(old_dir)
                     console.print(f"[dim]Cleaned up old backup: {old_dir.name}[/dim]")
@@ -0,0 +1,441 @@
+"""
+Content-addressed checkpoint store.
+
+Checkpoints record only the paths a caller says it is about to touch, as a
+manifest of {path: blob digest | None}, where None means "did not exist".
+Blobs live under objects/ keyed by SHA-256, so unchanged content is stored once
+no matter how many checkpoints reference it; checkpoint and restore cost is
+proportional to the number of touched files, not the size of the tree.
+
+Blob bytes are written with a reflink (copy-on-write clone) where the
+filesystem supports it, zstd-compressed when the optional `zstandard` package is
+installed, and plainly copied otherwise. Hardlinks are deliberately not used:
+tools that rewrite files in place would silently mutate the stored blob.
+
+Layout:
+    <root>/objects/ab/abcdef...[.zst]
+    <root>/checkpoints/<checkpoint_id>.json
+"""
+
+import errno
+import hashlib
+import json
+import logging
+import os
+import shutil
+import stat
+import sys
+import time
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ..core.fingerprint import get_fingerprint_store, hash_file
+
+try:
+    import zstandard as zstd
+except ImportError:  # pragma: no cover - optional dependency
+    zstd = None
+
+logger = logging.getLogger(__name__)
+
+OBJECTS_DIR = "objects"
+CHECKPOINTS_DIR = "checkpoints"
+_ZSTD_SUFFIX = ".zst"
+_FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+
+
+@dataclass
+class GCPolicy:
+    """
+    Retention rules for checkpoints, applied oldest first.
+
+    keep_last: keep at most this many checkpoints
+    max_age_days: drop checkpoints older than this
+    max_bytes: drop checkpoints until the live blobs fit in this budget
+    grace_seconds: never delete blobs written more recently than this, so a
+        checkpoint being created concurrently cannot lose its objects
+    """
+
+    keep_last: int | None = 10
+    max_age_days: float | None = None
+    max_bytes: int | None = None
+    grace_seconds: float = 3600.0
+
+
+@dataclass
+class RestoreReport:
+    """Outcome of restore_checkpoint()."""
+
+    restored: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    failed: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
+class CheckpointStore:
+    """
+    Deduplicating blob store with per-checkpoint manifests.
+
+    Usage:
+        store = CheckpointStore(backup_dir / "cas")
+        cp = store.create_checkpoint(project_root, changed_paths, kind="transaction")
+        ...
+        store.restore_checkpoint(cp)     # Put touched paths back
+        store.delete_checkpoint(cp)
+        store.gc(GCPolicy(keep_last=10))
+    """
+
+    def __init__(self, root: Path, compress: bool | None = None):
+        self.root = Path(root)
+        self.objects_dir = self.root / OBJECTS_DIR
+        self.checkpoints_dir = self.root / CHECKPOINTS_DIR
+        # Compress by default whenever zstandard is importable
+        self.compress = (zstd is not None) if compress is None else (compress and zstd is not None)
+        self._reflink_ok = sys.platform.startswith("linux")
+        self.stats = {"blobs_written": 0, "blobs_deduped": 0, "bytes_written": 0}
+
+    # -------------------------------------------------------------------------
+    # Checkpoints
+    # -------------------------------------------------------------------------
+
+    def create_checkpoint(
+        self,
+        project_root: Path,
+        paths: Iterable[Path | str],
+        kind: str = "checkpoint",
+        label: str = "",
+    ) -> str:
+        """
+        Record the current content of paths and return the checkpoint id.
+
+        Paths may be absolute or relative to project_root; missing paths are
+        recorded as absent so a restore deletes them again. Existing paths that
+        cannot be stored are left out of the manifest, so a restore never
+        touches them. Directories are expanded to the files they contain.
+        """
+        project_root = Path(project_root)
+        targets: dict[str, Path] = {}
+        for p in paths:
+            path = Path(p)
+            if not path.is_absolute():
+                path = project_root / path
+            if path.is_dir():
+                for sub in path.rglob("*"):
+                    if sub.is_file():
+                        targets[self._key(project_root, sub)] = sub
+            else:
+                targets[self._key(project_root, path)] = path
+
+        digests = get_fingerprint_store().fingerprint_many(targets.values())
+        entries: dict[str, list | None] = {}
+        for key, path in targets.items():
+            digest = digests.get(path)
+            try:
+                if digest is None:
+                    # fingerprint_many() also drops unreadable and non-regular
+                    # files; only a path that is really gone may be recorded as
+                    # absent, or a restore would delete it.
+                    try:
+                        st = os.lstat(path)
+                    except FileNotFoundError:
+                        entries[key] = None
+                        continue
+                    if not stat.S_ISREG(st.st_mode):
+                        logger.warning(f"Checkpoint skipped {path}: not a regular file")
+                        continue
+                digest = self.put_file(path, digest)
+                entries[key] = [digest, os.stat(path).st_mode & 0o7777]
+            except OSError as e:
+                logger.warning(f"Checkpoint could not store {path}: {e}")
+
+        checkpoint_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        manifest = {
+            "id": checkpoint_id,
+            "created_at": time.time(),
+            "kind": kind,
+            "label": label,
+            "root": str(project_root),
+            "entries": entries,
+        }
+        self.checkpoints_dir.mkdir(parents=True, exist_ok=True)
+        self._atomic_write(self.manifest_path(checkpoint_id), json.dumps(manifest).encode("utf-8"))
+        return checkpoint_id
+
+    def restore_checkpoint(
+        self, checkpoint_id: str, paths: Iterable[str] | None = None
+    ) -> RestoreReport:
+        """
+        Put the checkpointed paths (or the given subset) back as they were.
+
+        Files whose current content already matches are left untouched.
+        """
+        report = RestoreReport()
+        manifest = self.load_checkpoint(checkpoint_id)
+        if manifest is None:
+            report.failed.append(checkpoint_id)
+            return report
+
+        project_root = Path(manifest["root"])
+        entries: dict[str, list | None] = manifest["entries"]
+        keys = list(entries) if paths is None else [k for k in paths if k in entries]
+        targets = {key: self._resolve(project_root, key) for key in keys}
+        current = get_fingerprint_store().fingerprint_many(
+            target for key, target in targets.items() if entries[key] is not None
+        )
+
+        for key, target in targets.items():
+            entry = entries[key]
+            try:
+                if entry is None:
+                    if target.is_file() or target.is_symlink():
+                        target.unlink()
+                        report.removed.append(key)
+                    else:
+                        report.unchanged += 1
+                    continue
+
+                digest, mode = entry
+                if current.get(target) == digest:
+                    if os.stat(target).st_mode & 0o7777 != mode:
+                        os.chmod(target, mode)
+                    report.unchanged += 1
+                    continue
+                self.restore_blob(digest, target, mode)
+                report.restored.append(key)
+            except OSError as e:
+                logger.warning(f"Failed to restore {key} from checkpoint {checkpoint_id}: {e}")
+                report.failed.append(key)
+
+        return report
+
+    def load_checkpoint(self, checkpoint_id: str) -> dict | None:
+        try:
+            return json.loads(self.manifest_path(checkpoint_id).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Checkpoint {checkpoint_id} unreadable: {e}")
+            return None
+
+    def list_checkpoints(self, kind: str | None = None) -> list[dict]:
+        """Manifests, oldest first."""
+        if not self.checkpoints_dir.exists():
+            return []
+        manifests = []
+        for path in self.checkpoints_dir.glob("*.json"):
+            try:
+                manifest = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if kind is None or manifest.get("kind") == kind:
+                manifests.append(manifest)
+        manifests.sort(key=lambda m: (m.get("created_at", 0), m.get("id", "")))
+        return manifests
+
+    def delete_checkpoint(self, checkpoint_id: str):
+        """Drop a manifest; its blobs are reclaimed by the next gc()."""
+        try:
+            self.manifest_path(checkpoint_id).unlink()
+        except FileNotFoundError:
+            pass
+
+    def manifest_path(self, checkpoint_id: str) -> Path:
+        return self.checkpoints_dir / f"{checkpoint_id}.json"
+
+    # -------------------------------------------------------------------------
+    # Blobs
+    # -------------------------------------------------------------------------
+
+    def put_file(self, path: Path, digest: str | None = None) -> str:
+        """
+        Store a file's content and return its digest.
+
+        If a blob for digest already exists nothing is copied. Otherwise the
+        copy is re-hashed, so a file rewritten after it was fingerprinted is
+        stored under its real digest.
+        """
+        if digest is not None:
+            existing = self._find_blob(digest)
+            if existing is not None:
+                os.utime(existing)  # Refresh for the GC grace period
+                self.stats["blobs_deduped"] += 1
+                return digest
+
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.objects_dir / f".tmp-{uuid.uuid4().hex}"
+        try:
+            if self.compress:
+                data = Path(path).read_bytes()
+                actual = hashlib.sha256(data).hexdigest()
+                payload = zstd.ZstdCompressor().compress(data)
+                tmp.write_bytes(payload)
+                suffix = _ZSTD_SUFFIX
+            else:
+                self._clone(Path(path), tmp)
+                actual = hash_file(tmp)
+                suffix = ""
+
+            if self._find_blob(actual) is not None:
+                self.stats["blobs_deduped"] += 1
+                return actual
+            dest = self._blob_path(actual, suffix)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp, dest)
+            self.stats["blobs_written"] += 1
+            self.stats["bytes_written"] += dest.stat().st_size
+            return actual
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+    def restore_blob(self, digest: str, target: Path, mode: int | None = None):
+        """Atomically replace target with the blob's content."""
+        blob = self._find_blob(digest)
+        if blob is None:
+            raise FileNotFoundError(f"Blob {digest} missing from checkpoint store")
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.boring-restore-{uuid.uuid4().hex[:8]}")
+        try:
+            if blob.suffix == _ZSTD_SUFFIX:
+                if zstd is None:
+                    raise OSError("zstandard is required to restore compressed blobs")
+                with open(blob, "rb") as src, open(tmp, "wb") as dst:
+                    zstd.ZstdDecompressor().copy_stream(src, dst)
+            else:
+                self._clone(blob, tmp)
+            if mode is not None:
+                os.chmod(tmp, mode)
+            os.replace(tmp, target)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+    # -------------------------------------------------------------------------
+    # Garbage collection
+    # -------------------------------------------------------------------------
+
+    def gc(self, policy: GCPolicy | None = None, kind: str | None = None) -> dict:
+        """
+        Apply policy to checkpoints (optionally only those of one kind), then
+        delete blobs no remaining checkpoint references.
+        """
+        policy = policy or GCPolicy()
+        all_manifests = self.list_checkpoints()
+        candidates = [m for m in all_manifests if kind is None or m.get("kind") == kind]
+        doomed: set[str] = set()
+
+        if policy.keep_last is not None and len(candidates) > policy.keep_last:
+            doomed.update(m["id"] for m in candidates[: len(candidates) - policy.keep_last])
+        if policy.max_age_days is not None:
+            cutoff = time.time() - policy.max_age_days * 86400
+            doomed.update(m["id"] for m in candidates if m.get("created_at", 0) < cutoff)
+
+        blobs = self._blob_sizes()
+        if policy.max_bytes is not None:
+            # Newest checkpoint always survives
+            for manifest in candidates[:-1]:
+                if manifest["id"] in doomed:
+                    continue
+                live = self._referenced([m for m in all_manifests if m["id"] not in doomed])
+                if sum(size for d, (_, size) in blobs.items() if d in live) <= policy.max_bytes:
+                    break
+                doomed.add(manifest["id"])
+
+        for checkpoint_id in doomed:
+            self.delete_checkpoint(checkpoint_id)
+
+        live = self._referenced([m for m in all_manifests if m["id"] not in doomed])
+        cutoff = time.time() - policy.grace_seconds
+        blobs_removed = bytes_freed = 0
+        for digest, (path, size) in blobs.items():
+            if digest in live:
+                continue
+            try:
+                if path.stat().st_mtime > cutoff:
+                    continue
+                path.unlink()
+                blobs_removed += 1
+                bytes_freed += size
+            except OSError:
+                continue
+
+        return {
+            "checkpoints_removed": len(doomed),
+            "blobs_removed": blobs_removed,
+            "bytes_freed": bytes_freed,
+        }
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _key(project_root: Path, path: Path) -> str:
+        try:
+            return path.relative_to(project_root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    @staticmethod
+    def _resolve(project_root: Path, key: str) -> Path:
+        path = Path(key)
+        return path if path.is_absolute() else project_root / path
+
+    def _blob_path(self, digest: str, suffix: str = "") -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}{suffix}"
+
+    def _find_blob(self, digest: str) -> Path | None:
+        for suffix in ("", _ZSTD_SUFFIX):
+            path = self._blob_path(digest, suffix)
+            if path.exists():
+                return path
+        return None
+
+    def _blob_sizes(self) -> dict[str, tuple[Path, int]]:
+        blobs = {}
+        if not self.objects_dir.exists():
+            return blobs
+        for path in self.objects_dir.glob("*/*"):
+            try:
+                blobs[path.name.removesuffix(_ZSTD_SUFFIX)] = (path, path.stat().st_size)
+            except OSError:
+                continue
+        return blobs
+
+    @staticmethod
+    def _referenced(manifests: list[dict]) -> set[str]:
+        return {
+            entry[0]
+            for manifest in manifests
+            for entry in manifest.get("entries", {}).values()
+            if entry is not None
+        }
+
+    def _clone(self, src: Path, dst: Path):
+        """Reflink src to dst when the filesystem supports it, else copy."""
+        if self._reflink_ok:
+            try:
+                import fcntl
+
+                with open(src, "rb") as s, open(dst, "wb") as d:
+                    fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+                return
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTTY):
+                    raise
+                # Not a CoW filesystem (or cross-device): stop trying
+                self._reflink_ok = False
+            except ImportError:
+                self._reflink_ok = False
+        shutil.copyfile(src, dst)
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes):
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
@@ -8,12 +8,21 @@ Provides security utilities including:
 - Input sanitization
 """
 
+import bisect
+import hashlib
+import json
+import logging
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 from boring.core.logger import log_status
 
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # FILE PATH SECURITY
 # =============================================================================
@@ -338,6 +347,161 @@ SECRET_SCAN_PATTERNS = {
 }
 
 
+DEFAULT_SECRET_SCAN_EXTENSIONS = (
+    # Code
+    ".py",
+    ".js",
+    ".ts",
+    ".jsx",
+    ".tsx",
+    # Config
+    ".json",
+    ".yaml",
+    ".yml",
+    ".toml",
+    ".ini",
+    ".cfg",
+    ".conf",
+    # Environment files
+    ".env",
+    ".env.example",
+    ".env.local",
+    # Documentation & Text
+    ".txt",
+    ".md",
+    ".rst",
+    # Shell scripts
+    ".sh",
+    ".bash",
+    ".zsh",
+    ".ps1",
+    ".bat",
+    ".cmd",
+    # Other configs
+    ".xml",
+    ".html",
+    ".properties",
+    # Database files
+    ".sql",
+)
+
+SECRET_SCAN_IGNORED_DIRS = {".git", "node_modules", "__pycache__", ".venv", "venv", ".boring_cache"}
+
+SECRET_SCAN_CACHE_FILENAME = "secret_scan_cache.json"
+
+# Uncached bytes below which a process pool's startup outweighs parallel regex work
+_PROCESS_SCAN_MIN_BYTES = 8 * 1024 * 1024
+
+
+def _scoped_pattern(pattern: str) -> str:
+    """Turn a leading global (?i) into a scoped group so it can join an alternation."""
+    if pattern.startswith("(?i)"):
+        return f"(?i:{pattern[4:]})"
+    return f"(?:{pattern})"
+
+
+# Each pattern compiled once, plus one alternation of all of them used as a
+# single-pass prefilter over the whole file buffer.
+_COMPILED_SECRET_PATTERNS = [
+    (name, re.compile(pattern)) for name, pattern in SECRET_SCAN_PATTERNS.items()
+]
+_COMBINED_SECRET_PATTERN = re.compile(
+    "|".join(_scoped_pattern(p) for p in SECRET_SCAN_PATTERNS.values())
+)
+_SECRET_PATTERNS_DIGEST = hashlib.sha256(
+    json.dumps(SECRET_SCAN_PATTERNS, sort_keys=True).encode()
+).hexdigest()[:16]
+
+
+def _scan_secret_text(text: str) -> list[tuple[int, str]]:
+    """
+    Return sorted (line_number, pattern_name) hits, one per pattern per line.
+
+    The combined pattern runs once over the buffer; only lines it touches are
+    checked against the individual patterns. Every line a match spans is
+    rechecked, since one alternation match can consume text that hides another.
+    """
+    candidates: set[int] = set()
+    newlines = None
+    for match in _COMBINED_SECRET_PATTERN.finditer(text):
+        if newlines is None:
+            newlines = [m.start() for m in re.finditer("\n", text)]
+        first = bisect.bisect_left(newlines, match.start())
+        last = bisect.bisect_left(newlines, max(match.start(), match.end() - 1))
+        candidates.update(range(first, last + 1))
+    if not candidates:
+        return []
+
+    lines = text.split("\n")
+    hits = []
+    for index in sorted(candidates):
+        line = lines[index]
+        for name, pattern in _COMPILED_SECRET_PATTERNS:
+            if pattern.search(line):
+                hits.append((index + 1, name))
+    order = {name: i for i, name in enumerate(SECRET_SCAN_PATTERNS)}
+    hits.sort(key=lambda hit: (order[hit[1]], hit[0]))
+    return hits
+
+
+def _scan_secret_file(path: str) -> tuple[str, list[tuple[int, str]]] | None:
+    """(sha256, hits) for one file, or None if unreadable; runs in pool workers."""
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+    # Same newline handling as read_text(), so line numbers match editors
+    text = data.decode("utf-8", errors="ignore").replace("\r\n", "\n").replace("\r", "\n")
+    return hashlib.sha256(data).hexdigest(), _scan_secret_text(text)
+
+
+class _SecretScanCache:
+    """Per-project {rel_path: (sha256, hits)} store for scan_secrets."""
+
+    def __init__(self, project_root: Path):
+        from boring.paths import get_boring_path
+
+        self.project_root = project_root
+        self.path = (
+            get_boring_path(project_root, "cache", create=False, warn_legacy=False)
+            / SECRET_SCAN_CACHE_FILENAME
+        )
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._files: dict[str, list] = {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("patterns") == _SECRET_PATTERNS_DIGEST:
+                self._files = data.get("files", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def get(self, rel_path: str, digest: str) -> list[tuple[int, str]] | None:
+        entry = self._files.get(rel_path)
+        if entry and entry[0] == digest:
+            return [tuple(hit) for hit in entry[1]]
+        return None
+
+    def put(self, rel_path: str, digest: str, hits: list[tuple[int, str]]):
+        with self._lock:
+            self._files[rel_path] = [digest, [list(hit) for hit in hits]]
+            self._dirty = True
+
+    def save(self, seen: set[str]):
+        """Persist entries, dropping files that no longer exist."""
+        stale = {p for p in set(self._files) - seen if not (self.project_root / p).exists()}
+        if not (self._dirty or stale):
+            return
+        for rel_path in stale:
+            del self._files[rel_path]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            payload = {"patterns": _SECRET_PATTERNS_DIGEST, "files": self._files}
+            self.path.write_text(json.dumps(payload), encoding="utf-8")
+        except OSError as e:
+            logger.debug(f"Failed to save secret scan cache: {e}")
+
+
 @dataclass
 class SecurityIssue:
     """Represents a security issue found during scanning."""
@@ -387,84 +551,99 @@ class SecurityScanner:
         self.project_root = Path(project_root)
         self.report = SecurityReport()
 
-    def scan_secrets(self, extensions: list = None) -> list:
-        """Scan files for hardcoded secrets and credentials."""
-        if extensions is None:
-            # Comprehensive list covering all common text file types
-            extensions = [
-                ".py",
-                ".js",
-                ".ts",
-                ".jsx",
-                ".tsx",  # Code
-                ".json",
-                ".yaml",
-                ".yml",
-                ".toml",
-                ".ini",
-                ".cfg",
-                ".conf",  # Config
-                ".env",
-                ".env.example",
-                ".env.local",  # Environment files
-                ".txt",
-                ".md",
-                ".rst",  # Documentation & Text
-                ".sh",
-                ".bash",
-                ".zsh",
-                ".ps1",
-                ".bat",
-                ".cmd",  # Shell scripts
-                ".xml",
-                ".html",
-                ".properties",  # Other configs
-                ".sql",  # Database files
-            ]
+    def scan_secrets(self, extensions: list = None, use_cache: bool = True) -> list:
+        """
+        Scan files for hardcoded secrets and credentials.
+
+        One pruned os.walk collects candidate files. Findings are cached per file
+        content hash: a thread pool reads and hashes the files (hashlib releases
+        the GIL) and answers unchanged ones from the cache. The regex scan is
+        GIL-bound, so cache misses go to a process pool once they add up to
+        _PROCESS_SCAN_MIN_BYTES, and are scanned in this process otherwise.
+        """
+        suffixes = tuple(extensions or DEFAULT_SECRET_SCAN_EXTENSIONS)
+        cache = _SecretScanCache(self.project_root) if use_cache else None
+
+        files = []
+        for root, dirs, names in os.walk(self.project_root):
+            dirs[:] = [d for d in dirs if d not in SECRET_SCAN_IGNORED_DIRS]
+            for name in names:
+                if name.endswith(suffixes):
+                    path = Path(root) / name
+                    if cache is None or path != cache.path:
+                        files.append(path)
+
+        def lookup(file_path: Path) -> tuple[list[tuple[int, str]] | None, int]:
+            """(cached hits or None, size); unreadable files count as clean."""
+            try:
+                if cache is None:
+                    return None, file_path.stat().st_size
+                data = file_path.read_bytes()
+            except OSError:
+                return [], 0
+            rel_path = file_path.relative_to(self.project_root).as_posix()
+            return cache.get(rel_path, hashlib.sha256(data).hexdigest()), len(data)
+
+        if cache is not None and len(files) > 1:
+            workers = min(len(files), os.cpu_count() or 4, 16)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                looked_up = list(pool.map(lookup, files))
+        else:
+            looked_up = [lookup(f) for f in files]
+
+        results = [hits for hits, _ in looked_up]
+        misses = [i for i, hits in enumerate(results) if hits is None]
+        scanned = self._scan_uncached(
+            [files[i] for i in misses], sum(looked_up[i][1] for i in misses)
+        )
+        for i, outcome in zip(misses, scanned, strict=True):
+            if outcome is None:  # Unreadable by now
+                results[i] = []
+                continue
+            digest, results[i] = outcome
+            if cache is not None:
+                cache.put(files[i].relative_to(self.project_root).as_posix(), digest, results[i])
 
         issues = []
-        files_scanned = 0
-
-        for ext in extensions:
-            for file_path in self.project_root.rglob(f"*{ext}"):
-                if any(
-                    part in file_path.parts
-                    for part in [
-                        ".git",
-                        "node_modules",
-                        "__pycache__",
-                        ".venv",
-                        "venv",
-                        ".boring_cache",
-                    ]
-                ):
-                    continue
-
-                files_scanned += 1
-                try:
-                    content = file_path.read_text(encoding="utf-8", errors="ignore")
-                    lines = content.split("\n")
-
-                    for pattern_name, pattern in SECRET_SCAN_PATTERNS.items():
-                        for line_num, line in enumerate(lines, 1):
-                            if re.search(pattern, line):
-                                issue = SecurityIssue(
-                                    severity="HIGH",
-                                    category="secret",
-                                    file_path=str(file_path.relative_to(self.project_root)),
-                                    line_number=line_num,
-                                    description=f"Potential {pattern_name} detected",
-                                    recommendation="Move to environment variable or secrets manager",
-                                )
-                                issues.append(issue)
-                except Exception:
-                    pass
+        for file_path, hits in zip(files, results, strict=True):
+            rel_path = str(file_path.relative_to(self.project_root))
+            for line_num, pattern_name in hits:
+                issues.append(
+                    SecurityIssue(
+                        severity="HIGH",
+                        category="secret",
+                        file_path=rel_path,
+                        line_number=line_num,
+                        description=f"Potential {pattern_name} detected",
+                        recommendation="Move to environment variable or secrets manager",
+                    )
+                )
 
-        self.report.scanned_files = files_scanned
+        if cache is not None:
+            cache.save({f.relative_to(self.project_root).as_posix() for f in files})
+
+        self.report.scanned_files = len(files)
         self.report.secrets_found = len(issues)
         self.report.issues.extend(issues)
         return issues
 
+    @staticmethod
+    def _scan_uncached(
+        files: list[Path], total_bytes: int
+    ) -> list[tuple[str, list[tuple[int, str]]] | None]:
+        """Run _scan_secret_file over files, in a process pool when there is enough to scan."""
+        workers = min(len(files), os.cpu_count() or 1, 16)
+        if workers > 1 and total_bytes >= _PROCESS_SCAN_MIN_BYTES:
+            from concurrent.futures import ProcessPoolExecutor
+            from concurrent.futures.process import BrokenProcessPool
+
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    return list(pool.map(_scan_secret_file, map(str, files), chunksize=8))
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"Secret scan worker pool failed ({e}); scanning serially")
+        return [_scan_secret_file(str(f)) for f in files]
+
     def scan_vulnerabilities(self, target: str = "src/") -> list:
         """Run bandit SAST scanner on Python code."""
         import subprocess
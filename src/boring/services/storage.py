@@ -16,9 +16,13 @@ Tables:
 - loops: Loop execution history
 - errors: Error patterns and solutions
 - metrics: Performance metrics
+- brain_patterns: Learned patterns; embeddings are packed float32 BLOBs and the
+  text columns are mirrored into the brain_patterns_fts (FTS5) table by triggers,
+  so search_patterns() ranks text and vectors in one call with no side index
 """
 
 import json
+import re
 import sqlite3
 import threading
 from contextlib import contextmanager
@@ -29,6 +33,11 @@ from typing import Any
 
 from boring.core.logger import log_status
 
+# Hybrid pattern search
+_RRF_K = 60  # Reciprocal-rank fusion constant
+_ANN_MIN_VECTORS = 50_000  # Above this, use an HNSW index (faiss) instead of brute force
+_FTS_TOKEN = re.compile(r"\w+", re.UNICODE)
+
 # =============================================================================
 # Performance: Thread-local connection pool
 # =============================================================================
@@ -204,7 +213,70 @@ class SQLiteStorage:
                 -- Brain Indexes
                 CREATE INDEX IF NOT EXISTS idx_brain_context ON brain_patterns(context);
                 CREATE INDEX IF NOT EXISTS idx_brain_type ON brain_patterns(pattern_type);
+
+                -- Brain: bumped on every change that affects the in-memory vector matrix
+                CREATE TABLE IF NOT EXISTS brain_meta (
+                    key TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );
+                INSERT OR IGNORE INTO brain_meta (key, value) VALUES ('vectors_version', 0);
+                CREATE TRIGGER IF NOT EXISTS brain_vectors_ai AFTER INSERT ON brain_patterns BEGIN
+                    UPDATE brain_meta SET value = value + 1 WHERE key = 'vectors_version';
+                END;
+                CREATE TRIGGER IF NOT EXISTS brain_vectors_ad AFTER DELETE ON brain_patterns BEGIN
+                    UPDATE brain_meta SET value = value + 1 WHERE key = 'vectors_version';
+                END;
+                CREATE TRIGGER IF NOT EXISTS brain_vectors_au
+                AFTER UPDATE OF embedding, pattern_type ON brain_patterns
+                WHEN old.embedding IS NOT new.embedding OR old.pattern_type IS NOT new.pattern_type
+                BEGIN
+                    UPDATE brain_meta SET value = value + 1 WHERE key = 'vectors_version';
+                END;
+            """)
+            self._fts_enabled = self._init_pattern_fts(conn)
+
+        # Vector matrix cache: (vectors_version, rowids, pattern_types, unit vectors, ann index)
+        self._vector_cache: tuple | None = None
+        self._vector_lock = threading.Lock()
+
+    @staticmethod
+    def _init_pattern_fts(conn: sqlite3.Connection) -> bool:
+        """Create the FTS5 mirror of brain_patterns (filled once for existing rows)."""
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'brain_patterns_fts'"
+        ).fetchone()
+        try:
+            conn.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS brain_patterns_fts USING fts5(
+                    description, context, solution,
+                    content='brain_patterns', content_rowid='id'
+                );
+                CREATE TRIGGER IF NOT EXISTS brain_fts_ai AFTER INSERT ON brain_patterns BEGIN
+                    INSERT INTO brain_patterns_fts (rowid, description, context, solution)
+                    VALUES (new.id, new.description, new.context, new.solution);
+                END;
+                CREATE TRIGGER IF NOT EXISTS brain_fts_ad AFTER DELETE ON brain_patterns BEGIN
+                    INSERT INTO brain_patterns_fts
+                        (brain_patterns_fts, rowid, description, context, solution)
+                    VALUES ('delete', old.id, old.description, old.context, old.solution);
+                END;
+                CREATE TRIGGER IF NOT EXISTS brain_fts_au
+                AFTER UPDATE OF description, context, solution ON brain_patterns BEGIN
+                    INSERT INTO brain_patterns_fts
+                        (brain_patterns_fts, rowid, description, context, solution)
+                    VALUES ('delete', old.id, old.description, old.context, old.solution);
+                    INSERT INTO brain_patterns_fts (rowid, description, context, solution)
+                    VALUES (new.id, new.description, new.context, new.solution);
+                END;
             """)
+            if not exists:
+                conn.execute(
+                    "INSERT INTO brain_patterns_fts (brain_patterns_fts) VALUES ('rebuild')"
+                )
+            return True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5: text search falls back to LIKE
+            return False
 
     @contextmanager
     def _get_connection(self):
@@ -495,10 +567,8 @@ class SQLiteStorage:
     # =========================================================================
 
     def upsert_pattern(self, pattern: dict[str, Any]) -> int:
-        """Insert or update a learned pattern."""
-        embedding_json = (
-            json.dumps(pattern.get("embedding", [])) if pattern.get("embedding") else None
-        )
+        """Insert or update a learned pattern (embedding stored as a float32 BLOB)."""
+        embedding_blob = _encode_embedding(pattern.get("embedding"))
 
         with self._get_connection() as conn:
             cursor = conn.execute(
@@ -514,7 +584,7 @@ class SQLiteStorage:
                     success_count=excluded.success_count,
                     last_used=excluded.last_used,
                     decay_score=excluded.decay_score,
-                    embedding=excluded.embedding,
+                    embedding=COALESCE(excluded.embedding, brain_patterns.embedding),
                     cluster_id=excluded.cluster_id
             """,
                 (
@@ -526,7 +596,7 @@ class SQLiteStorage:
                     pattern.get("success_count", 1),
                     pattern.get("last_used", datetime.now().isoformat()),
                     pattern.get("decay_score", 1.0),
-                    embedding_json,
+                    embedding_blob,
                     pattern.get("cluster_id"),
                     pattern.get("created_at", datetime.now().isoformat()),
                 ),
@@ -591,10 +661,9 @@ class SQLiteStorage:
                 return None
             data = dict(row)
             if data.get("embedding"):
-                try:
-                    data["embedding"] = json.loads(data["embedding"])
-                except json.JSONDecodeError:
-                    pass
+                vector = _decode_embedding(data["embedding"])
+                if vector is not None:
+                    data["embedding"] = vector.tolist()
             return data
 
     def delete_pattern(self, pattern_id: str) -> bool:
@@ -603,6 +672,159 @@ class SQLiteStorage:
             cursor = conn.execute("DELETE FROM brain_patterns WHERE pattern_id = ?", (pattern_id,))
             return cursor.rowcount > 0
 
+    def search_patterns(
+        self,
+        query: str = "",
+        embedding: Any = None,
+        pattern_type: str | None = None,
+        limit: int = 5,
+    ) -> list[dict[str, Any]]:
+        """
+        Hybrid pattern search in one call.
+
+        Full-text matches (FTS5, BM25 order) and vector neighbours (cosine over
+        the stored float32 embeddings) are fused by reciprocal-rank fusion.
+        Either input may be omitted.
+
+        Args:
+            query: Free-text query
+            embedding: Query embedding (same model as the stored vectors)
+            pattern_type: Restrict to one pattern type
+            limit: Maximum patterns returned
+
+        Returns:
+            Pattern rows (without the embedding) with an added "score", best first
+        """
+        depth = max(limit * 4, 20)
+        rankings = []
+        with self._get_connection() as conn:
+            if query and query.strip():
+                rankings.append(self._text_ranking(conn, query, pattern_type, depth))
+            if embedding is not None:
+                rankings.append(self._vector_ranking(conn, embedding, pattern_type, depth))
+
+            fused: dict[int, float] = {}
+            for ranking in rankings:
+                for rank, rowid in enumerate(ranking, start=1):
+                    fused[rowid] = fused.get(rowid, 0.0) + 1.0 / (_RRF_K + rank)
+            top = sorted(fused, key=lambda rowid: fused[rowid], reverse=True)[:limit]
+            if not top:
+                return []
+
+            rows = conn.execute(
+                f"SELECT * FROM brain_patterns WHERE id IN ({','.join('?' * len(top))})", top
+            ).fetchall()
+
+        by_id = {row["id"]: dict(row) for row in rows}
+        results = []
+        for rowid in top:
+            data = by_id.get(rowid)
+            if data is None:
+                continue
+            data.pop("embedding", None)
+            data["score"] = round(fused[rowid] * (_RRF_K + 1) / len(rankings), 4)
+            results.append(data)
+        return results
+
+    def _text_ranking(
+        self, conn: sqlite3.Connection, query: str, pattern_type: str | None, depth: int
+    ) -> list[int]:
+        """Row ids matching any query term, best BM25 first."""
+        terms = _FTS_TOKEN.findall(query)
+        if not terms:
+            return []
+        type_clause = " AND p.pattern_type = ?" if pattern_type else ""
+        type_params = [pattern_type] if pattern_type else []
+
+        if self._fts_enabled:
+            match = " OR ".join('"' + t.replace('"', "") + '"' for t in terms)
+            rows = conn.execute(
+                "SELECT p.id FROM brain_patterns_fts f JOIN brain_patterns p ON p.id = f.rowid "
+                f"WHERE brain_patterns_fts MATCH ?{type_clause} "
+                "ORDER BY bm25(brain_patterns_fts) LIMIT ?",
+                [match, *type_params, depth],
+            ).fetchall()
+        else:
+            like = " OR ".join(["p.description LIKE ? OR p.context LIKE ?"] * len(terms))
+            params = [f"%{t}%" for t in terms for _ in range(2)]
+            rows = conn.execute(
+                f"SELECT p.id FROM brain_patterns p WHERE ({like}){type_clause} "
+                "ORDER BY p.success_count DESC LIMIT ?",
+                [*params, *type_params, depth],
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def _vector_ranking(
+        self, conn: sqlite3.Connection, embedding: Any, pattern_type: str | None, depth: int
+    ) -> list[int]:
+        """Row ids by cosine similarity to the query embedding, best first."""
+        import numpy as np
+
+        query = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(query))
+        cache = self._load_vectors(conn)
+        _, rowids, types, matrix, ann = cache
+        if not len(rowids) or norm == 0.0 or matrix.shape[1] != query.shape[0]:
+            return []
+        query = query / norm
+
+        if ann is not None:
+            # Over-fetch so the type filter still leaves enough candidates
+            _, found = ann.search(query[None, :], depth * 4 if pattern_type else depth)
+            order = [int(i) for i in found[0] if i >= 0]
+        else:
+            scores = matrix @ query
+            if pattern_type:
+                scores = np.where(types == pattern_type, scores, -np.inf)
+            k = min(depth, len(scores))
+            candidates = np.argpartition(-scores, k - 1)[:k]
+            order = candidates[np.argsort(-scores[candidates])].tolist()
+        if pattern_type:
+            order = [i for i in order if types[i] == pattern_type]
+        return [int(rowids[i]) for i in order[:depth]]
+
+    def _load_vectors(self, conn: sqlite3.Connection) -> tuple:
+        """Unit-normalized embedding matrix, rebuilt only when the table changed."""
+        import numpy as np
+
+        version = conn.execute(
+            "SELECT value FROM brain_meta WHERE key = 'vectors_version'"
+        ).fetchone()[0]
+        with self._vector_lock:
+            if self._vector_cache is not None and self._vector_cache[0] == version:
+                return self._vector_cache
+
+            rowids, types, vectors = [], [], []
+            for rowid, pattern_type, blob in conn.execute(
+                "SELECT id, pattern_type, embedding FROM brain_patterns WHERE embedding IS NOT NULL"
+            ):
+                vector = _decode_embedding(blob)
+                if vector is not None and vector.size:
+                    rowids.append(rowid)
+                    types.append(pattern_type)
+                    vectors.append(vector)
+
+            # Keep the dominant dimension (vectors from an older model are skipped)
+            if vectors:
+                dim = max({v.shape[0] for v in vectors}, key=[v.shape[0] for v in vectors].count)
+                keep = [i for i, v in enumerate(vectors) if v.shape[0] == dim]
+                matrix = np.stack([vectors[i] for i in keep])
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                matrix = matrix / np.where(norms == 0, 1.0, norms)
+                rowids = [rowids[i] for i in keep]
+                types = [types[i] for i in keep]
+            else:
+                matrix = np.zeros((0, 0), dtype=np.float32)
+
+            self._vector_cache = (
+                version,
+                np.asarray(rowids, dtype=np.int64),
+                np.asarray(types, dtype=object),
+                matrix,
+                _build_ann_index(matrix),
+            )
+            return self._vector_cache
+
     def upsert_rubric(self, name: str, description: str, criteria: list[dict]) -> int:
         """Insert or update a rubric."""
         criteria_json = json.dumps(criteria)
@@ -872,6 +1094,40 @@ class SQLiteStorage:
             return False
 
 
+def _encode_embedding(embedding: Any) -> bytes | None:
+    """Pack an embedding as little-endian float32 bytes."""
+    if embedding is None or len(embedding) == 0:
+        return None
+    import numpy as np
+
+    return np.asarray(embedding, dtype="<f4").tobytes()
+
+
+def _decode_embedding(value: Any):
+    """float32 vector from a BLOB (or from a legacy JSON text column); None if unreadable."""
+    import numpy as np
+
+    if isinstance(value, bytes | memoryview):
+        return np.frombuffer(value, dtype="<f4")
+    try:
+        return np.asarray(json.loads(value), dtype=np.float32)
+    except (TypeError, ValueError):
+        return None
+
+
+def _build_ann_index(matrix):
+    """HNSW index for large pattern sets (needs faiss); None means brute force."""
+    if matrix.shape[0] < _ANN_MIN_VECTORS:
+        return None
+    try:
+        import faiss
+    except ImportError:
+        return None
+    index = faiss.IndexHNSWFlat(matrix.shape[1], 32, faiss.METRIC_INNER_PRODUCT)
+    index.add(matrix)
+    return index
+
+
 def create_storage(project_root: Path, log_dir: Path | None = None) -> SQLiteStorage:
     """Factory function to create storage instance."""
     try:
@@ -0,0 +1,171 @@
+"""
+Change-scoped verification helpers.
+
+Turn the agent loop's change set into the files worth verifying and the tests
+worth running:
+
+- dependents_of(): files that call into the changed files, read from the RAG
+  dependency graph snapshot (if the project has been indexed)
+- select_tests(): test files that exercise the changed modules, matched by
+  file name convention and by import of the changed module
+"""
+
+import logging
+import os
+import re
+from collections.abc import Iterable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_TEST_DIRS = ("tests", "test")
+_TEST_SKIP_DIRS = {"__pycache__", "node_modules", ".git", ".venv", "venv"}
+_TEST_FILE_RE = re.compile(r"^(test_.+|.+_test|.+\.(test|spec))\.\w+$")
+
+
+def rel_key(project_root: Path, path: Path) -> str:
+    """Project-relative path string, the form used by RAG chunk file paths."""
+    try:
+        return str(path.relative_to(project_root))
+    except ValueError:
+        return str(path)
+
+
+def is_excluded(project_root: Path, path: Path, excludes: Iterable[str]) -> bool:
+    """Whether path lies under a directory named in excludes (VERIFICATION_EXCLUDES)."""
+    try:
+        parts = path.relative_to(project_root).parts[:-1]
+    except ValueError:
+        parts = path.parts[:-1]
+    return not set(excludes).isdisjoint(parts)
+
+
+def resolve_changed_files(project_root: Path, paths: Iterable[str | Path]) -> list[Path]:
+    """Absolute, de-duplicated paths of changed files that still exist."""
+    resolved: dict[Path, None] = {}
+    for p in paths:
+        path = Path(p)
+        if not path.is_absolute():
+            path = project_root / path
+        if path.is_file():
+            resolved[path] = None
+    return list(resolved)
+
+
+def dependents_of(project_root: Path, files: list[Path], depth: int = 1) -> list[Path]:
+    """
+    Files whose chunks call into any of files, via DependencyGraph.get_file_impact_zone.
+
+    Uses the graph snapshot persisted by the RAG index, whatever index version it
+    was built from; returns [] when the project has not been indexed.
+    """
+    snapshot = _graph_snapshot(project_root) if files else None
+    if snapshot is None:
+        return []
+    try:
+        from ..rag.graph_builder import DependencyGraph
+
+        graph = DependencyGraph.load(snapshot, fingerprint=None)
+    except Exception as e:
+        logger.debug(f"Dependency graph unavailable: {e}")
+        return []
+    if graph is None:
+        return []
+
+    zone = graph.get_file_impact_zone([rel_key(project_root, f) for f in files], depth=depth)
+    return [p for p in (project_root / rel for rel in zone) if p.is_file()]
+
+
+def _graph_snapshot(project_root: Path) -> Path | None:
+    """The RAG graph snapshot: under paths.get_rag_db(), or RAGRetriever's default dir."""
+    from ..paths import BoringPaths
+    from ..rag.rag_retriever import _DEFAULT_PERSIST_DIR, _GRAPH_SNAPSHOT_FILENAME
+
+    for rag_dir in (
+        BoringPaths(project_root, create=False).get_rag_db(),
+        project_root / _DEFAULT_PERSIST_DIR,
+    ):
+        snapshot = rag_dir / _GRAPH_SNAPSHOT_FILENAME
+        if snapshot.exists():
+            return snapshot
+    return None
+
+
+def module_name(project_root: Path, path: Path) -> str | None:
+    """Dotted Python module name for a source file (src/ layout aware)."""
+    if path.suffix != ".py":
+        return None
+    try:
+        parts = list(path.relative_to(project_root).with_suffix("").parts)
+    except ValueError:
+        return None
+    if parts and parts[0] == "src":
+        parts = parts[1:]
+    if parts and parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join(parts) or None
+
+
+def is_test_file(path: Path) -> bool:
+    return bool(_TEST_FILE_RE.match(path.name))
+
+
+def _iter_test_files(project_root: Path) -> Iterable[Path]:
+    for name in _TEST_DIRS:
+        test_dir = project_root / name
+        if not test_dir.is_dir():
+            continue
+        for root, dirs, files in os.walk(test_dir):
+            dirs[:] = [d for d in dirs if d not in _TEST_SKIP_DIRS]
+            for file in files:
+                path = Path(root) / file
+                if is_test_file(path):
+                    yield path
+
+
+def select_tests(project_root: Path, changed_files: list[Path]) -> list[Path]:
+    """
+    Test files relevant to changed_files.
+
+    A test is selected when it was itself changed, when its name matches a
+    changed module (test_foo.py, foo_test.py, foo.test.ts, foo.spec.js), or when
+    it imports a changed Python module.
+    """
+    selected: dict[Path, None] = {f: None for f in changed_files if is_test_file(f)}
+    sources = [f for f in changed_files if not is_test_file(f)]
+    if not sources:
+        return sorted(selected)
+
+    stems = {f.stem for f in sources if f.stem != "__init__"}
+    import_patterns = []
+    for f in sources:
+        module = module_name(project_root, f)
+        if not module:
+            continue
+        parent, _, leaf = module.rpartition(".")
+        # "import pkg.mod", "from pkg.mod import x", "from pkg import mod", patch("pkg.mod.x")
+        alternatives = [rf"\b{re.escape(module)}\b"]
+        if parent:
+            alternatives.append(rf"from\s+{re.escape(parent)}\s+import\s[^\n]*\b{leaf}\b")
+        import_patterns.append("|".join(alternatives))
+    import_re = (
+        re.compile("|".join(f"(?:{p})" for p in import_patterns)) if import_patterns else None
+    )
+
+    for test_file in _iter_test_files(project_root):
+        if test_file in selected:
+            continue
+        name = test_file.name.split(".")[0]
+        subject = name[5:] if name.startswith("test_") else name.removesuffix("_test")
+        if subject in stems:
+            selected[test_file] = None
+            continue
+        if import_re is not None and test_file.suffix == ".py":
+            try:
+                text = test_file.read_text(encoding="utf-8", errors="ignore")
+            except OSError:
+                continue
+            if import_re.search(text):
+                selected[test_file] = None
+
+    return sorted(selected)
@@ -441,34 +441,225 @@ def verify_lint_generic(
         )
 
 
+# ==============================================================================
+# BATCH LINT CHECKERS
+# ==============================================================================
+# One tool invocation per group of files instead of one process per file.
+# Each returns {path: VerificationResult}, or None when the tool failed as a
+# whole so the caller can fall back to the per-file handler.
+
+# Paths per invocation; keeps command lines well under Windows' 32k limit
+BATCH_ARGS_LIMIT = 200
+
+
+def _path_key(path: Path | str) -> str:
+    return os.path.normcase(str(Path(path).resolve()))
+
+
+def _display_path(path: Path, project_root: Path) -> str:
+    try:
+        return str(path.relative_to(project_root))
+    except ValueError:
+        return str(path)
+
+
+def verify_lint_python_batch(
+    file_paths: list[Path], project_root: Path, tools: ToolManager, auto_fix: bool = False
+) -> dict[Path, VerificationResult] | None:
+    """Lint many Python files with one `ruff check` per BATCH_ARGS_LIMIT paths."""
+    if not tools.is_available("ruff"):
+        return {
+            f: VerificationResult(
+                passed=True,
+                check_type="lint",
+                message="Skipped (ruff not found)",
+                details=[],
+                suggestions=[],
+            )
+            for f in file_paths
+        }
+
+    results: dict[Path, VerificationResult] = {}
+    for start in range(0, len(file_paths), BATCH_ARGS_LIMIT):
+        batch = file_paths[start : start + BATCH_ARGS_LIMIT]
+        paths = [str(f) for f in batch]
+
+        if auto_fix:
+            try:
+                subprocess.run(
+                    ["ruff", "check", *paths, "--fix", "--unsafe-fixes"],
+                    stdin=subprocess.DEVNULL,
+                    capture_output=True,
+                    text=True,
+                    timeout=120,
+                    cwd=project_root,
+                )
+            except Exception:
+                pass
+
+        try:
+            result = subprocess.run(
+                ["ruff", "check", *paths, "--output-format", "json"],
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                timeout=120,
+                cwd=project_root,
+            )
+            diagnostics = json.loads(result.stdout or "[]") if result.returncode in (0, 1) else None
+        except Exception:
+            diagnostics = None
+        if diagnostics is None:
+            return None
+
+        issues: dict[str, list[str]] = {}
+        for diag in diagnostics:
+            location = diag.get("location") or {}
+            issues.setdefault(_path_key(diag.get("filename", "")), []).append(
+                f"{_display_path(Path(diag.get('filename', '')), project_root)}:"
+                f"{location.get('row', 0)}:{location.get('column', 0)}: "
+                f"{diag.get('code') or 'E'} {diag.get('message', '')}"
+            )
+
+        for file_path in batch:
+            file_issues = issues.get(_path_key(file_path))
+            if not file_issues:
+                results[file_path] = VerificationResult(
+                    passed=True,
+                    check_type="lint",
+                    message=f"Lint OK: {file_path.name}",
+                    details=[],
+                    suggestions=[],
+                )
+            else:
+                results[file_path] = VerificationResult(
+                    passed=False,
+                    check_type="lint",
+                    message=f"Lint issues: {file_path.name}",
+                    details=file_issues[:20],
+                    suggestions=["Run ruff check --fix"],
+                )
+    return results
+
+
+def verify_lint_node_batch(
+    file_paths: list[Path], project_root: Path, tools: ToolManager, auto_fix: bool = False
+) -> dict[Path, VerificationResult] | None:
+    """Lint many JS/TS files with one `eslint --format json` per BATCH_ARGS_LIMIT paths."""
+    if not tools.is_available("eslint"):
+        return {
+            f: VerificationResult(
+                passed=True, check_type="lint", message="Skipped", details=[], suggestions=[]
+            )
+            for f in file_paths
+        }
+
+    results: dict[Path, VerificationResult] = {}
+    for start in range(0, len(file_paths), BATCH_ARGS_LIMIT):
+        batch = file_paths[start : start + BATCH_ARGS_LIMIT]
+        cmd = ["eslint", "--format", "json", *[str(f) for f in batch]]
+        if auto_fix:
+            cmd.append("--fix")
+
+        try:
+            result = subprocess.run(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                timeout=120,
+                cwd=project_root,
+            )
+            reports = json.loads(result.stdout or "[]") if result.returncode in (0, 1) else None
+        except Exception:
+            reports = None
+        if reports is None:
+            return None
+
+        by_path = {_path_key(r.get("filePath", "")): r for r in reports}
+        for file_path in batch:
+            report = by_path.get(_path_key(file_path)) or {}
+            messages = report.get("messages") or []
+            # Like the per-file handler, warnings alone do not fail the check
+            if not report.get("errorCount"):
+                results[file_path] = VerificationResult(
+                    passed=True,
+                    check_type="lint",
+                    message=f"ESLint OK: {file_path.name}",
+                    details=[],
+                    suggestions=[],
+                )
+            else:
+                results[file_path] = VerificationResult(
+                    passed=False,
+                    check_type="lint",
+                    message=f"ESLint issues: {file_path.name}",
+                    details=[
+                        f"{m.get('line', 0)}:{m.get('column', 0)} {m.get('message', '')}"
+                        + (f" ({m['ruleId']})" if m.get("ruleId") else "")
+                        for m in messages[:20]
+                    ],
+                    suggestions=["Fix ESLint issues"],
+                )
+    return results
+
+
+# Per-file lint handler -> batch equivalent
+BATCH_LINT_HANDLERS = {
+    verify_lint_python: verify_lint_python_batch,
+    verify_lint_node: verify_lint_node_batch,
+}
+
+
 # ==============================================================================
 # IMPORT CHECKERS
 # ==============================================================================
 
 
+def _project_python(project_root: Path) -> Path | str:
+    """Prefer the project's virtual environment interpreter for import checks."""
+    venv_path = project_root / ".venv"
+    if venv_path.is_dir():
+        if sys.platform == "win32":
+            python_executable = venv_path / "Scripts" / "python.exe"
+        else:
+            python_executable = venv_path / "bin" / "python"
+        if python_executable.exists():
+            return python_executable
+    return sys.executable
+
+
+def _import_in_subprocess(module: str, python_executable: Path | str, project_root: Path) -> bool:
+    """Fallback check: try the import in a fresh interpreter."""
+    try:
+        subprocess.run(
+            [
+                str(python_executable),
+                "-c",
+                f"import sys; sys.path.insert(0, '{project_root.as_posix()}'); import {module}",
+            ],
+            check=True,
+            capture_output=True,
+            timeout=5,
+        )
+        return True
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        return False
+
+
 def verify_imports_python(file_path: Path, project_root: Path) -> VerificationResult:
     """
-    Verify python imports by shelling out to the project's virtual environment
-    if it exists. This is more reliable than using __import__ in the current process.
+    Verify python imports against the project's virtual environment if it
+    exists. Module lookups go through a resident find_spec probe whose
+    answers are cached per environment (see import_probe).
     """
     try:
         content = file_path.read_text(encoding="utf-8")
         import_pattern = r"^(?:from\s+([\w.]+)\s+)?import\s+([\w.]+(?:\s*,\s*[\w.]+)*)"
         imports = re.findall(import_pattern, content, re.MULTILINE)
-        missing_imports = []
-
-        # Prefer python from venv for checking imports
-        python_executable = None
-        venv_path = project_root / ".venv"
-        if venv_path.is_dir():
-            if sys.platform == "win32":
-                python_executable = venv_path / "Scripts" / "python.exe"
-            else:
-                python_executable = venv_path / "bin" / "python"
-
-        if not python_executable or not python_executable.exists():
-            python_executable = sys.executable
+        stdlib = getattr(sys, "stdlib_module_names", set())
 
+        root_modules: set[str] = set()
         for from_module, import_names in imports:
             # Handle cases like `import a, b, c`
             all_modules = [name.strip() for name in import_names.split(",")]
@@ -485,24 +676,19 @@ def verify_imports_python(file_path: Path, project_root: Path) -> VerificationRe
                 root_module = module_name.split(".")[0]
 
                 # Skip stdlib (optimization)
-                stdlib = getattr(sys, "stdlib_module_names", set())
-                if root_module in stdlib:
-                    continue
+                if root_module not in stdlib:
+                    root_modules.add(root_module)
 
-                try:
-                    # Use a subprocess to check the import in the correct environment
-                    subprocess.run(
-                        [
-                            str(python_executable),
-                            "-c",
-                            f"import sys; sys.path.insert(0, '{project_root.as_posix()}'); import {root_module}",
-                        ],
-                        check=True,
-                        capture_output=True,
-                        timeout=5,
-                    )
-                except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-                    missing_imports.append(root_module)
+        python_executable = _project_python(project_root)
+        try:
+            from .import_probe import resolve_modules
+
+            resolved = resolve_modules(root_modules, python_executable, project_root)
+        except Exception:
+            resolved = {
+                m: _import_in_subprocess(m, python_executable, project_root) for m in root_modules
+            }
+        missing_imports = [m for m, found in resolved.items() if not found]
 
         if missing_imports:
             unique_missing = sorted(set(missing_imports))
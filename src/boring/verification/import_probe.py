@@ -0,0 +1,241 @@
+"""
+Import resolution cache for verify_imports_python.
+
+A single long-lived probe interpreter per (python executable, project root)
+answers "is module X importable?" with importlib.util.find_spec, instead of one
+`python -c "import X"` process per module per file. Answers are memoized per
+environment, keyed by the interpreter path plus the mtimes of its
+site-packages directories and of the project root, and persisted to the cache
+directory so unchanged environments are not re-probed across runs.
+
+The probe is only started on a cache miss, and every read from it has a
+deadline: a probe that hangs (e.g. on a misbehaving import hook) is killed and
+the caller falls back to one subprocess per module.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import subprocess
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = "import_resolution.json"
+
+_READ_TIMEOUT = 10.0  # Seconds to wait for each line from the probe
+
+# Runs inside the target interpreter. First line out: the environment's
+# site-packages directories; then one JSON answer per module name read.
+_PROBE_SCRIPT = r"""
+import importlib.util, json, site, sys
+sys.path.insert(0, sys.argv[1])
+dirs = list(getattr(site, "getsitepackages", lambda: [])())
+user = getattr(site, "getusersitepackages", lambda: "")()
+if user:
+    dirs.append(user)
+print(json.dumps(dirs), flush=True)
+for line in sys.stdin:
+    name = line.strip()
+    try:
+        found = importlib.util.find_spec(name) is not None
+    except Exception:
+        found = False
+    print(json.dumps([name, found]), flush=True)
+"""
+
+
+class _Probe:
+    """One resident interpreter answering find_spec queries over stdin/stdout."""
+
+    def __init__(self, python_executable: str, project_root: Path):
+        self.python_executable = python_executable
+        self.project_root = project_root
+        self.lock = threading.Lock()
+        self.proc = subprocess.Popen(
+            [python_executable, "-c", _PROBE_SCRIPT, project_root.as_posix()],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        # stdout is drained by a thread so reads can time out
+        self._lines: queue.Queue[str] = queue.Queue()
+        threading.Thread(target=self._pump, name="import-probe-reader", daemon=True).start()
+        self.site_dirs: list[str] = json.loads(self._readline() or "[]")
+
+    def _pump(self):
+        try:
+            for line in self.proc.stdout:
+                self._lines.put(line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._lines.put("")  # EOF
+
+    def _readline(self) -> str:
+        try:
+            return self._lines.get(timeout=_READ_TIMEOUT)
+        except queue.Empty:
+            self.proc.kill()
+            self.close()
+            raise TimeoutError(f"import probe gave no answer within {_READ_TIMEOUT}s") from None
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def resolve(self, modules: list[str]) -> dict[str, bool]:
+        """Pipeline all names, then read the answers."""
+        with self.lock:
+            self.proc.stdin.write("".join(f"{m}\n" for m in modules))
+            self.proc.stdin.flush()
+            answers = {}
+            for _ in modules:
+                line = self._readline()
+                if not line:
+                    raise RuntimeError("import probe exited")
+                name, found = json.loads(line)
+                answers[name] = bool(found)
+            return answers
+
+    def close(self):
+        try:
+            self.proc.stdin.close()
+            self.proc.terminate()
+            self.proc.wait(timeout=2)
+        except Exception:
+            pass
+
+
+_lock = threading.Lock()
+_probes: dict[tuple[str, str], _Probe] = {}
+# (python, project_root) -> {"fingerprint": str, "modules": {name: bool}}
+_cache: dict[str, dict] | None = None
+
+
+def _cache_path() -> Path:
+    return settings.CACHE_DIR / CACHE_FILENAME
+
+
+def _load_cache() -> dict[str, dict]:
+    global _cache
+    if _cache is None:
+        try:
+            _cache = json.loads(_cache_path().read_text(encoding="utf-8"))
+        except Exception:
+            _cache = {}
+    return _cache
+
+
+def _save_cache():
+    try:
+        path = _cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(_cache), encoding="utf-8")
+    except Exception as e:
+        logger.debug(f"Failed to save import resolution cache: {e}")
+
+
+def _mtime_ns(path: str | Path) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _fingerprint(python_executable: str, project_root: Path, site_dirs: list[str]) -> str:
+    """Changes whenever packages are (un)installed or top-level modules appear."""
+    parts = [python_executable, str(_mtime_ns(project_root))]
+    parts.extend(f"{d}={_mtime_ns(d)}" for d in site_dirs)
+    return "|".join(parts)
+
+
+def _get_probe(python_executable: str, project_root: Path) -> _Probe:
+    key = (python_executable, str(project_root))
+    probe = _probes.get(key)
+    if probe is None or not probe.alive():
+        probe = _Probe(python_executable, project_root)
+        _probes[key] = probe
+    return probe
+
+
+def resolve_modules(
+    modules: Iterable[str], python_executable: Path | str, project_root: Path
+) -> dict[str, bool]:
+    """
+    Return {module: importable} for top-level module names.
+
+    Each distinct module is probed at most once per environment fingerprint,
+    and no probe is started when the cache answers every module. Raises
+    TimeoutError if the probe stops answering.
+    """
+    wanted = sorted(set(modules))
+    if not wanted:
+        return {}
+
+    python_executable = str(python_executable)
+    with _lock:
+        cache = _load_cache()
+        key = f"{python_executable}::{project_root}"
+        entry = cache.get(key)
+        if entry is not None and entry.get("fingerprint") == _fingerprint(
+            python_executable, project_root, entry.get("site_dirs", [])
+        ):
+            known = entry["modules"]
+            if all(m in known for m in wanted):
+                return {m: known[m] for m in wanted}
+
+        probe = _get_probe(python_executable, project_root)
+        fingerprint = _fingerprint(python_executable, project_root, probe.site_dirs)
+        if entry is None or entry.get("fingerprint") != fingerprint:
+            entry = {"fingerprint": fingerprint, "modules": {}}
+            cache[key] = entry
+        dirty = entry.get("site_dirs") != probe.site_dirs
+        entry["site_dirs"] = probe.site_dirs
+        known = entry["modules"]
+
+        unknown = [m for m in wanted if m not in known]
+        if unknown:
+            try:
+                known.update(probe.resolve(unknown))
+            except TimeoutError:
+                _probes.pop((python_executable, str(project_root)), None)
+                raise
+            except Exception as e:
+                # One restart, then give up on the batch
+                logger.debug(f"Import probe failed ({e}); restarting")
+                probe.close()
+                _probes.pop((python_executable, str(project_root)), None)
+                probe = _get_probe(python_executable, project_root)
+                known.update(probe.resolve(unknown))
+        if unknown or dirty:
+            _save_cache()
+
+        return {m: known[m] for m in wanted}
+
+
+def clear_import_cache():
+    """Forget all memoized answers and stop resident probes."""
+    global _cache
+    with _lock:
+        for probe in _probes.values():
+            probe.close()
+        _probes.clear()
+        _cache = {}
+        try:
+            _cache_path().unlink()
+        except OSError:
+            pass
+
+
+@atexit.register
+def _shutdown_probes():
+    for probe in list(_probes.values()):
+        probe.close()
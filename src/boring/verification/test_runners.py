@@ -6,7 +6,7 @@ from .tools import ToolManager
 
 
 def run_tests_python(
-    project_root: Path, tools: ToolManager, test_path: Path = None
+    project_root: Path, tools: ToolManager, test_path: Path | list[Path] = None
 ) -> VerificationResult:
     if not tools.is_available("pytest"):
         return VerificationResult(
@@ -17,15 +17,18 @@ def run_tests_python(
             suggestions=[],
         )
 
-    test_target = test_path or (project_root / "tests")
-    if not test_target.exists():
+    if isinstance(test_path, list):
+        test_targets = [p for p in test_path if p.exists()]
+    else:
+        test_targets = [test_path or (project_root / "tests")]
+    if not test_targets or not all(t.exists() for t in test_targets):
         return VerificationResult(
             passed=True, check_type="test", message="No tests found", details=[], suggestions=[]
         )
 
     try:
         result = subprocess.run(
-            ["pytest", str(test_target), "-q"],
+            ["pytest", *(str(t) for t in test_targets), "-q"],
             stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
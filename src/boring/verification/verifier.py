@@ -9,7 +9,7 @@ from ..cache import VerificationCache
 from ..config import settings
 from ..logger import logger
 from ..models import VerificationResult
-from . import handlers, test_runners
+from . import change_scope, handlers, test_runners
 from .config import load_custom_rules
 from .tools import ToolManager
 
@@ -154,6 +154,69 @@ class CodeVerifier:
 
         return results
 
+    def verify_files(
+        self,
+        file_paths: list[Path],
+        level: str = "STANDARD",
+        auto_fix: bool = False,
+        max_workers: int = 4,
+        progress_callback=None,
+    ) -> dict[Path, list[VerificationResult]]:
+        """
+        Verify many files, invoking each batch-capable linter once per group.
+
+        Lint runs first, grouped by handler (see handlers.BATCH_LINT_HANDLERS),
+        so auto-fixes land before the per-file syntax and import checks, which
+        then run on a thread pool. Handlers without a batch form, or batches
+        whose tool invocation failed, fall back to the per-file path.
+
+        Returns:
+            {file_path: [syntax, lint, import, ...]} in verify_file() order
+        """
+        files = [f for f in file_paths if f.suffix.lower() in self.handlers]
+        lint_results: dict[Path, VerificationResult] = {}
+
+        if level in ["STANDARD", "FULL", "SEMANTIC"]:
+            groups: dict = {}
+            for f in files:
+                lint = self.handlers[f.suffix.lower()].get("lint")
+                batch_fn = handlers.BATCH_LINT_HANDLERS.get(lint)
+                if batch_fn:
+                    groups.setdefault(batch_fn, []).append(f)
+            for batch_fn, group in groups.items():
+                try:
+                    batch_results = batch_fn(
+                        group, self.project_root, self.tools, auto_fix=auto_fix
+                    )
+                except Exception as e:
+                    logger.warning(f"Batch lint failed, falling back to per-file: {e}")
+                    batch_results = None
+                if batch_results:
+                    lint_results.update(batch_results)
+
+        def _verify(file_path: Path) -> list[VerificationResult]:
+            results = [self.verify_syntax(file_path)]
+            if level in ["STANDARD", "FULL", "SEMANTIC"]:
+                lint = lint_results.get(file_path)
+                results.append(lint or self.verify_lint(file_path, auto_fix=auto_fix))
+                results.append(self.verify_imports(file_path))
+            if level == "SEMANTIC" and self.judge:
+                results.append(self.verify_semantics(file_path))
+            return results
+
+        output: dict[Path, list[VerificationResult]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_file = {executor.submit(_verify, f): f for f in files}
+            for future in as_completed(future_to_file):
+                file_path = future_to_file[future]
+                if progress_callback:
+                    progress_callback(file_path)
+                try:
+                    output[file_path] = future.result()
+                except Exception as e:
+                    logger.error(f"Error verifying {file_path}: {e}")
+        return output
+
     def verify_semantics(self, file_path: Path) -> VerificationResult:
         """Run LLM Judge on file."""
         try:
@@ -219,6 +282,13 @@ class CodeVerifier:
 
         return test_runners.run_tests_python(self.project_root, self.tools, test_path)
 
+    def run_selected_tests(self, test_files: list[Path]) -> VerificationResult:
+        """Run a subset of test files (Python projects; others run their full suite)."""
+        markers = ("Cargo.toml", "pom.xml", "build.gradle", "build.gradle.kts", "package.json")
+        if any((self.project_root / m).exists() for m in (*markers, "go.mod")):
+            return self.run_tests()
+        return test_runners.run_tests_python(self.project_root, self.tools, test_files)
+
     def _aggregate_results(
         self, file_path: Path, results: list[VerificationResult]
     ) -> VerificationResult:
@@ -273,6 +343,7 @@ class CodeVerifier:
         max_workers: int = 4,
         force: bool = False,
         incremental: bool = False,
+        batch: bool = True,
     ) -> tuple[bool, str]:
         target_dir = self.project_root / "src"
         if not target_dir.exists():
@@ -280,7 +351,6 @@ class CodeVerifier:
         if not target_dir.exists():
             return True, "Project directory not found"
 
-        all_results: list[VerificationResult] = []
         excludes = set(settings.VERIFICATION_EXCLUDES)
 
         target_files = []
@@ -298,6 +368,61 @@ class CodeVerifier:
             if not target_files:
                 return True, "No changed files to verify (incremental mode)"
 
+        all_results = self._verify_targets(
+            target_files, level, auto_fix, max_workers, force=force, batch=batch
+        )
+
+        if level == "FULL":
+            all_results.append(self.run_tests())
+
+        return self._summarize(all_results)
+
+    def verify_changes(
+        self,
+        changed_files: list[str | Path],
+        level: str = "STANDARD",
+        auto_fix: bool = False,
+        max_workers: int = 4,
+        include_dependents: bool = True,
+    ) -> tuple[bool, str]:
+        """
+        Verify only what a change set can break.
+
+        Checks the changed files plus their dependents from the RAG dependency
+        graph (when the project is indexed). At FULL level, runs only the tests
+        selected for those files instead of the whole suite.
+        """
+        files = change_scope.resolve_changed_files(self.project_root, changed_files)
+        if include_dependents:
+            files += [
+                f for f in change_scope.dependents_of(self.project_root, files) if f not in files
+            ]
+        excludes = set(settings.VERIFICATION_EXCLUDES)
+        files = [f for f in files if not change_scope.is_excluded(self.project_root, f, excludes)]
+        target_files = [f for f in files if f.suffix.lower() in self.handlers]
+
+        all_results = self._verify_targets(target_files, level, auto_fix, max_workers)
+
+        if level == "FULL":
+            tests = change_scope.select_tests(self.project_root, files)
+            if tests:
+                all_results.append(self.run_selected_tests(tests))
+
+        if not all_results:
+            return True, "No changed files to verify"
+        return self._summarize(all_results)
+
+    def _verify_targets(
+        self,
+        target_files: list[Path],
+        level: str,
+        auto_fix: bool,
+        max_workers: int,
+        force: bool = False,
+        batch: bool = True,
+    ) -> list[VerificationResult]:
+        """Verify files, serving unchanged ones from the cache."""
+        all_results: list[VerificationResult] = []
         files_to_verify = []
         if self.cache and not force:
             for f in target_files:
@@ -321,29 +446,42 @@ class CodeVerifier:
                 task_id = progress.add_task(
                     f"Verifying {len(files_to_verify)} files...", total=len(files_to_verify)
                 )
-                with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                    future_to_file = {
-                        executor.submit(self.verify_file, f, level, auto_fix=auto_fix): f
-                        for f in files_to_verify
-                    }
-                    for future in as_completed(future_to_file):
-                        file_path = future_to_file[future]
-                        progress.advance(task_id)
-                        try:
-                            results = future.result()
-                            all_results.extend(results)
-                            if self.cache:
-                                aggregate = self._aggregate_results(file_path, results)
-                                cache_updates[file_path] = aggregate
-                        except Exception as e:
-                            logger.error(f"Error verifying {file_path}: {e}")
+                if batch:
+                    per_file = self.verify_files(
+                        files_to_verify,
+                        level,
+                        auto_fix=auto_fix,
+                        max_workers=max_workers,
+                        progress_callback=lambda _f: progress.advance(task_id),
+                    )
+                    for file_path, results in per_file.items():
+                        all_results.extend(results)
+                        if self.cache:
+                            cache_updates[file_path] = self._aggregate_results(file_path, results)
+                else:
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        future_to_file = {
+                            executor.submit(self.verify_file, f, level, auto_fix=auto_fix): f
+                            for f in files_to_verify
+                        }
+                        for future in as_completed(future_to_file):
+                            file_path = future_to_file[future]
+                            progress.advance(task_id)
+                            try:
+                                results = future.result()
+                                all_results.extend(results)
+                                if self.cache:
+                                    aggregate = self._aggregate_results(file_path, results)
+                                    cache_updates[file_path] = aggregate
+                            except Exception as e:
+                                logger.error(f"Error verifying {file_path}: {e}")
 
         if self.cache and cache_updates:
             self.cache.bulk_update(cache_updates)
 
-        if level == "FULL":
-            all_results.append(self.run_tests())
+        return all_results
 
+    def _summarize(self, all_results: list[VerificationResult]) -> tuple[bool, str]:
         failed = [r for r in all_results if not r.passed]
         if not failed:
             return True, f"All {len(all_results)} checks passed"
@@ -0,0 +1,58 @@
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root / "src"))
+
+COUNT = 2000
+THREADS = 8
+
+
+def _run(label, async_mode, threads=1):
+    from boring.core.events import EventStore
+
+    root = Path(tempfile.mkdtemp(prefix="boring_evt_bench_"))
+    try:
+        store = EventStore(root, async_mode=async_mode)
+        per_thread = COUNT // threads
+
+        def worker(n):
+            for i in range(per_thread):
+                store.append("BenchEvent", {"worker": n, "i": i, "data": "x" * 100})
+
+        t0 = time.perf_counter()
+        workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        store.flush()
+        duration = time.perf_counter() - t0
+
+        total = per_thread * threads
+        commits = store._ledger.commits
+        assert store.verify_integrity(), f"{label}: integrity check failed"
+        store.close()
+        print(
+            f"{label:<28} {total / duration:>10.0f} events/sec  "
+            f"({total} events, {commits} commits, {duration * 1000:.0f}ms)"
+        )
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def benchmark_event_store():
+    print(f"Benchmarking EventStore.append ({COUNT} events)...")
+    _run("sync, 1 thread", async_mode=False)
+    _run(f"sync, {THREADS} threads", async_mode=False, threads=THREADS)
+    _run("async, 1 thread", async_mode=True)
+    _run(f"async, {THREADS} threads", async_mode=True, threads=THREADS)
+
+
+if __name__ == "__main__":
+    benchmark_event_store()
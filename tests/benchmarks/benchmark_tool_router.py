@@ -0,0 +1,150 @@
+"""
+Micro-benchmark for ToolRouter.route.
+
+Routes a corpus of real natural-language requests (English and CJK) and checks
+every decision against the one recorded before routing moved to a single-pass
+keyword automaton, then reports routing throughput.
+
+Usage:
+    python tests/benchmarks/benchmark_tool_router.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root / "src"))
+
+ROUNDS = 200
+
+# (query, expected tool, expected category)
+CORPUS = [
+    ("search for authentication code", "boring_rag_search", "rag"),
+    ("search for authentication logic", "boring_rag_search", "rag"),
+    ("review my code for security issues", "boring_code_review", "review"),
+    ("Think about the race condition in the auth module", "sequentialthinking", "reasoning"),
+    ("How do I use the new React useActionState hook?", "boring_rag_search", "rag"),
+    ("React useActionState hook 怎麼用？", "context7_query-docs", "external_docs"),
+    ("幫我想一下 auth 模組的競態條件", "sequentialthinking", "reasoning"),
+    ("rollback to V1.0", "boring_checkpoint", "git"),
+    ("save current state as checkpoint-alpha", "boring_checkpoint", "git"),
+    ("show me all checkpoints", "boring_checkpoint", "git"),
+    ("幫我建立一個存檔叫做 test-point", "boring_checkpoint", "git"),
+    ("幫我還原到 Pre-Refactor", "boring_checkpoint", "git"),
+    ("救命", "boring_checkpoint", "git"),
+    ("救命！還原一下", "boring_checkpoint", "git"),
+    ("查看所有存檔清單", "boring_checkpoint", "git"),
+    ("還原到某個地方", "boring_checkpoint", "git"),
+    ("restore to v1.2", "boring_checkpoint", "git"),
+    ("revert to baseline", "boring_checkpoint", "git"),
+    ("list checkpoints", "boring_checkpoint", "git"),
+    ("create checkpoint named milestone-1", "boring_checkpoint", "git"),
+    ("find where the config file is loaded", "boring_workspace_add", "workspace"),
+    ("index the project for rag", "boring_rag_index", "rag"),
+    ("where is the retry logic defined", "sequentialthinking", "reasoning"),
+    ("程式碼在哪裡處理登入", "boring_rag_search", "rag"),
+    ("幫我找 database 連線的程式碼", "boring_delegate", "delegate"),
+    ("run the unit tests", "boring_test_gen", "test"),
+    ("generate tests for src/utils.py", "boring_test_gen", "test"),
+    ("幫我寫測試", "boring_test_gen", "test"),
+    ("check test coverage", "boring_test_gen", "test"),
+    ("commit my changes with a good message", "boring_commit", "git"),
+    ("create a smart commit", "boring_commit", "git"),
+    ("幫我提交程式碼", "boring_rag_search", "rag"),
+    ("run the pre-commit hooks", "boring_commit", "git"),
+    ("what changed since the last commit", "boring_commit", "git"),
+    ("scan for security vulnerabilities", "boring_security_scan", "security"),
+    ("check dependencies for known cves", "boring_vibe_check", "review"),
+    ("檢查安全漏洞", "boring_security_scan", "security"),
+    ("refactor the payment module architecture", "boring_prompt_plan", "planning"),
+    ("plan the implementation of the new feature", "boring_prompt_plan", "planning"),
+    ("幫我規劃架構", "boring_prompt_plan", "planning"),
+    ("design a multi-agent workflow", "boring_multi_agent", "planning"),
+    ("evaluate the quality of this code", "boring_evaluate", "evaluation"),
+    ("show evaluation metrics", "boring_evaluation_metrics", "evaluation"),
+    ("generate a rubric for code review", "boring_code_review", "review"),
+    ("bias report for the judge", "boring_bias_report", "evaluation"),
+    ("review the pull request", "boring_code_review", "review"),
+    ("幫我 review 這段程式碼", "boring_code_review", "review"),
+    ("code review for src/api.py", "boring_code_review", "review"),
+    ("fix the lint errors", "boring_prompt_fix", "fix"),
+    ("format the code", "boring_rag_search", "rag"),
+    ("verify the build", "boring_verify", "test"),
+    ("驗證程式碼", "boring_rag_search", "rag"),
+    ("what should I do next", "boring_best_next_action", "guidance"),
+    ("suggest next step", "boring_suggest_next", "intelligence"),
+    ("下一步要做什麼", "boring_help", "guidance"),
+    ("check project health status", "boring_get_progress", "health"),
+    ("顯示專案進度", "boring_workspace_add", "workspace"),
+    ("learn from this error pattern", "boring_incremental_learn", "intelligence"),
+    ("what patterns has the brain learned", "boring_brain_health", "intelligence"),
+    ("sync brain with the team", "boring_brain_sync", "intelligence"),
+    ("install a plugin", "boring_run_plugin", "plugin"),
+    ("create a custom plugin", "boring_run_plugin", "plugin"),
+    ("start the one dragon flow", "boring_flow", "flow"),
+    ("開始自動開發", "boring_flow", "flow"),
+    ("look up the fastapi docs", "context7_query-docs", "external_docs"),
+    ("查詢 react 官方文件", "boring_doc_gen", "docs"),
+    ("delegate this task to another agent", "boring_delegate", "delegate"),
+    ("use the API to call an external service", "boring_delegate", "delegate"),
+    ("explain why this test fails", "boring_doc_gen", "docs"),
+    ("analyze the stack trace", "boring_code_review", "review"),
+    ("一步步分析這個錯誤", "sequentialthinking", "reasoning"),
+    ("speckit plan for the checkout flow", "boring_speckit_plan", "speckit"),
+    ("clarify the requirements", "boring_speckit_clarify", "speckit"),
+    ("write a spec for user login", "boring_test_gen", "test"),
+    ("summarize the session", "boring_session_start", "session"),
+    ("show usage statistics", "boring_commit", "git"),
+    ("optimize performance of the query", "boring_rag_search", "rag"),
+    ("update the documentation", "boring_doc_gen", "docs"),
+    ("generate docs for the module", "context7_query-docs", "external_docs"),
+    ("compare two versions of parser.py", "boring_evaluate", "evaluation"),
+    ("help", "boring_help", "guidance"),
+    ("", "boring_rag_search", "rag"),
+    ("asdfghjkl", "boring_rag_search", "rag"),
+    ("context for the retriever class", "boring_rag_context", "rag"),
+    ("expand the rag results", "boring_rag_expand", "rag"),
+    ("rag graph of call dependencies", "boring_rag_graph", "visualize"),
+    ("check status of the index", "boring_get_progress", "health"),
+    ("save as backup_2026", "boring_checkpoint", "git"),
+    ("mark current state as start", "boring_flow", "flow"),
+    ("which checkpoints available", "boring_checkpoint", "git"),
+]
+
+
+def benchmark_tool_router():
+    from boring.mcp.tool_router import ToolRouter
+
+    router = ToolRouter()
+    t0 = time.perf_counter()
+    router._compile_keyword_tables()
+    build_ms = (time.perf_counter() - t0) * 1000
+
+    mismatches = []
+    for query, tool, category in CORPUS:
+        result = router.route(query)
+        if (result.matched_tool, result.category) != (tool, category):
+            mismatches.append((query, (tool, category), (result.matched_tool, result.category)))
+    for query, expected, got in mismatches:
+        print(f"CHANGED {query!r}: expected {expected}, got {got}")
+    assert not mismatches, f"{len(mismatches)} routing decisions changed"
+
+    t0 = time.perf_counter()
+    for _ in range(ROUNDS):
+        for query, _, _ in CORPUS:
+            router.route(query)
+    duration = time.perf_counter() - t0
+
+    total = ROUNDS * len(CORPUS)
+    print(f"Routing decisions unchanged for {len(CORPUS)} queries")
+    print(f"Keyword automaton build: {build_ms:.1f}ms")
+    print(
+        f"route(): {total / duration:>10.0f} queries/sec  "
+        f"({duration / total * 1e6:.1f}us per query, {total} queries)"
+    )
+
+
+if __name__ == "__main__":
+    benchmark_tool_router()
@@ -37,18 +37,13 @@ async def test_state_file_deletion_recovery(clean_project):
         state = state_mgr.current
         assert state.user_goal == "Test Goal"
         assert state.total_tasks == 10
-        assert (clean_project / ".boring" / "state.json").exists() or (
-            clean_project / ".boring" / "state.json.gz"
-        ).exists()
+        assert (clean_project / ".boring" / "state.snap").exists()
 
         # 2. CHAOS: Simulate failure (Delete ALL state files)
-        state_file = clean_project / ".boring" / "state.json"
-        state_file_gz = clean_project / ".boring" / "state.json.gz"
-
-        if state_file.exists():
-            state_file.unlink()
-        if state_file_gz.exists():
-            state_file_gz.unlink()
+        for name in ("state.snap", "state.json", "state.json.gz"):
+            state_file = clean_project / ".boring" / name
+            if state_file.exists():
+                state_file.unlink()
 
         # Cleanup old manager resources and release locks
         state_mgr.events.close()
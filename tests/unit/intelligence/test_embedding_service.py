@@ -0,0 +1,150 @@
+"""Tests for boring.intelligence.embedding_service module."""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from boring.intelligence.embedding_service import (
+    EmbeddingCache,
+    EmbeddingEngine,
+    EmbeddingService,
+    text_digest,
+)
+
+
+class FakeModel:
+    """Deterministic stand-in for SentenceTransformer that records encode calls."""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls: list[list[str]] = []
+
+    def encode(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        return np.array([[float(len(t)), float(sum(map(ord, t)) % 97), 1.0] for t in texts])
+
+    def get_sentence_embedding_dimension(self):
+        return 3
+
+
+@pytest.fixture
+def fake_st():
+    models = []
+
+    def factory(name):
+        model = FakeModel(name)
+        models.append(model)
+        return model
+
+    module = SimpleNamespace(SentenceTransformer=factory)
+    with patch.dict("sys.modules", {"sentence_transformers": module}):
+        yield models
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = EmbeddingCache(tmp_path / "embeddings.db")
+    yield cache
+    cache.close()
+
+
+class TestEmbeddingEngine:
+    def test_embed_returns_float32_matrix(self, fake_st, cache):
+        engine = EmbeddingEngine("fake-model", cache=cache)
+        try:
+            vectors = engine.embed(["a", "bb", "a"])
+        finally:
+            engine.shutdown()
+
+        assert isinstance(vectors, np.ndarray)
+        assert vectors.dtype == np.float32
+        assert vectors.shape == (3, 3)
+        np.testing.assert_array_equal(vectors[0], vectors[2])
+        # Duplicates are encoded once
+        assert fake_st[0].calls == [["a", "bb"]]
+
+    def test_cache_hits_skip_inference(self, fake_st, cache):
+        """Re-embedding unchanged content costs zero model calls, even in a new engine."""
+        first = EmbeddingEngine("fake-model", cache=cache)
+        try:
+            expected = first.embed(["def foo(): pass", "class Bar: ..."])
+        finally:
+            first.shutdown()
+
+        second = EmbeddingEngine("fake-model", cache=EmbeddingCache(cache.db_path))
+        try:
+            again = second.embed(["class Bar: ...", "def foo(): pass"])
+        finally:
+            second.shutdown()
+            second.cache.close()
+
+        np.testing.assert_array_equal(again, expected[::-1])
+        assert second.is_loaded is False
+        assert second.stats["cache_hits"] == 2
+
+    def test_cache_is_keyed_by_model(self, fake_st, cache):
+        cache.put_many("model-a", [(text_digest("x"), np.ones(3))])
+        assert cache.get_many("model-b", [text_digest("x")]) == {}
+        assert set(cache.get_many("model-a", [text_digest("x")])) == {text_digest("x")}
+
+    def test_concurrent_requests_are_coalesced(self, fake_st, cache):
+        engine = EmbeddingEngine("fake-model", cache=cache, max_wait_seconds=0.2)
+        results = {}
+        barrier = threading.Barrier(4)
+
+        def worker(i):
+            barrier.wait()
+            results[i] = engine.embed([f"text {i}"])
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        try:
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            engine.shutdown()
+
+        assert sorted(results) == [0, 1, 2, 3]
+        # Fewer model calls than requests
+        assert len(fake_st[0].calls) < 4
+        assert sum(len(c) for c in fake_st[0].calls) == 4
+
+    def test_model_failure_propagates(self, cache):
+        with patch.dict("sys.modules", {"sentence_transformers": None}):
+            engine = EmbeddingEngine("fake-model", cache=cache)
+            assert engine.is_available is False
+            with pytest.raises(ImportError):
+                engine.embed(["x"])
+            engine.shutdown()
+
+
+class TestEmbeddingService:
+    async def test_compute_embedding_async(self, fake_st, cache):
+        engine = EmbeddingEngine("fake-model", cache=cache)
+        with patch(
+            "boring.intelligence.embedding_service.get_embedding_engine", return_value=engine
+        ):
+            service = EmbeddingService()
+        try:
+            vector = await service.compute_embedding("hello")
+            batch = await service.compute_embeddings(["hello", "world"])
+        finally:
+            service.shutdown()
+
+        assert vector.shape == (3,)
+        np.testing.assert_array_equal(batch[0], vector)
+        assert len(fake_st[0].calls) == 2
+
+    async def test_compute_embedding_returns_none_on_failure(self, cache):
+        with patch.dict("sys.modules", {"sentence_transformers": None}):
+            engine = EmbeddingEngine("fake-model", cache=cache)
+            with patch(
+                "boring.intelligence.embedding_service.get_embedding_engine", return_value=engine
+            ):
+                service = EmbeddingService()
+            assert await service.compute_embedding("hello") is None
+            service.shutdown()
@@ -0,0 +1,63 @@
+import math
+import random
+
+from boring.intelligence.search import InvertedIndex
+
+WORDS = [f"word{i:02d}" for i in range(40)]
+
+
+def _exhaustive_bm25(index: InvertedIndex, query: str) -> dict[str, float]:
+    n_docs = len(index.documents)
+    scores: dict[str, float] = {}
+    for token in set(index.tokenize(query)):
+        postings = index.index.get(token, {})
+        idf = math.log((n_docs - len(postings) + 0.5) / (len(postings) + 0.5) + 1)
+        for doc_id, tf in postings.items():
+            norm = tf + index.K1 * (
+                1 - index.B + index.B * index.doc_lengths[doc_id] / index.avg_doc_length
+            )
+            scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (index.K1 + 1) / norm
+    return {doc_id: round(score, 4) for doc_id, score in scores.items()}
+
+
+class TestInvertedIndexSearch:
+    def test_pruned_top_k_matches_exhaustive_scoring(self):
+        rng = random.Random(7)
+        index = InvertedIndex()
+        for i in range(300):
+            words = rng.choices(WORDS, weights=range(40, 0, -1), k=rng.randint(3, 30))
+            index.add_document(f"d{i}", " ".join(words))
+        # Updates and removals keep the running stats consistent
+        index.add_document("d0", "word39 word39 word38")
+        index.remove_document("d1")
+
+        assert index.total_length == sum(index.doc_lengths.values())
+        for _ in range(20):
+            query = " ".join(rng.sample(WORDS, rng.randint(1, 4)))
+            results = index.search(query, limit=5)
+            expected = _exhaustive_bm25(index, query)
+            # Same top scores (ties may pick different documents), each one exact
+            assert [r["score"] for r in results] == sorted(expected.values(), reverse=True)[:5]
+            assert all(expected[r["doc_id"]] == r["score"] for r in results)
+
+    def test_postings_hold_term_frequencies(self):
+        index = InvertedIndex()
+        index.add_document("a", "retry retry backoff", {"kind": "net"})
+
+        assert index.index["retry"] == {"a": 2}
+        assert index.documents["a"].length == 3
+        assert index.search("backoff")[0]["metadata"] == {"kind": "net"}
+
+
+class TestInvertedIndexSerialization:
+    def test_round_trips_through_dict(self):
+        index = InvertedIndex()
+        index.add_document("a", "database connection timeout", {"kind": "db"})
+        index.add_document("b", "parse yaml configuration")
+
+        restored = InvertedIndex()
+        restored.from_dict(index.to_dict())
+
+        assert restored.doc_lengths == index.doc_lengths
+        assert restored.search("configuration yaml") == index.search("configuration yaml")
+        assert restored.search("timeout")[0]["metadata"] == {"kind": "db"}
@@ -70,7 +70,7 @@ class TestTransactionManager:
         assert res["status"] == "success"
         assert res["transaction_id"].startswith("tx-")
         assert res["checkpoint"] == "abc1234"
-        assert res["files_stashed"] == 0
+        assert res["files_checkpointed"] == 0
 
         assert manager.current_transaction is not None
         assert manager.current_transaction.commit_hash == "abc1234"
@@ -81,18 +81,20 @@ class TestTransactionManager:
         # 1. rev-parse --git-dir -> success
         # 2. rev-parse HEAD -> commit_hash
         # 3. status --porcelain -> modified files
-        # 4. stash push -> success
+        # Changed files go to the checkpoint store, not a stash
         mock_run.side_effect = [
             MagicMock(returncode=0, stdout=".git", stderr=""),  # git-dir
             MagicMock(returncode=0, stdout="abc1234", stderr=""),  # HEAD
             MagicMock(returncode=0, stdout=" M file1.py\n?? file2.py", stderr=""),  # status
-            MagicMock(returncode=0, stdout="Saved working directory", stderr=""),  # stash push
         ]
 
         res = manager.start()
         assert res["status"] == "success"
-        assert res["files_stashed"] == 2
-        assert manager.current_transaction.commit_hash == "stash@{0}"
+        assert res["files_checkpointed"] == 2
+        assert mock_run.call_count == 3
+        assert manager.current_transaction.commit_hash == "abc1234"
+        assert manager.current_transaction.files_changed == ["file1.py", "file2.py"]
+        assert manager.current_transaction.checkpoint_id
 
     def test_start_already_in_progress(self, manager):
         manager.current_transaction = TransactionState("tx-1", datetime.now(), "hash", "desc")
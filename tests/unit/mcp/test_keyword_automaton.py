@@ -0,0 +1,54 @@
+# Copyright 2026 Boring for Gemini Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+import re
+
+from boring.mcp.keyword_automaton import KeywordAutomaton
+from boring.mcp.tool_router import ToolRouter
+
+
+def _naive_scan(patterns, text):
+    return {
+        i: bool(re.search(rf"\b{re.escape(p)}\b", text))
+        for i, p in enumerate(patterns)
+        if p in text
+    }
+
+
+def test_overlapping_and_cjk_patterns():
+    automaton = KeywordAutomaton(["he", "she", "hers", "還原", "還原到", "save as", "he"])
+
+    found = automaton.scan("ushers 還原到 v1, save as x")
+    hits = {automaton.patterns[i]: bounded for i, bounded in found.items()}
+
+    assert hits == {
+        "he": False,
+        "she": False,
+        "hers": False,
+        "還原": False,
+        "還原到": True,
+        "save as": True,
+    }
+    assert automaton.scan("") == {}
+
+
+def test_scan_matches_substring_and_regex_semantics():
+    patterns = ["ab", "abc", "bc", "b", "c_d", "測試", "測", "a b", "x-y"]
+    automaton = KeywordAutomaton(patterns)
+    rng = random.Random(3)
+    alphabet = ["a", "b", "c", "d", "_", " ", "-", "x", "y", "測", "試", "。"]
+
+    for _ in range(2000):
+        text = "".join(rng.choices(alphabet, k=rng.randint(0, 12)))
+        assert automaton.scan(text) == _naive_scan(patterns, text), text
+
+
+def test_router_rescans_after_categories_change():
+    router = ToolRouter()
+    router.categories = {"rag": router.categories["rag"]}
+    router._compile_keyword_tables()
+
+    result = router.route("review this code")
+    assert result.category == "rag"
+    assert result.confidence > 0.3
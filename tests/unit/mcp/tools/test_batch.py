@@ -95,3 +95,90 @@ def test_boring_batch_missing_tool(mock_mcp):
 
     assert result["data"]["results"][0]["status"] == "error"
     assert "not found" in result["data"]["results"][0]["message"]
+
+
+def _sleepy_tool(delay, value=None, active=None):
+    import threading
+    import time
+
+    lock = threading.Lock()
+
+    def fn(**kwargs):
+        if active is not None:
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+        time.sleep(delay)
+        if active is not None:
+            with lock:
+                active["now"] -= 1
+        return value if value is not None else kwargs
+
+    tool = MagicMock()
+    tool.fn = fn
+    return tool
+
+
+def test_boring_batch_parallel_steps_overlap(mock_mcp):
+    active = {"now": 0, "max": 0}
+    mock_mcp._tools["slow"] = _sleepy_tool(0.1, value="ok", active=active)
+
+    steps = [{"tool": "slow", "args": {}} for _ in range(4)]
+    result = boring_batch(steps=steps, parallel=True, max_parallel=2)
+
+    data = result["data"]
+    assert data["executed_steps"] == 4
+    assert all(r["status"] == "success" for r in data["results"])
+    assert [r["step"] for r in data["results"]] == [0, 1, 2, 3]
+    assert active["max"] == 2
+    assert data["wall_ms"] < data["sum_step_ms"]
+    assert all(r["duration_ms"] >= 90 for r in data["results"])
+
+
+def test_boring_batch_depends_on_and_references(mock_mcp):
+    order = []
+
+    def record(name, value):
+        def fn(**kwargs):
+            order.append(name)
+            return {"value": value, "args": kwargs}
+
+        tool = MagicMock()
+        tool.fn = fn
+        return tool
+
+    mock_mcp._tools["search"] = record("search", ["a.py", "b.py"])
+    mock_mcp._tools["read"] = record("read", "text")
+
+    steps = [
+        {"id": "find", "tool": "search", "args": {}, "parallel": True},
+        {"id": "other", "tool": "read", "args": {}, "parallel": True},
+        {"id": "use", "tool": "read", "args": {"path": "$steps.find.output.value.1"}},
+    ]
+    result = boring_batch(steps=steps)
+
+    results = result["data"]["results"]
+    assert [r["id"] for r in results] == ["find", "other", "use"]
+    assert results[2]["output"]["args"] == {"path": "b.py"}
+    assert order.index("search") < order.index("read", order.index("search"))
+
+
+def test_boring_batch_failed_dependency_is_skipped(mock_mcp):
+    bad = MagicMock()
+    bad.fn = MagicMock(side_effect=RuntimeError("nope"))
+    good = MagicMock()
+    good.fn = MagicMock(return_value="fine")
+    mock_mcp._tools["bad"] = bad
+    mock_mcp._tools["good"] = good
+
+    steps = [
+        {"id": "a", "tool": "bad", "args": {}},
+        {"id": "b", "tool": "good", "args": {}, "depends_on": ["a"]},
+        {"id": "c", "tool": "good", "args": {}, "parallel": True},
+        {"id": "d", "tool": "good", "args": {}, "depends_on": ["z"]},
+    ]
+    result = boring_batch(steps=steps, continue_on_error=True)
+
+    statuses = {r["id"]: r["status"] for r in result["data"]["results"]}
+    assert statuses == {"a": "failure", "b": "skipped", "c": "success", "d": "error"}
+    assert good.fn.call_count == 1
@@ -0,0 +1,139 @@
+"""
+Tests for the CSR-backed DependencyGraph: incremental patching and snapshots.
+"""
+
+from unittest.mock import patch
+
+from boring.rag.code_indexer import CodeChunk
+from boring.rag.graph_builder import DependencyGraph
+
+
+def _chunk(chunk_id, file_path, name, deps=(), parent=None):
+    return CodeChunk(
+        chunk_id=chunk_id,
+        file_path=file_path,
+        chunk_type="method" if parent else "function",
+        name=name,
+        content=f"def {name}(): pass",
+        start_line=1,
+        end_line=1,
+        dependencies=list(deps),
+        parent=parent,
+    )
+
+
+def _edges(graph):
+    return {
+        (chunk.chunk_id, callee.chunk_id)
+        for chunk in graph.get_chunks()
+        for callee in graph.get_callees(chunk.chunk_id)
+    }
+
+
+def _project():
+    return [
+        _chunk("a", "a.py", "handler", ["service", "helper"]),
+        _chunk("s", "s.py", "service", ["Repo.fetch"]),
+        _chunk("r", "r.py", "fetch", [], parent="Repo"),
+        _chunk("h", "h.py", "helper", []),
+    ]
+
+
+class TestDependencyGraphPatching:
+    def test_update_file_matches_full_rebuild(self):
+        graph = DependencyGraph(_project())
+
+        # s.py now also calls helper, and r.py gains a new "save" method
+        new_s = [_chunk("s", "s.py", "service", ["Repo.fetch", "helper"])]
+        new_r = [
+            _chunk("r", "r.py", "fetch", [], parent="Repo"),
+            _chunk("r2", "r.py", "save", ["fetch"], parent="Repo"),
+        ]
+        graph.update_file("s.py", new_s)
+        graph.update_file("r.py", new_r)
+
+        expected = DependencyGraph(
+            [c for c in _project() if c.file_path not in ("s.py", "r.py")] + new_s + new_r
+        )
+        assert _edges(graph) == _edges(expected)
+        assert {c.chunk_id for c in graph.get_callers("s")} == {"a"}
+
+    def test_new_name_links_existing_callers(self):
+        chunks = [_chunk("a", "a.py", "main", ["missing"])]
+        graph = DependencyGraph(chunks)
+
+        graph.update_file("m.py", [_chunk("m", "m.py", "missing")])
+
+        assert [c.chunk_id for c in graph.get_callers("m")] == ["a"]
+
+    def test_remove_file_drops_nodes_and_edges(self):
+        graph = DependencyGraph(_project())
+
+        removed = graph.remove_file("s.py")
+
+        assert removed == ["s"]
+        assert graph.get_chunk("s") is None
+        assert [c.chunk_id for c in graph.get_callees("a")] == ["h"]
+        assert graph.get_callers("r") == []
+
+    def test_compact_preserves_edges(self):
+        graph = DependencyGraph(_project())
+        graph.update_file("h.py", [_chunk("h", "h.py", "helper", ["service"])])
+        before = _edges(graph)
+
+        graph.compact()
+
+        assert _edges(graph) == before
+        assert graph.find_path("a", "r") == ["a", "s", "r"]
+
+
+class TestDependencyGraphSnapshot:
+    def test_snapshot_roundtrip(self, tmp_path):
+        graph = DependencyGraph(_project())
+        path = tmp_path / "graph.bin"
+
+        assert graph.save(path, fingerprint="v1")
+        loaded = DependencyGraph.load(path, fingerprint="v1")
+
+        assert loaded is not None
+        assert _edges(loaded) == _edges(graph)
+        assert loaded.get_chunk("a").content == ""
+        assert loaded.get_stats().total_edges == 3
+        assert [c.chunk_id for c in loaded.get_impact_zone("r", depth=2)] == ["s", "a"]
+
+    def test_loaded_graph_can_be_patched(self, tmp_path):
+        path = tmp_path / "graph.bin"
+        DependencyGraph(_project()).save(path, fingerprint="v1")
+        loaded = DependencyGraph.load(path, fingerprint="v1")
+
+        loaded.update_file("h.py", [_chunk("h", "h.py", "helper", ["fetch"])])
+        loaded.save(path, fingerprint="v2")
+        reloaded = DependencyGraph.load(path, fingerprint="v2")
+
+        assert {c.chunk_id for c in reloaded.get_callees("h")} == {"r"}
+        assert {c.chunk_id for c in reloaded.get_callers("h")} == {"a"}
+
+    def test_save_compacts_only_with_pending_overlay(self, tmp_path):
+        path = tmp_path / "graph.bin"
+        DependencyGraph(_project()).save(path, fingerprint="v1")
+        loaded = DependencyGraph.load(path, fingerprint="v1")
+
+        with patch.object(DependencyGraph, "compact", autospec=True) as compact:
+            assert loaded.save(path, fingerprint="v2")
+        compact.assert_not_called()
+        assert _edges(DependencyGraph.load(path, fingerprint="v2")) == _edges(loaded)
+
+        loaded.update_file("h.py", [_chunk("h", "h.py", "helper", ["fetch"])])
+        with patch.object(DependencyGraph, "compact", autospec=True) as compact:
+            loaded.save(path, fingerprint="v3")
+        compact.assert_called_once()
+
+    def test_load_rejects_other_fingerprint_or_garbage(self, tmp_path):
+        path = tmp_path / "graph.bin"
+        DependencyGraph(_project()).save(path, fingerprint="v1")
+
+        assert DependencyGraph.load(path, fingerprint="v2") is None
+
+        path.write_bytes(b"not a graph")
+        assert DependencyGraph.load(path, fingerprint="v1") is None
+        assert DependencyGraph.load(tmp_path / "missing.bin") is None
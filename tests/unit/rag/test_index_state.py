@@ -0,0 +1,109 @@
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from boring.rag.index_state import IndexState
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    root.mkdir()
+    cache = tmp_path / "cache"
+    mock_settings = MagicMock(PROJECT_ROOT=root, CACHE_DIR=cache)
+    with patch("boring.rag.index_state.settings", mock_settings):
+        yield root
+
+
+class TestIndexStateSQLite:
+    def test_round_trip_persists_rows_and_commit(self, project):
+        f = project / "a.py"
+        f.write_text("x = 1\n")
+
+        state = IndexState(project)
+        state.update(f, ["c1", "c2"])
+        state.update_commit("abc123")
+        state.save()
+
+        reloaded = IndexState(project)
+        assert reloaded.get_chunks_for_file(f) == ["c1", "c2"]
+        assert reloaded.get_last_commit() == "abc123"
+        assert reloaded.get_stale_files([f]) == []
+
+    def test_unchanged_stat_skips_hashing(self, project):
+        f = project / "a.py"
+        f.write_text("x = 1\n")
+        state = IndexState(project)
+        state.update(f, ["c1"])
+        state.save()
+
+        reloaded = IndexState(project)
+        with patch.object(reloaded, "_compute_hash", side_effect=AssertionError("hashed")):
+            assert reloaded.get_changed_files([f]) == []
+
+    def test_touched_file_with_same_content_is_not_changed(self, project):
+        f = project / "a.py"
+        f.write_text("x = 1\n")
+        state = IndexState(project)
+        state.update(f, ["c1"])
+
+        st = f.stat()
+        os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+        assert state.get_changed_files([f]) == []
+
+        f.write_text("x = 2\n")
+        assert state.get_changed_files([f]) == [f]
+
+    def test_save_writes_only_dirty_rows(self, project):
+        files = []
+        for i in range(3):
+            f = project / f"m{i}.py"
+            f.write_text(f"v = {i}\n")
+            files.append(f)
+        state = IndexState(project)
+        for f in files:
+            state.update(f, [f.stem])
+        state.save()
+
+        state.update(files[0], ["new"])
+        state.remove("m1.py")
+        assert state._dirty == {"m0.py"}
+        state.save()
+        assert not state._dirty and not state._removed
+
+        reloaded = IndexState(project)
+        assert reloaded.get_chunks_for_file(files[0]) == ["new"]
+        assert "m1.py" not in reloaded.state
+        assert reloaded.get_chunks_for_file(files[2]) == ["m2"]
+
+    def test_migrates_legacy_json(self, project):
+        from boring.rag import index_state as module
+
+        cache_dir = module.settings.CACHE_DIR
+        cache_dir.mkdir(parents=True)
+        legacy = {"a.py": {"hash": "h", "chunks": ["c1"]}, "__meta__": {"commit": "deadbeef"}}
+        (cache_dir / IndexState.LEGACY_FILENAME).write_text(json.dumps(legacy))
+
+        state = IndexState(project)
+        assert state.state["a.py"]["chunks"] == ["c1"]
+        assert state.get_last_commit() == "deadbeef"
+        assert "__meta__" not in state.get_stale_files([])
+        assert not (cache_dir / IndexState.LEGACY_FILENAME).exists()
+        assert IndexState(project).state["a.py"]["hash"] == "h"
+
+    def test_clear_forgets_everything(self, project):
+        f = project / "a.py"
+        f.write_text("x = 1\n")
+        state = IndexState(project)
+        state.update(f, ["c1"])
+        state.update_commit("abc")
+        state.save()
+
+        state.clear()
+        state.save()
+
+        reloaded = IndexState(project)
+        assert reloaded.state == {}
+        assert reloaded.get_last_commit() == ""
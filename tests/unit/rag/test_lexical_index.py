@@ -0,0 +1,133 @@
+import math
+import random
+import sqlite3
+from unittest.mock import patch
+
+from boring.rag.code_indexer import CodeChunk
+from boring.rag.lexical_index import (
+    BM25_B,
+    BM25_K1,
+    LexicalIndex,
+    symbol_from_query,
+    tokenize_code,
+)
+
+
+def _chunk(chunk_id, name, content="", file_path="mod.py", chunk_type="function", signature=None):
+    return CodeChunk(
+        chunk_id=chunk_id,
+        file_path=file_path,
+        chunk_type=chunk_type,
+        name=name,
+        content=content,
+        start_line=1,
+        end_line=2,
+        signature=signature,
+    )
+
+
+class TestTokenizer:
+    def test_splits_identifiers(self):
+        assert tokenize_code("getUserName") == ["getusername", "get", "user", "name"]
+        assert tokenize_code("parse_HTTPResponse") == [
+            "parse_httpresponse",
+            "parse",
+            "http",
+            "response",
+        ]
+        assert tokenize_code("x = load(config)") == ["load", "config"]
+
+    def test_symbol_queries(self):
+        assert symbol_from_query("RAGRetriever._boost_and_rank") == "_boost_and_rank"
+        assert symbol_from_query(" loadConfig() ") == "loadConfig"
+        assert symbol_from_query("where is config loaded") is None
+
+
+class TestLexicalIndex:
+    def test_search_ranks_identifier_matches(self, tmp_path):
+        index = LexicalIndex(tmp_path / "lex.db")
+        index.add_chunks(
+            [
+                _chunk("a", "getUserName", "return self.user.name"),
+                _chunk("b", "render_page", "html = template.render(user)"),
+                _chunk("c", "save", "db.commit()", file_path="store.py"),
+            ]
+        )
+
+        hits = index.search("user name", k=5)
+        assert [cid for cid, _ in hits][:2] == ["a", "b"]
+        assert index.search("get_user_name", k=1)[0][0] == "a"
+        assert index.search("commit", file_filter="mod.py") == []
+        assert index.lookup_symbol("getUserName") == ["a"]
+        assert index.lookup_symbol("getusername") == []
+
+    def test_incremental_updates_keep_statistics(self, tmp_path):
+        index = LexicalIndex(tmp_path / "lex.db")
+        index.add_chunks([_chunk("a", "alpha"), _chunk("b", "beta")])
+        index.add_chunks([_chunk("a", "gamma")])  # Re-index replaces the old postings
+        index.remove_chunks(["b", "missing"])
+
+        reopened = LexicalIndex(tmp_path / "lex.db")
+        assert len(reopened) == 1
+        assert reopened.search("alpha") == []
+        assert reopened.lookup_symbol("gamma") == ["a"]
+
+        reopened.set_generation(7)
+        assert reopened.generation == "7"
+        reopened.clear()
+        assert len(reopened) == 0
+        assert reopened.generation == ""
+
+    def test_pruned_search_matches_exhaustive_bm25(self, tmp_path):
+        rng = random.Random(5)
+        vocab = [f"w{i}" for i in range(40)]
+        chunks = [
+            _chunk(
+                f"c{i}",
+                rng.choice(vocab),
+                " ".join(rng.choices(vocab, weights=range(40, 0, -1), k=rng.randint(1, 30))),
+                file_path=f"pkg{i % 3}/mod.py",
+            )
+            for i in range(300)
+        ]
+        index = LexicalIndex(tmp_path / "lex.db")
+        index.add_chunks(chunks)
+
+        terms = {c.chunk_id: LexicalIndex.chunk_terms(c) for c in chunks}
+        avg_length = sum(sum(t.values()) for t in terms.values()) / len(terms)
+
+        def exhaustive(query, k, file_filter=None):
+            words = set(tokenize_code(query))
+            scores = {}
+            for word in words:
+                df = sum(1 for t in terms.values() if word in t)
+                idf = math.log(1 + (len(terms) - df + 0.5) / (df + 0.5))
+                for chunk in chunks:
+                    tf = terms[chunk.chunk_id][word]
+                    if not tf or (file_filter and file_filter not in chunk.file_path):
+                        continue
+                    length = sum(terms[chunk.chunk_id].values())
+                    norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+                    scores[chunk.chunk_id] = (
+                        scores.get(chunk.chunk_id, 0.0) + idf * tf * (BM25_K1 + 1) / norm
+                    )
+            return sorted(scores.values(), reverse=True)[:k]
+
+        for _ in range(50):
+            query = " ".join(rng.sample(vocab, rng.randint(1, 6)))
+            file_filter = rng.choice([None, "pkg1"])
+            k = rng.choice([1, 5, 20])
+            hits = index.search(query, k=k, file_filter=file_filter)
+            assert [round(s, 9) for _, s in hits] == [
+                round(s, 9) for s in exhaustive(query, k, file_filter)
+            ], query
+
+    def test_reuses_one_connection(self, tmp_path):
+        index = LexicalIndex(tmp_path / "lex.db")
+        with patch("boring.rag.lexical_index.sqlite3.connect", wraps=sqlite3.connect) as connect:
+            index.add_chunks([_chunk("a", "alpha")])
+            index.search("alpha")
+            index.lookup_symbol("alpha")
+            assert len(index) == 1
+        assert connect.call_count == 1
+        index.close()
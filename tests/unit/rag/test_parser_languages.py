@@ -69,3 +69,66 @@ def test_validate_language_support_graceful():
         res = parser.validate_language_support("kotlin", "code")
         assert res["success"] is False
         assert "tree-sitter not available" in res["error"]
+
+
+def test_queries_compiled_once_per_language(mock_parser):
+    parser, _ = mock_parser
+    from boring.rag.parser import get_language
+
+    parser.extract_chunks("class A {}", "kotlin")
+    parser.extract_chunks("class B {}", "kotlin")
+
+    assert get_language.return_value.query.call_count == 1
+
+
+def test_incremental_reparse_edits_cached_tree(tmp_path):
+    ts_parser = MagicMock()
+    with (
+        patch("boring.rag.parser.HAS_TREE_SITTER", True),
+        patch("boring.rag.parser.get_parser", return_value=ts_parser),
+        patch("boring.rag.parser.get_language") as mock_lang,
+    ):
+        mock_lang.return_value.query.return_value.matches.return_value = []
+        parser = TreeSitterParser(tree_cache_size=1)
+        source = tmp_path / "main.go"
+        source.write_text("package main\nfunc a() {}\n", encoding="utf-8")
+        parser.parse_file(source, incremental=True)
+        first_tree = ts_parser.parse.return_value
+
+        source.write_text("package main\nfunc abc() {}\n", encoding="utf-8")
+        parser.parse_file(source, incremental=True)
+
+        first_tree.edit.assert_called_once_with(
+            start_byte=19,
+            old_end_byte=19,
+            new_end_byte=21,
+            start_point=(1, 6),
+            old_end_point=(1, 6),
+            new_end_point=(1, 8),
+        )
+        assert ts_parser.parse.call_args.args[1] is first_tree
+
+        # Bounded LRU: another file evicts the first one
+        other = tmp_path / "other.go"
+        other.write_text("package other\n", encoding="utf-8")
+        parser.parse_file(other, incremental=True)
+        assert list(parser._trees) == [str(other.resolve())]
+
+
+def test_indexer_forget_drops_cached_tree(tmp_path):
+    from boring.rag.code_indexer import CodeIndexer
+
+    with (
+        patch("boring.rag.parser.HAS_TREE_SITTER", True),
+        patch("boring.rag.parser.get_parser"),
+        patch("boring.rag.parser.get_language") as mock_lang,
+    ):
+        mock_lang.return_value.query.return_value.matches.return_value = []
+        indexer = CodeIndexer(tmp_path)
+        source = tmp_path / "main.go"
+        source.write_text("package main\nfunc a() {}\n", encoding="utf-8")
+        list(indexer.index_file(source, incremental=True))
+        assert list(indexer._ts_parser._trees) == [str(source.resolve())]
+
+        indexer.forget(source)
+        assert not indexer._ts_parser._trees
@@ -1,4 +1,3 @@
-import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -45,7 +44,7 @@ class TestRAGRetrieverUtility:
     def test_clear_query_cache(self):
         from boring.rag.rag_retriever import _query_cache
 
-        _query_cache["test"] = ([], time.time())
+        _query_cache.put(("scope", 0, "test"), [])
         _clear_query_cache()
         assert len(_query_cache) == 0
 
@@ -117,3 +117,110 @@ class TestRAGWatcher:
         with patch("boring.rag.rag_watcher.RAGWatcher.stop", return_value=True):
             res_stop = stop_rag_watch(tmp_path)
             assert res_stop["status"] == "STOPPED"
+
+
+class TestRAGWatcherBackends:
+    def _wait_for(self, predicate, timeout=5.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.05)
+        return False
+
+    @pytest.mark.parametrize("backend", ["watchdog", "polling"])
+    def test_debounced_exact_paths(self, tmp_path, backend):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "node_modules").mkdir()
+        received = []
+
+        watcher = RAGWatcher(tmp_path, debounce_seconds=0.2, poll_interval=0.05, backend=backend)
+        assert watcher.start(on_files_changed=received.append)
+        try:
+            assert watcher.active_backend == backend
+            (tmp_path / "src" / "a.py").write_text("x = 1\n")
+            (tmp_path / "src" / "b.py").write_text("y = 2\n")
+            (tmp_path / "node_modules" / "dep.js").write_text("ignored")
+            (tmp_path / "src" / "image.png").write_bytes(b"ignored")
+
+            assert self._wait_for(lambda: received)
+        finally:
+            watcher.stop()
+
+        changed = {p for batch in received for p in batch}
+        assert changed == {tmp_path / "src" / "a.py", tmp_path / "src" / "b.py"}
+
+    def test_ignored_top_level_dirs_are_not_scheduled(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / ".git").mkdir()
+
+        with patch("boring.rag.rag_watcher.Observer") as mock_observer_cls:
+            watcher = RAGWatcher(tmp_path, backend="watchdog")
+            watcher._start_observer()
+
+        scheduled = {c.args[1] for c in mock_observer_cls.return_value.schedule.call_args_list}
+        assert scheduled == {str(tmp_path), str(tmp_path / "src")}
+
+    def test_nested_ignored_dirs_are_not_scheduled(self, tmp_path):
+        for d in (
+            "pkg/node_modules/dep",
+            "pkg/src",
+            "services/api/.venv/lib",
+            "services/api/app",
+            "services/web",
+            "docs",
+        ):
+            (tmp_path / d).mkdir(parents=True)
+
+        with patch("boring.rag.rag_watcher.Observer") as mock_observer_cls:
+            watcher = RAGWatcher(tmp_path, backend="watchdog")
+            watcher._start_observer()
+
+        scheduled = {
+            (c.args[1], c.kwargs["recursive"])
+            for c in mock_observer_cls.return_value.schedule.call_args_list
+        }
+        assert scheduled == {
+            (str(tmp_path), False),
+            (str(tmp_path / "pkg"), False),
+            (str(tmp_path / "pkg" / "src"), True),
+            (str(tmp_path / "services"), False),
+            (str(tmp_path / "services" / "api"), False),
+            (str(tmp_path / "services" / "api" / "app"), True),
+            (str(tmp_path / "services" / "web"), True),
+            (str(tmp_path / "docs"), True),
+        }
+
+    def test_ignored_dir_created_later_splits_the_watch(self, tmp_path):
+        (tmp_path / "pkg" / "src").mkdir(parents=True)
+
+        with patch("boring.rag.rag_watcher.Observer") as mock_observer_cls:
+            watcher = RAGWatcher(tmp_path, backend="watchdog")
+            watcher._start_observer()
+            observer = mock_observer_cls.return_value
+            observer.schedule.reset_mock()
+
+            (tmp_path / "pkg" / "node_modules").mkdir()
+            watcher._on_directory_created(tmp_path / "pkg" / "node_modules")
+
+        observer.unschedule.assert_called_once()
+        scheduled = {(c.args[1], c.kwargs["recursive"]) for c in observer.schedule.call_args_list}
+        assert scheduled == {
+            (str(tmp_path / "pkg"), False),
+            (str(tmp_path / "pkg" / "src"), True),
+        }
+
+    def test_flush_waits_for_quiet_period(self, tmp_path):
+        watcher = RAGWatcher(tmp_path, debounce_seconds=10)
+        callback = MagicMock()
+        watcher._on_files_changed = callback
+
+        watcher._record_change(tmp_path / "a.py")
+        watcher._flush_if_quiet()
+        callback.assert_not_called()
+
+        watcher._last_change_time = time.time() - 11
+        watcher._flush_if_quiet()
+        callback.assert_called_once_with([tmp_path / "a.py"])
+        assert watcher._pending_paths == set()
@@ -0,0 +1,81 @@
+"""Tests for the batched background writer of AuditLogger."""
+
+import sqlite3
+import threading
+
+from boring.services.audit import AuditLogger
+
+
+def _count(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM audit_logs").fetchone()[0]
+
+
+def test_events_are_group_committed(tmp_path):
+    audit = AuditLogger(db_path=tmp_path / "audit.db", batch_size=50, flush_interval=0.5)
+    try:
+        for i in range(120):
+            audit.log("TOOL_EXECUTION", f"tool_{i}", "EXECUTE", details={"i": i})
+
+        assert audit.flush()
+        assert _count(audit.db_path) == 120
+        assert audit.stats["written"] == 120
+        assert audit.stats["batches"] <= 4  # 50 + 50 + 20, not one commit per event
+        assert audit.stats["dropped"] == 0
+    finally:
+        audit.close()
+
+    with sqlite3.connect(audit.db_path) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_sanitization_happens_on_writer_thread(tmp_path, monkeypatch):
+    audit = AuditLogger(db_path=tmp_path / "audit.db")
+    threads = []
+
+    def sanitize(args):
+        threads.append(threading.current_thread().name)
+        return {k: "[REDACTED]" if k == "token" else v for k, v in args.items()}
+
+    monkeypatch.setattr(audit, "_sanitize_args", sanitize)
+    try:
+        audit.log("TOOL_EXECUTION", "t", "EXECUTE", details={"token": "s3cret", "x": 1})
+        logs = audit.get_logs(limit=5)
+    finally:
+        audit.close()
+
+    assert threads == ["BoringAuditWriter"]
+    assert '"[REDACTED]"' in logs[0]["details"]
+    assert "s3cret" not in logs[0]["details"]
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    audit = AuditLogger(db_path=tmp_path / "audit.db", max_queue=5)
+    gate = threading.Event()
+    original = audit._write_batch
+
+    def slow_write(batch):
+        gate.wait(timeout=5)
+        original(batch)
+
+    audit._write_batch = slow_write
+    try:
+        for i in range(50):
+            audit.log("TOOL_EXECUTION", "t", "EXECUTE", details={"i": i})
+        dropped = audit.stats["dropped"]
+    finally:
+        gate.set()
+        audit.close()
+
+    assert dropped > 0
+    assert audit.stats["written"] + dropped == 50
+
+
+def test_close_flushes_and_late_events_still_land(tmp_path):
+    audit = AuditLogger(db_path=tmp_path / "audit.db", flush_interval=10)
+    audit.log("A", "r", "EXECUTE")
+    audit.close()
+    audit.log("B", "r", "EXECUTE")
+
+    assert _count(audit.db_path) == 2
+    assert not audit._writer.is_alive()
@@ -0,0 +1,181 @@
+"""
+Tests for the content-addressed checkpoint store and the backups built on it.
+"""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from boring.services.backup import BackupManager
+from boring.services.checkpoint_store import CheckpointStore, GCPolicy
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "a.py").write_text("a = 1\n")
+    (root / "src" / "b.py").write_text("b = 2\n")
+    return root
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CheckpointStore(tmp_path / "cas", compress=False)
+
+
+def _objects(store):
+    return sorted(p for p in store.objects_dir.glob("*/*"))
+
+
+class TestCheckpointStore:
+    def test_roundtrip_restores_only_changed_paths(self, project, store):
+        cp = store.create_checkpoint(project, ["src/a.py", "src/b.py", "src/new.py"])
+
+        (project / "src" / "a.py").write_text("a = 100\n")
+        (project / "src" / "new.py").write_text("created\n")
+
+        report = store.restore_checkpoint(cp)
+
+        assert report.ok
+        assert report.restored == ["src/a.py"]
+        assert report.removed == ["src/new.py"]
+        assert report.unchanged == 1
+        assert (project / "src" / "a.py").read_text() == "a = 1\n"
+        assert not (project / "src" / "new.py").exists()
+
+    def test_identical_content_is_stored_once(self, project, store):
+        (project / "src" / "copy.py").write_text("a = 1\n")
+        store.create_checkpoint(project, ["src/a.py", "src/copy.py"])
+        store.create_checkpoint(project, ["src/a.py"])
+
+        assert len(_objects(store)) == 1
+        assert store.stats["blobs_written"] == 1
+
+    def test_restores_file_mode(self, project, store):
+        script = project / "run.sh"
+        script.write_text("#!/bin/sh\n")
+        script.chmod(0o755)
+        cp = store.create_checkpoint(project, [script])
+
+        script.unlink()
+        store.restore_checkpoint(cp)
+
+        assert script.read_text() == "#!/bin/sh\n"
+        assert os.stat(script).st_mode & 0o777 == 0o755
+
+    def test_missing_blob_is_reported(self, project, store):
+        cp = store.create_checkpoint(project, ["src/a.py"])
+        (project / "src" / "a.py").write_text("changed\n")
+        for blob in _objects(store):
+            blob.unlink()
+
+        report = store.restore_checkpoint(cp)
+
+        assert not report.ok
+        assert report.failed == ["src/a.py"]
+
+    def test_existing_file_dropped_by_fingerprinting_is_not_deleted_on_restore(
+        self, project, store
+    ):
+        from boring.core.fingerprint import get_fingerprint_store
+
+        fingerprints = get_fingerprint_store()
+        real = fingerprints.fingerprint_many
+        a = project / "src" / "a.py"
+
+        def drop_a(paths):
+            return {p: d for p, d in real(paths).items() if p != a}
+
+        with patch.object(fingerprints, "fingerprint_many", side_effect=drop_a):
+            cp = store.create_checkpoint(project, ["src/a.py", "src/b.py"])
+
+        assert store.load_checkpoint(cp)["entries"]["src/a.py"] is not None
+        a.write_text("a = 100\n")
+
+        report = store.restore_checkpoint(cp)
+
+        assert report.ok
+        assert "src/a.py" not in report.removed
+        assert a.read_text() == "a = 1\n"
+
+    def test_unstorable_path_is_left_out_of_manifest(self, project, store):
+        dangling = project / "src" / "link.py"
+        dangling.symlink_to(project / "src" / "missing.py")
+
+        cp = store.create_checkpoint(project, ["src/link.py", "src/gone.py"])
+        entries = store.load_checkpoint(cp)["entries"]
+
+        assert "src/link.py" not in entries
+        assert entries["src/gone.py"] is None
+        store.restore_checkpoint(cp)
+        assert dangling.is_symlink()
+
+    def test_gc_keeps_last_and_sweeps_unreferenced_blobs(self, project, store):
+        ids = []
+        for i in range(3):
+            (project / "src" / "a.py").write_text(f"a = {i}\n")
+            ids.append(store.create_checkpoint(project, ["src/a.py"], kind="loop"))
+            time.sleep(0.01)
+        assert len(_objects(store)) == 3
+
+        result = store.gc(GCPolicy(keep_last=1, grace_seconds=0), kind="loop")
+
+        assert result["checkpoints_removed"] == 2
+        assert result["blobs_removed"] == 2
+        assert [m["id"] for m in store.list_checkpoints()] == [ids[-1]]
+        assert store.restore_checkpoint(ids[-1]).ok
+
+    def test_gc_only_prunes_requested_kind(self, project, store):
+        keep = store.create_checkpoint(project, ["src/a.py"], kind="transaction")
+        store.create_checkpoint(project, ["src/b.py"], kind="loop")
+        store.create_checkpoint(project, ["src/b.py"], kind="loop")
+
+        store.gc(GCPolicy(keep_last=0, grace_seconds=0), kind="loop")
+
+        assert [m["id"] for m in store.list_checkpoints()] == [keep]
+        assert len(_objects(store)) == 1
+
+    def test_gc_grace_period_protects_fresh_blobs(self, project, store):
+        cp = store.create_checkpoint(project, ["src/a.py"])
+        store.delete_checkpoint(cp)
+
+        assert store.gc(GCPolicy(keep_last=None))["blobs_removed"] == 0
+        assert store.gc(GCPolicy(keep_last=None, grace_seconds=0))["blobs_removed"] == 1
+
+
+class TestBackupManager:
+    def test_snapshot_and_restore(self, project, tmp_path):
+        manager = BackupManager(7, project_root=project, backup_dir=tmp_path / "backups")
+        manifest = manager.create_snapshot([project / "src" / "a.py"])
+        assert manifest is not None and manifest.exists()
+
+        (project / "src" / "a.py").write_text("broken\n")
+        BackupManager(7, project_root=project, backup_dir=tmp_path / "backups").restore_snapshot()
+
+        assert (project / "src" / "a.py").read_text() == "a = 1\n"
+
+    def test_snapshot_of_nothing(self, project, tmp_path):
+        manager = BackupManager(1, project_root=project, backup_dir=tmp_path / "backups")
+        assert manager.create_snapshot([]) is None
+        assert manager.create_snapshot([project / "missing.py"]) is None
+
+    def test_cleanup_old_backups_applies_gc_policy(self, project, tmp_path):
+        backups = tmp_path / "backups"
+        (backups / "loop_1_20240101_000000").mkdir(parents=True)
+        for i in range(4):
+            (project / "src" / "a.py").write_text(f"a = {i}\n")
+            BackupManager(i, project_root=project, backup_dir=backups).create_snapshot(
+                [project / "src" / "a.py"]
+            )
+            time.sleep(0.01)
+
+        with patch("boring.services.backup.settings") as mock_settings:
+            mock_settings.BACKUP_DIR = backups
+            BackupManager.cleanup_old_backups(keep_last=0)
+
+        store = CheckpointStore(backups / "cas")
+        assert store.list_checkpoints() == []
+        assert not (backups / "loop_1_20240101_000000").exists()
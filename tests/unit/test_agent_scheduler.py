@@ -0,0 +1,165 @@
+"""Tests for DAG scheduling of multi-agent plans."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from boring.agents.orchestrator import MultiAgentOrchestrator
+from boring.agents.protocol import AgentResponse, ChatMessage
+from boring.agents.scheduler import (
+    DagScheduler,
+    PlanTask,
+    build_edges,
+    footprints_overlap,
+    parse_plan,
+)
+
+
+def _task(task_id, *files, after=()):
+    return PlanTask(task_id, f"task {task_id}", frozenset(files), list(after))
+
+
+class Recorder:
+    """execute() stand-in that tracks concurrency and completion order."""
+
+    def __init__(self, delay=0.05, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.active = 0
+        self.max_active = 0
+        self.order: list[str] = []
+
+    async def __call__(self, task):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        self.order.append(task.task_id)
+        if task.task_id in self.fail:
+            raise RuntimeError("boom")
+        return task.task_id
+
+
+class TestParsePlan:
+    def test_annotations(self):
+        tasks = parse_plan(
+            "- [T1] Add model (files: src/app/models.py)\n"
+            "- [T2] Add API (files: src/app/api.py, tests/test_api.py) (after: T1)\n"
+            "- [T3] Update docs (after: T9)\n"
+        )
+
+        assert [t.task_id for t in tasks] == ["T1", "T2", "T3"]
+        assert tasks[0].description == "Add model"
+        assert tasks[1].footprint == {"src/app/api", "tests/test_api"}
+        assert tasks[1].files == ["src/app/api.py", "tests/test_api.py"]
+        assert tasks[1].depends_on == ["T1"]
+        assert tasks[2].depends_on == []  # Unknown / forward references are dropped
+
+    def test_plain_bullets_infer_footprint(self):
+        tasks = parse_plan(["- Fix bug in src/utils.py", "* Write README.md", "3. Refactor"])
+
+        assert [t.task_id for t in tasks] == ["T1", "T2", "T3"]
+        assert tasks[0].footprint == {"src/utils"}
+        assert tasks[1].footprint == {"README"}
+        assert tasks[2].footprint == frozenset()
+
+    def test_overlap_rules(self):
+        assert footprints_overlap(frozenset({"src/a"}), frozenset({"src/a"}))
+        assert footprints_overlap(frozenset({"src"}), frozenset({"src/a"}))
+        assert footprints_overlap(
+            frozenset({"src/boring/agents/runner"}), frozenset({"boring/agents/runner"})
+        )
+        assert not footprints_overlap(frozenset({"src/a"}), frozenset({"src/ab"}))
+        assert footprints_overlap(frozenset(), frozenset({"src/a"}))
+
+    def test_conflicting_tasks_are_ordered(self):
+        edges = build_edges([_task("A", "a"), _task("B", "b"), _task("C", "a", "c")])
+        assert edges == {"A": [], "B": [], "C": ["A"]}
+
+
+class TestDagScheduler:
+    async def test_disjoint_tasks_run_concurrently(self):
+        recorder = Recorder()
+        tasks = [_task("A", "a"), _task("B", "b"), _task("C", "a")]
+
+        report = await DagScheduler(max_parallel=3).run(tasks, recorder)
+
+        assert recorder.max_active == 2
+        assert recorder.order.index("A") < recorder.order.index("C")
+        assert report.results == {"A": "A", "B": "B", "C": "C"}
+        assert report.critical_path == ["A", "C"]
+        assert report.wall_time < report.busy_time
+
+    async def test_width_is_respected(self):
+        recorder = Recorder(delay=0.02)
+        tasks = [_task(str(i), f"f{i}") for i in range(6)]
+
+        await DagScheduler(max_parallel=2).run(tasks, recorder)
+
+        assert recorder.max_active == 2
+        assert len(recorder.order) == 6
+
+    async def test_unknown_footprint_is_serialized(self):
+        recorder = Recorder(delay=0.01)
+        tasks = [_task("A", "a"), _task("B"), _task("C", "c")]
+
+        await DagScheduler(max_parallel=3).run(tasks, recorder)
+
+        assert recorder.max_active == 1
+        assert recorder.order == ["A", "B", "C"]
+
+    async def test_failed_dependency_skips_dependents(self):
+        recorder = Recorder(delay=0.01, fail={"A"})
+        tasks = [_task("A", "a"), _task("B", "b", after=["A"]), _task("C", "c")]
+
+        report = await DagScheduler().run(tasks, recorder, on_skip=lambda t, reason: reason)
+
+        assert isinstance(report.results["A"], RuntimeError)
+        assert report.results["B"] == "Skipped: dependency A failed"
+        assert report.results["C"] == "C"
+        assert report.timings["B"].status == "skipped"
+        assert "B" not in recorder.order
+
+
+class TestOrchestratorScheduling:
+    async def test_execute_goal_runs_plan_in_parallel(self, tmp_path):
+        plan = (
+            "- [T1] Add parser (files: src/parser.py)\n"
+            "- [T2] Add lexer (files: src/lexer.py)\n"
+            "- [T3] Wire parser and lexer (files: src/parser.py, src/lexer.py) (after: T1)\n"
+        )
+        active = {"now": 0, "max": 0}
+        context_files = {}
+
+        async def execute_task(task):
+            if task.agent_name == "architect":
+                content = plan
+            elif task.agent_name == "reviewer":
+                content = "APPROVED"
+            else:
+                context_files[task.instructions] = task.context_files
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+                await asyncio.sleep(0.05)
+                active["now"] -= 1
+                content = f"done: {task.instructions}"
+            return AgentResponse(messages=[ChatMessage(role="assistant", content=content)])
+
+        with patch("boring.agents.orchestrator.AsyncAgentRunner") as runner_cls:
+            runner = runner_cls.return_value
+            runner.execute_task = AsyncMock(side_effect=execute_task)
+            runner.close = AsyncMock()
+            orch = MultiAgentOrchestrator(tmp_path, max_parallel=3)
+            results = await orch.execute_goal("build a compiler")
+
+        assert [r.messages[-1].content for r in results] == [
+            "done: Implement this sub-task: Add parser",
+            "done: Implement this sub-task: Add lexer",
+            "done: Implement this sub-task: Wire parser and lexer",
+        ]
+        assert context_files["Implement this sub-task: Wire parser and lexer"] == [
+            "src/parser.py",
+            "src/lexer.py",
+        ]
+        assert active["max"] == 2
+        assert orch.last_schedule.critical_path[-1] == "T3"
+        runner.close.assert_awaited_once()
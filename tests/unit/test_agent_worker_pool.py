@@ -0,0 +1,284 @@
+"""Tests for the warm agent worker pool and its framed protocol."""
+
+import asyncio
+import io
+import os
+import sqlite3
+import sys
+import textwrap
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import boring
+from boring.agents.pool import AgentWorkerPool
+from boring.agents.protocol import AgentTask
+from boring.agents.runner import AsyncAgentRunner
+from boring.agents.worker import encode_frame, read_frame, run_task, serve, write_frame
+from boring.intelligence.agent_scorer import AgentScorer
+
+SRC_DIR = str(Path(boring.__file__).resolve().parents[1])
+
+FAKE_WORKER = textwrap.dedent(
+    """
+    import os
+    import sys
+    import time
+
+    from boring.agents.worker import serve
+
+    def handler(frame):
+        if frame["prompt"] == "crash":
+            os._exit(3)
+        if frame["prompt"] == "hang":
+            time.sleep(60)
+        return {
+            "type": "result",
+            "id": frame["id"],
+            "success": True,
+            "output": f"{os.getpid()}:{frame['prompt']}",
+            "error": None,
+            "duration_ms": 0.0,
+        }
+
+    serve(sys.stdin.buffer, os.fdopen(os.dup(1), "wb"), handler)
+    """
+)
+
+
+@pytest.fixture
+def make_pool(tmp_path):
+    script = tmp_path / "fake_worker.py"
+    script.write_text(FAKE_WORKER)
+
+    def factory(**kwargs):
+        return AgentWorkerPool(
+            tmp_path,
+            command=[sys.executable, str(script)],
+            env={"PYTHONPATH": SRC_DIR},
+            **kwargs,
+        )
+
+    return factory
+
+
+def _pid(result):
+    return result["output"].split(":")[0]
+
+
+class TestFraming:
+    def test_serve_answers_ping_and_tasks(self):
+        stdin = io.BytesIO(
+            encode_frame({"type": "ping"})
+            + encode_frame({"type": "task", "id": "t1", "prompt": "hi"})
+            + encode_frame({"type": "shutdown"})
+        )
+        channel = io.BytesIO()
+
+        serve(stdin, channel, handler=lambda f: {"type": "result", "id": f["id"]})
+
+        channel.seek(0)
+        frames = [read_frame(channel) for _ in range(3)]
+        assert [f["type"] for f in frames] == ["ready", "pong", "result"]
+        assert frames[2]["id"] == "t1"
+        assert read_frame(channel) is None
+
+    def test_run_task_captures_output_and_scopes_env(self):
+        def fake_one_shot(**kwargs):
+            print(f"role={os.environ['BORING_AGENT_ROLE']} prompt={kwargs['instruction']}")
+
+        with patch("boring.main._run_one_shot", side_effect=fake_one_shot):
+            result = run_task({"id": "x", "prompt": "do it", "env": {"BORING_AGENT_ROLE": "Coder"}})
+
+        assert result["success"] is True
+        assert result["output"] == "role=Coder prompt=do it"
+        assert "BORING_AGENT_ROLE" not in os.environ
+
+    def test_run_task_reports_failure(self):
+        import typer
+
+        with patch("boring.main._run_one_shot", side_effect=typer.Exit(code=1)):
+            result = run_task({"id": "x", "prompt": "p"})
+
+        assert result["success"] is False
+
+    def test_concurrent_tasks_use_separate_prompt_files(self, tmp_path, monkeypatch):
+        from boring.core.config import settings
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(settings, "PROMPT_FILE", settings.PROMPT_FILE)
+        both_written = threading.Barrier(2, timeout=10)
+        prompts = {}
+
+        class FakeLoop:
+            def __init__(self, prompt_file, **kwargs):
+                self.prompt_file = prompt_file
+
+            def run(self):
+                both_written.wait()  # Neither task reads its prompt before both are written
+                prompts[self.prompt_file.name] = self.prompt_file.read_text(encoding="utf-8")
+
+        debugger = MagicMock()
+        debugger.return_value.run_with_healing.side_effect = lambda fn: fn()
+        context = MagicMock()
+        context.return_value.get_context_summary.return_value = ""
+        context.return_value.resolve_reference.return_value = None
+
+        results = {}
+        with (
+            patch("boring.loop.AgentLoop", FakeLoop),
+            patch("boring.debugger.BoringDebugger", debugger),
+            patch("boring.intelligence.context_manager.ContextManager", context),
+            patch("boring.cli.suggestions.run_suggestions"),
+        ):
+            threads = [
+                threading.Thread(
+                    target=lambda i=i: results.update(
+                        {i: run_task({"id": i, "prompt": f"task {i}"})}
+                    )
+                )
+                for i in ("a", "b")
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert all(result["success"] for result in results.values()), results
+        assert "task a" in prompts[".boring_run_prompt.a.md"]
+        assert "task b" in prompts[".boring_run_prompt.b.md"]
+        assert not list(tmp_path.glob(".boring_run_prompt*"))
+
+    def test_frames_round_trip(self):
+        stream = io.BytesIO()
+        write_frame(stream, {"type": "result", "output": "ünïcode\n" * 3})
+        stream.seek(0)
+        assert read_frame(stream)["output"] == "ünïcode\n" * 3
+
+
+class TestAgentWorkerPool:
+    async def test_workers_are_reused(self, make_pool):
+        pool = make_pool(size=1)
+        try:
+            results = [await pool.run({"prompt": f"t{i}"}) for i in range(3)]
+        finally:
+            await pool.close()
+
+        assert len({_pid(r) for r in results}) == 1
+        assert pool.stats["spawned"] == 1
+        assert pool.stats["reused"] == 2
+
+    async def test_workers_are_recycled(self, make_pool):
+        pool = make_pool(size=1, max_tasks_per_worker=2)
+        try:
+            pids = [_pid(await pool.run({"prompt": f"t{i}"})) for i in range(3)]
+        finally:
+            await pool.close()
+
+        assert pids[0] == pids[1] != pids[2]
+        assert pool.stats["recycled"] == 1
+
+    async def test_crashed_worker_is_replaced(self, make_pool):
+        pool = make_pool(size=1)
+        try:
+            first = await pool.run({"prompt": "ok"})
+            crashed = await pool.run({"prompt": "crash"})
+            after = await pool.run({"prompt": "ok"})
+        finally:
+            await pool.close()
+
+        assert crashed["success"] is False
+        assert after["success"] is True
+        assert _pid(first) != _pid(after)
+
+    async def test_unhealthy_idle_worker_is_replaced(self, make_pool):
+        pool = make_pool(size=1, health_check_interval=0)
+        try:
+            first = await pool.run({"prompt": "ok"})
+            pool._idle[0].process.stdin.close()  # Worker sees EOF and exits
+            await pool._idle[0].process.wait()
+            second = await pool.run({"prompt": "ok"})
+        finally:
+            await pool.close()
+
+        assert _pid(first) != _pid(second)
+
+    async def test_cancelled_task_kills_its_worker(self, make_pool):
+        pool = make_pool(size=1)
+        checked_out = []
+        checkout = pool._checkout
+
+        async def _spy(agent_id):
+            worker = await checkout(agent_id)
+            checked_out.append(worker)
+            return worker
+
+        try:
+            with patch.object(pool, "_checkout", _spy):
+                task = asyncio.create_task(pool.run({"prompt": "hang"}))
+                while not checked_out:
+                    await asyncio.sleep(0.01)
+                await asyncio.sleep(0.1)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+            assert not checked_out[0].alive
+            assert pool.idle_workers == 0
+            assert (await pool.run({"prompt": "ok"}))["success"] is True
+        finally:
+            await pool.close()
+
+    async def test_spawn_latency_is_recorded(self, make_pool, tmp_path):
+        scorer = AgentScorer(tmp_path / "scores.db")
+        pool = make_pool(size=1, scorer=scorer)
+        try:
+            await pool.run({"prompt": "ok"}, agent_id="Coder")
+        finally:
+            await pool.close()
+
+        with sqlite3.connect(scorer.db_path) as conn:
+            rows = conn.execute(
+                "SELECT agent_id, value FROM agent_metrics WHERE metric_type='worker_spawn_ms'"
+            ).fetchall()
+        assert len(rows) == 1
+        assert rows[0][0] == "Coder" and rows[0][1] > 0
+
+
+class TestAsyncAgentRunner:
+    async def test_execute_task_uses_pool(self, tmp_path):
+        with patch("boring.agents.runner.AgentScorer") as scorer_cls:
+            scorer_cls.return_value.record_metric = AsyncMock()
+            runner = AsyncAgentRunner(tmp_path)
+        runner.pool.run = AsyncMock(return_value={"success": True, "output": "done"})
+
+        response = await runner.execute_task(AgentTask(agent_name="Coder", instructions="x"))
+
+        assert response.finish_reason == "stop"
+        assert response.messages[-1].content == "done"
+        payload = runner.pool.run.call_args[0][0]
+        assert payload["env"]["BORING_AGENT_ROLE"] == "Coder"
+        assert payload["max_loops"] == 5
+        assert runner._get_token_tracker() is runner._get_token_tracker()
+
+    async def test_subprocesses_use_separate_prompt_files(self, tmp_path):
+        with patch("boring.agents.runner.AgentScorer") as scorer_cls:
+            scorer_cls.return_value.record_metric = AsyncMock()
+            runner = AsyncAgentRunner(tmp_path, use_worker_pool=False)
+        process = MagicMock(returncode=0)
+        process.communicate = AsyncMock(return_value=(b"done", b""))
+
+        with patch(
+            "boring.agents.runner.asyncio.create_subprocess_exec",
+            AsyncMock(return_value=process),
+        ) as spawn:
+            await runner.execute_parallel(
+                [AgentTask(agent_name="Coder", instructions=str(i)) for i in range(2)]
+            )
+
+        prompt_files = [
+            call.args[call.args.index("--prompt-file") + 1] for call in spawn.call_args_list
+        ]
+        assert len(set(prompt_files)) == 2
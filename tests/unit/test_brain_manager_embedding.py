@@ -65,21 +65,13 @@ class TestBrainManagerEmbedding:
         mock_model.encode.assert_called_once()
         mock_faiss.search.assert_called_once()
 
-    def test_get_relevant_patterns_fallback_to_inverted(self, temp_project):
-        """Test fallback sequence: Vector -> Inverted Index."""
+    def test_get_relevant_patterns_without_any_store(self, temp_project):
+        """Test empty result when no pattern table rows or vector stores exist."""
         manager = BrainManager(temp_project)
         manager.vector_store = None
         manager.faiss_index = None
 
-        # Mock Inverted Index
-        manager.index = MagicMock()
-        manager.index.search.return_value = [{"metadata": {"pattern_id": "inverted_1"}}]
-
-        results = manager.get_relevant_patterns("query")
-
-        assert len(results) == 1
-        assert results[0]["pattern_id"] == "inverted_1"
-        manager.index.search.assert_called_once()
+        assert manager.get_relevant_patterns("query") == []
 
     def test_sync_to_faiss(self, temp_project):
         """Test pattern synchronization with FAISS."""
@@ -0,0 +1,104 @@
+"""Tests for the cached chain head and group commit in EventStore."""
+
+import threading
+import time
+
+import pytest
+
+from boring.core.events import EventStore
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".boring").mkdir()
+    return tmp_path
+
+
+def test_sync_seq_matches_stored_chain(project):
+    store = EventStore(project)
+    try:
+        seqs = [store.append("E", {"i": i})[1] for i in range(3)]
+        assert seqs == [0, 1, 2]
+        assert store.latest_seq == 2
+        assert store.verify_integrity() is True
+        assert store._ledger.commits == 3
+    finally:
+        store.close()
+
+
+def _hold_first_commit(store, waiting):
+    """Block the first ledger write until `waiting` appenders are queued behind it."""
+    write = store._ledger.write
+    first = threading.Event()
+
+    def gated_write(batch):
+        if not first.is_set():
+            first.set()
+            deadline = time.monotonic() + 5
+            while len(store._group_pending) < waiting and time.monotonic() < deadline:
+                time.sleep(0.001)
+        return write(batch)
+
+    store._ledger.write = gated_write
+
+
+def test_appenders_queued_behind_a_commit_share_the_next_one(project):
+    store = EventStore(project)
+    _hold_first_commit(store, waiting=7)
+    threads = [threading.Thread(target=store.append, args=("E", {"n": n})) for n in range(8)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert store._ledger.events_written == 8
+        assert store._ledger.commits == 2  # The leader alone, then the other seven together
+        assert store.verify_integrity() is True
+    finally:
+        store.close()
+
+
+def test_concurrent_appenders_share_commits(project):
+    store = EventStore(project)
+    _hold_first_commit(store, waiting=7)
+    seqs = []
+    lock = threading.Lock()
+
+    def worker(n):
+        for i in range(25):
+            _, seq = store.append("E", {"worker": n, "i": i})
+            with lock:
+                seqs.append(seq)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(seqs) == list(range(200))
+        assert store.verify_integrity() is True
+        assert store._ledger.events_written == 200
+        assert store._ledger.commits <= 200 - 6
+    finally:
+        store.close()
+
+
+def test_cached_head_detects_other_writers(project):
+    a = EventStore(project)
+    b = EventStore(project)
+    try:
+        a.append("A", {})
+        b.append("B", {})
+        _, seq = a.append("A", {})  # a's cached head is stale; must reload
+        assert seq == 2
+
+        a.truncate(0)
+        _, seq = b.append("B", {})
+        assert seq == 1
+        assert a.verify_integrity() is True
+    finally:
+        a.close()
+        b.close()
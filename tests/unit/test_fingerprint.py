@@ -0,0 +1,117 @@
+import hashlib
+import os
+import sqlite3
+import time
+from unittest.mock import patch
+
+import pytest
+
+from boring.core.fingerprint import FingerprintStore, hash_file
+
+
+def _age(path, seconds=10):
+    """Move mtime out of the racy window so the digest is memoized."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = FingerprintStore(tmp_path / "cache" / "fingerprints.db")
+    yield store
+    store.close()
+
+
+class TestFingerprintStore:
+    def test_digest_matches_sha256(self, tmp_path, store):
+        f = tmp_path / "a.py"
+        f.write_bytes(b"x = 1\n")
+        big = tmp_path / "big.bin"
+        big.write_bytes(os.urandom(300 * 1024))  # mmap path
+
+        digests = store.fingerprint_many([f, big, tmp_path / "missing.py", tmp_path])
+
+        assert digests == {
+            f: hashlib.sha256(b"x = 1\n").hexdigest(),
+            big: hashlib.sha256(big.read_bytes()).hexdigest(),
+        }
+        assert hash_file(big) == digests[big]
+
+    def test_unchanged_files_are_not_rehashed_across_instances(self, tmp_path, store):
+        files = []
+        for i in range(10):
+            f = tmp_path / f"m{i}.py"
+            f.write_text(f"value = {i}\n")
+            _age(f)
+            files.append(f)
+        first = store.fingerprint_many(files)
+        store.close()
+
+        reopened = FingerprintStore(store.db_path)
+        try:
+            with patch("boring.core.fingerprint.hash_file", side_effect=AssertionError("hashed")):
+                assert reopened.fingerprint_many(files) == first
+            assert reopened.stats["hits"] == 10
+        finally:
+            reopened.close()
+
+    def test_changed_stat_rehashes(self, tmp_path, store):
+        f = tmp_path / "a.py"
+        f.write_text("old\n")
+        _age(f, 20)
+        old = store.fingerprint(f)
+
+        f.write_text("new content\n")
+        _age(f, 5)
+
+        assert store.fingerprint(f) == hashlib.sha256(b"new content\n").hexdigest() != old
+
+    def test_same_size_rewrite_with_restored_mtime_rehashes(self, tmp_path, store):
+        f = tmp_path / "a.py"
+        f.write_text("old\n")
+        _age(f, 20)
+        st = os.stat(f)
+        old = store.fingerprint(f)
+
+        time.sleep(0.01)
+        f.write_text("new\n")
+        os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert store.fingerprint(f) == hashlib.sha256(b"new\n").hexdigest() != old
+
+    def test_legacy_table_is_replaced(self, tmp_path):
+        db = tmp_path / "fingerprints.db"
+        conn = sqlite3.connect(db)
+        conn.execute(
+            "CREATE TABLE fingerprints (path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, "
+            "size INTEGER NOT NULL, digest TEXT NOT NULL) WITHOUT ROWID"
+        )
+        conn.commit()
+        conn.close()
+        f = tmp_path / "a.py"
+        f.write_text("a\n")
+        _age(f)
+
+        store = FingerprintStore(db)
+        try:
+            assert store.fingerprint(f) == hashlib.sha256(b"a\n").hexdigest()
+            assert store.fingerprint(f) == hashlib.sha256(b"a\n").hexdigest()
+            assert store.stats == {"hits": 1, "hashed": 1}
+        finally:
+            store.close()
+
+    def test_recently_modified_files_are_not_memoized(self, tmp_path, store):
+        f = tmp_path / "hot.py"
+        f.write_text("a\n")
+        store.fingerprint(f)
+        store.fingerprint(f)
+        assert store.stats == {"hits": 0, "hashed": 2}
+
+    def test_forget(self, tmp_path, store):
+        f = tmp_path / "a.py"
+        f.write_text("a\n")
+        _age(f)
+        store.fingerprint(f)
+        store.forget([f])
+        store.fingerprint(f)
+        assert store.stats["hashed"] == 2
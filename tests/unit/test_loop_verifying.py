@@ -265,3 +265,45 @@ class TestVerifyingState:
 
         # Should not raise exception
         verifying_state._record_metrics(mock_context, StateResult.SUCCESS)
+
+    def test_handle_change_scope_verifies_changes_only(self, verifying_state, mock_context):
+        """Each iteration verifies the loop's change set, not the whole project."""
+        mock_context.verification_scope = "changes"
+        mock_verifier = MagicMock()
+        mock_verifier.verify_changes.return_value = (True, "")
+        mock_context.verifier = mock_verifier
+
+        with (
+            patch("boring.loop.states.verifying.log_status"),
+            patch("boring.loop.states.verifying.console"),
+            patch.object(verifying_state, "_check_plan_complete", return_value=False),
+        ):
+            result = verifying_state.handle(mock_context)
+
+        assert result == StateResult.SUCCESS
+        mock_verifier.verify_changes.assert_called_once_with(["file1.py", "file2.py"], "STANDARD")
+        mock_verifier.verify_project.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "should_exit, plan_complete, scope",
+        [(True, False, "changes"), (False, True, "changes"), (False, False, "project")],
+    )
+    def test_handle_full_sweep_on_exit_or_demand(
+        self, verifying_state, mock_context, should_exit, plan_complete, scope
+    ):
+        """The full-project sweep runs when the loop is ending or when requested."""
+        mock_context.verification_scope = scope
+        mock_context.should_exit = should_exit
+        mock_verifier = MagicMock()
+        mock_verifier.verify_project.return_value = (True, "")
+        mock_context.verifier = mock_verifier
+
+        with (
+            patch("boring.loop.states.verifying.log_status"),
+            patch("boring.loop.states.verifying.console"),
+            patch.object(verifying_state, "_check_plan_complete", return_value=plan_complete),
+        ):
+            verifying_state.handle(mock_context)
+
+        mock_verifier.verify_project.assert_called_once_with("STANDARD")
+        mock_verifier.verify_changes.assert_not_called()
@@ -401,3 +401,551 @@ class TestRAGRetrieverInitialization:
                 results = await retriever.retrieve_async("test query")
 
                 assert results == []
+
+
+class TestIndexPipeline:
+    """测试流水线式索引构建（解析阶段 → 有界队列 → 写入阶段）"""
+
+    def _make_retriever(self, project, mock_client):
+        mock_collection = MagicMock()
+        mock_collection.count.return_value = 0
+        mock_collection.get.return_value = {"ids": []}
+        mock_client.get_or_create_collection.return_value = mock_collection
+        retriever = RAGRetriever(project)
+        retriever.index_state = MagicMock()
+        retriever.index_state.get_last_commit.return_value = ""
+        retriever.index_state.get_chunks_for_file.return_value = []
+        return retriever, mock_collection
+
+    def test_serial_pipeline_upserts_in_batches_and_records_stats(
+        self, temp_project, mock_chroma_env
+    ):
+        """規格：workers=1 → 串行解析，按批次 upsert，IndexStats 记录吞吐量"""
+        _, _, mock_client = mock_chroma_env
+        files = []
+        for i in range(3):
+            f = temp_project / f"mod_{i}.py"
+            f.write_text("\n".join(f"def f{j}():\n    pass\n" for j in range(60)), encoding="utf-8")
+            files.append(f)
+
+        with patch("boring.rag.rag_retriever.CHROMA_AVAILABLE", True):
+            retriever, mock_collection = self._make_retriever(temp_project, mock_client)
+            progress = []
+            with patch("boring.rag.rag_retriever.CodeIndexer.collect_files", return_value=files):
+                retriever.build_index(
+                    incremental=False, workers=1, progress_callback=lambda d, t: progress.append(d)
+                )
+
+        stats = retriever.get_stats().index_stats
+        assert stats.total_files == 3
+        assert stats.functions == 180
+        assert stats.workers == 1
+        assert stats.upsert_batches == 2  # 180 chunks → 100 + 80
+        assert stats.elapsed_seconds > 0
+        assert progress == [1, 2, 3]
+        upserted = sum(len(c.kwargs["ids"]) for c in mock_collection.upsert.call_args_list)
+        assert upserted == 180
+
+    def test_parallel_pipeline_matches_serial_output(self, temp_project, mock_chroma_env):
+        """規格：workers>1 → 进程池解析，产生与串行相同的 chunk 集合"""
+        _, _, mock_client = mock_chroma_env
+        files = []
+        for i in range(6):
+            f = temp_project / f"pkg_{i}.py"
+            f.write_text(f"class C{i}:\n    def m(self):\n        return {i}\n", encoding="utf-8")
+            files.append(f)
+
+        def _upserted_ids(workers):
+            retriever, mock_collection = self._make_retriever(temp_project, mock_client)
+            with patch("boring.rag.rag_retriever.CodeIndexer.collect_files", return_value=files):
+                retriever.build_index(incremental=False, workers=workers)
+            ids = set()
+            for call in mock_collection.upsert.call_args_list:
+                ids.update(call.kwargs["ids"])
+            return ids, retriever.get_stats().index_stats
+
+        with patch("boring.rag.rag_retriever.CHROMA_AVAILABLE", True):
+            serial_ids, _ = _upserted_ids(1)
+            parallel_ids, stats = _upserted_ids(2)
+
+        assert parallel_ids == serial_ids
+        assert len(serial_ids) == 12  # one class + one method per file
+        assert stats.workers == 2
+        assert stats.total_files == 6
+
+    def test_failed_parse_drops_stale_chunks_and_state(self, temp_project, mock_chroma_env):
+        """規格：解析失败 → 删除该文件旧 chunk 并清除其索引状态，下次重试"""
+        _, _, mock_client = mock_chroma_env
+        broken = temp_project / "broken.py"
+        broken.write_text("def f(:\n", encoding="utf-8")
+
+        with patch("boring.rag.rag_retriever.CHROMA_AVAILABLE", True):
+            retriever, mock_collection = self._make_retriever(temp_project, mock_client)
+            retriever.index_state.get_chunks_for_file.return_value = ["old_1", "old_2"]
+            retriever.index_state._get_rel_path.side_effect = lambda p: p.name
+            with (
+                patch("boring.rag.rag_retriever.CodeIndexer.collect_files", return_value=[broken]),
+                patch.object(retriever, "_iter_parsed_files", return_value=iter([(broken, None)])),
+            ):
+                retriever.build_index(incremental=False, workers=1)
+
+        assert retriever.get_stats().index_stats.skipped_files == 1
+        mock_collection.delete.assert_any_call(ids=["old_1", "old_2"])
+        retriever.index_state.remove.assert_called_once_with("broken.py")
+        retriever.index_state.update.assert_not_called()
+
+
+class TestUpdateFiles:
+    """测试 watcher 触发的精确文件级增量更新"""
+
+    def test_update_files_reindexes_changed_and_drops_deleted(self, temp_project, mock_chroma_env):
+        """規格：update_files([修改, 删除]) → 修改的文件重新 upsert，删除的文件移出索引"""
+        _, _, mock_client = mock_chroma_env
+        mock_collection = MagicMock()
+        mock_client.get_or_create_collection.return_value = mock_collection
+
+        with patch("boring.rag.rag_retriever.CHROMA_AVAILABLE", True):
+            retriever = RAGRetriever(temp_project)
+            retriever.index_state = MagicMock()
+            retriever.index_state.get_chunks_for_file.return_value = []
+            retriever.index_state._get_rel_path.side_effect = lambda p: p.name
+
+            gone = temp_project / "gone.py"
+            retriever._file_to_chunks["gone.py"] = ["old_gone"]
+            retriever._chunks["old_gone"] = MagicMock()
+
+            with patch.object(retriever.indexer, "forget") as forget:
+                count = retriever.update_files([temp_project / "test.py", gone])
+
+        assert count == 1
+        forget.assert_called_once_with(gone)
+        mock_collection.delete.assert_any_call(ids=["old_gone"])
+        assert "gone.py" not in retriever._file_to_chunks
+        assert "old_gone" not in retriever._chunks
+        retriever.index_state.remove.assert_called_once_with("gone.py")
+        retriever.index_state.update.assert_called_once()
+        retriever.index_state.save.assert_called_once()
+
+    def test_graph_snapshot_written_every_n_updates(self, temp_project, mock_chroma_env):
+        """規格：增量更新只标记图快照为脏 → 累计 N 次或 flush 时才重写快照"""
+        _, _, mock_client = mock_chroma_env
+        mock_client.get_or_create_collection.return_value = MagicMock()
+
+        with (
+            patch("boring.rag.rag_retriever.CHROMA_AVAILABLE", True),
+            patch("boring.rag.rag_retriever._GRAPH_SNAPSHOT_EVERY", 3),
+        ):
+            retriever = RAGRetriever(temp_project)
+            retriever.graph = MagicMock()
+
+            retriever.update_files([temp_project / "test.py"])
+            retriever.update_file(temp_project / "test.py")
+            retriever.graph.save.assert_not_called()
+
+            retriever.update_file(temp_project / "test.py")
+            retriever.graph.save.assert_called_once()
+
+            retriever.update_file(temp_project / "test.py")
+            retriever.flush_graph_snapshot()
+            retriever.flush_graph_snapshot()  # Nothing pending the second time
+            assert retriever.graph.save.call_count == 2
+
+
+class TestChunkHydration:
+    """测试启动时分页、仅元数据的 chunk 加载"""
+
+    @staticmethod
+    def _paged_collection(total: int):
+        collection = MagicMock()
+        collection.count.return_value = total
+        rows = [
+            (
+                f"c{i}",
+                {
+                    "file_path": f"m{i}.py",
+                    "chunk_type": "function",
+                    "name": f"f{i}",
+                    "start_line": 1,
+                    "end_line": 2,
+                    "dependencies": f"f{i + 1}" if i + 1 < total else "",
+                },
+            )
+            for i in range(total)
+        ]
+
+        def get(limit=None, offset=0, include=None, ids=None):
+            if ids is not None:
+                return {"ids": ids, "documents": [f"function: x\n\nbody of {i}" for i in ids]}
+            assert "documents" not in include
+            page = rows[offset : offset + limit]
+            return {"ids": [r[0] for r in page], "metadatas": [r[1] for r in page]}
+
+        collection.get.side_effect = get
+        return collection
+
+    def test_hydration_pages_past_one_page_without_documents(self, temp_project, mock_chroma_env):
+        """規格：超过一页的索引 → 全部加载（无 10k 上限），内容延迟到使用时批量获取"""
+        _, _, mock_client = mock_chroma_env
+        collection = self._paged_collection(5)
+        mock_client.get_or_create_collection.return_value = collection
+
+        with (
+            patch("boring.rag.rag_retriever.CHROMA_AVAILABLE", True),
+            patch("boring.rag.rag_retriever._HYDRATION_PAGE_SIZE", 2),
+        ):
+            retriever = RAGRetriever(temp_project)
+            retriever._load_chunks_from_db()
+
+        assert len(retriever._chunks) == 5
+        assert retriever._chunks["c0"].dependencies == ["f1"]
+        assert retriever._chunks["c0"].content == ""
+        assert retriever.graph.get_chunk("c4") is not None
+
+        retriever._ensure_content([retriever._chunks["c0"], retriever._chunks["c3"]])
+
+        assert retriever._chunks["c0"].content == "body of c0"
+        assert retriever._lazy_content_ids == {"c1", "c2", "c4"}
+
+    def test_hydration_reuses_graph_snapshot_when_index_unchanged(
+        self, temp_project, mock_chroma_env
+    ):
+        """規格：索引未变化 → 第二次启动直接读取图快照，不再扫描集合"""
+        _, _, mock_client = mock_chroma_env
+        collection = self._paged_collection(3)
+        mock_client.get_or_create_collection.return_value = collection
+
+        with patch("boring.rag.rag_retriever.CHROMA_AVAILABLE", True):
+            first = RAGRetriever(temp_project)
+            first._load_chunks_from_db()
+            collection.get.reset_mock()
+
+            second = RAGRetriever(temp_project)
+            second._load_chunks_from_db()
+
+        collection.get.assert_not_called()
+        assert set(second._chunks) == {"c0", "c1", "c2"}
+        assert second.graph.get_callees("c0")[0].chunk_id == "c1"
+
+    def test_legacy_metadata_without_dependencies_is_backfilled(
+        self, temp_project, mock_chroma_env
+    ):
+        """規格：旧索引元数据缺少 dependencies → 重新解析源文件一次，补全依赖图并写回"""
+        from boring.rag.code_indexer import CodeIndexer
+
+        _, _, mock_client = mock_chroma_env
+        source = temp_project / "legacy_mod.py"
+        source.write_text("def helper():\n    return 1\n\n\ndef main():\n    return helper()\n")
+        parsed = list(CodeIndexer(temp_project).index_file(source))
+
+        with patch("boring.rag.rag_retriever.CHROMA_AVAILABLE", True):
+            retriever = RAGRetriever(temp_project)
+            rows = []
+            for chunk in parsed:
+                meta = retriever._chunk_to_metadata(chunk)
+                del meta["dependencies"]
+                rows.append((chunk.chunk_id, meta))
+
+            collection = MagicMock()
+            collection.count.return_value = len(rows)
+            collection.get.return_value = {
+                "ids": [r[0] for r in rows],
+                "metadatas": [r[1] for r in rows],
+            }
+            retriever.collection = collection
+            retriever._load_chunks_from_db()
+
+        main = next(c for c in parsed if c.name == "main")
+        helper = next(c for c in parsed if c.name == "helper")
+        assert [c.chunk_id for c in retriever.graph.get_callees(main.chunk_id)] == [helper.chunk_id]
+        written = collection.update.call_args.kwargs
+        assert set(written["ids"]) == {c.chunk_id for c in parsed}
+        assert all("dependencies" in m for m in written["metadatas"])
+
+
+class TestRetrieveMany:
+    """测试批量多查询检索"""
+
+    @staticmethod
+    def _query_result(rows):
+        return {
+            "ids": [[cid for cid, _ in row] for row in rows],
+            "distances": [[d for _, d in row] for row in rows],
+            "metadatas": [
+                [
+                    {"file_path": f"{cid}.py", "chunk_type": "function", "name": cid}
+                    for cid, _ in row
+                ]
+                for row in rows
+            ],
+            "documents": [[f"function: {cid}\n\nbody {cid}" for cid, _ in row] for row in rows],
+        }
+
+    def test_retrieve_many_issues_one_search_and_one_rerank(self, temp_project, mock_chroma_env):
+        """規格：3 个查询（其中 1 个重复）→ 1 次向量检索、1 次批量重排，结果按查询顺序返回"""
+        _, _, mock_client = mock_chroma_env
+        collection = MagicMock()
+        collection.query.return_value = self._query_result(
+            [[("a", 0.1), ("shared", 0.2)], [("shared", 0.1), ("b", 0.3)]]
+        )
+        mock_client.get_or_create_collection.return_value = collection
+
+        reranker = MagicMock()
+        reranker.rerank_many.side_effect = lambda reqs, top_k: [
+            [(i, 1.0 - i * 0.1) for i in range(len(chunks))] for _, chunks, _ in reqs
+        ]
+
+        with (
+            patch("boring.rag.rag_retriever.CHROMA_AVAILABLE", True),
+            patch("boring.rag.rag_retriever.get_ensemble_reranker", return_value=reranker),
+            patch("boring.rag.rag_retriever._get_intelligent_ranker", return_value=None),
+        ):
+            retriever = RAGRetriever(temp_project)
+            results = retriever.retrieve_many(
+                ["find a", "find b", "find a"], n_results=2, use_hyde=False
+            )
+
+        collection.query.assert_called_once()
+        assert collection.query.call_args.kwargs["query_texts"] == ["find a", "find b"]
+        reranker.rerank_many.assert_called_once()
+        assert [r.chunk.chunk_id for r in results[0]] == ["a", "shared"]
+        assert [r.chunk.chunk_id for r in results[1]] == ["shared", "b"]
+        assert results[2] is results[0]
+        # The shared chunk is reconstructed once and reused across queries
+        assert results[0][1].chunk is results[1][0].chunk
+
+    def test_retrieve_many_serves_cached_queries(self, temp_project, mock_chroma_env):
+        """規格：已缓存的查询 → 不再进入批量检索"""
+        _, _, mock_client = mock_chroma_env
+        collection = MagicMock()
+        collection.query.return_value = self._query_result([[("a", 0.1)]])
+        mock_client.get_or_create_collection.return_value = collection
+
+        with (
+            patch("boring.rag.rag_retriever.CHROMA_AVAILABLE", True),
+            patch("boring.rag.rag_retriever._get_intelligent_ranker", return_value=None),
+        ):
+            retriever = RAGRetriever(temp_project)
+            retriever.retrieve("cached", use_hyde=False, use_rerank=False)
+            retriever.retrieve_many(["cached", "fresh"], use_hyde=False, use_rerank=False)
+
+        assert collection.query.call_args.kwargs["query_texts"] == ["fresh"]
+
+    def test_cross_encoder_rerank_many_predicts_once(self):
+        """規格：多个请求 → 模型只 predict 一次，分数按请求分别归一化"""
+        from boring.rag.reranker import CrossEncoderReranker
+
+        reranker = CrossEncoderReranker()
+        reranker._initialized = True
+        reranker._model = MagicMock()
+        reranker._model.predict.return_value = [0.0, 2.0, 5.0, 1.0]
+
+        results = reranker.rerank_many(
+            [("q1", ["d1", "d2"], [0.5, 0.5]), ("q2", ["d3", "d4"], [0.5, 0.5])],
+            weight_original=0.0,
+        )
+
+        reranker._model.predict.assert_called_once()
+        assert [idx for idx, _ in results[0]] == [1, 0]
+        assert [idx for idx, _ in results[1]] == [0, 1]
+        assert results[1][0][1].rerank_score == 1.0
+
+
+class TestQueryCache:
+    """测试有界、感知索引版本的查询缓存"""
+
+    def test_lru_evicts_by_entries_and_bytes(self):
+        """規格：超过条目数或字节上限 → 淘汰最久未使用的条目并计数"""
+        from boring.rag.rag_retriever import _QueryResultCache
+
+        cache = _QueryResultCache(max_entries=2, max_bytes=10_000)
+        cache.put(("s", 0, "a"), [])
+        cache.put(("s", 0, "b"), [])
+        assert cache.get(("s", 0, "a")) == []  # a becomes most recent
+        cache.put(("s", 0, "c"), [])
+
+        assert cache.get(("s", 0, "b")) is None
+        big = [MagicMock(chunk=MagicMock(content="x" * 5_744))]  # ~6000 bytes
+        cache.put(("s", 0, "big1"), big)
+        cache.put(("s", 0, "big2"), big)
+
+        stats = cache.stats()
+        assert stats["evictions"] == 4
+        assert stats["entries"] == 1
+        assert stats["bytes"] == 6_000
+        assert stats["hits"] == 1 and stats["misses"] == 1
+
+    def test_index_write_invalidates_cached_results(self, temp_project, mock_chroma_env):
+        """規格：update_file 写入索引 → 相同查询不再命中旧缓存；统计通过 get_stats 暴露"""
+        _, _, mock_client = mock_chroma_env
+        collection = MagicMock()
+        collection.query.return_value = {"ids": [[]]}
+        mock_client.get_or_create_collection.return_value = collection
+
+        with patch("boring.rag.rag_retriever.CHROMA_AVAILABLE", True):
+            retriever = RAGRetriever(temp_project)
+            retriever.index_state = MagicMock()
+            retriever.index_state.get_chunks_for_file.return_value = []
+
+            retriever.retrieve("  find   test ", use_hyde=False, use_rerank=False)
+            retriever.retrieve("find test", use_hyde=False, use_rerank=False)
+            assert collection.query.call_count == 1
+
+            retriever.update_file(temp_project / "test.py")
+            retriever.retrieve("find test", use_hyde=False, use_rerank=False)
+
+        assert collection.query.call_count == 2
+        stats = retriever.get_stats()
+        assert stats.query_cache_hits == 1
+        assert stats.query_cache_misses == 2
+
+
+class TestLexicalFusion:
+    """测试 BM25 词法索引与向量检索的 RRF 融合"""
+
+    @staticmethod
+    def _chunk(chunk_id, name, content):
+        from boring.rag.code_indexer import CodeChunk
+
+        return CodeChunk(
+            chunk_id=chunk_id,
+            file_path=f"{chunk_id}.py",
+            chunk_type="function",
+            name=name,
+            content=content,
+            start_line=1,
+            end_line=2,
+        )
+
+    def test_exact_symbol_query_skips_vector_search(self, temp_project, mock_chroma_env):
+        """規格：查询恰为已索引的标识符 → 只查倒排表，不调用向量检索（无嵌入）"""
+        _, _, mock_client = mock_chroma_env
+        collection = MagicMock()
+        mock_client.get_or_create_collection.return_value = collection
+
+        with (
+            patch("boring.rag.rag_retriever.CHROMA_AVAILABLE", True),
+            patch("boring.rag.rag_retriever._get_intelligent_ranker", return_value=None),
+        ):
+            retriever = RAGRetriever(temp_project)
+            chunk = self._chunk("c1", "parseConfigFile", "return toml.load(path)")
+            retriever._chunks["c1"] = chunk
+            retriever.lexical_index.add_chunks([chunk])
+
+            results = retriever.retrieve("parseConfigFile", n_results=1, use_rerank=False)
+            many = retriever.retrieve_many(
+                ["loader.parseConfigFile"], n_results=1, use_rerank=False
+            )
+
+        collection.query.assert_not_called()
+        assert [r.chunk.chunk_id for r in results] == ["c1"]
+        assert results[0].retrieval_method == "keyword"
+        assert [r.chunk.chunk_id for r in many[0]] == ["c1"]
+
+    def test_symbol_query_with_too_few_hits_is_fused_with_vector_results(
+        self, temp_project, mock_chroma_env
+    ):
+        """規格：精确标识符命中数不足 n_results → 仍做向量检索，并融合两边结果"""
+        _, _, mock_client = mock_chroma_env
+        collection = MagicMock()
+        collection.query.return_value = {
+            "ids": [["v1", "v2"]],
+            "distances": [[0.1, 0.2]],
+            "metadatas": [
+                [
+                    {"file_path": "v1.py", "chunk_type": "function", "name": "load_settings"},
+                    {"file_path": "v2.py", "chunk_type": "function", "name": "read_toml"},
+                ]
+            ],
+            "documents": [["function::load_settings\nload()", "function::read_toml\nread()"]],
+        }
+        mock_client.get_or_create_collection.return_value = collection
+
+        with (
+            patch("boring.rag.rag_retriever.CHROMA_AVAILABLE", True),
+            patch("boring.rag.rag_retriever._get_intelligent_ranker", return_value=None),
+        ):
+            retriever = RAGRetriever(temp_project)
+            chunk = self._chunk("c1", "parseConfigFile", "return toml.load(path)")
+            retriever._chunks["c1"] = chunk
+            retriever.lexical_index.add_chunks([chunk])
+
+            results = retriever.retrieve(
+                "parseConfigFile", n_results=3, use_hyde=False, use_rerank=False
+            )
+            many = retriever.retrieve_many(
+                ["loader.parseConfigFile"], n_results=3, use_hyde=False, use_rerank=False
+            )
+
+        assert collection.query.call_count == 2
+        assert {r.chunk.chunk_id for r in results} == {"c1", "v1", "v2"}
+        assert results[0].chunk.chunk_id == "c1"
+        assert {r.chunk.chunk_id for r in many[0]} == {"c1", "v1", "v2"}
+
+    def test_lexical_hits_outside_vector_top_k_are_fused(self, temp_project, mock_chroma_env):
+        """規格：向量结果之外的精确标识符命中 → 经 RRF 融合后出现在结果中"""
+        _, _, mock_client = mock_chroma_env
+        collection = MagicMock()
+        collection.query.return_value = {
+            "ids": [["v1", "v2"]],
+            "distances": [[0.1, 0.2]],
+            "metadatas": [
+                [
+                    {"file_path": "v1.py", "chunk_type": "function", "name": "open_socket"},
+                    {"file_path": "v2.py", "chunk_type": "function", "name": "retry_request"},
+                ]
+            ],
+            "documents": [["function::open_socket\nsock.connect()", "function::retry\nretry()"]],
+        }
+        collection.get.return_value = {
+            "ids": ["lex"],
+            "metadatas": [
+                {"file_path": "lex.py", "chunk_type": "function", "name": "backoffDelay"}
+            ],
+            "documents": ["function::backoffDelay\nreturn base * 2 ** attempt"],
+        }
+        mock_client.get_or_create_collection.return_value = collection
+
+        with (
+            patch("boring.rag.rag_retriever.CHROMA_AVAILABLE", True),
+            patch("boring.rag.rag_retriever._get_intelligent_ranker", return_value=None),
+        ):
+            retriever = RAGRetriever(temp_project)
+            retriever.lexical_index.add_chunks(
+                [
+                    self._chunk("v2", "retry_request", "retry()"),
+                    self._chunk("lex", "backoffDelay", "return base * 2 ** attempt"),
+                ]
+            )
+
+            results = retriever.retrieve(
+                "retry backoff delay", use_hyde=False, use_rerank=False, expand_graph=False
+            )
+
+        methods = {r.chunk.chunk_id: r.retrieval_method for r in results}
+        assert methods == {"v1": "vector", "v2": "hybrid", "lex": "keyword"}
+        assert results[0].chunk.chunk_id == "v2"  # Ranked in both lists
+        lexical_only = next(r for r in results if r.chunk.chunk_id == "lex")
+        assert lexical_only.chunk.content == "return base * 2 ** attempt"
+
+    def test_update_file_keeps_lexical_index_in_sync(self, temp_project, mock_chroma_env):
+        """規格：update_file 修改/删除文件 → 词法索引同步增删，并记录 IndexState 版本"""
+        _, _, mock_client = mock_chroma_env
+        mock_client.get_or_create_collection.return_value = MagicMock()
+
+        with patch("boring.rag.rag_retriever.CHROMA_AVAILABLE", True):
+            retriever = RAGRetriever(temp_project)
+            retriever.index_state = MagicMock()
+            retriever.index_state.get_generation.return_value = 3
+            retriever.index_state.get_chunks_for_file.return_value = []
+
+            source = temp_project / "test.py"
+            retriever.update_file(source)
+            chunk_ids = retriever.lexical_index.lookup_symbol("test")
+            assert chunk_ids
+            assert retriever.lexical_index.generation == "3"
+
+            source.unlink()
+            retriever.index_state.get_chunks_for_file.return_value = chunk_ids
+            retriever.update_file(source)
+
+        assert retriever.lexical_index.lookup_symbol("test") == []
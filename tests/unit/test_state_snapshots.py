@@ -0,0 +1,117 @@
+"""Tests for periodic binary snapshots and bounded replay in StateManager."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from boring.core.state import SNAPSHOT_MAGIC, StateManager
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".boring").mkdir()
+    # Snapshot writes are jailed to settings.PROJECT_ROOT
+    with patch("boring.core.utils.TransactionalFileWriter._validate_path"):
+        yield tmp_path
+
+
+@pytest.fixture
+def managers():
+    created = []
+
+    def make(root, **kwargs):
+        sm = StateManager(root, **kwargs)
+        created.append(sm)
+        return sm
+
+    yield make
+    for sm in created:
+        sm.events.close()
+
+
+def test_snapshots_are_periodic(project, managers):
+    sm = managers(project, snapshot_every=5, snapshot_interval=3600)
+
+    sm.set_goal("g")  # First snapshot: none on disk yet
+    assert sm.snapshot_file.read_bytes().startswith(SNAPSHOT_MAGIC)
+    for i in range(3):
+        sm.update(total_tasks=i)
+    assert sm.metrics["snapshots_written"] == 1
+
+    sm.update(total_tasks=10)
+    sm.update(total_tasks=11)  # 5 events since the first snapshot
+    assert sm.metrics["snapshots_written"] == 2
+    assert sm.current.total_tasks == 11
+
+
+def test_cold_start_replays_only_the_tail(project, managers):
+    writer = managers(project, snapshot_every=10, snapshot_interval=3600)
+    writer.set_goal("g")
+    for i in range(13):
+        writer.update(completed_tasks=i)
+
+    reader = managers(project)
+    state = reader.current
+
+    assert state.user_goal == "g"
+    assert state.completed_tasks == 12
+    assert reader.metrics["snapshot_loaded"] is True
+    assert reader.metrics["events_replayed"] == 3
+    assert reader.metrics["hydrate_ms"] > 0
+
+
+def test_legacy_json_snapshot_is_read_and_replaced(project, managers):
+    legacy = project / ".boring" / "state.json"
+    legacy.write_text(json.dumps({"user_goal": "old", "ledger_offset": -1}))
+
+    sm = managers(project)
+    assert sm.current.user_goal == "old"
+
+    sm.update(total_tasks=3)
+    assert sm.snapshot_file.exists()
+    assert not legacy.exists()
+    assert managers(project).current.total_tasks == 3
+
+
+def test_snapshot_ahead_of_ledger_is_discarded(project, managers):
+    sm = managers(project, snapshot_every=1)
+    sm.set_goal("first")
+    sm.set_goal("second")
+    sm.events.truncate(0)
+
+    assert managers(project).current.user_goal == "first"
+
+
+def test_current_picks_up_other_writers(project, managers):
+    a = managers(project, snapshot_interval=3600)
+    b = managers(project, snapshot_interval=3600)
+    a.set_goal("from a")
+    assert b.current.user_goal == "from a"
+
+    a.update(total_tasks=7)  # No new snapshot; b must read the ledger tail
+    assert b.current.total_tasks == 7
+
+
+def test_current_skips_ledger_query_until_something_commits(project, managers):
+    a = managers(project, snapshot_interval=3600)
+    b = managers(project, snapshot_interval=3600)
+    a.set_goal("g")
+    b.current  # noqa: B018 - hydrate
+
+    calls = []
+    store = b.events.store
+    real_last_event = store.get_last_event
+
+    def counting_last_event():
+        calls.append(1)
+        return real_last_event()
+
+    with patch.object(store, "get_last_event", side_effect=counting_last_event):
+        for _ in range(50):
+            assert b.current.user_goal == "g"
+        assert calls == []
+
+        a.update(total_tasks=3)
+        assert b.current.total_tasks == 3
+        assert len(calls) == 1
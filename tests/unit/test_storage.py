@@ -122,6 +122,67 @@ class TestSQLiteStorage:
         assert len(metrics) == 2
 
 
+def _pattern(pattern_id, description, embedding=None, pattern_type="error_solution"):
+    return {
+        "pattern_id": pattern_id,
+        "pattern_type": pattern_type,
+        "description": description,
+        "context": "ctx",
+        "solution": "sol",
+        "embedding": embedding,
+    }
+
+
+class TestPatternSearch:
+    """Tests for the FTS5 + float32 vector pattern backend."""
+
+    def test_embeddings_stored_as_float32_blobs(self, tmp_path):
+        """Embeddings round-trip through a packed BLOB; metadata-only saves keep them."""
+        storage = SQLiteStorage(tmp_path / ".boring_memory")
+        storage.upsert_pattern(_pattern("p1", "timeout", [0.5, -1.0, 2.0]))
+        storage.upsert_pattern(_pattern("p1", "timeout retry"))
+
+        with storage._get_connection() as conn:
+            blob = conn.execute("SELECT embedding FROM brain_patterns").fetchone()[0]
+        assert isinstance(blob, bytes) and len(blob) == 12
+        assert storage.get_pattern_by_id("p1")["embedding"] == [0.5, -1.0, 2.0]
+
+    def test_hybrid_search(self, tmp_path):
+        """Text and vector rankings are fused; filters and updates apply immediately."""
+        storage = SQLiteStorage(tmp_path / ".boring_memory")
+        storage.upsert_pattern(_pattern("auth", "Authentication token expired", [1.0, 0.0]))
+        storage.upsert_pattern(_pattern("db", "Database connection refused", [0.0, 1.0]))
+        storage.upsert_pattern(_pattern("style", "Token naming", [0.9, 0.1], "code_style"))
+
+        assert storage.search_patterns("") == []
+        text = storage.search_patterns("database", limit=5)
+        assert [r["pattern_id"] for r in text] == ["db"]
+        assert "embedding" not in text[0]
+
+        vector = storage.search_patterns(embedding=[0.0, 2.0], limit=1)
+        assert [r["pattern_id"] for r in vector] == ["db"]
+
+        both = storage.search_patterns("token", embedding=[1.0, 0.0], limit=3)
+        assert {r["pattern_id"] for r in both[:2]} == {"auth", "style"}
+        assert both[0]["score"] > both[2]["score"]
+        typed = storage.search_patterns("token", embedding=[1.0, 0.0], pattern_type="code_style")
+        assert [r["pattern_id"] for r in typed] == ["style"]
+
+        storage.upsert_pattern(_pattern("db", "Disk full", [1.0, 0.0]))
+        storage.delete_pattern("auth")
+        assert storage.search_patterns("database") == []
+        assert storage.search_patterns(embedding=[1.0, 0.0], limit=1)[0]["pattern_id"] == "db"
+
+    def test_legacy_json_embeddings_are_searchable(self, tmp_path):
+        """Rows written before the BLOB format (JSON text) still take part in search."""
+        storage = SQLiteStorage(tmp_path / ".boring_memory")
+        storage.upsert_pattern(_pattern("old", "legacy"))
+        with storage._get_connection() as conn:
+            conn.execute("UPDATE brain_patterns SET embedding = '[0.0, 1.0]'")
+
+        assert storage.search_patterns(embedding=[0.0, 1.0])[0]["pattern_id"] == "old"
+
+
 class TestContextSelector:
     """Tests for context selector."""
 
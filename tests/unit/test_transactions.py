@@ -1,7 +1,9 @@
 # Copyright 2025-2026 Boring for Gemini Authors
 # SPDX-License-Identifier: Apache-2.0
 
-from unittest.mock import MagicMock
+import shutil
+import subprocess
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -21,10 +23,8 @@ def test_transaction_start(mock_git_manager):
     mock_git_manager._get_current_commit = MagicMock(return_value="abc1234")
     mock_git_manager._get_changed_files = MagicMock(return_value=["file1.py"])
 
-    # Mock successful stash
     mock_git_manager._run_git.side_effect = [
         (True, ".git"),  # check git dir
-        (True, "stash output"),  # stash push
     ]
 
     result = mock_git_manager.start("Test transaction")
@@ -46,9 +46,8 @@ def test_transaction_commit(mock_git_manager):
     assert result["status"] == "success"
     assert not mock_git_manager.current_transaction  # Should be cleared
 
-    # Verify stash drop was called (since we mocked files changed)
-    # The actual call args check depends on how many times _run_git was called
-    # Here we just ensure current_transaction is gone
+    # The checkpoint is dropped without touching git
+    mock_git_manager._run_git.assert_not_called()
 
 
 def test_transaction_rollback(mock_git_manager):
@@ -62,10 +61,9 @@ def test_transaction_rollback(mock_git_manager):
     assert result["status"] == "success"
     assert not mock_git_manager.current_transaction
 
-    # Verify reset/clean calls were made
-    calls = [c[0][0] for c in mock_git_manager._run_git.call_args_list]
-    assert "checkout" in calls[0]
-    assert "clean" in calls[1]
+    # Nothing changed, so nothing is checked out, cleaned or reset
+    calls = [c[0][0][0] for c in mock_git_manager._run_git.call_args_list]
+    assert not {"checkout", "clean", "reset", "stash"} & set(calls)
 
 
 def test_transaction_status(mock_git_manager):
@@ -77,3 +75,74 @@ def test_transaction_status(mock_git_manager):
     status = mock_git_manager.status()
     assert status["status"] == "active"
     assert status["description"] == "Active Tx"
+
+
+def _git(cwd, *args):
+    subprocess.run(
+        ["git", "-c", "user.email=t@example.com", "-c", "user.name=t", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_rollback_restores_only_changed_paths(tmp_path):
+    """Dirty-at-start files come back from the checkpoint, everything else from HEAD."""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "clean.py").write_text("clean = 1\n")
+    (tmp_path / "dirty.py").write_text("dirty = 1\n")
+    (tmp_path / "doomed.py").write_text("doomed = 1\n")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-qm", "init")
+
+    (tmp_path / "dirty.py").write_text("dirty = 2  # uncommitted work\n")
+    (tmp_path / "scratch.txt").write_text("untracked notes\n")
+
+    manager = TransactionManager(tmp_path)
+    started = manager.start("agent edit")
+    assert started["files_checkpointed"] == started["files_stashed"] == 2
+
+    (tmp_path / "dirty.py").write_text("dirty = 3\n")
+    (tmp_path / "pkg" / "clean.py").write_text("broken\n")
+    (tmp_path / "doomed.py").unlink()
+    (tmp_path / "scratch.txt").unlink()
+    (tmp_path / "pkg" / "new").mkdir()
+    (tmp_path / "pkg" / "new" / "module.py").write_text("new\n")
+    _git(tmp_path, "add", "pkg/clean.py")
+    _git(tmp_path, "commit", "-qm", "agent commit")
+
+    result = manager.rollback()
+
+    assert result["status"] == "success", result
+    assert (tmp_path / "dirty.py").read_text() == "dirty = 2  # uncommitted work\n"
+    assert (tmp_path / "pkg" / "clean.py").read_text() == "clean = 1\n"
+    assert (tmp_path / "doomed.py").read_text() == "doomed = 1\n"
+    assert (tmp_path / "scratch.txt").read_text() == "untracked notes\n"
+    assert not (tmp_path / "pkg" / "new").exists()
+    assert manager.store.list_checkpoints() == []
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_rollback_checks_locks_only_on_touched_paths(tmp_path):
+    """The lock check covers what rollback reverts, not every file in the tree."""
+    (tmp_path / "untouched.py").write_text("x = 1\n")
+    (tmp_path / "edited.py").write_text("y = 1\n")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-qm", "init")
+    (tmp_path / "dirty.md").write_text("notes\n")
+
+    manager = TransactionManager(tmp_path)
+    manager.start("agent edit")
+    (tmp_path / "edited.py").write_text("y = 2\n")
+    (tmp_path / "created.py").write_text("z = 1\n")
+
+    with patch(
+        "boring.loop.transactions.FileLockDetector.is_file_locked", return_value=False
+    ) as is_locked:
+        assert manager.rollback()["status"] == "success"
+
+    checked = {p.relative_to(tmp_path).as_posix() for (p,), _ in is_locked.call_args_list}
+    assert checked == {"edited.py", "created.py", "dirty.md"}
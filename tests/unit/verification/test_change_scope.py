@@ -0,0 +1,136 @@
+"""Tests for change-scoped verification (change_scope + CodeVerifier.verify_changes)."""
+
+from unittest.mock import patch
+
+from boring.models import VerificationResult
+from boring.rag.code_indexer import CodeChunk
+from boring.rag.graph_builder import DependencyGraph
+from boring.verification import change_scope
+from boring.verification.verifier import CodeVerifier
+
+
+def _chunk(chunk_id, file_path, name, deps=()):
+    return CodeChunk(
+        chunk_id=chunk_id,
+        file_path=file_path,
+        chunk_type="function",
+        name=name,
+        content=f"def {name}(): pass",
+        start_line=1,
+        end_line=1,
+        dependencies=list(deps),
+    )
+
+
+def _project(tmp_path):
+    src = tmp_path / "src" / "pkg"
+    src.mkdir(parents=True)
+    for name in ("core", "api", "cli", "unrelated"):
+        (src / f"{name}.py").write_text(f"def {name}(): pass\n")
+    tests = tmp_path / "tests" / "unit"
+    tests.mkdir(parents=True)
+    (tests / "test_core.py").write_text("def test_x(): pass\n")
+    (tests / "test_imports_core.py").write_text("from pkg import core\n")
+    (tests / "test_patches_api.py").write_text('patch("pkg.api.thing")\n')
+    (tests / "test_other.py").write_text("import pkg.unrelated_two\n")
+
+    graph = DependencyGraph(
+        [
+            _chunk("core", "src/pkg/core.py", "core"),
+            _chunk("api", "src/pkg/api.py", "api", ["core"]),
+            _chunk("cli", "src/pkg/cli.py", "cli", ["api"]),
+            _chunk("unrelated", "src/pkg/unrelated.py", "unrelated"),
+        ]
+    )
+    snapshot_dir = tmp_path / ".boring_memory" / "rag_db"
+    snapshot_dir.mkdir(parents=True)
+    graph.save(snapshot_dir / "graph_snapshot.bin", "any-index-version")
+    return tmp_path
+
+
+class TestChangeScope:
+    def test_dependents_from_graph_snapshot(self, tmp_path):
+        root = _project(tmp_path)
+        core = root / "src" / "pkg" / "core.py"
+
+        assert change_scope.dependents_of(root, [core]) == [root / "src" / "pkg" / "api.py"]
+        assert change_scope.dependents_of(root, [core], depth=2) == [
+            root / "src" / "pkg" / "api.py",
+            root / "src" / "pkg" / "cli.py",
+        ]
+
+    def test_dependents_from_unified_layout_snapshot(self, tmp_path):
+        root = _project(tmp_path)
+        rag_db = root / ".boring" / "memory" / "rag_db"
+        rag_db.parent.mkdir(parents=True)
+        (root / ".boring_memory" / "rag_db").rename(rag_db)
+
+        core = root / "src" / "pkg" / "core.py"
+        assert change_scope.dependents_of(root, [core]) == [root / "src" / "pkg" / "api.py"]
+
+    def test_dependents_without_index(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1\n")
+        assert change_scope.dependents_of(tmp_path, [tmp_path / "a.py"]) == []
+
+    def test_select_tests_by_name_and_import(self, tmp_path):
+        root = _project(tmp_path)
+        tests = root / "tests" / "unit"
+
+        selected = change_scope.select_tests(root, [root / "src" / "pkg" / "core.py"])
+        assert selected == [tests / "test_core.py", tests / "test_imports_core.py"]
+
+        selected = change_scope.select_tests(root, [root / "src" / "pkg" / "api.py"])
+        assert selected == [tests / "test_patches_api.py"]
+
+    def test_changed_test_file_is_selected(self, tmp_path):
+        root = _project(tmp_path)
+        test_file = root / "tests" / "unit" / "test_other.py"
+        assert change_scope.select_tests(root, [test_file]) == [test_file]
+
+
+class TestVerifyChanges:
+    def test_verifies_changed_files_and_dependents_only(self, tmp_path):
+        root = _project(tmp_path)
+        verifier = CodeVerifier(root, tmp_path / "logs", use_cache=False)
+        ok = VerificationResult(True, "syntax", "ok", [], [])
+
+        with patch.object(verifier, "verify_files") as mock_verify:
+            mock_verify.return_value = {root / "src/pkg/core.py": [ok]}
+            passed, _msg = verifier.verify_changes(["src/pkg/core.py", "deleted.py"])
+
+        assert passed is True
+        targets = mock_verify.call_args[0][0]
+        assert targets == [root / "src" / "pkg" / "core.py", root / "src" / "pkg" / "api.py"]
+
+    def test_excluded_directories_are_skipped(self, tmp_path):
+        root = _project(tmp_path)
+        vendored = root / "node_modules" / "lib.py"
+        vendored.parent.mkdir()
+        vendored.write_text("x = 1\n")
+        verifier = CodeVerifier(root, tmp_path / "logs", use_cache=False)
+
+        with patch.object(verifier, "verify_files", return_value={}) as mock_verify:
+            verifier.verify_changes(["node_modules/lib.py", "src/pkg/unrelated.py"])
+
+        assert mock_verify.call_args[0][0] == [root / "src" / "pkg" / "unrelated.py"]
+
+    def test_full_level_runs_selected_tests(self, tmp_path):
+        root = _project(tmp_path)
+        verifier = CodeVerifier(root, tmp_path / "logs", use_cache=False)
+        test_result = VerificationResult(True, "test", "Tests passed", [], [])
+
+        with (
+            patch.object(verifier, "verify_files", return_value={}),
+            patch.object(verifier, "run_selected_tests", return_value=test_result) as run_sel,
+            patch.object(verifier, "run_tests") as run_all,
+        ):
+            passed, _ = verifier.verify_changes(["src/pkg/api.py"], level="FULL")
+
+        assert passed is True
+        run_all.assert_not_called()
+        selected = run_sel.call_args[0][0]
+        assert root / "tests" / "unit" / "test_patches_api.py" in selected
+
+    def test_no_changes(self, tmp_path):
+        verifier = CodeVerifier(tmp_path, tmp_path / "logs", use_cache=False)
+        assert verifier.verify_changes([]) == (True, "No changed files to verify")
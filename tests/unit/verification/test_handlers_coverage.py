@@ -43,3 +43,45 @@ class TestVerificationHandlers:
         with patch.object(tools, "is_available", return_value=False):
             result = handlers.verify_syntax_node(test_file, tmp_path, tools)
             assert result.passed is True  # Skipped
+
+
+class TestBatchLintHandlers:
+    """Tests for one-invocation-per-group lint handlers."""
+
+    def test_ruff_batch_maps_diagnostics_to_files(self, tmp_path):
+        import json
+        from unittest.mock import MagicMock
+
+        clean = tmp_path / "clean.py"
+        dirty = tmp_path / "dirty.py"
+        clean.write_text("x = 1\n", encoding="utf-8")
+        dirty.write_text("import os\n", encoding="utf-8")
+        diagnostics = [
+            {
+                "filename": str(dirty),
+                "code": "F401",
+                "message": "`os` imported but unused",
+                "location": {"row": 1, "column": 8},
+            }
+        ]
+        tools = MagicMock()
+        tools.is_available.return_value = True
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=1, stdout=json.dumps(diagnostics))
+            results = handlers.verify_lint_python_batch([clean, dirty], tmp_path, tools)
+
+        mock_run.assert_called_once()
+        assert str(clean) in mock_run.call_args.args[0]
+        assert results[clean].passed is True
+        assert results[dirty].passed is False
+        assert results[dirty].details == ["dirty.py:1:8: F401 `os` imported but unused"]
+
+    def test_ruff_batch_returns_none_when_tool_errors(self, tmp_path):
+        from unittest.mock import MagicMock
+
+        tools = MagicMock()
+        tools.is_available.return_value = True
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=2, stdout="", stderr="boom")
+            assert handlers.verify_lint_python_batch([tmp_path / "a.py"], tmp_path, tools) is None
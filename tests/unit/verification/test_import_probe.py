@@ -0,0 +1,94 @@
+"""
+Tests for the per-environment import resolution cache.
+"""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from boring.verification import import_probe
+from boring.verification.handlers import verify_imports_python
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path_factory):
+    cache_file = tmp_path_factory.mktemp("cache") / "imports.json"
+    with patch.object(import_probe, "_cache_path", return_value=cache_file):
+        import_probe.clear_import_cache()
+        yield
+        import_probe.clear_import_cache()
+
+
+class TestImportProbe:
+    def test_resolves_with_single_resident_probe(self, tmp_path):
+        result = import_probe.resolve_modules(
+            ["pytest", "definitely_not_a_module_xyz"], sys.executable, tmp_path
+        )
+
+        assert result == {"pytest": True, "definitely_not_a_module_xyz": False}
+        assert len(import_probe._probes) == 1
+
+    def test_each_module_is_probed_once_per_environment(self, tmp_path):
+        import_probe.resolve_modules(["pytest"], sys.executable, tmp_path)
+
+        with patch.object(import_probe._Probe, "resolve") as probe_resolve:
+            probe_resolve.return_value = {"json_missing_pkg": False}
+            import_probe.resolve_modules(["pytest"], sys.executable, tmp_path)
+            probe_resolve.assert_not_called()
+
+            import_probe.resolve_modules(["pytest", "json_missing_pkg"], sys.executable, tmp_path)
+            probe_resolve.assert_called_once_with(["json_missing_pkg"])
+
+    def test_answers_persist_across_runs_until_environment_changes(self, tmp_path):
+        import_probe.resolve_modules(["pytest"], sys.executable, tmp_path)
+        import_probe._cache = None  # simulate a new process reading the cache file
+
+        with patch.object(import_probe._Probe, "resolve", return_value={"pytest": True}) as res:
+            import_probe.resolve_modules(["pytest"], sys.executable, tmp_path)
+            res.assert_not_called()
+
+            # A new top-level module in the project changes the fingerprint
+            (tmp_path / "newmod.py").write_text("", encoding="utf-8")
+            import_probe.resolve_modules(["pytest"], sys.executable, tmp_path)
+            res.assert_called_once()
+
+    def test_local_modules_are_found(self, tmp_path):
+        (tmp_path / "localpkg").mkdir()
+        (tmp_path / "localpkg" / "__init__.py").write_text("", encoding="utf-8")
+
+        assert import_probe.resolve_modules(["localpkg"], sys.executable, tmp_path) == {
+            "localpkg": True
+        }
+
+    def test_cache_hit_does_not_start_a_probe(self, tmp_path):
+        import_probe.resolve_modules(["pytest"], sys.executable, tmp_path)
+        import_probe._shutdown_probes()
+        import_probe._probes.clear()
+        import_probe._cache = None
+
+        with patch.object(import_probe, "_Probe", side_effect=AssertionError("spawned")):
+            assert import_probe.resolve_modules(["pytest"], sys.executable, tmp_path) == {
+                "pytest": True
+            }
+        assert import_probe._probes == {}
+
+    def test_hung_probe_is_killed_and_handler_falls_back(self, tmp_path):
+        hanging = "import sys, time\nprint('[]', flush=True)\ntime.sleep(60)\n"
+        with (
+            patch.object(import_probe, "_PROBE_SCRIPT", hanging),
+            patch.object(import_probe, "_READ_TIMEOUT", 0.2),
+        ):
+            with pytest.raises(TimeoutError):
+                import_probe.resolve_modules(["pytest"], sys.executable, tmp_path)
+            assert import_probe._probes == {}
+
+            source = tmp_path / "mod.py"
+            source.write_text("import pytest\n", encoding="utf-8")
+            with patch(
+                "boring.verification.handlers._import_in_subprocess", return_value=True
+            ) as fallback:
+                result = verify_imports_python(source, tmp_path)
+
+        assert result.passed is True
+        fallback.assert_called_once()
@@ -52,3 +52,62 @@ class TestCodeVerifierCoverage:
         passed, message = verifier.verify_project("BASIC")
         # Should handle gracefully
         assert isinstance(passed, bool)
+
+
+class TestBatchedVerification:
+    """verify_files groups files per lint handler and runs each tool once."""
+
+    def test_verify_files_uses_one_batch_call_per_handler(self, tmp_path):
+        from unittest.mock import MagicMock, patch
+
+        from boring.models import VerificationResult
+        from boring.verification import handlers
+
+        files = []
+        for i in range(3):
+            f = tmp_path / f"m{i}.py"
+            f.write_text("x = 1\n", encoding="utf-8")
+            files.append(f)
+
+        batch = MagicMock(
+            side_effect=lambda paths, *a, **k: {
+                p: VerificationResult(True, "lint", "Lint OK", [], []) for p in paths
+            }
+        )
+        verifier = CodeVerifier(tmp_path, use_cache=False)
+        with (
+            patch.dict(handlers.BATCH_LINT_HANDLERS, {handlers.verify_lint_python: batch}),
+            patch.object(verifier, "verify_lint") as per_file_lint,
+            patch.object(
+                verifier,
+                "verify_imports",
+                return_value=VerificationResult(True, "import", "ok", [], []),
+            ),
+        ):
+            results = verifier.verify_files(files, "STANDARD")
+
+        batch.assert_called_once()
+        per_file_lint.assert_not_called()
+        assert [r.check_type for r in results[files[0]]] == ["syntax", "lint", "import"]
+
+    def test_verify_files_falls_back_when_batch_fails(self, tmp_path):
+        from unittest.mock import MagicMock, patch
+
+        from boring.models import VerificationResult
+        from boring.verification import handlers
+
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n", encoding="utf-8")
+        verifier = CodeVerifier(tmp_path, use_cache=False)
+        lint_ok = VerificationResult(True, "lint", "Lint OK", [], [])
+        with (
+            patch.dict(
+                handlers.BATCH_LINT_HANDLERS,
+                {handlers.verify_lint_python: MagicMock(return_value=None)},
+            ),
+            patch.object(verifier, "verify_lint", return_value=lint_ok) as per_file_lint,
+        ):
+            results = verifier.verify_files([f], "STANDARD")
+
+        per_file_lint.assert_called_once_with(f, auto_fix=False)
+        assert results[f][1] is lint_ok